@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Attack detection benchmark: per-rule scanning vs the single-pass matcher.
+
+Builds a corpus of benign and malicious request lines (or reads one request
+line per line from --corpus, e.g. "GET /path?query"), then times the old
+AttackAnalyzer logic (blocked-path set, substring lists, then one regex at a
+time over path and query) against ``AttackMatcher.match``. Prints ns per
+request for each and the request lines that only one of them flags.
+
+Usage:
+    python benchmarks/attack_matcher_benchmark.py [--lines 20000] [--malicious-ratio 0.05] [--corpus FILE]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from typing import Callable, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polly.attack_matcher import BLOCKED_PATHS, AttackMatcher  # noqa: E402
+
+BENIGN_PATHS = [
+    "/",
+    "/dashboard",
+    "/htmx/polls",
+    "/htmx/polls-realtime",
+    "/htmx/poll/{id}/details",
+    "/htmx/poll/{id}/results-realtime",
+    "/htmx/create-form",
+    "/htmx/channels",
+    "/super-admin/htmx/polls",
+    "/static/css/app.css",
+    "/static/uploads/image_{id}.webp",
+    "/api/polls/{id}/export.csv",
+    "/health",
+]
+BENIGN_QUERIES = [
+    "",
+    "filter=active",
+    "page={id}&per_page=25",
+    "server_id=123456789012345678&channel_id=876543210987654321",
+    "timezone=America%2FNew_York&sort=close_time",
+    "q=weekly+game+night",
+]
+MALICIOUS_LINES = [
+    "/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+    "/blog/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+    "/wp-login.php",
+    "/site/wp-admin/setup-config.php",
+    "/.env",
+    "/index.php?s=/index/think/app/invokefunction",
+    "/hello.world?%ADd+allow_url_include%3d1+%ADd+auto_prepend_file%3dphp://input",
+    "/search?q=1%27+UNION+SELECT+password+FROM+users",
+    "/htmx/polls?filter=%3Cscript%3Ealert(1)%3C/script%3E",
+    "/static/..%2f..%2f..%2fetc/passwd",
+    "/api/export?file=../../../../etc/passwd",
+    "/htmx/polls?filter=active;cat%20/etc/passwd",
+]
+
+# The per-rule checks AttackAnalyzer ran before the combined matcher
+LEGACY_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in [
+        r"allow_url_include\s*=\s*1",
+        r"auto_prepend_file\s*=\s*php://",
+        r"php://input",
+        r"php://filter",
+        r"data://",
+        r"expect://",
+        r"(?i)(union\s+select|drop\s+table|delete\s+from|insert\s+into)",
+        r"(?i)(update\s+.*\s+set)",
+        r"(?i)(<script[^>]*>|javascript:|on\w+\s*=)",
+        r"(?i)(eval\s*\()",
+        r"(?i)(;|\||&|`|\$\(|\${)",
+        r";\s*(cat|ls|pwd|whoami|id|uname)",
+        r"\|\s*(cat|ls|pwd|whoami|id|uname)",
+        r"&&\s*(cat|ls|pwd|whoami|id|uname)",
+        r"(\.\.\/|\.\.\\|%2e%2e%2f|%2e%2e%5c)",
+    ]
+]
+LEGACY_SUBSTRINGS = [
+    "vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+    "vendor/phpunit/phpunit/Util/PHP/eval-stdin.php",
+    "vendor/phpunit/src/Util/PHP/eval-stdin.php",
+    "vendor/phpunit/Util/PHP/eval-stdin.php",
+    "phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+    "phpunit/src/Util/PHP/eval-stdin.php",
+    "lib/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+    "wp-admin/",
+    "wp-login.php",
+    "wp-config.php",
+    "xmlrpc.php",
+    "phpmyadmin/",
+    "admin/",
+    "panel/",
+    ".env",
+]
+
+
+def legacy_is_malicious(path: str, query: str) -> bool:
+    if path in BLOCKED_PATHS:
+        return True
+    for substring in LEGACY_SUBSTRINGS:
+        if substring in path:
+            return True
+    if path.endswith(".php"):
+        return True
+    if query:
+        for pattern in LEGACY_PATTERNS:
+            if pattern.search(query):
+                return True
+    path_decoded = path.replace("%2e", ".").replace("%2f", "/").replace("%5c", "\\")
+    for pattern in LEGACY_PATTERNS:
+        if pattern.search(path_decoded):
+            return True
+    return False
+
+
+def build_corpus(lines: int, malicious_ratio: float) -> List[str]:
+    rng = random.Random(42)
+    corpus = []
+    for _ in range(lines):
+        if rng.random() < malicious_ratio:
+            corpus.append(rng.choice(MALICIOUS_LINES))
+            continue
+        path = rng.choice(BENIGN_PATHS).format(id=rng.randrange(1, 5000))
+        query = rng.choice(BENIGN_QUERIES).format(id=rng.randrange(1, 50))
+        corpus.append(f"{path}?{query}" if query else path)
+    return corpus
+
+
+def load_corpus(filename: str) -> List[str]:
+    corpus = []
+    with open(filename) as f:
+        for line in f:
+            parts = line.split()
+            if parts:
+                # Accept "METHOD /target" or a bare "/target"
+                corpus.append(parts[1] if len(parts) > 1 and not parts[0].startswith("/") else parts[0])
+    return corpus
+
+
+def time_detector(name: str, detect: Callable[[str, str], bool], requests: List[Tuple[str, str]], rounds: int):
+    best = None
+    flagged = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        flagged = [detect(path, query) for path, query in requests]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    ns_per_request = best / len(requests) * 1e9
+    print(f"  {name:<10} {ns_per_request:9.0f} ns/request  ({sum(flagged)} flagged)")
+    return flagged, ns_per_request
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--lines", type=int, default=20000)
+    parser.add_argument("--malicious-ratio", type=float, default=0.05)
+    parser.add_argument("--corpus", help="file with one request line per line")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else build_corpus(args.lines, args.malicious_ratio)
+    requests = [tuple(line.partition("?")[::2]) for line in corpus]
+    matcher = AttackMatcher()
+
+    print(f"{len(requests)} request lines, best of {args.rounds} rounds\n")
+    legacy, legacy_ns = time_detector("per-rule", legacy_is_malicious, requests, args.rounds)
+    combined, combined_ns = time_detector(
+        "combined", lambda path, query: matcher.match(path, query) is not None, requests, args.rounds
+    )
+    print(f"\n  speedup: {legacy_ns / combined_ns:.2f}x")
+
+    # Mostly the old bare "&" metacharacter rule, which matched every multi-parameter query
+    only_legacy = sorted({line for line, old, new in zip(corpus, legacy, combined) if old and not new})
+    only_combined = sorted({line for line, old, new in zip(corpus, legacy, combined) if new and not old})
+    for label, lines in (("per-rule only", only_legacy), ("combined only", only_combined)):
+        print(f"  flagged by {label}: {len(lines)} distinct lines")
+        for line in lines[:5]:
+            print(f"    {line}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Per-request authentication overhead.
+
+Measures what one authenticated request spends on its session cookie:
+
+- legacy: the middleware verifies the JWT, then ``get_current_user`` decodes
+  it again and rebuilds the ``DiscordUser`` (the flow before the verified
+  token cache)
+- cold: one verification per request (token cache disabled)
+- cached: the token cache hit in the middleware, the dependency reading the
+  user from ``request.state``
+
+It then drives a protected FastAPI route that depends on ``require_auth``
+through ``SecurityPipelineMiddleware`` over ASGI with the cache disabled and
+enabled, like an HTMX polling endpoint would be hit.
+
+Usage:
+    python benchmarks/auth_overhead_benchmark.py [--requests 20000] [--guilds 25]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Measure authentication, not Redis round-trips
+os.environ.setdefault("RATE_LIMIT_REDIS_ENABLED", "false")
+
+from fastapi import Depends, FastAPI  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from polly import auth  # noqa: E402
+from polly.auth import (  # noqa: E402
+    SECRET_KEY,
+    DiscordUser,
+    VerifiedTokenCache,
+    authenticate_token,
+    create_access_token,
+    require_auth,
+    user_from_payload,
+)
+from polly.security_pipeline import SecurityPipelineMiddleware  # noqa: E402
+
+
+def legacy_auth(token: str) -> DiscordUser:
+    # AuthenticationMiddleware.dispatch
+    jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    # get_current_user
+    payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+    return user_from_payload(payload)
+
+
+def cached_auth(token: str) -> DiscordUser:
+    # Pipeline stage; the dependency then reads request.state
+    return authenticate_token(token)
+
+
+def time_calls(fn: Callable[[str], DiscordUser], token: str, requests: int) -> List[float]:
+    for _ in range(min(200, requests)):
+        fn(token)
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        fn(token)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return sorted(latencies)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/htmx/poll/{poll_id}/results-realtime")
+    async def results(poll_id: int, current_user: DiscordUser = Depends(require_auth)):
+        return {"poll_id": poll_id, "user": current_user.id}
+
+    app.add_middleware(SecurityPipelineMiddleware, requests_per_minute=10**9, requests_per_hour=10**9)
+    return app
+
+
+def make_scope(path: str, cookie: str) -> Dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"cookie", f"access_token={cookie}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+
+
+async def call(app: Callable, scope: Dict) -> int:
+    status = 0
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_done.set()
+
+    # Each request gets a fresh scope, so request.state doesn't leak between them
+    await app(dict(scope), receive, send)
+    return status
+
+
+async def time_requests(app: Callable, scope: Dict, requests: int) -> List[float]:
+    for _ in range(min(200, requests)):
+        await call(app, scope)
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        status = await call(app, scope)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+        if status != 200:
+            raise RuntimeError(f"{scope['path']} returned {status}")
+    return sorted(latencies)
+
+
+def report(label: str, latencies: List[float], baseline: float, baseline_label: str) -> None:
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"  {label:<8} p50 {p50:8.1f} us  p99 {p99:8.1f} us  ({baseline / p50:.1f}x vs {baseline_label})")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--guilds", type=int, default=25, help="admin guilds carried in the token")
+    args = parser.parse_args()
+
+    guilds = [{"id": str(10**17 + i), "permissions": "8"} for i in range(args.guilds)]
+    token = create_access_token(DiscordUser({"id": "1", "username": "bench"}, guilds))
+    print(f"{args.requests} requests, token with {args.guilds} admin guilds ({len(token)} bytes)\n")
+
+    print("authentication per request:")
+    auth._token_cache = VerifiedTokenCache(max_size=0)
+    legacy = time_calls(legacy_auth, token, args.requests)
+    cold = time_calls(cached_auth, token, args.requests)
+    auth._token_cache = VerifiedTokenCache()
+    cached = time_calls(cached_auth, token, args.requests)
+    baseline = statistics.median(legacy)
+    for label, latencies in (("legacy", legacy), ("cold", cold), ("cached", cached)):
+        report(label, latencies, baseline, "legacy")
+
+    print("\nprotected HTMX route through the security pipeline:")
+    app = build_app()
+    scope = make_scope("/htmx/poll/1/results-realtime", token)
+    auth._token_cache = VerifiedTokenCache(max_size=0)
+    uncached = asyncio.run(time_requests(app, scope, args.requests))
+    auth._token_cache = VerifiedTokenCache()
+    cached = asyncio.run(time_requests(app, scope, args.requests))
+    baseline = statistics.median(uncached)
+    for label, latencies in (("cold", uncached), ("cached", cached)):
+        report(label, latencies, baseline, "cold")
+    print(f"\ntoken cache: {auth.get_token_cache().get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
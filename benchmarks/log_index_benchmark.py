@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Log analyzer benchmark: full per-row reparse vs the incremental log index.
+
+Writes a synthetic log file, then times the old PandasLogAnalyzer parsing
+(every line from byte zero, a dict per line, ``pd.to_datetime`` and the
+metadata regexes per row) against the first ``LogIndex.refresh`` and against
+a refresh after appending a small batch of lines, which is what a super
+admin request pays once the index is warm. Also times the analyzer's
+filtered query and error trends off the warm index.
+
+Usage:
+    python benchmarks/log_index_benchmark.py [--megabytes 50] [--append-lines 2000] [--skip-legacy]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from polly.log_index import (  # noqa: E402
+    ENDPOINT_PATTERNS,
+    ERROR_KEYWORDS,
+    HTTP_REQUEST_PATTERN,
+    POLL_ID_PATTERNS,
+    RESPONSE_TIME_PATTERNS,
+    SERVER_ID_PATTERNS,
+    STATUS_CODE_PATTERNS,
+    USER_ID_PATTERNS,
+    LogIndex,
+)
+from polly.pandas_log_analyzer import PandasLogAnalyzer  # noqa: E402
+
+LEGACY_LINE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ - (\w+) - (.+)$")
+
+MESSAGES = [
+    ("INFO", "polly.web_app", "GET /htmx/polls status: 200 took {ms}ms"),
+    ("INFO", "polly.discord_bot", "DM DEBUG - reaction on poll_id: {id} by user: {user}"),
+    ("INFO", "polly.htmx_endpoints", "DASHBOARD DEBUG - rendering {id} polls for guild: {guild}"),
+    ("WARNING", "polly.redis_client", "Redis timeout after {ms}ms"),
+    ("ERROR", "polly.background_tasks", "Failed to close poll #{id}: connection refused"),
+    ("DEBUG", "polly.database", "query took {ms} milliseconds"),
+]
+
+
+def write_lines(f, count: int, start: datetime, step: timedelta) -> None:
+    for i in range(count):
+        level, name, template = random.choice(MESSAGES)
+        message = template.format(
+            ms=random.randint(2, 2500),
+            id=random.randint(1, 5000),
+            user=random.randint(10**17, 10**18),
+            guild=random.randint(10**17, 10**18),
+        )
+        f.write(f"{start + step * i:%Y-%m-%d %H:%M:%S},{i % 1000:03d} - {name} - {level} - {message}\n")
+        if level == "ERROR" and i % 7 == 0:
+            f.write("Traceback (most recent call last):\n  File \"polly/background_tasks.py\", line 1\n")
+
+
+def legacy_metadata(message: str) -> Dict[str, Any]:
+    metadata: Dict[str, Any] = {"is_error": any(k in message.lower() for k in ERROR_KEYWORDS)}
+    fields = [
+        ("poll_id", POLL_ID_PATTERNS),
+        ("user_id", USER_ID_PATTERNS),
+        ("server_id", SERVER_ID_PATTERNS),
+        ("endpoint", (HTTP_REQUEST_PATTERN,) + ENDPOINT_PATTERNS),
+        ("status_code", STATUS_CODE_PATTERNS),
+        ("response_time", RESPONSE_TIME_PATTERNS),
+    ]
+    for field, patterns in fields:
+        metadata[field] = None
+        for pattern in patterns:
+            match = re.search(pattern, message, re.IGNORECASE)
+            if match:
+                metadata[field] = " ".join(match.groups())
+                break
+    return metadata
+
+
+def legacy_parse(path: str) -> pd.DataFrame:
+    rows: List[Dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            match = LEGACY_LINE.match(line)
+            if match:
+                timestamp_str, level, message = match.groups()
+                timestamp = pd.to_datetime(timestamp_str, format="%Y-%m-%d %H:%M:%S")
+                row = {"timestamp": timestamp, "level": level, "message": message, "line_number": line_num,
+                       "hour": timestamp.hour, "day_of_week": timestamp.day_name(), "date": timestamp.date()}
+                row.update(legacy_metadata(message))
+            else:
+                timestamp = pd.Timestamp.now()
+                row = {"timestamp": timestamp, "level": "UNSTRUCTURED", "message": line, "line_number": line_num}
+            rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def timed(label: str, fn) -> Any:
+    started = time.perf_counter()
+    result = fn()
+    print(f"  {label:<34} {time.perf_counter() - started:8.3f} s")
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--megabytes", type=int, default=50, help="size of the synthetic log")
+    parser.add_argument("--append-lines", type=int, default=2000, help="lines appended between requests")
+    parser.add_argument("--skip-legacy", action="store_true", help="don't time the full reparse")
+    args = parser.parse_args()
+
+    random.seed(7)
+    with tempfile.TemporaryDirectory() as workdir:
+        # The analyzer reads logs/polly.log relative to the working directory
+        os.makedirs(os.path.join(workdir, "logs"))
+        os.chdir(workdir)
+        path = os.path.join("logs", "polly.log")
+
+        start = datetime.now() - timedelta(days=6)
+        with open(path, "w") as f:
+            while f.tell() < args.megabytes * 1024 * 1024:
+                write_lines(f, 10000, start, timedelta(milliseconds=250))
+                start += timedelta(milliseconds=250) * 10000
+        print(f"log file: {os.path.getsize(path) / 1024 / 1024:.1f} MB\n")
+
+        if not args.skip_legacy:
+            legacy = timed("legacy full reparse", lambda: legacy_parse(path))
+            print(f"  {'':<34} {legacy.memory_usage(deep=True).sum() / 1024 / 1024:8.1f} MB in memory")
+
+        index = LogIndex([path])
+        frame = timed("index first refresh", index.refresh)
+        print(f"  {'':<34} {frame.memory_usage(deep=True).sum() / 1024 / 1024:8.1f} MB in memory")
+
+        with open(path, "a") as f:
+            write_lines(f, args.append_lines, datetime.now(), timedelta(milliseconds=10))
+        timed(f"index refresh (+{args.append_lines} lines)", index.refresh)
+        timed("index refresh (no new lines)", index.refresh)
+
+        analyzer = PandasLogAnalyzer()
+        analyzer.index = index
+        timed("get_filtered_logs(24h, limit 500)", lambda: analyzer.get_filtered_logs(time_range="24h"))
+        timed("get_filtered_logs(search 'refused')", lambda: analyzer.get_filtered_logs(search_filter="refused"))
+        timed("get_error_trends(7)", lambda: analyzer.get_error_trends(days=7))
+        print(f"\nindex: {index.get_stats()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Per-request overhead of the security middleware stack.
+
+Builds the same small FastAPI app three times: bare, wrapped in the legacy
+four ``BaseHTTPMiddleware`` layers (auth, rate limit, security headers,
+Turnstile; frozen copies in ``legacy_middleware.py``) in their old order, and
+wrapped in ``SecurityPipelineMiddleware``.
+Drives each app directly over ASGI (no sockets) on a public page, a
+protected page with a valid session cookie, and a streaming response, and
+prints p50/p99 latency and the overhead relative to the bare app.
+
+Usage:
+    python benchmarks/middleware_overhead_benchmark.py [--requests 5000] [--chunks 20]
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Measure the middleware itself, not Redis round-trips
+os.environ.setdefault("RATE_LIMIT_REDIS_ENABLED", "false")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.responses import HTMLResponse, StreamingResponse  # noqa: E402
+
+from legacy_middleware import (  # noqa: E402
+    AuthenticationMiddleware,
+    RateLimitMiddleware,
+    SecurityHeadersMiddleware,
+    TurnstileSecurityMiddleware,
+)
+from polly.auth import DiscordUser, create_access_token  # noqa: E402
+from polly.security_pipeline import SecurityPipelineMiddleware  # noqa: E402
+
+# High enough that the benchmark never trips the limiter
+RATE_LIMITS = {"requests_per_minute": 10**9, "requests_per_hour": 10**9}
+
+
+def build_app(stack: str, chunks: int) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/", response_class=HTMLResponse)
+    async def home():
+        return "<html><body>Polly</body></html>"
+
+    @app.get("/dashboard", response_class=HTMLResponse)
+    async def dashboard():
+        return "<html><body>Dashboard</body></html>"
+
+    @app.get("/htmx/export.csv")
+    async def export():
+        async def rows():
+            for i in range(chunks):
+                yield f"{i},option,{i * 3}\n".encode()
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    if stack == "legacy":
+        app.add_middleware(TurnstileSecurityMiddleware)
+        app.add_middleware(SecurityHeadersMiddleware)
+        app.add_middleware(RateLimitMiddleware, **RATE_LIMITS)
+        app.add_middleware(AuthenticationMiddleware)
+    elif stack == "pipeline":
+        app.add_middleware(SecurityPipelineMiddleware, **RATE_LIMITS)
+    return app
+
+
+def make_scope(path: str, cookie: str) -> Dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost"), (b"cookie", f"access_token={cookie}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+    }
+
+
+async def call(app: Callable, scope: Dict) -> int:
+    status = 0
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Disconnect listeners block here until the response is finished
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            response_done.set()
+
+    await app(scope, receive, send)
+    return status
+
+
+async def measure(app: Callable, scope: Dict, requests: int) -> List[float]:
+    # Warm up routing, lazy imports and caches
+    for _ in range(min(200, requests)):
+        await call(app, scope)
+
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        status = await call(app, scope)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+        if status != 200:
+            raise RuntimeError(f"{scope['path']} returned {status}")
+    return sorted(latencies)
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+async def run(requests: int, chunks: int) -> None:
+    cookie = create_access_token(DiscordUser({"id": "1", "username": "bench"}, []))
+    apps = {stack: build_app(stack, chunks) for stack in ("bare", "legacy", "pipeline")}
+    routes = {"public": "/", "protected": "/dashboard", "streaming": "/htmx/export.csv"}
+
+    for route_name, path in routes.items():
+        scope = make_scope(path, cookie)
+        results = {stack: await measure(app, scope, requests) for stack, app in apps.items()}
+        base_p50 = statistics.median(results["bare"])
+        base_p99 = percentile(results["bare"], 0.99)
+
+        print(f"{route_name} ({path}):")
+        for stack, latencies in results.items():
+            p50 = statistics.median(latencies)
+            p99 = percentile(latencies, 0.99)
+            overhead = ""
+            if stack != "bare":
+                overhead = f"  overhead: p50 +{p50 - base_p50:.1f} us, p99 +{p99 - base_p99:.1f} us"
+            print(f"  {stack:<9} p50 {p50:8.1f} us  p99 {p99:8.1f} us{overhead}")
+        print()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--chunks", type=int, default=20, help="chunks in the streaming response")
+    args = parser.parse_args()
+
+    print(f"{args.requests} requests per route and stack\n")
+    asyncio.run(run(args.requests, args.chunks))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Hot-path query benchmark for the composite/unique index migration.
+
+Builds a synthetic SQLite database at schema version 11, times the queries
+used by vote collection, on_reaction_add, the dashboard poll lists and the
+super admin list, then applies migration 12 (add_hot_path_indexes) and runs
+the same queries again. Prints the query plan and latency for both runs.
+
+Usage:
+    python benchmarks/query_index_benchmark.py [--polls 5000] [--votes 500000]
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from polly.migrations import DatabaseMigrator  # noqa: E402
+
+INDEX_MIGRATION_VERSION = 12
+
+
+def build_database(db_path: str, poll_count: int, vote_count: int, creators: int) -> dict:
+    """Create a pre-index (version 11) database and fill it with synthetic data"""
+    migrator = DatabaseMigrator(db_path)
+    migrator.migrations = [
+        m for m in migrator.migrations if m["version"] < INDEX_MIGRATION_VERSION
+    ]
+    if not migrator.run_migrations():
+        raise RuntimeError("Failed to build baseline schema")
+
+    rng = random.Random(42)
+    now = datetime(2025, 1, 1)
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    polls = []
+    for poll_id in range(1, poll_count + 1):
+        created = now - timedelta(minutes=poll_count - poll_id)
+        polls.append(
+            (
+                poll_id,
+                f"Poll {poll_id}",
+                "Question?",
+                '["A", "B", "C", "D"]',
+                "100000000000000000",
+                "200000000000000000",
+                str(300000000000000000 + rng.randrange(creators)),
+                str(400000000000000000 + poll_id),
+                created,
+                created + timedelta(days=1),
+                created,
+                rng.choice(["scheduled", "active", "closed", "closed"]),
+            )
+        )
+    cursor.executemany(
+        """
+        INSERT INTO polls (id, name, question, options_json, server_id, channel_id,
+                           creator_id, message_id, open_time, close_time, created_at, status)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        polls,
+    )
+
+    votes = []
+    seen = set()
+    while len(votes) < vote_count:
+        poll_id = rng.randrange(1, poll_count + 1)
+        user_id = str(500000000000000000 + rng.randrange(vote_count))
+        option_index = rng.randrange(4)
+        key = (poll_id, user_id, option_index)
+        if key in seen:
+            continue
+        seen.add(key)
+        votes.append((poll_id, user_id, option_index, now))
+    cursor.executemany(
+        "INSERT INTO votes (poll_id, user_id, option_index, voted_at) VALUES (?, ?, ?, ?)",
+        votes,
+    )
+    conn.commit()
+    conn.close()
+
+    sample_vote = votes[len(votes) // 2]
+    sample_poll = polls[len(polls) // 2]
+    return {
+        "poll_id": sample_vote[0],
+        "user_id": sample_vote[1],
+        "option_index": sample_vote[2],
+        "message_id": sample_poll[7],
+        "creator_id": sample_poll[6],
+    }
+
+
+def hot_path_queries(sample: dict) -> list:
+    """(name, sql, params) for each hot query"""
+    return [
+        (
+            "vote by poll+user (single choice)",
+            "SELECT * FROM votes WHERE poll_id = ? AND user_id = ? LIMIT 1",
+            (sample["poll_id"], sample["user_id"]),
+        ),
+        (
+            "vote by poll+user+option (multiple choice)",
+            "SELECT * FROM votes WHERE poll_id = ? AND user_id = ? AND option_index = ? LIMIT 1",
+            (sample["poll_id"], sample["user_id"], sample["option_index"]),
+        ),
+        (
+            "poll by message_id (on_reaction_add)",
+            "SELECT * FROM polls WHERE message_id = ? LIMIT 1",
+            (sample["message_id"],),
+        ),
+        (
+            "per-option counts for a poll",
+            "SELECT option_index, COUNT(*) FROM votes WHERE poll_id = ? GROUP BY option_index",
+            (sample["poll_id"],),
+        ),
+        (
+            "poll votes ordered by voted_at",
+            "SELECT * FROM votes WHERE poll_id = ? ORDER BY voted_at DESC",
+            (sample["poll_id"],),
+        ),
+        (
+            "creator polls by status (dashboard)",
+            "SELECT * FROM polls WHERE creator_id = ? AND status = ? ORDER BY created_at DESC",
+            (sample["creator_id"], "closed"),
+        ),
+        (
+            "polls by status (super admin list)",
+            "SELECT * FROM polls WHERE status = ? ORDER BY created_at DESC LIMIT 50",
+            ("active",),
+        ),
+    ]
+
+
+def measure(db_path: str, queries: list, iterations: int) -> dict:
+    """Return {name: (plan, median_ms, p95_ms)}"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute("ANALYZE")
+    results = {}
+
+    for name, sql, params in queries:
+        plan = "; ".join(
+            row[-1] for row in cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        )
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            cursor.execute(sql, params).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results[name] = (
+            plan,
+            statistics.median(timings),
+            timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        )
+
+    conn.close()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--polls", type=int, default=5000)
+    parser.add_argument("--votes", type=int, default=500000)
+    parser.add_argument("--creators", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        print(f"Building database: {args.polls} polls, {args.votes} votes...")
+        sample = build_database(db_path, args.polls, args.votes, args.creators)
+        queries = hot_path_queries(sample)
+
+        before = measure(db_path, queries, args.iterations)
+
+        print(f"Applying migration {INDEX_MIGRATION_VERSION}...")
+        if not DatabaseMigrator(db_path).run_migrations():
+            print("❌ Migration failed")
+            return 1
+
+        after = measure(db_path, queries, args.iterations)
+
+    print()
+    for name, _, _ in queries:
+        plan_before, median_before, p95_before = before[name]
+        plan_after, median_after, p95_after = after[name]
+        speedup = median_before / median_after if median_after else float("inf")
+        print(name)
+        print(f"  before: {median_before:8.3f} ms median, {p95_before:8.3f} ms p95  | {plan_before}")
+        print(f"  after:  {median_after:8.3f} ms median, {p95_after:8.3f} ms p95  | {plan_after}")
+        print(f"  speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
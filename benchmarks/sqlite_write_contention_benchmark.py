@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+SQLite write-contention benchmark for the shared engine factory.
+
+Simulates N concurrent voters, each inserting votes through its own ORM
+session and committing, while a few readers keep polling results. Runs once
+against a bare ``create_engine`` (the old setup: rollback journal, no
+busy_timeout) and once against ``create_db_engine`` (WAL, synchronous=NORMAL,
+busy_timeout, cache/mmap sizing), then prints commit latency percentiles,
+throughput and how many commits hit "database is locked".
+
+Usage:
+    python benchmarks/sqlite_write_contention_benchmark.py [--voters 16] [--votes-per-voter 50]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from polly.database import Base, Vote, create_db_engine  # noqa: E402
+
+POLL_COUNT = 10
+MAX_ATTEMPTS = 5
+
+
+def build_engine(profile: str, db_path: str):
+    url = f"sqlite:///{db_path}"
+    if profile == "baseline":
+        return create_engine(url, connect_args={"check_same_thread": False})
+    return create_db_engine(url)
+
+
+def seed_polls(engine) -> None:
+    Base.metadata.create_all(bind=engine)
+    now = datetime.now()
+    with engine.begin() as conn:
+        for poll_id in range(1, POLL_COUNT + 1):
+            conn.execute(
+                text(
+                    """
+                    INSERT INTO polls (id, name, question, options_json, server_id, channel_id,
+                                       creator_id, open_time, close_time, created_at, status)
+                    VALUES (:id, :name, 'Question?', '["A", "B", "C", "D"]', '1', '2', '3',
+                            :now, :now, :now, 'active')
+                    """
+                ),
+                {"id": poll_id, "name": f"Poll {poll_id}", "now": now},
+            )
+
+
+def voter(Session, voter_id: int, votes: int, stats: dict, lock: threading.Lock) -> None:
+    """Cast ``votes`` votes, retrying on lock errors like vote collection does"""
+    for n in range(votes):
+        poll_id = (voter_id + n) % POLL_COUNT + 1
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            db = Session()
+            try:
+                db.add(Vote(poll_id=poll_id, user_id=f"{voter_id}-{n}", option_index=n % 4))
+                start = time.perf_counter()
+                db.commit()
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    stats["latencies"].append(elapsed)
+                break
+            except OperationalError as e:
+                db.rollback()
+                with lock:
+                    if "locked" in str(e):
+                        stats["locked"] += 1
+                    if attempt == MAX_ATTEMPTS:
+                        stats["failed"] += 1
+                time.sleep(0.01 * attempt)
+            finally:
+                db.close()
+
+
+def reader(Session, stop: threading.Event, stats: dict, lock: threading.Lock) -> None:
+    """Keep reading per-option counts while the voters write"""
+    while not stop.is_set():
+        db = Session()
+        try:
+            db.execute(
+                text("SELECT poll_id, option_index, COUNT(*) FROM votes GROUP BY poll_id, option_index")
+            ).fetchall()
+            with lock:
+                stats["reads"] += 1
+        except OperationalError:
+            with lock:
+                stats["read_errors"] += 1
+        finally:
+            db.close()
+
+
+def run_profile(profile: str, voters: int, votes_per_voter: int, readers: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = build_engine(profile, os.path.join(tmp_dir, "bench.db"))
+        seed_polls(engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        journal_mode = engine.connect().execute(text("PRAGMA journal_mode")).scalar()
+
+        stats = {"latencies": [], "locked": 0, "failed": 0, "reads": 0, "read_errors": 0}
+        lock = threading.Lock()
+        stop = threading.Event()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=voters + readers) as pool:
+            reader_futures = [
+                pool.submit(reader, Session, stop, stats, lock) for _ in range(readers)
+            ]
+            voter_futures = [
+                pool.submit(voter, Session, voter_id, votes_per_voter, stats, lock)
+                for voter_id in range(voters)
+            ]
+            for future in voter_futures:
+                future.result()
+            stop.set()
+            for future in reader_futures:
+                future.result()
+        stats["elapsed"] = time.perf_counter() - start
+        stats["journal_mode"] = journal_mode
+        engine.dispose()
+    return stats
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * pct))]
+
+
+def report(profile: str, stats: dict) -> None:
+    latencies = sorted(stats["latencies"])
+    commits = len(latencies)
+    print(f"{profile} (journal_mode={stats['journal_mode']})")
+    print(
+        f"  commits: {commits} in {stats['elapsed']:.2f}s "
+        f"({commits / stats['elapsed'] if stats['elapsed'] else 0:.0f}/s), "
+        f"locked: {stats['locked']}, failed: {stats['failed']}"
+    )
+    if latencies:
+        print(
+            f"  commit latency: p50 {statistics.median(latencies):.2f} ms, "
+            f"p95 {percentile(latencies, 0.95):.2f} ms, "
+            f"p99 {percentile(latencies, 0.99):.2f} ms, max {latencies[-1]:.2f} ms"
+        )
+    print(f"  reads: {stats['reads']}, read errors: {stats['read_errors']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--voters", type=int, default=16)
+    parser.add_argument("--votes-per-voter", type=int, default=50)
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument(
+        "--profile", choices=["baseline", "production", "both"], default="both"
+    )
+    args = parser.parse_args()
+
+    profiles = ["baseline", "production"] if args.profile == "both" else [args.profile]
+    print(
+        f"{args.voters} voters x {args.votes_per_voter} votes, {args.readers} readers\n"
+    )
+    for profile in profiles:
+        stats = run_profile(profile, args.voters, args.votes_per_voter, args.readers)
+        report(profile, stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -385,6 +385,33 @@ class SystemCommands:
                     self.helpers.error(f"Vacuum failed: {str(e)}")
                     return 1
             
+            elif args.db_action == 'tallies':
+                from polly.database import get_db_session
+                from polly.poll_tallies import rebuild_poll_tallies, verify_poll_tallies
+
+                db = get_db_session()
+                try:
+                    if args.rebuild:
+                        self.helpers.info("Rebuilding poll tallies from votes...")
+                        rows = rebuild_poll_tallies(db, args.poll_id)
+                        self.helpers.success(f"Rebuilt {rows} tally rows")
+
+                    mismatches = verify_poll_tallies(db, args.poll_id)
+                finally:
+                    db.close()
+
+                if mismatches:
+                    for mismatch in mismatches:
+                        self.helpers.error(
+                            f"Poll {mismatch['poll_id']} option {mismatch['option_index']}: "
+                            f"expected {mismatch['expected']}, found {mismatch['actual']}"
+                        )
+                    self.helpers.warning("Run 'db tallies --rebuild' to repair")
+                    return 1
+
+                self.helpers.success("Poll tallies match votes")
+                return 0
+
             else:
                 self.helpers.error(f"Unknown database action: {args.db_action}")
                 return 1
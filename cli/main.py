@@ -170,6 +170,13 @@ Examples:
         
         db_subparsers.add_parser('migrate', help='Run database migrations')
         db_subparsers.add_parser('vacuum', help='Vacuum database (cleanup)')
+
+        tallies_parser = db_subparsers.add_parser('tallies',
+                                                help='Verify vote tallies against votes')
+        tallies_parser.add_argument('--rebuild', action='store_true',
+                                  help='Recompute tallies from votes before verifying')
+        tallies_parser.add_argument('--poll-id', type=int,
+                                  help='Check a specific poll only')
     
     def _add_admin_commands(self, subparsers):
         """Add admin commands"""
@@ -10,6 +10,7 @@ from fastapi.templating import Jinja2Templates
 
 from .auth import require_auth, DiscordUser
 from .ip_blocker import get_ip_blocker
+from .super_admin import require_super_admin
 
 logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="templates")
@@ -51,18 +52,24 @@ async def get_security_status(
     # In production, you might want to restrict this to specific admin users
 
     ip_blocker = get_ip_blocker()
-    blocked_ips = ip_blocker.get_blocked_ips()
+    blocks = ip_blocker.get_block_details()
 
-    # Get violation counts for blocked IPs
+    # Get violation counts and expiry for blocked IPs and ranges
     ip_details = []
-    for ip in blocked_ips:
+    for block in blocks:
         ip_details.append(
-            {"ip": ip, "violation_count": ip_blocker.get_violation_count(ip)}
+            {
+                "ip": block["network"],
+                "violation_count": ip_blocker.get_violation_count(block["network"]),
+                "expires_at": block["expires_at"] or None,
+                "reason": block["reason"],
+                "asn": block["asn"],
+            }
         )
 
     return JSONResponse(
         {
-            "blocked_ips": len(blocked_ips),
+            "blocked_ips": len(blocks),
             "ip_details": ip_details,
             "timestamp": request.headers.get("X-Request-Time", "unknown"),
         }
@@ -102,6 +109,60 @@ async def unblock_ip(
         raise HTTPException(status_code=500, detail="Failed to unblock IP")
 
 
+async def block_ip(
+    request: Request, current_user: DiscordUser = Depends(require_super_admin)
+) -> JSONResponse:
+    """Block an IP, a CIDR range or an ASN's prefixes for a limited time"""
+
+    try:
+        body = await request.json()
+        network = body.get("network") or body.get("ip")
+        asn = body.get("asn")
+        prefixes = body.get("prefixes") or []
+        duration = body.get("duration")
+        reason = body.get("reason") or f"Blocked by {current_user.username}"
+
+        if duration is not None:
+            try:
+                duration = int(duration)
+            except (TypeError, ValueError):
+                duration = -1
+            if duration < 0:
+                raise HTTPException(
+                    status_code=400, detail="duration must be a non-negative number of seconds"
+                )
+        if asn is not None:
+            try:
+                asn = int(asn)
+            except (TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="asn must be a number")
+        if not network and not (asn and prefixes):
+            raise HTTPException(
+                status_code=400, detail="An IP/CIDR network, or an ASN with prefixes, is required"
+            )
+
+        ip_blocker = get_ip_blocker()
+        try:
+            if network:
+                entries = [ip_blocker.block(network, duration, reason)]
+            else:
+                entries = ip_blocker.block_asn(asn, prefixes, duration, reason)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid IP address or network")
+
+        blocked = [entry.network for entry in entries]
+        logger.info(f"Blocked {blocked} by user {current_user.username}: {reason}")
+        return JSONResponse(
+            {"success": True, "blocked": blocked, "expires_at": entries[0].expires_at or None}
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error blocking IP: {e}")
+        raise HTTPException(status_code=500, detail="Failed to block IP")
+
+
 async def get_system_health(
     request: Request, current_user: DiscordUser = Depends(require_auth)
 ) -> JSONResponse:
@@ -120,6 +181,21 @@ async def get_system_health(
 
         ip_blocker = get_ip_blocker()
         blocked_ips_count = len(ip_blocker.get_blocked_ips())
+        ip_blocker_stats = ip_blocker.get_stats()
+
+        from .reaction_reconciler import get_reaction_reconciler
+        from .vote_ingestion import get_vote_ingestion_queue
+        from .poll_message_updater import get_poll_message_updater
+        from .poll_results_stream import get_poll_results_broadcaster
+        from .discord_user_resolver import get_discord_user_resolver
+        from .database import get_db_loop_guard_stats
+        from .poll_schedule_sweeper import get_poll_schedule_sweeper
+        from .recovery_executor import get_recovery_executor
+        from .image_processing import get_image_processing_service
+        from .http_clients import get_http_client_registry
+        from .rate_limiter import get_rate_limiter
+        from .auth import get_token_cache
+        from .logging_setup import get_logging_setup
 
         return JSONResponse(
             {
@@ -128,6 +204,20 @@ async def get_system_health(
                     "redis": redis_health,
                     "discord_bot": bot_status,
                     "blocked_ips": blocked_ips_count,
+                    "reaction_reconciler": get_reaction_reconciler().get_stats(),
+                    "vote_ingestion": get_vote_ingestion_queue().get_stats(),
+                    "poll_message_updates": get_poll_message_updater().get_stats(),
+                    "poll_results_streams": get_poll_results_broadcaster().get_stats(),
+                    "discord_user_resolver": get_discord_user_resolver().get_stats(),
+                    "db_loop_guard": get_db_loop_guard_stats(),
+                    "poll_schedule_sweeper": get_poll_schedule_sweeper().get_stats(),
+                    "recovery_executor": get_recovery_executor().get_stats(),
+                    "image_processing": get_image_processing_service().get_stats(),
+                    "http_clients": get_http_client_registry().get_stats(),
+                    "rate_limiter": get_rate_limiter().get_stats(),
+                    "ip_blocker": ip_blocker_stats,
+                    "auth_tokens": get_token_cache().get_stats(),
+                    "logging": get_logging_setup().get_stats() if get_logging_setup() else None,
                 },
                 "timestamp": request.headers.get("X-Request-Time", "unknown"),
             }
@@ -288,6 +378,12 @@ def add_admin_routes(app):
     ):
         return await unblock_ip(request, current_user)
 
+    @app.post("/admin/security/block")
+    async def admin_block_ip(
+        request: Request, current_user: DiscordUser = Depends(require_super_admin)
+    ):
+        return await block_ip(request, current_user)
+
     @app.get("/admin/health")
     async def admin_system_health(
         request: Request, current_user: DiscordUser = Depends(require_auth)
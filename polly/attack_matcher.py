@@ -0,0 +1,259 @@
+"""
+Polly Attack Matcher
+Single-pass detection of known attack patterns in request lines.
+
+``AttackAnalyzer`` used to check a set of blocked paths, then several lists
+of substrings, then every regex in turn against the path and again against
+the query string, and ``security_monitor.py`` kept its own similar list for
+offline log analysis. All rules now live in ``ATTACK_RULES``; for each
+request component (path, query, headers) they are compiled into one
+alternation regex over lower-cased text, so a component is scanned once.
+Exact known-bad paths stay a set lookup. Stdlib only, so the offline
+monitor can import it without the web stack.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Tuple
+from urllib.parse import unquote_plus
+
+PATH = "path"
+QUERY = "query"
+HEADER = "header"
+
+SEVERITY_RANK = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
+
+# Request headers scanned for injection payloads
+SCANNED_HEADERS = ("user-agent", "referer")
+
+# Known malicious paths that should be blocked immediately
+BLOCKED_PATHS: FrozenSet[str] = frozenset(
+    {
+        # PHPUnit RCE paths
+        "/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/vendor/phpunit/phpunit/Util/PHP/eval-stdin.php",
+        "/vendor/phpunit/src/Util/PHP/eval-stdin.php",
+        "/vendor/phpunit/Util/PHP/eval-stdin.php",
+        "/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/phpunit/phpunit/Util/PHP/eval-stdin.php",
+        "/phpunit/src/Util/PHP/eval-stdin.php",
+        "/phpunit/Util/PHP/eval-stdin.php",
+        "/lib/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/lib/phpunit/phpunit/Util/PHP/eval-stdin.php",
+        "/lib/phpunit/src/Util/PHP/eval-stdin.php",
+        "/lib/phpunit/Util/PHP/eval-stdin.php",
+        "/lib/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/laravel/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/www/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/ws/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/yii/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/zend/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/ws/ec/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/V2/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/tests/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        "/test/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php",
+        # Common attack paths
+        "/hello.world",
+        "/.env",
+        "/wp-admin/",
+        "/wp-login.php",
+        "/admin/",
+        "/phpmyadmin/",
+        "/mysql/",
+        "/config.php",
+        "/wp-config.php",
+        "/xmlrpc.php",
+    }
+)
+
+
+@dataclass(frozen=True)
+class AttackRule:
+    """
+    One detection rule, matched against lower-cased text.
+
+    Each alternative in ``patterns`` must start with a literal character:
+    sre then rejects a non-matching branch of the combined alternation with a
+    single compare, which is what makes the one-pass scan cheap.
+    """
+
+    rule_id: str
+    severity: str
+    description: str
+    patterns: Tuple[str, ...]
+    components: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class AttackMatch:
+    """The rule that matched and where"""
+
+    rule_id: str
+    severity: str
+    description: str
+    component: str
+    matched: str
+
+
+def _rule(rule_id: str, severity: str, description: str, patterns: Tuple[str, ...], *components: str):
+    return AttackRule(rule_id, severity, description, patterns, frozenset(components))
+
+
+_COMMANDS = r"\s*(?:cat|ls|pwd|whoami|id|uname)\b"
+
+# Ordered by severity: at any one position the first matching rule wins
+ATTACK_RULES: Tuple[AttackRule, ...] = (
+    _rule(
+        "phpunit_rce", "HIGH", "PHPUnit RCE attack detected",
+        (r"phpunit/(?:phpunit/)?(?:src/)?util/php/eval-stdin\.php",), PATH,
+    ),
+    _rule(
+        "wordpress_probe", "HIGH", "WordPress attack detected",
+        (r"wp-admin/", r"wp-login\.php", r"wp-config\.php", r"xmlrpc\.php"), PATH,
+    ),
+    _rule("php_file", "HIGH", "PHP file request blocked", (r"\.php$",), PATH),
+    _rule(
+        "php_rfi", "HIGH", "PHP remote file inclusion attempt",
+        (
+            r"allow_url_include\s*=\s*1",
+            r"auto_prepend_file\s*=\s*php://",
+            r"php://(?:input|filter)",
+            r"data://",
+            r"expect://",
+        ),
+        PATH, QUERY, HEADER,
+    ),
+    _rule(
+        "sql_injection", "HIGH", "SQL injection attempt",
+        (r"union\s+select", r"drop\s+table", r"delete\s+from", r"insert\s+into"), PATH, QUERY, HEADER,
+    ),
+    _rule(
+        "admin_probe", "MEDIUM", "Admin/config file attack detected",
+        (r"phpmyadmin/", r"admin/", r"panel/", r"\.env"), PATH,
+    ),
+    _rule(
+        "xss", "MEDIUM", "Cross-site scripting attempt",
+        # on<event>= only at a word start (the lookbehind stands in for \b)
+        (r"<script[^>]*>", r"javascript:", r"o(?<![a-z0-9_]o)n[a-z]+\s*="), PATH, QUERY, HEADER,
+    ),
+    _rule(
+        "shell_command", "MEDIUM", "Command injection attempt",
+        (";" + _COMMANDS, r"\|" + _COMMANDS, "&&" + _COMMANDS), PATH, QUERY, HEADER,
+    ),
+    _rule(
+        "path_traversal", "MEDIUM", "Path traversal attempt",
+        (r"\.\./", r"\.\.\\", r"%2e%2e%2f", r"%2e%2e%5c"), PATH, QUERY, HEADER,
+    ),
+    _rule("sql_update", "LOW", "SQL update statement", (r"update\s+.*\s+set",), PATH, QUERY),
+    _rule("code_eval", "LOW", "Code evaluation attempt", (r"eval\s*\(",), PATH, QUERY),
+    _rule("shell_metachar", "LOW", "Shell metacharacter", (";", r"\|", "`", r"\$\(", r"\$\{"), PATH, QUERY),
+)
+
+# Encoded dots and slashes that a double-encoded path still carries after ASGI decoding
+_ENCODED_SEPARATORS = re.compile(r"%(2e|2f|5c)")
+_SEPARATOR_CHARS = {"2e": ".", "2f": "/", "5c": "\\"}
+
+
+def _decode_separators(path: str) -> str:
+    if "%" not in path:
+        return path
+    return _ENCODED_SEPARATORS.sub(lambda m: _SEPARATOR_CHARS[m.group(1)], path)
+
+
+class AttackMatcher:
+    """
+    One compiled alternation per request component over ``ATTACK_RULES``.
+
+    The combined pattern has no named groups (their mark ops would defeat
+    sre's literal branch skip); when it hits, the rule is identified by
+    re-matching the component's rules in order at that position, which only
+    happens for suspicious requests.
+    """
+
+    def __init__(
+        self, rules: Iterable[AttackRule] = ATTACK_RULES, blocked_paths: Iterable[str] = BLOCKED_PATHS
+    ):
+        self.rules: Tuple[AttackRule, ...] = tuple(rules)
+        self.blocked_paths = frozenset(blocked_paths)
+        self._rule_patterns: Dict[str, Pattern] = {
+            rule.rule_id: re.compile("|".join(rule.patterns)) for rule in self.rules
+        }
+        self._component_rules: Dict[str, Tuple[AttackRule, ...]] = {}
+        self._patterns: Dict[str, Pattern] = {}
+        for component in (PATH, QUERY, HEADER):
+            component_rules = tuple(rule for rule in self.rules if component in rule.components)
+            self._component_rules[component] = component_rules
+            self._patterns[component] = re.compile(
+                "|".join(pattern for rule in component_rules for pattern in rule.patterns)
+            )
+
+    def _identify(self, component: str, text: str, position: int) -> AttackMatch:
+        for rule in self._component_rules[component]:
+            found = self._rule_patterns[rule.rule_id].match(text, position)
+            if found:
+                return AttackMatch(rule.rule_id, rule.severity, rule.description, component, found.group())
+        raise AssertionError(f"no {component} rule matches at {position}")
+
+    def _scan(self, component: str, text: str, find_all: bool) -> List[AttackMatch]:
+        matches = []
+        best_rank = 0
+        for found in self._patterns[component].finditer(text):
+            attack = self._identify(component, text, found.start())
+            rank = SEVERITY_RANK[attack.severity]
+            if find_all or rank > best_rank:
+                matches.append(attack)
+                best_rank = max(best_rank, rank)
+                if not find_all and rank == SEVERITY_RANK["HIGH"]:
+                    break
+        return matches
+
+    def _components(self, path: str, query_string: str, headers: Optional[Mapping[str, str]]):
+        yield PATH, _decode_separators(path.lower())
+        if query_string:
+            if "%" in query_string or "+" in query_string:
+                query_string = unquote_plus(query_string)
+            yield QUERY, query_string.lower()
+        if headers:
+            for name in SCANNED_HEADERS:
+                value = headers.get(name)
+                if value:
+                    yield HEADER, value.lower()
+
+    def match_all(
+        self, path: str, query_string: str = "", headers: Optional[Mapping[str, str]] = None
+    ) -> List[AttackMatch]:
+        """Every rule hit in the request, in scan order"""
+        matches = []
+        if path in self.blocked_paths:
+            matches.append(AttackMatch("blocked_path", "HIGH", "Known malicious path", PATH, path))
+        for component, text in self._components(path, query_string, headers):
+            matches.extend(self._scan(component, text, find_all=True))
+        return matches
+
+    def match(
+        self, path: str, query_string: str = "", headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[AttackMatch]:
+        """The most severe rule hit (earliest on ties), or None for a clean request"""
+        if path in self.blocked_paths:
+            return AttackMatch("blocked_path", "HIGH", "Known malicious path", PATH, path)
+
+        best: Optional[AttackMatch] = None
+        for component, text in self._components(path, query_string, headers):
+            for found in self._scan(component, text, find_all=False):
+                if best is None or SEVERITY_RANK[found.severity] > SEVERITY_RANK[best.severity]:
+                    best = found
+            if best is not None and best.severity == "HIGH":
+                break
+        return best
+
+
+# Global matcher instance
+_attack_matcher: Optional[AttackMatcher] = None
+
+
+def get_attack_matcher() -> AttackMatcher:
+    """Get or create the shared attack matcher"""
+    global _attack_matcher
+    if _attack_matcher is None:
+        _attack_matcher = AttackMatcher()
+    return _attack_matcher
@@ -4,21 +4,25 @@ Discord OAuth for web interface and bot permission checking.
 """
 
 import os
-import httpx
 import discord
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from fastapi import HTTPException, Depends, Request
 from fastapi.security import HTTPBearer
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import pytz
 from sqlalchemy import select
 
 try:
     from .database import get_async_db_session, get_db_session, User, AsyncDatabaseNotConfiguredError
+    from .http_clients import get_http_client_registry
 except ImportError:
     from database import get_async_db_session, get_db_session, User, AsyncDatabaseNotConfiguredError  # type: ignore
+    from http_clients import get_http_client_registry  # type: ignore
 
 # Discord OAuth settings
 DISCORD_CLIENT_ID = os.getenv("DISCORD_CLIENT_ID")
@@ -27,6 +31,10 @@ DISCORD_REDIRECT_URI = os.getenv(
     "DISCORD_REDIRECT_URI", "http://localhost:8000/auth/callback"
 )
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-this")
+AUTH_TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+
+# request.state attribute holding the user authenticated by the middleware
+AUTH_STATE_ATTR = "auth_user"
 
 # Discord API endpoints
 DISCORD_API_BASE = "https://discord.com/api/v10"
@@ -101,33 +109,33 @@ async def exchange_code_for_token(code: str) -> Dict[str, Any]:
     }
     headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-    async with httpx.AsyncClient() as client:
-        response = await client.post(DISCORD_TOKEN_URL, data=data, headers=headers)
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=400, detail="Failed to exchange code for token"
-            )
-        return response.json()
+    response = await get_http_client_registry().post(DISCORD_TOKEN_URL, data=data, headers=headers)
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=400, detail="Failed to exchange code for token"
+        )
+    return response.json()
 
 
 async def get_discord_user(access_token: str) -> DiscordUser:
     """Get Discord user info and guilds"""
     headers = {"Authorization": f"Bearer {access_token}"}
 
-    async with httpx.AsyncClient() as client:
-        # Get user info
-        user_response = await client.get(DISCORD_USER_URL, headers=headers)
-        if user_response.status_code != 200:
-            raise HTTPException(status_code=400, detail="Failed to get user info")
-        user_data = user_response.json()
+    client = get_http_client_registry()
 
-        # Get user guilds
-        guilds_response = await client.get(DISCORD_GUILDS_URL, headers=headers)
-        if guilds_response.status_code != 200:
-            raise HTTPException(status_code=400, detail="Failed to get user guilds")
-        guilds_data = guilds_response.json()
+    # Get user info
+    user_response = await client.get(DISCORD_USER_URL, headers=headers)
+    if user_response.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to get user info")
+    user_data = user_response.json()
 
-        return DiscordUser(user_data, guilds_data)
+    # Get user guilds
+    guilds_response = await client.get(DISCORD_GUILDS_URL, headers=headers)
+    if guilds_response.status_code != 200:
+        raise HTTPException(status_code=400, detail="Failed to get user guilds")
+    guilds_data = guilds_response.json()
+
+    return DiscordUser(user_data, guilds_data)
 
 
 def create_access_token(user: DiscordUser) -> str:
@@ -142,13 +150,99 @@ def create_access_token(user: DiscordUser) -> str:
     return jwt.encode(to_encode, SECRET_KEY, algorithm="HS256")
 
 
+def user_from_payload(payload: Dict[str, Any]) -> DiscordUser:
+    """Build a DiscordUser from verified token claims"""
+    user_data = {"id": payload["sub"], "username": payload["username"]}
+    # Mock guilds data from token
+    guilds_data = [
+        {"id": guild_id, "permissions": "32"}
+        for guild_id in payload.get("admin_guilds", [])
+    ]
+    return DiscordUser(user_data, guilds_data)
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified tokens keyed by SHA-256 digest.
+    A hit skips HMAC verification and user construction until the token's exp.
+    """
+
+    def __init__(self, max_size: int = AUTH_TOKEN_CACHE_SIZE):
+        self.max_size = max_size
+        # digest -> (exp, payload, user), least recently used first
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any], DiscordUser]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def verify(self, token: str) -> Optional[Tuple[Dict[str, Any], DiscordUser]]:
+        """Claims and user for a valid token, or None"""
+        key = hashlib.sha256(token.encode()).digest()
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.time():
+                self.hits += 1
+                try:
+                    self._entries.move_to_end(key)
+                except KeyError:
+                    pass
+                return entry[1], entry[2]
+            self._entries.pop(key, None)
+
+        self.misses += 1
+        try:
+            payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+            user = user_from_payload(payload)
+        except (JWTError, KeyError, TypeError):
+            self.rejected += 1
+            return None
+
+        exp = payload.get("exp")
+        if self.max_size > 0 and isinstance(exp, (int, float)):
+            self._entries[key] = (float(exp), payload, user)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return payload, user
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "rejected": self.rejected,
+            "evictions": self.evictions,
+        }
+
+
+# Global verified token cache
+_token_cache: Optional[VerifiedTokenCache] = None
+
+
+def get_token_cache() -> VerifiedTokenCache:
+    """Get or create the verified token cache"""
+    global _token_cache
+    if _token_cache is None:
+        _token_cache = VerifiedTokenCache()
+    return _token_cache
+
+
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """Verify JWT token"""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-        return payload
-    except JWTError:
-        return None
+    verified = get_token_cache().verify(token)
+    return verified[0] if verified else None
+
+
+def authenticate_token(token: str) -> Optional[DiscordUser]:
+    """User for a valid JWT token, or None"""
+    verified = get_token_cache().verify(token)
+    return verified[1] if verified else None
 
 
 async def get_current_user(
@@ -156,25 +250,21 @@ async def get_current_user(
 ) -> Optional[DiscordUser]:
     """Get current authenticated user"""
     if not token:
+        # Reuse the session the middleware already verified
+        user = getattr(request.state, AUTH_STATE_ATTR, None)
+        if user is not None:
+            return user
+
         # Try to get token from cookie
         token_str = request.cookies.get("access_token")
         if not token_str:
             return None
-    else:
-        token_str = token.credentials
-
-    payload = verify_token(token_str)
-    if not payload:
-        return None
+        user = authenticate_token(token_str)
+        if user is not None:
+            setattr(request.state, AUTH_STATE_ATTR, user)
+        return user
 
-    # Create DiscordUser from token payload
-    user_data = {"id": payload["sub"], "username": payload["username"]}
-    # Mock guilds data from token
-    guilds_data = [
-        {"id": guild_id, "permissions": "32"}
-        for guild_id in payload.get("admin_guilds", [])
-    ]
-    return DiscordUser(user_data, guilds_data)
+    return authenticate_token(token.credentials)
 
 
 async def require_auth(
@@ -12,6 +12,9 @@ from sqlalchemy import (
     DateTime,
     ForeignKey,
     Boolean,
+    Index,
+    event,
+    inspect as sa_inspect,
 )
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -21,15 +24,25 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 from sqlalchemy.sql import func
-from typing import AsyncIterator, List, Optional
+from typing import AsyncIterator, Callable, Dict, List, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from decouple import config
+import asyncio
+import functools
 import json
 import logging
+import os
 import pytz
 import threading
+import traceback
 from datetime import datetime
 
+try:
+    from .migrations import POLL_TALLY_TRIGGERS_SQL, POLL_TOTAL_TALLY_INDEX
+except ImportError:
+    from migrations import POLL_TALLY_TRIGGERS_SQL, POLL_TOTAL_TALLY_INDEX  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,7 +98,69 @@ class TypeSafeColumn:
 
 # Database setup
 DATABASE_URL = config("DATABASE_URL", default="sqlite:///./db/polly.db")
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+
+# SQLite production profile, applied to every new connection (sync and async)
+SQLITE_WAL = config("DB_SQLITE_WAL", default=True, cast=bool)
+SQLITE_SYNCHRONOUS = config("DB_SQLITE_SYNCHRONOUS", default="NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = config("DB_SQLITE_BUSY_TIMEOUT_MS", default=5000, cast=int)
+SQLITE_CACHE_SIZE_KB = config("DB_SQLITE_CACHE_SIZE_KB", default=20000, cast=int)
+SQLITE_MMAP_SIZE = config("DB_SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int)
+
+
+def sqlite_pragmas() -> List[str]:
+    """PRAGMA statements run on each new SQLite connection"""
+    pragmas = [
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}",
+        # Negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+    if SQLITE_WAL:
+        # WAL lets readers run alongside the single writer instead of failing
+        # with "database is locked" during vote bursts
+        pragmas.insert(0, "PRAGMA journal_mode=WAL")
+    return pragmas
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in sqlite_pragmas():
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def create_db_engine(url: str, is_async: bool = False, **kwargs):
+    """Create a sync or async engine with Polly's connection settings.
+
+    Both the sync ``engine`` and the lazily built async engine come from here,
+    so SQLite connections always get the same pragmas (WAL, busy_timeout,
+    synchronous, cache/mmap sizes) whichever session type opens them.
+    """
+    is_sqlite = url.startswith("sqlite")
+    if is_sqlite:
+        connect_args = kwargs.pop("connect_args", {})
+        connect_args.setdefault("check_same_thread", False)
+        # sqlite3's own lock wait, in seconds (busy_timeout covers the rest)
+        connect_args.setdefault("timeout", SQLITE_BUSY_TIMEOUT_MS / 1000)
+        kwargs["connect_args"] = connect_args
+    else:
+        kwargs.setdefault("pool_pre_ping", True)
+        kwargs.setdefault("pool_size", config("DB_POOL_SIZE", default=5, cast=int))
+        kwargs.setdefault("max_overflow", config("DB_MAX_OVERFLOW", default=10, cast=int))
+        kwargs.setdefault("pool_recycle", config("DB_POOL_RECYCLE", default=3600, cast=int))
+
+    new_engine = create_async_engine(url, **kwargs) if is_async else create_engine(url, **kwargs)
+    if is_sqlite:
+        sync_engine = new_engine.sync_engine if is_async else new_engine
+        event.listen(sync_engine, "connect", _apply_sqlite_pragmas)
+    return new_engine
+
+
+engine = create_db_engine(DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -191,12 +266,7 @@ def _build_async_engine():
                 f"Current value (password redacted): {_safe_url(ASYNC_DATABASE_URL)}"
             )
 
-        connect_args = (
-            {"check_same_thread": False}
-            if ASYNC_DATABASE_URL.startswith("sqlite")
-            else {}
-        )
-        _async_engine = create_async_engine(ASYNC_DATABASE_URL, connect_args=connect_args)
+        _async_engine = create_db_engine(ASYNC_DATABASE_URL, is_async=True)
         _AsyncSessionLocal = async_sessionmaker(
             _async_engine, class_=AsyncSession, expire_on_commit=False, autoflush=False
         )
@@ -230,6 +300,14 @@ class Poll(Base):
     """Poll model with name, question, options, and scheduling"""
 
     __tablename__ = "polls"
+    # Mirrors migrations 12 (add_hot_path_indexes) and 14 (add_poll_due_time_indexes)
+    __table_args__ = (
+        Index("ix_polls_creator_status_created", "creator_id", "status", "created_at"),
+        Index("ix_polls_status_created", "status", "created_at"),
+        Index("ux_polls_message_id", "message_id", unique=True),
+        Index("ix_polls_status_open_time", "status", "open_time"),
+        Index("ix_polls_status_close_time", "status", "close_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(255), nullable=False)
@@ -280,6 +358,10 @@ class Poll(Base):
         order_by="Vote.voted_at.desc()",
     )
 
+    # Per-option counts maintained by database triggers (migration 13).
+    # Read-only from the ORM; load with ``selectinload(Poll.tallies)``.
+    tallies = relationship("PollTally", viewonly=True)
+
     @property
     def options(self) -> List[str]:
         """Get poll options as Python list"""
@@ -306,9 +388,27 @@ class Poll(Base):
         """Set poll emojis from Python list"""
         self.emojis_json = json.dumps(value)
 
+    def _tallies_by_option(self) -> Optional[Dict[int, "PollTally"]]:
+        """Tally rows keyed by option_index, or None to count loaded votes instead"""
+        state = sa_inspect(self)
+        if not state.has_identity:
+            # Not flushed yet, so the votes only exist in memory
+            return None
+        if "tallies" in state.unloaded and "votes" not in state.unloaded:
+            # Votes are already loaded; counting them avoids another query
+            return None
+        return {tally.option_index: tally for tally in self.tallies}
+
     def get_results(self):
         """Get vote counts for each option"""
         results = {i: 0 for i in range(len(self.options))}
+        tallies = self._tallies_by_option()
+        if tallies is not None:
+            for option_index in results:
+                if option_index in tallies:
+                    results[option_index] = tallies[option_index].count
+            return results
+
         for vote in self.votes:
             if vote.option_index in results:
                 results[vote.option_index] += 1
@@ -316,6 +416,13 @@ class Poll(Base):
 
     def get_total_votes(self):
         """Get total number of votes (unique users for multiple choice, total votes for single choice)"""
+        tallies = self._tallies_by_option()
+        if tallies is not None:
+            total = tallies.get(POLL_TOTAL_TALLY_INDEX)
+            if total is None:
+                return 0
+            return total.unique_voters if bool(self.multiple_choice) else total.count
+
         if bool(self.multiple_choice):
             # For multiple choice, count unique users who voted
             unique_users = set(vote.user_id for vote in self.votes)
@@ -326,6 +433,10 @@ class Poll(Base):
 
     def get_total_vote_count(self):
         """Get total number of individual votes cast (regardless of poll type)"""
+        tallies = self._tallies_by_option()
+        if tallies is not None:
+            total = tallies.get(POLL_TOTAL_TALLY_INDEX)
+            return total.count if total is not None else 0
         return len(self.votes)
 
     def get_winner(self):
@@ -367,6 +478,11 @@ class Vote(Base):
     """Vote model linking users to poll options"""
 
     __tablename__ = "votes"
+    # Mirrors migration 12 (add_hot_path_indexes)
+    __table_args__ = (
+        Index("ux_votes_poll_user_option", "poll_id", "user_id", "option_index", unique=True),
+        Index("ix_votes_poll_voted_at", "poll_id", "voted_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     poll_id = Column(Integer, ForeignKey("polls.id"), nullable=False)
@@ -378,6 +494,27 @@ class Vote(Base):
     poll = relationship("Poll", back_populates="votes")
 
 
+class PollTally(Base):
+    """Vote count per poll option, kept current by triggers on the votes table"""
+
+    __tablename__ = "poll_tallies"
+
+    poll_id = Column(Integer, ForeignKey("polls.id"), primary_key=True)
+    # Option index, or POLL_TOTAL_TALLY_INDEX for the whole-poll totals row
+    option_index = Column(Integer, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    unique_voters = Column(Integer, nullable=False, default=0)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_poll_tally_triggers(target, connection, **kw):
+    """Install the poll_tallies triggers when tables come from create_all"""
+    if connection.dialect.name != "sqlite":
+        return
+    for sql in POLL_TALLY_TRIGGERS_SQL:
+        connection.exec_driver_sql(sql)
+
+
 class User(Base):
     """User model for web authentication"""
 
@@ -503,6 +640,102 @@ def get_db_session():
     return SessionLocal()
 
 
+# Bounded thread pool for sync Session work called from coroutines, so slow
+# queries/commits don't block the event loop (gateway heartbeat, HTTP requests)
+DB_THREAD_POOL_SIZE = config("DB_THREAD_POOL_SIZE", default=4, cast=int)
+_db_executor: Optional[ThreadPoolExecutor] = None
+_db_executor_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def _get_db_executor() -> ThreadPoolExecutor:
+    global _db_executor
+    if _db_executor is None:
+        with _db_executor_lock:
+            if _db_executor is None:
+                _db_executor = ThreadPoolExecutor(
+                    max_workers=max(1, DB_THREAD_POOL_SIZE),
+                    thread_name_prefix="polly-db",
+                )
+    return _db_executor
+
+
+async def run_db(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run blocking database code on the DB thread pool and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_db_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def run_in_db_session(func: Callable[..., T]) -> T:
+    """Run ``func(db)`` with a fresh sync session on the DB thread pool.
+
+    The session is opened, rolled back on error and closed on the worker
+    thread. Returned ORM objects are detached but keep their loaded columns;
+    eager-load any relationships the caller needs.
+    """
+
+    def work():
+        db = SessionLocal()
+        try:
+            return func(db)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    return await run_db(work)
+
+
+# Debug guard: report sync Session queries executed on the event loop thread
+DB_LOOP_GUARD = config("DB_LOOP_GUARD", default=config("DEBUG", default=False, cast=bool), cast=bool)
+_loop_guard_sites: Dict[str, int] = {}
+_POLLY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _blocking_call_site() -> str:
+    """First Polly frame (outside this module) on the current stack"""
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        if frame.filename.startswith(_POLLY_DIR) and not frame.filename.endswith("database.py"):
+            return f"{os.path.relpath(frame.filename, _POLLY_DIR)}:{frame.lineno} in {frame.name}"
+    return "unknown"
+
+
+def _warn_if_on_event_loop(conn, cursor, statement, parameters, context, executemany):
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Worker thread or sync context: fine
+
+    site = _blocking_call_site()
+    count = _loop_guard_sites.get(site, 0) + 1
+    _loop_guard_sites[site] = count
+    # Log each call site once, then every 100th hit, to keep the log readable
+    if count == 1 or count % 100 == 0:
+        logger.warning(
+            f"🐢 DB LOOP GUARD - Blocking sync query on the event loop ({count}x) at {site}: "
+            f"{statement.split(chr(10))[0][:120]}"
+        )
+
+
+def install_db_loop_guard() -> None:
+    """Log sync engine queries that run on the event loop thread (debug aid)"""
+    if not event.contains(engine, "before_cursor_execute", _warn_if_on_event_loop):
+        event.listen(engine, "before_cursor_execute", _warn_if_on_event_loop)
+
+
+def get_db_loop_guard_stats() -> Dict[str, int]:
+    """Blocking call sites seen by the loop guard and how often they ran"""
+    return dict(_loop_guard_sites)
+
+
+if DB_LOOP_GUARD:
+    install_db_loop_guard()
+
+
 # Emoji mapping for poll reactions
 POLL_EMOJIS = ["🇦", "🇧", "🇨", "🇩", "🇪", "🇫", "🇬", "🇭", "🇮", "🇯"]
 
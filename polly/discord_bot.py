@@ -8,9 +8,10 @@ import logging
 import discord
 from discord.ext import commands
 try:
-    from .database import get_db_session, Poll, POLL_EMOJIS, TypeSafeColumn
-    from .discord_utils import update_poll_message
+    from .database import get_db_session, run_db, Poll, POLL_EMOJIS, TypeSafeColumn
+    from .poll_message_updater import request_poll_message_update
     from .error_handler import PollErrorHandler, setup_automatic_bot_owner_notifications, set_bot_for_automatic_notifications
+    from .recovery_executor import get_discord_rate_budget
 except ImportError:
     ############### Temporary fix for import issues during testing ################
     import sys
@@ -18,9 +19,10 @@ except ImportError:
     current_dir = pathlib.Path(__file__).parent.resolve()
     sys.path.append(str(current_dir))
     ###############################################################################
-    from database import get_db_session, Poll, POLL_EMOJIS, TypeSafeColumn  # type: ignore
-    from discord_utils import update_poll_message  # type: ignore
+    from database import get_db_session, run_db, Poll, POLL_EMOJIS, TypeSafeColumn  # type: ignore
+    from poll_message_updater import request_poll_message_update  # type: ignore
     from error_handler import PollErrorHandler, setup_automatic_bot_owner_notifications, set_bot_for_automatic_notifications  # type: ignore
+    from recovery_executor import get_discord_rate_budget  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +37,12 @@ intents.message_content = True
 intents.guilds = True
 intents.reactions = True
 
-bot = commands.Bot(command_prefix=lambda bot, message: None, intents=intents)
+# The HTTP trace feeds Discord's rate-limit headers to the startup recovery budget
+bot = commands.Bot(
+    command_prefix=lambda bot, message: None,
+    intents=intents,
+    http_trace=get_discord_rate_budget().trace_config(),
+)
 
 
 @bot.event
@@ -130,19 +137,47 @@ async def on_error(event, *args, **kwargs):
     logger.error(''.join(traceback.format_exception(exc_type, exc_value, exc_traceback)))
 
 
+@bot.event
+async def on_raw_reaction_add(payload):
+    """Flag the message for the reaction reconciler.
+
+    Fires for every reaction, including on messages that are not in the
+    message cache (where ``on_reaction_add`` never runs). Reactions on
+    messages that are not known poll messages are dropped; for polls the
+    reconciler rescans the message after a grace period and picks up
+    anything ``on_reaction_add`` did not handle.
+    """
+    if bot.user and payload.user_id == bot.user.id:
+        return
+
+    try:
+        from .reaction_reconciler import get_reaction_reconciler
+
+        get_reaction_reconciler().on_raw_reaction(payload.message_id)
+    except Exception as e:
+        logger.warning(f"Error flagging message {payload.message_id} for reconciliation: {e}")
+
+
+def _find_poll_by_message_id(message_id: str):
+    """Blocking poll lookup; run via run_db so the gateway loop never waits on SQLite"""
+    db = get_db_session()
+    try:
+        return db.query(Poll).filter(Poll.message_id == message_id).first()
+    finally:
+        db.close()
+
+
 @bot.event
 async def on_reaction_add(reaction, user):
     """Handle poll voting via reactions using bulletproof operations"""
     if user.bot:
         return
 
-    # Check if this is a poll message
-    db = get_db_session()
+    # Check if this is a poll message (looked up on the DB thread pool)
+    message_id = str(reaction.message.id)
     poll = None  # Initialize poll variable
     try:
-        poll = (
-            db.query(Poll).filter(Poll.message_id == str(reaction.message.id)).first()
-        )
+        poll = await run_db(_find_poll_by_message_id, message_id)
         if not poll or TypeSafeColumn.get_string(poll, "status") != "active":
             return
 
@@ -172,7 +207,7 @@ async def on_reaction_add(reaction, user):
         if result["success"]:
             # Vote was successfully recorded - handle reaction based on poll type and anonymity
             vote_action = result.get("action", "unknown")
-            logger.info(f"🔔 DM DEBUG - Vote processing successful, vote_action: {vote_action}, poll_id: {poll_id}, user: {user.id}")
+            logger.debug(f"🔔 DM DEBUG - Vote processing successful, vote_action: {vote_action}, poll_id: {poll_id}, user: {user.id}")
 
             # Check poll properties safely using TypeSafeColumn
             is_anonymous = TypeSafeColumn.get_bool(poll, "anonymous", False)
@@ -210,12 +245,12 @@ async def on_reaction_add(reaction, user):
             try:
                 from .discord_utils import send_vote_confirmation_dm
 
-                logger.info(f"🔔 DM DEBUG - About to call send_vote_confirmation_dm for vote_action: {vote_action} to user {user.id}")
-                logger.info(f"🔔 DM DEBUG - Parameters: poll_id={poll_id}, user_id={user.id}, option_index={option_index}, vote_action={vote_action}")
+                logger.debug(f"🔔 DM DEBUG - About to call send_vote_confirmation_dm for vote_action: {vote_action} to user {user.id}")
+                logger.debug(f"🔔 DM DEBUG - Parameters: poll_id={poll_id}, user_id={user.id}, option_index={option_index}, vote_action={vote_action}")
                 dm_sent = await send_vote_confirmation_dm(
                     bot, poll, str(user.id), option_index, vote_action
                 )
-                logger.info(f"🔔 DM DEBUG - send_vote_confirmation_dm returned: {dm_sent}")
+                logger.debug(f"🔔 DM DEBUG - send_vote_confirmation_dm returned: {dm_sent}")
                 if dm_sent:
                     logger.info(
                         f"✅ Vote confirmation DM sent to user {user.id} for poll {poll_id} (action: {vote_action})"
@@ -230,13 +265,13 @@ async def on_reaction_add(reaction, user):
                 )
                 # Don't fail the vote process if DM fails
 
-            # Always update poll embed for live updates (key requirement)
+            # Always update poll embed for live updates (key requirement).
+            # Coalesced per poll so a burst of votes produces one edit per window.
             try:
-                await update_poll_message(bot, poll)
-                logger.debug(f"✅ Poll message updated for poll {poll_id}")
+                request_poll_message_update(bot, poll_id)
             except Exception as update_error:
                 logger.error(
-                    f"❌ Failed to update poll message for poll {poll_id}: {update_error}"
+                    f"❌ Failed to queue poll message update for poll {poll_id}: {update_error}"
                 )
         else:
             # Vote failed - do NOT remove reaction, log the error
@@ -260,8 +295,6 @@ async def on_reaction_add(reaction, user):
             logger.error(
                 f"Critical error in vote error handling: {error_handling_error}"
             )
-    finally:
-        db.close()
 
 
 async def start_bot():
@@ -0,0 +1,238 @@
+"""
+Polly Discord User Resolver
+Batched username/avatar lookup for every voter on a poll.
+
+Dashboards, CSV exports and static pages need display data for all voters at
+once. Instead of one cache read and one ``fetch_user`` call per vote, the
+resolver deduplicates the IDs, bulk-reads the Redis user cache with one MGET,
+takes whatever the bot's user and guild member caches already hold, and only
+then fetches the remainder from the Discord API concurrently. Those fetches
+share one process-wide budget (a concurrency cap plus a minimum spacing
+between requests) so several pages rendering at once can't stampede the API.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+
+def fallback_username(user_id: str) -> str:
+    """Placeholder name shown when a user can't be resolved"""
+    return f"User {user_id[:8]}..." if user_id else "Unknown User"
+
+
+def _user_data(user) -> Dict[str, Any]:
+    return {
+        "username": user.display_name or user.name,
+        "avatar_url": user.avatar.url if user.avatar else None,
+        "cached_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+class DiscordUserResolver:
+    """Resolves many Discord user IDs to ``{"username", "avatar_url"}`` in one call"""
+
+    def __init__(self):
+        # Configuration
+        self.max_concurrent_fetches = max(
+            1, config("DISCORD_USER_FETCH_CONCURRENCY", default=5, cast=int)
+        )
+        self.max_fetches_per_second = config(
+            "DISCORD_USER_FETCH_RATE", default=20.0, cast=float
+        )
+
+        # Shared fetch budget, created on first use inside the running loop
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_fetch_at = 0.0
+
+        # Metrics
+        self.batches = 0
+        self.users_requested = 0
+        self.redis_hits = 0
+        self.gateway_hits = 0
+        self.api_fetches = 0
+        self.api_failures = 0
+        self.fetches_in_flight = 0
+
+    def _budget(self) -> asyncio.Semaphore:
+        if self._fetch_semaphore is None:
+            self._fetch_semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+            self._rate_lock = asyncio.Lock()
+        return self._fetch_semaphore
+
+    async def _wait_for_rate_slot(self) -> None:
+        """Space API fetches at most ``max_fetches_per_second`` apart, process-wide"""
+        if self.max_fetches_per_second <= 0:
+            return
+        async with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_fetch_at - now
+            self._next_fetch_at = max(now, self._next_fetch_at) + 1.0 / self.max_fetches_per_second
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    async def _fetch_user(self, bot, user_id: str) -> Optional[Dict[str, Any]]:
+        async with self._budget():
+            await self._wait_for_rate_slot()
+            self.api_fetches += 1
+            self.fetches_in_flight += 1
+            try:
+                user = await bot.fetch_user(int(user_id))
+                return _user_data(user) if user else None
+            except Exception as e:
+                self.api_failures += 1
+                logger.warning(f"Could not fetch Discord user {user_id}: {e}")
+                return None
+            finally:
+                self.fetches_in_flight -= 1
+
+    def _from_gateway(self, bot, user_id: str, guild) -> Optional[Dict[str, Any]]:
+        """Look ``user_id`` up in the bot's in-memory caches (no API call)"""
+        try:
+            user = None
+            if guild is not None:
+                user = guild.get_member(int(user_id))
+            if user is None:
+                user = bot.get_user(int(user_id))
+            return _user_data(user) if user else None
+        except (ValueError, AttributeError):
+            return None
+
+    async def resolve_users(
+        self,
+        bot,
+        user_ids: Iterable[str],
+        guild_id: Optional[str] = None,
+        fetch_missing: bool = True,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Resolve ``user_ids`` to display data; unresolvable IDs are left out.
+
+        Lookup order per unique ID: Redis user cache, guild member cache,
+        bot user cache, then (if ``fetch_missing`` and the bot is ready) the
+        Discord API under the shared fetch budget. Newly resolved users are
+        written back to Redis in one pipelined call.
+        """
+        unique_ids: List[str] = list(dict.fromkeys(str(uid) for uid in user_ids if uid))
+        self.batches += 1
+        self.users_requested += len(unique_ids)
+        if not unique_ids:
+            return {}
+
+        from .services.cache.enhanced_cache_service import get_enhanced_cache_service
+
+        enhanced_cache = get_enhanced_cache_service()
+        try:
+            users = await enhanced_cache.get_cached_discord_users(unique_ids)
+        except Exception as e:
+            logger.warning(f"Discord user cache bulk read failed: {e}")
+            users = {}
+        self.redis_hits += len(users)
+
+        missing = [uid for uid in unique_ids if uid not in users]
+        if not missing or bot is None:
+            return users
+
+        guild = None
+        if guild_id:
+            try:
+                guild = bot.get_guild(int(guild_id))
+            except (ValueError, AttributeError):
+                guild = None
+
+        resolved: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for user_id in missing:
+            user_data = self._from_gateway(bot, user_id, guild)
+            if user_data:
+                resolved[user_id] = user_data
+            else:
+                to_fetch.append(user_id)
+        self.gateway_hits += len(resolved)
+
+        bot_ready = not hasattr(bot, "is_ready") or bot.is_ready()
+        if to_fetch and fetch_missing and bot_ready:
+            fetched = await asyncio.gather(
+                *(self._fetch_user(bot, user_id) for user_id in to_fetch)
+            )
+            for user_id, user_data in zip(to_fetch, fetched):
+                if user_data:
+                    resolved[user_id] = user_data
+        elif to_fetch and fetch_missing:
+            logger.warning(
+                f"Discord bot not ready, {len(to_fetch)} users left unresolved"
+            )
+
+        if resolved:
+            try:
+                await enhanced_cache.cache_discord_users(resolved)
+            except Exception as e:
+                logger.warning(f"Discord user cache bulk write failed: {e}")
+            users.update(resolved)
+
+        logger.debug(
+            f"👥 Resolved {len(users)}/{len(unique_ids)} Discord users "
+            f"({len(unique_ids) - len(missing)} cached, {len(to_fetch)} fetched)"
+        )
+        return users
+
+    async def cache_avatars(self, users: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Store resolved users' avatars locally; returns user_id -> cached avatar URL"""
+        from .services.cache.avatar_cache_service import get_avatar_cache_service
+
+        avatar_service = get_avatar_cache_service()
+        semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+        async def cache_one(user_id: str, user_data: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                try:
+                    return await avatar_service.cache_user_avatar(
+                        user_id, user_data["avatar_url"], user_data.get("username")
+                    )
+                except Exception as e:
+                    logger.warning(f"Error caching avatar for user {user_id}: {e}")
+                    return None
+
+        with_avatars = [
+            (user_id, user_data)
+            for user_id, user_data in users.items()
+            if user_data.get("avatar_url")
+        ]
+        cached = await asyncio.gather(
+            *(cache_one(user_id, user_data) for user_id, user_data in with_avatars)
+        )
+        return {
+            user_id: avatar_url
+            for (user_id, _), avatar_url in zip(with_avatars, cached)
+            if avatar_url
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "batches": self.batches,
+            "users_requested": self.users_requested,
+            "redis_hits": self.redis_hits,
+            "gateway_hits": self.gateway_hits,
+            "api_fetches": self.api_fetches,
+            "api_failures": self.api_failures,
+            "fetches_in_flight": self.fetches_in_flight,
+        }
+
+
+# Global resolver instance
+_discord_user_resolver: Optional[DiscordUserResolver] = None
+
+
+def get_discord_user_resolver() -> DiscordUserResolver:
+    """Get or create the Discord user resolver instance"""
+    global _discord_user_resolver
+    if _discord_user_resolver is None:
+        _discord_user_resolver = DiscordUserResolver()
+    return _discord_user_resolver
@@ -796,6 +796,12 @@ async def post_poll_to_channel(bot: commands.Bot, poll_or_id, message_content: s
                 setattr(poll_to_update, "message_id", str(message.id))
                 setattr(poll_to_update, "status", "active")
                 db.commit()
+                try:
+                    from .reaction_reconciler import get_reaction_reconciler
+
+                    get_reaction_reconciler().track(message.id)
+                except Exception as track_error:
+                    logger.warning(f"Could not register poll message {message.id} for reconciliation: {track_error}")
                 return {
                     "success": True,
                     "message_id": message.id,
@@ -839,15 +845,6 @@ async def update_poll_message(bot: commands.Bot, poll: Poll):
             logger.error(f"❌ UPDATE MESSAGE - Channel {poll_channel_id} is not a text channel for poll {poll_id}")
             return False
 
-        try:
-            message = await channel.fetch_message(int(str(poll_message_id)))
-        except discord.NotFound:
-            logger.error(f"❌ UPDATE MESSAGE - Poll message {poll_message_id} not found for poll {poll_id}")
-            return False
-        except Exception as fetch_error:
-            logger.error(f"❌ UPDATE MESSAGE - Error fetching message {poll_message_id} for poll {poll_id}: {fetch_error}")
-            return False
-
         # Update embed - ALWAYS show results for closed polls, regardless of anonymity
         poll_status = str(getattr(poll, "status", "unknown"))
         
@@ -857,7 +854,15 @@ async def update_poll_message(bot: commands.Bot, poll: Poll):
             show_results = bool(poll.should_show_results())
         
         embed = await create_poll_embed(poll, show_results=show_results)
-        await message.edit(embed=embed)
+
+        # Edit through a PartialMessage: no fetch_message round-trip, and the
+        # edit response carries the full message (including reactions)
+        partial_message = channel.get_partial_message(int(str(poll_message_id)))
+        try:
+            message = await partial_message.edit(embed=embed)
+        except discord.NotFound:
+            logger.error(f"❌ UPDATE MESSAGE - Poll message {poll_message_id} not found for poll {poll_id}")
+            return False
 
         # CRITICAL: Restore reactions for reopened polls
         if poll_status == "active":
@@ -1265,20 +1270,20 @@ async def send_vote_confirmation_dm(
         )
 
         # Check user's voting history for this poll to provide context
-        db = get_db_session()
         previous_votes = []
         try:
-            from .database import Vote
-            user_votes = (
-                db.query(Vote)
-                .filter(Vote.poll_id == getattr(poll, "id"), Vote.user_id == user_id)
-                .all()
+            from .database import Vote, run_in_db_session
+            poll_id = getattr(poll, "id")
+            previous_votes = await run_in_db_session(
+                lambda db: [
+                    row[0]
+                    for row in db.query(Vote.option_index)
+                    .filter(Vote.poll_id == poll_id, Vote.user_id == user_id)
+                    .all()
+                ]
             )
-            previous_votes = [vote.option_index for vote in user_votes]
         except Exception as e:
             logger.warning(f"Could not fetch previous votes for user {user_id}: {e}")
-        finally:
-            db.close()
 
         # Determine action message based on vote action and previous votes
         poll_multiple_choice = bool(getattr(poll, "multiple_choice", False))
@@ -1314,15 +1319,6 @@ async def send_vote_confirmation_dm(
             # Fallback for unknown actions
             action_description = f"🗳️ Your vote: {selected_emoji} **{selected_option}**"
 
-        # Check if user already had this exact vote (for better messaging)
-        had_this_vote_before = option_index in [v.option_index for v in (
-            db.query(Vote).filter(
-                Vote.poll_id == getattr(poll, "id"),
-                Vote.user_id == user_id,
-                Vote.option_index == option_index
-            ).all() if 'db' in locals() else []
-        )]
-
         # Add contextual information for repeated votes
         if vote_action == "added" and not poll_multiple_choice:
             # For single choice, "added" usually means first vote, but let's be explicit
@@ -1364,19 +1360,19 @@ async def send_vote_confirmation_dm(
         current_user_votes = []
 
         # Get current votes after the action
-        db = get_db_session()
         try:
-            from .database import Vote
-            current_votes = (
-                db.query(Vote)
-                .filter(Vote.poll_id == getattr(poll, "id"), Vote.user_id == user_id)
-                .all()
+            from .database import Vote, run_in_db_session
+            poll_id = getattr(poll, "id")
+            current_user_votes = await run_in_db_session(
+                lambda db: [
+                    row[0]
+                    for row in db.query(Vote.option_index)
+                    .filter(Vote.poll_id == poll_id, Vote.user_id == user_id)
+                    .all()
+                ]
             )
-            current_user_votes = [vote.option_index for vote in current_votes]
         except Exception as e:
             logger.warning(f"Could not fetch current votes for user {user_id}: {e}")
-        finally:
-            db.close()
 
         for i, option in enumerate(poll.options):
             emoji = poll.emojis[i] if i < len(poll.emojis) else POLL_EMOJIS[i]
@@ -4,13 +4,15 @@ Provides optimized database connection management with pooling and monitoring.
 """
 
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
 from decouple import config
 from typing import Generator
 
+try:
+    from .database import create_db_engine, engine, SessionLocal
+except ImportError:
+    from database import create_db_engine, engine, SessionLocal  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 # Enhanced database configuration with connection pooling
@@ -30,47 +32,24 @@ class DatabaseConfig:
         self.echo_sql = config("DB_ECHO", default=False, cast=bool)
         
     def create_engine(self):
-        """Create optimized database engine with connection pooling"""
-        
-        if self.database_url.startswith("sqlite"):
-            # SQLite-specific optimizations
-            engine = create_engine(
-                self.database_url,
-                connect_args={
-                    "check_same_thread": False,
-                    "timeout": 20,  # Prevent hanging connections
-                },
-                poolclass=QueuePool,
+        """Create a separate engine through the shared factory (same pragmas/pooling)"""
+        kwargs = {"echo": self.echo_sql}
+        if not self.database_url.startswith("sqlite"):
+            kwargs.update(
                 pool_size=self.pool_size,
                 max_overflow=self.max_overflow,
                 pool_timeout=self.pool_timeout,
                 pool_recycle=self.pool_recycle,
-                pool_pre_ping=True,  # Verify connections before use
-                echo=self.echo_sql,
             )
-        else:
-            # PostgreSQL/MySQL optimizations
-            engine = create_engine(
-                self.database_url,
-                poolclass=QueuePool,
-                pool_size=self.pool_size,
-                max_overflow=self.max_overflow,
-                pool_timeout=self.pool_timeout,
-                pool_recycle=self.pool_recycle,
-                pool_pre_ping=True,
-                echo=self.echo_sql,
-            )
-        
-        logger.info(f"🔧 DATABASE ENGINE - Created with pool_size={self.pool_size}, "
-                   f"max_overflow={self.max_overflow}, recycle={self.pool_recycle}s")
-        
-        return engine
+        return create_db_engine(self.database_url, **kwargs)
 
 
-# Global database configuration
+# Global database configuration. The optimized engine IS the application
+# engine from polly.database, so this module no longer opens a second pool
+# against the same SQLite file.
 db_config = DatabaseConfig()
-optimized_engine = db_config.create_engine()
-OptimizedSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=optimized_engine)
+optimized_engine = engine
+OptimizedSessionLocal = SessionLocal
 
 
 @contextmanager
@@ -6,10 +6,11 @@ and follow the same patterns as fresh instances.
 
 import asyncio
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional
 import pytz
 from dataclasses import dataclass
+from sqlalchemy import or_
 
 # Handle both relative and absolute imports for direct execution
 try:
@@ -355,64 +356,48 @@ class EnhancedRecoveryValidator:
             logger.error(f"Error validating reactions for poll: {e}")
     
     async def _validate_scheduled_operations(self):
-        """Validate that all scheduled operations are properly restored"""
+        """Validate that the poll schedule sweeper is running and nothing is overdue"""
         logger.info("🔍 PHASE 3 - Validating scheduled operations")
-        
-        scheduler = get_scheduler()
-        if not scheduler:
-            self.validation_errors.append("Scheduler not available")
-            return
-        
-        # Get all scheduled jobs
-        scheduled_jobs = scheduler.get_jobs()
-        job_poll_ids = set()
-        
-        for job in scheduled_jobs:
-            if hasattr(job, 'args') and job.args:
-                if isinstance(job.args[0], int):  # Poll ID
-                    job_poll_ids.add(job.args[0])
-        
-        self.metrics["scheduled_jobs_validated"] = len(scheduled_jobs)
-        
-        # Check database for polls that should have scheduled jobs
+
+        from .poll_schedule_sweeper import get_poll_schedule_sweeper
+
+        sweeper = get_poll_schedule_sweeper()
+        if not sweeper.get_stats()["running"]:
+            self.validation_errors.append("Poll schedule sweeper not running")
+            sweeper.start()
+            self.recovery_actions.append("Started poll schedule sweeper")
+            self.metrics["recovery_actions_executed"] += 1
+
+        # Polls are opened/closed from the database, so the only thing that can
+        # be "missing" is a poll left overdue well past its open/close time
         db = get_db_session()
         try:
-            now = datetime.now(pytz.UTC)
-            
-            # Scheduled polls that should have opening jobs
-            scheduled_polls = db.query(Poll).filter(
-                Poll.status == "scheduled",
-                Poll.open_time > now
-            ).all()
-            
-            # Active polls that should have closing jobs
-            active_polls = db.query(Poll).filter(
-                Poll.status == "active",
-                Poll.close_time > now
+            overdue_before = datetime.now(pytz.UTC) - timedelta(minutes=5)
+
+            pending_count = db.query(Poll).filter(
+                Poll.status.in_(["scheduled", "active"])
+            ).count()
+            overdue_polls = db.query(Poll.id).filter(
+                or_(
+                    (Poll.status == "scheduled") & (Poll.open_time <= overdue_before),
+                    Poll.status.in_(["scheduled", "active"]) & (Poll.close_time <= overdue_before),
+                )
             ).all()
-            
-            expected_job_poll_ids = set()
-            for poll in scheduled_polls + active_polls:
-                poll_id = TypeSafeColumn.get_int(poll, "id")
-                expected_job_poll_ids.add(poll_id)
-            
-            missing_jobs = expected_job_poll_ids - job_poll_ids
-            
-            if missing_jobs:
-                self.validation_errors.append(f"Missing scheduled jobs for polls: {missing_jobs}")
-                
-                # Restore missing jobs
-                from .background_tasks import restore_scheduled_jobs
-                await restore_scheduled_jobs()
-                
-                self.recovery_actions.append(f"Restored scheduled jobs for {len(missing_jobs)} polls")
-                self.metrics["recovery_actions_executed"] += len(missing_jobs)
-            
-            logger.info(f"✅ PHASE 3 - Validated {len(scheduled_jobs)} scheduled operations")
-            
+
+            self.metrics["scheduled_jobs_validated"] = pending_count
+
+            if overdue_polls:
+                overdue_ids = {row[0] for row in overdue_polls}
+                self.validation_errors.append(f"Overdue scheduled polls: {overdue_ids}")
+                sweeper.wake()
+                self.recovery_actions.append(f"Woke poll schedule sweeper for {len(overdue_ids)} overdue polls")
+                self.metrics["recovery_actions_executed"] += len(overdue_ids)
+
+            logger.info(f"✅ PHASE 3 - Validated {pending_count} scheduled operations")
+
         finally:
             db.close()
-    
+
     async def _validate_discord_message_consistency(self):
         """Validate Discord message consistency with database"""
         logger.info("🔍 PHASE 4 - Validating Discord message consistency")
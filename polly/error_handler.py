@@ -665,45 +665,13 @@ class PollErrorHandler:
                 try:
                     poll = db.query(Poll).filter(Poll.id == poll_id).first()
                     if poll:
-                        now = datetime.now(pytz.UTC)
-
-                        # Reschedule opening if needed using unified opening service
-                        poll_open_time = poll.open_time_aware
-                        if (
-                            str(poll.status) == "scheduled"
-                            and poll_open_time
-                            and poll_open_time > now
-                        ):
-                            from .background_tasks import open_poll_scheduled
-                            from apscheduler.triggers.date import DateTrigger
-
-                            scheduler.add_job(
-                                open_poll_scheduled,
-                                DateTrigger(run_date=poll.open_time_aware),
-                                args=[poll.id],
-                                id=f"open_poll_{poll.id}",
-                                replace_existing=True,
-                            )
-                            logger.info(f"Rescheduled opening for poll {poll_id} using unified service")
-
-                        # Reschedule closing if needed
-                        poll_close_time = poll.close_time_aware
-                        if (
-                            str(poll.status) in ["scheduled", "active"]
-                            and poll_close_time is not None
-                            and poll_close_time > now
-                        ):
-                            from .background_tasks import close_poll
-                            from apscheduler.triggers.date import DateTrigger
-
-                            scheduler.add_job(
-                                close_poll,
-                                DateTrigger(run_date=poll.close_time_aware),
-                                args=[poll.id],
-                                id=f"close_poll_{poll.id}",
-                                replace_existing=True,
-                            )
-                            logger.info(f"Rescheduled closing for poll {poll_id}")
+                        # Opening/closing is driven from the poll row by the
+                        # due-time sweeper; just make it re-read the schedule
+                        if str(poll.status) in ["scheduled", "active"]:
+                            from .poll_schedule_sweeper import get_poll_schedule_sweeper
+
+                            get_poll_schedule_sweeper().wake()
+                            logger.info(f"Woke poll schedule sweeper for poll {poll_id}")
 
                         # Notify bot owner of successful recovery
                         if bot:
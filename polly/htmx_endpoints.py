@@ -19,9 +19,8 @@ from pydantic import ValidationError as PydanticValidationError
 # Ensure UPLOADS_DIR is ALWAYS absolute and normalized
 UPLOADS_DIR = os.path.abspath(os.path.normpath("static/uploads"))
 from fastapi.templating import Jinja2Templates
-from apscheduler.triggers.date import DateTrigger
 
-from sqlalchemy import func, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import selectinload
 
 try:
@@ -45,6 +44,9 @@ try:
     from .debug_config import get_debug_logger
     from .data_utils import sanitize_data_for_json
     from .htmx_utils import htmx_target
+    from .poll_cards import PollCard, load_poll_cards
+    from .discord_user_resolver import fallback_username, get_discord_user_resolver
+    from .streaming_export import EXPORT_CHUNK_SIZE, CsvChunkEncoder, streaming_download, wants_gzip
     from .poll_request_models import (
         DEFAULT_TIMEZONE,
         TIMEZONE_ALIASES,
@@ -73,6 +75,9 @@ except ImportError:
     from debug_config import get_debug_logger  # type: ignore
     from data_utils import sanitize_data_for_json  # type: ignore
     from htmx_utils import htmx_target  # type: ignore
+    from poll_cards import PollCard, load_poll_cards  # type: ignore
+    from discord_user_resolver import fallback_username, get_discord_user_resolver  # type: ignore
+    from streaming_export import EXPORT_CHUNK_SIZE, CsvChunkEncoder, streaming_download, wants_gzip  # type: ignore
     from poll_request_models import (  # type: ignore
         DEFAULT_TIMEZONE,
         TIMEZONE_ALIASES,
@@ -685,13 +690,6 @@ async def open_poll_now_htmx(
                 )
 
             logger.info(f"Poll {poll_id} opened immediately by user {current_user.id} via unified service")
-
-            # Remove the scheduled opening job now that the manual open succeeded.
-            try:
-                scheduler.remove_job(f"open_poll_{poll_id}")
-                logger.info(f"Removed scheduled opening job for poll {poll_id}")
-            except Exception as e:
-                logger.debug(f"Job open_poll_{poll_id} not found or already removed: {e}")
         except Exception as e:
             logger.error(f"Error posting poll {poll_id} to Discord: {e}")
             return templates.TemplateResponse(
@@ -1960,124 +1958,6 @@ async def get_create_form_json_import_htmx(
     )
 
 
-# Helper functions for Redis caching
-def _serialize_polls_for_cache(polls: list) -> list:
-    """Convert Poll objects to JSON-serializable dictionaries with pre-calculated expensive operations"""
-    serialized_polls = []
-    
-    for poll in polls:
-        try:
-            # Pre-calculate expensive operations during serialization
-            total_votes = poll.get_total_votes()
-            
-            # Extract all poll data safely using TypeSafeColumn
-            poll_data = {
-                "id": TypeSafeColumn.get_int(poll, "id"),
-                "name": TypeSafeColumn.get_string(poll, "name"),
-                "question": TypeSafeColumn.get_string(poll, "question"),
-                "status": TypeSafeColumn.get_string(poll, "status"),
-                "creator_id": TypeSafeColumn.get_string(poll, "creator_id"),
-                "server_id": TypeSafeColumn.get_string(poll, "server_id"),
-                "server_name": TypeSafeColumn.get_string(poll, "server_name"),
-                "channel_id": TypeSafeColumn.get_string(poll, "channel_id"),
-                "channel_name": TypeSafeColumn.get_string(poll, "channel_name"),
-                "options": poll.options,  # Use property method
-                "emojis": poll.emojis,    # Use property method
-                "anonymous": TypeSafeColumn.get_bool(poll, "anonymous", False),
-                "multiple_choice": TypeSafeColumn.get_bool(poll, "multiple_choice", False),
-                "max_choices": TypeSafeColumn.get_int(poll, "max_choices"),
-                "ping_role_enabled": TypeSafeColumn.get_bool(poll, "ping_role_enabled", False),
-                "ping_role_id": TypeSafeColumn.get_string(poll, "ping_role_id"),
-                "ping_role_name": TypeSafeColumn.get_string(poll, "ping_role_name"),
-                "ping_role_on_close": TypeSafeColumn.get_bool(poll, "ping_role_on_close", False),
-                "ping_role_on_update": TypeSafeColumn.get_bool(poll, "ping_role_on_update", False),
-                "image_path": TypeSafeColumn.get_string(poll, "image_path"),
-                "image_message_text": TypeSafeColumn.get_string(poll, "image_message_text"),
-                "timezone": TypeSafeColumn.get_string(poll, "timezone"),
-                "created_at": TypeSafeColumn.get_datetime(poll, "created_at").isoformat() if TypeSafeColumn.get_datetime(poll, "created_at") else None,
-                "updated_at": TypeSafeColumn.get_datetime(poll, "updated_at").isoformat() if TypeSafeColumn.get_datetime(poll, "updated_at") else None,
-                "open_time": TypeSafeColumn.get_datetime(poll, "open_time").isoformat() if TypeSafeColumn.get_datetime(poll, "open_time") else None,
-                "close_time": TypeSafeColumn.get_datetime(poll, "close_time").isoformat() if TypeSafeColumn.get_datetime(poll, "close_time") else None,
-                # Pre-calculated expensive operations
-                "total_votes": total_votes,
-                # Add status class for template compatibility
-                "status_class": {
-                    "active": "bg-success",
-                    "scheduled": "bg-warning", 
-                    "closed": "bg-danger",
-                }.get(TypeSafeColumn.get_string(poll, "status"), "bg-secondary")
-            }
-            
-            serialized_polls.append(poll_data)
-            
-        except Exception as e:
-            logger.error(f"Error serializing poll {TypeSafeColumn.get_int(poll, 'id', 0)}: {e}")
-            continue
-    
-    return serialized_polls
-
-
-def _reconstruct_polls_from_cache(cached_polls: list) -> list:
-    """Recreate Poll-like objects from cached data with proper method interfaces"""
-    reconstructed_polls = []
-    
-    for poll_data in cached_polls:
-        try:
-            # Create a Poll-like object that maintains template compatibility
-            class CachedPoll:
-                def __init__(self, data):
-                    # Set all attributes from cached data
-                    for key, value in data.items():
-                        if key.endswith('_at') or key.endswith('_time'):
-                            # Convert ISO strings back to datetime objects
-                            if value:
-                                try:
-                                    setattr(self, key, datetime.fromisoformat(value.replace('Z', '+00:00')))
-                                except (ValueError, AttributeError):
-                                    setattr(self, key, None)
-                            else:
-                                setattr(self, key, None)
-                        else:
-                            setattr(self, key, value)
-                
-                def get_total_votes(self):
-                    """Return pre-calculated total votes from cache"""
-                    return getattr(self, 'total_votes', 0)
-                
-                @property
-                def options(self):
-                    """Return options list"""
-                    return getattr(self, '_options', [])
-                
-                @options.setter
-                def options(self, value):
-                    self._options = value
-                
-                @property
-                def emojis(self):
-                    """Return emojis list"""
-                    return getattr(self, '_emojis', [])
-                
-                @emojis.setter  
-                def emojis(self, value):
-                    self._emojis = value
-            
-            # Create the cached poll object
-            cached_poll = CachedPoll(poll_data)
-            
-            # Set options and emojis using the properties
-            cached_poll.options = poll_data.get('options', [])
-            cached_poll.emojis = poll_data.get('emojis', [])
-            
-            reconstructed_polls.append(cached_poll)
-            
-        except Exception as e:
-            logger.error(f"Error reconstructing cached poll {poll_data.get('id', 'unknown')}: {e}")
-            continue
-    
-    return reconstructed_polls
-
-
 async def invalidate_user_polls_cache(user_id: str, enhanced_cache=None):
     """Clear all poll cache variations for a user"""
     if enhanced_cache is None:
@@ -2146,26 +2026,12 @@ async def get_polls_htmx(
                     logger.debug(f"🔍 CACHE DEBUG - First poll data keys: {list(serialized_polls[0].keys()) if isinstance(serialized_polls[0], dict) else 'Not a dict'}")
                 
                 try:
-                    # Reconstruct Poll-like objects from cached data
-                    cached_polls = _reconstruct_polls_from_cache(serialized_polls)
-                    
+                    cached_polls = [
+                        PollCard.from_cache_dict(poll_data) for poll_data in serialized_polls
+                    ]
                     logger.debug(f"🔍 CACHE DEBUG - Reconstructed polls count: {len(cached_polls)}")
-                    
-                    # Debug the reconstructed objects
-                    if cached_polls and len(cached_polls) > 0:
-                        first_poll = cached_polls[0]
-                        logger.debug(f"🔍 CACHE DEBUG - First reconstructed poll type: {type(first_poll)}")
-                        logger.debug(f"🔍 CACHE DEBUG - First poll has get_total_votes: {hasattr(first_poll, 'get_total_votes')}")
-                        logger.debug(f"🔍 CACHE DEBUG - First poll get_total_votes callable: {callable(getattr(first_poll, 'get_total_votes', None))}")
-                        
-                        # Test the method
-                        try:
-                            test_votes = first_poll.get_total_votes()
-                            logger.debug(f"🔍 CACHE DEBUG - First poll total votes: {test_votes}")
-                        except Exception as method_error:
-                            logger.error(f"🔍 CACHE DEBUG - Error calling get_total_votes: {method_error}")
-                    
-                    # Prepare template data with reconstructed polls
+
+                    # Prepare template data with cached poll cards
                     polls_data = {
                         "polls": cached_polls,
                         "current_filter": cached_polls_data.get("current_filter"),
@@ -2196,22 +2062,11 @@ async def get_polls_htmx(
 
     try:
         async with get_async_db_session() as db:
-            # Query polls with error handling
+            # Query poll cards with error handling
             try:
-                stmt = (
-                    select(Poll)
-                    .where(Poll.creator_id == current_user.id)
-                    .options(selectinload(Poll.votes))
-                )
-
-                # Apply filter if specified with validation
-                if filter and filter in ["active", "scheduled", "closed"]:
-                    stmt = stmt.where(Poll.status == filter)
-                    logger.debug(f"Applied filter: {filter}")
-
-                stmt = stmt.order_by(Poll.created_at.desc())
-                polls = (await db.execute(stmt)).scalars().all()
-                logger.debug(f"Found {len(polls)} polls for user {current_user.id}")
+                status_filter = filter if filter in ["active", "scheduled", "closed"] else None
+                processed_polls = await load_poll_cards(db, current_user.id, status_filter)
+                logger.debug(f"Found {len(processed_polls)} polls for user {current_user.id}")
 
             except Exception as e:
                 logger.error(
@@ -2228,44 +2083,6 @@ async def get_polls_htmx(
                 }
                 return templates.TemplateResponse("htmx/polls.html", {"request": request, "format_datetime_for_user": format_datetime_for_user, **error_data})
 
-        # Process polls with individual error handling and defensive programming
-        processed_polls = []
-        for poll in polls:
-            try:
-                # Debug the poll object type and methods
-                logger.debug(f"🔍 POLL PROCESSING DEBUG - Processing poll object type: {type(poll)}")
-                logger.debug(f"🔍 POLL PROCESSING DEBUG - Poll object attributes: {dir(poll) if hasattr(poll, '__dict__') else 'No __dict__'}")
-                
-                # Check if poll has get_total_votes method
-                if hasattr(poll, 'get_total_votes') and callable(getattr(poll, 'get_total_votes')):
-                    logger.debug(f"🔍 POLL PROCESSING DEBUG - Poll {TypeSafeColumn.get_int(poll, 'id', 0)} has get_total_votes method")
-                    try:
-                        # Test the method to ensure it works
-                        test_votes = poll.get_total_votes()
-                        logger.debug(f"🔍 POLL PROCESSING DEBUG - Poll {TypeSafeColumn.get_int(poll, 'id', 0)} total votes: {test_votes}")
-                    except Exception as method_error:
-                        logger.error(f"🔍 POLL PROCESSING DEBUG - Error calling get_total_votes on poll {TypeSafeColumn.get_int(poll, 'id', 0)}: {method_error}")
-                else:
-                    logger.warning(f"🔍 POLL PROCESSING DEBUG - Poll {TypeSafeColumn.get_int(poll, 'id', 0)} missing get_total_votes method")
-
-                # Add status_class to each poll for template
-                poll.status_class = {
-                    "active": "bg-success",
-                    "scheduled": "bg-warning",
-                    "closed": "bg-danger",
-                }.get(TypeSafeColumn.get_string(poll, "status"), "bg-secondary")
-
-                processed_polls.append(poll)
-                logger.debug(
-                    f"Processed poll {TypeSafeColumn.get_int(poll, 'id')} with status {TypeSafeColumn.get_string(poll, 'status')}"
-                )
-
-            except Exception as e:
-                logger.error(
-                    f"Error processing poll {TypeSafeColumn.get_int(poll, 'id', 0)}: {e}"
-                )
-                # Continue with other polls, skip this one
-
         # Get user's timezone preference with error handling
         try:
             user_prefs = get_user_preferences(current_user.id)
@@ -2279,7 +2096,7 @@ async def get_polls_htmx(
 
         # Serialize polls for caching (with pre-calculated expensive operations)
         try:
-            serialized_polls = _serialize_polls_for_cache(processed_polls)
+            serialized_polls = [poll.to_cache_dict() for poll in processed_polls]
             
             # Prepare cacheable data
             cacheable_data = {
@@ -3250,36 +3067,14 @@ async def get_polls_realtime_htmx(
     try:
         async with get_async_db_session() as db:
             try:
-                stmt = (
-                    select(Poll)
-                    .where(Poll.creator_id == current_user.id)
-                    .options(selectinload(Poll.votes))
-                )
-                if filter and filter in ["active", "scheduled", "closed"]:
-                    stmt = stmt.where(Poll.status == filter)
-                stmt = stmt.order_by(Poll.created_at.desc())
-                polls = (await db.execute(stmt)).scalars().all()
+                status_filter = filter if filter in ["active", "scheduled", "closed"] else None
+                processed_polls = await load_poll_cards(db, current_user.id, status_filter)
             except Exception as e:
                 logger.error(
                     f"Database error in realtime polls for user {current_user.id}: {e}"
                 )
                 return ""  # Return empty for real-time updates on error
 
-        # Process polls with individual error handling (same as get_polls_htmx)
-        processed_polls = []
-        for poll in polls:
-            try:
-                poll.status_class = {
-                    "active": "bg-success",
-                    "scheduled": "bg-warning",
-                    "closed": "bg-danger",
-                }.get(TypeSafeColumn.get_string(poll, "status"), "bg-secondary")
-                processed_polls.append(poll)
-            except Exception as e:
-                logger.error(
-                    f"Error processing poll {TypeSafeColumn.get_int(poll, 'id', 0)} for realtime: {e}"
-                )
-
         # Get user's timezone preference with error handling
         try:
             user_prefs = get_user_preferences(current_user.id)
@@ -3842,7 +3637,7 @@ async def get_poll_details_htmx(
                 await db.execute(
                     select(Poll)
                     .where(Poll.id == poll_id, Poll.creator_id == current_user.id)
-                    .options(selectinload(Poll.votes))
+                    .options(selectinload(Poll.tallies))
                 )
             ).scalar_one_or_none()
 
@@ -3939,6 +3734,71 @@ async def get_poll_details_htmx(
         )
 
 
+def _render_poll_results_html(poll) -> str:
+    """Render the live results fragment (option bars and total) for a poll"""
+    poll_status = TypeSafeColumn.get_string(poll, "status", "active")
+
+    # Get poll results
+    total_votes = poll.get_total_votes()
+    results = poll.get_results()
+
+    # Get poll data safely
+    options = poll.options  # Use the property method from Poll model
+    emojis = poll.emojis  # Use the property method from Poll model
+    is_anonymous = TypeSafeColumn.get_bool(poll, "anonymous", False)
+
+    # Generate HTML for results
+    html_parts = []
+
+    for i in range(len(options)):
+        option_votes = results.get(i, 0)
+        percentage = (option_votes / total_votes * 100) if total_votes > 0 else 0
+        emoji = (
+            emojis[i]
+            if i < len(emojis)
+            else POLL_EMOJIS[min(i, len(POLL_EMOJIS) - 1)]
+        )
+        option_text = options[i]
+
+        html_parts.append(
+            f"""
+        <div class="mb-3">
+            <div class="d-flex justify-content-between align-items-center mb-1">
+                <span>{emoji} {escape(option_text)}</span>
+                <span class="text-muted">{option_votes} votes ({percentage:.1f}%)</span>
+            </div>
+            <div class="progress" style="height: 20px;">
+                <div class="progress-bar" role="progressbar" style="width: {percentage}%;"
+                     aria-valuenow="{percentage}" aria-valuemin="0" aria-valuemax="100">
+                </div>
+            </div>
+        </div>
+        """
+        )
+
+    # Add total votes and anonymous badge
+    anonymous_badge = (
+        '<span class="badge bg-info ms-2">Anonymous</span>' if is_anonymous else ""
+    )
+
+    # Add status indicator for closed polls
+    status_indicator = ""
+    if poll_status == "closed":
+        status_indicator = '<div class="alert alert-info mt-2"><i class="fas fa-info-circle me-1"></i>This poll is closed. Results are final.</div>'
+
+    html_parts.append(
+        f"""
+    <div class="mt-3">
+        <strong>Total Votes: {total_votes}</strong>
+        {anonymous_badge}
+    </div>
+    {status_indicator}
+    """
+    )
+
+    return "".join(html_parts)
+
+
 async def get_poll_results_realtime_htmx(
     poll_id: int, request: Request, current_user: DiscordUser = Depends(require_auth)
 ):
@@ -3984,7 +3844,7 @@ async def get_poll_results_realtime_htmx(
                 await db.execute(
                     select(Poll)
                     .where(Poll.id == poll_id, Poll.creator_id == current_user.id)
-                    .options(selectinload(Poll.votes))
+                    .options(selectinload(Poll.tallies))
                 )
             ).scalar_one_or_none()
             if not poll:
@@ -3996,65 +3856,9 @@ async def get_poll_results_realtime_htmx(
             poll_status = TypeSafeColumn.get_string(poll, "status", "active")
             logger.debug(f"📊 POLL STATUS - Poll {poll_id} status is '{poll_status}'")
 
-            # Get poll results
             total_votes = poll.get_total_votes()
             results = poll.get_results()
-
-            # Get poll data safely
-            options = poll.options  # Use the property method from Poll model
-            emojis = poll.emojis  # Use the property method from Poll model
-            is_anonymous = TypeSafeColumn.get_bool(poll, "anonymous", False)
-
-            # Generate HTML for results
-            html_parts = []
-
-            for i in range(len(options)):
-                option_votes = results.get(i, 0)
-                percentage = (option_votes / total_votes * 100) if total_votes > 0 else 0
-                emoji = (
-                    emojis[i]
-                    if i < len(emojis)
-                    else POLL_EMOJIS[min(i, len(POLL_EMOJIS) - 1)]
-                )
-                option_text = options[i]
-
-                html_parts.append(
-                    f"""
-                <div class="mb-3">
-                    <div class="d-flex justify-content-between align-items-center mb-1">
-                        <span>{emoji} {escape(option_text)}</span>
-                        <span class="text-muted">{option_votes} votes ({percentage:.1f}%)</span>
-                    </div>
-                    <div class="progress" style="height: 20px;">
-                        <div class="progress-bar" role="progressbar" style="width: {percentage}%;"
-                             aria-valuenow="{percentage}" aria-valuemin="0" aria-valuemax="100">
-                        </div>
-                    </div>
-                </div>
-                """
-                )
-
-            # Add total votes and anonymous badge
-            anonymous_badge = (
-                '<span class="badge bg-info ms-2">Anonymous</span>' if is_anonymous else ""
-            )
-
-            # Add status indicator for closed polls
-            status_indicator = ""
-            if poll_status == "closed":
-                status_indicator = '<div class="alert alert-info mt-2"><i class="fas fa-info-circle me-1"></i>This poll is closed. Results are final.</div>'
-
-            html_parts.append(
-                f"""
-            <div class="mt-3">
-                <strong>Total Votes: {total_votes}</strong>
-                {anonymous_badge}
-            </div>
-            {status_indicator}
-            """
-            )
-
-            html_content = "".join(html_parts)
+            html_content = _render_poll_results_html(poll)
 
             # Cache the results with status-aware TTL (10s for active, 7 days for closed)
             cacheable_data = {
@@ -4078,6 +3882,39 @@ async def get_poll_results_realtime_htmx(
         return '<div class="alert alert-danger">Error loading poll results</div>'
 
 
+async def stream_poll_results_htmx(
+    poll_id: int, request: Request, current_user: DiscordUser = Depends(require_auth)
+):
+    """Server-Sent Events stream of live poll results, pushed when votes are committed"""
+    from fastapi.responses import StreamingResponse
+    from .poll_results_stream import get_poll_results_broadcaster
+
+    async def render():
+        try:
+            async with get_async_db_session() as db:
+                poll = (
+                    await db.execute(
+                        select(Poll)
+                        .where(Poll.id == poll_id, Poll.creator_id == current_user.id)
+                        .options(selectinload(Poll.tallies))
+                    )
+                ).scalar_one_or_none()
+                if not poll:
+                    return None, True
+                finished = TypeSafeColumn.get_string(poll, "status") == "closed"
+                return _render_poll_results_html(poll), finished
+        except Exception as e:
+            logger.error(f"Error rendering streamed results for poll {poll_id}: {e}")
+            return None, True
+
+    logger.debug(f"📡 RESULTS STREAM - User {current_user.id} subscribed to poll {poll_id}")
+    return StreamingResponse(
+        get_poll_results_broadcaster().stream(poll_id, render, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 async def get_poll_dashboard_htmx(
     poll_id: int,
     request: Request,
@@ -4089,7 +3926,7 @@ async def get_poll_dashboard_htmx(
 
     enhanced_cache = get_enhanced_cache_service()
 
-    logger.info(
+    logger.debug(
         f"🔍 DASHBOARD DEBUG - Starting dashboard request for poll {poll_id} by user {current_user.id}"
     )
 
@@ -4099,138 +3936,137 @@ async def get_poll_dashboard_htmx(
         logger.info(
             f"🚀 DASHBOARD CACHE HIT - Retrieved cached dashboard for poll {poll_id}"
         )
-        logger.info(
+        logger.debug(
             f"🔍 DASHBOARD DEBUG - Cached data keys: {list(cached_dashboard.keys())}"
         )
-        logger.info(
+        logger.debug(
             f"🔍 DASHBOARD DEBUG - Cached total_votes: {cached_dashboard.get('total_votes', 'NOT_FOUND')}"
         )
-        logger.info(
+        logger.debug(
             f"🔍 DASHBOARD DEBUG - Cached unique_voters: {cached_dashboard.get('unique_voters', 'NOT_FOUND')}"
         )
-        logger.info(
+        logger.debug(
             f"🔍 DASHBOARD DEBUG - Cached results: {cached_dashboard.get('results', 'NOT_FOUND')}"
         )
-        logger.info(
+        logger.debug(
             f"🔍 DASHBOARD DEBUG - Cached vote_data length: {len(cached_dashboard.get('vote_data', []))}"
         )
 
-        # We still need to get the Poll object for the template since it's not cached
-        db = get_db_session()
-        try:
-            poll = (
-                db.query(Poll)
-                .filter(Poll.id == poll_id, Poll.creator_id == current_user.id)
-                .first()
+        # We still need to get the Poll object for the template since it's not cached.
+        # Tallies are loaded eagerly so the fresh summary stats don't lazy-load.
+        async with get_async_db_session() as db:
+            result = await db.execute(
+                select(Poll)
+                .options(selectinload(Poll.tallies))
+                .where(Poll.id == poll_id, Poll.creator_id == current_user.id)
+            )
+            poll = result.scalar_one_or_none()
+        if not poll:
+            logger.error(
+                f"🔍 DASHBOARD DEBUG - Poll {poll_id} not found or access denied for user {current_user.id}"
+            )
+            return templates.TemplateResponse(
+                "htmx/components/inline_error.html",
+                {"request": request, "message": "Poll not found or access denied"},
             )
-            if not poll:
-                logger.error(
-                    f"🔍 DASHBOARD DEBUG - Poll {poll_id} not found or access denied for user {current_user.id}"
-                )
-                return templates.TemplateResponse(
-                    "htmx/components/inline_error.html",
-                    {"request": request, "message": "Poll not found or access denied"},
-                )
 
-            logger.info(f"🔍 DASHBOARD DEBUG - Poll object retrieved: {poll.id}")
+        logger.debug(f"🔍 DASHBOARD DEBUG - Poll object retrieved: {poll.id}")
 
-            # Convert cached vote data back to template-friendly format
-            # The cached data has ISO strings, but templates need datetime objects
-            cached_vote_data = cached_dashboard.get("vote_data", [])
-            template_vote_data = []
+        # Convert cached vote data back to template-friendly format
+        # The cached data has ISO strings, but templates need datetime objects
+        cached_vote_data = cached_dashboard.get("vote_data", [])
+        template_vote_data = []
 
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - Processing {len(cached_vote_data)} cached votes"
-            )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - Processing {len(cached_vote_data)} cached votes"
+        )
 
-            for i, vote in enumerate(cached_vote_data):
-                template_vote = vote.copy()
-                # Convert ISO string back to datetime object for template use
-                if vote.get("voted_at"):
-                    try:
-                        template_vote["voted_at"] = datetime.fromisoformat(
-                            vote["voted_at"].replace("Z", "+00:00")
-                        )
-                    except (ValueError, AttributeError) as e:
-                        logger.warning(
-                            f"Error parsing cached datetime {vote.get('voted_at')}: {e}"
-                        )
-                        template_vote["voted_at"] = None
-                else:
+        for i, vote in enumerate(cached_vote_data):
+            template_vote = vote.copy()
+            # Convert ISO string back to datetime object for template use
+            if vote.get("voted_at"):
+                try:
+                    template_vote["voted_at"] = datetime.fromisoformat(
+                        vote["voted_at"].replace("Z", "+00:00")
+                    )
+                except (ValueError, AttributeError) as e:
+                    logger.warning(
+                        f"Error parsing cached datetime {vote.get('voted_at')}: {e}"
+                    )
                     template_vote["voted_at"] = None
-                template_vote_data.append(template_vote)
+            else:
+                template_vote["voted_at"] = None
+            template_vote_data.append(template_vote)
 
-                if i < 3:  # Log first 3 votes for debugging
-                    logger.info(
-                        f"🔍 DASHBOARD DEBUG - Vote {i + 1}: user_id={vote.get('user_id', 'MISSING')}, option_index={vote.get('option_index', 'MISSING')}"
-                    )
+            if i < 3:  # Log first 3 votes for debugging
+                logger.debug(
+                    f"🔍 DASHBOARD DEBUG - Vote {i + 1}: user_id={vote.get('user_id', 'MISSING')}, option_index={vote.get('option_index', 'MISSING')}"
+                )
 
-            # Always calculate fresh summary statistics from the Poll model to avoid cache corruption
-            logger.info("🔍 DASHBOARD DEBUG - Calculating fresh summary statistics")
-            fresh_total_votes = poll.get_total_votes()
-            fresh_unique_voters = len(
-                set(vote["user_id"] for vote in template_vote_data)
-            )
-            fresh_results = poll.get_results()
+        # Always calculate fresh summary statistics from the Poll model to avoid cache corruption
+        logger.debug("🔍 DASHBOARD DEBUG - Calculating fresh summary statistics")
+        fresh_total_votes = poll.get_total_votes()
+        fresh_unique_voters = len(
+            set(vote["user_id"] for vote in template_vote_data)
+        )
+        fresh_results = poll.get_results()
 
-            logger.info("🔍 DASHBOARD DEBUG - Fresh calculations:")
-            logger.info(f"🔍 DASHBOARD DEBUG - fresh_total_votes: {fresh_total_votes}")
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - fresh_unique_voters: {fresh_unique_voters}"
-            )
-            logger.info(f"🔍 DASHBOARD DEBUG - fresh_results: {fresh_results}")
+        logger.debug("🔍 DASHBOARD DEBUG - Fresh calculations:")
+        logger.debug(f"🔍 DASHBOARD DEBUG - fresh_total_votes: {fresh_total_votes}")
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - fresh_unique_voters: {fresh_unique_voters}"
+        )
+        logger.debug(f"🔍 DASHBOARD DEBUG - fresh_results: {fresh_results}")
 
-            # Compare with cached values
-            cached_total = cached_dashboard.get("total_votes", "NOT_FOUND")
-            cached_unique = cached_dashboard.get("unique_voters", "NOT_FOUND")
-            cached_results = cached_dashboard.get("results", "NOT_FOUND")
+        # Compare with cached values
+        cached_total = cached_dashboard.get("total_votes", "NOT_FOUND")
+        cached_unique = cached_dashboard.get("unique_voters", "NOT_FOUND")
+        cached_results = cached_dashboard.get("results", "NOT_FOUND")
 
-            logger.info("🔍 DASHBOARD DEBUG - Comparison with cached values:")
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - total_votes: fresh={fresh_total_votes} vs cached={cached_total}"
-            )
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - unique_voters: fresh={fresh_unique_voters} vs cached={cached_unique}"
-            )
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - results: fresh={fresh_results} vs cached={cached_results}"
-            )
+        logger.debug("🔍 DASHBOARD DEBUG - Comparison with cached values:")
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - total_votes: fresh={fresh_total_votes} vs cached={cached_total}"
+        )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - unique_voters: fresh={fresh_unique_voters} vs cached={cached_unique}"
+        )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - results: fresh={fresh_results} vs cached={cached_results}"
+        )
 
-            # Add the non-cacheable objects to the cached data, but use fresh summary stats
-            template_data = {
-                "poll": poll,
-                "vote_data": template_vote_data,  # Use converted vote data with datetime objects
-                "total_votes": fresh_total_votes,  # Always use fresh calculation
-                "unique_voters": fresh_unique_voters,  # Always use fresh calculation
-                "results": fresh_results,  # Always use fresh calculation
-                "format_datetime_for_user": format_datetime_for_user,
-                **{
-                    k: v
-                    for k, v in cached_dashboard.items()
-                    if k not in ["vote_data", "total_votes", "unique_voters", "results"]
-                },  # Exclude vote_data and summary stats
-            }
+        # Add the non-cacheable objects to the cached data, but use fresh summary stats
+        template_data = {
+            "poll": poll,
+            "vote_data": template_vote_data,  # Use converted vote data with datetime objects
+            "total_votes": fresh_total_votes,  # Always use fresh calculation
+            "unique_voters": fresh_unique_voters,  # Always use fresh calculation
+            "results": fresh_results,  # Always use fresh calculation
+            "format_datetime_for_user": format_datetime_for_user,
+            **{
+                k: v
+                for k, v in cached_dashboard.items()
+                if k not in ["vote_data", "total_votes", "unique_voters", "results"]
+            },  # Exclude vote_data and summary stats
+        }
 
-            logger.info("🔍 DASHBOARD DEBUG - Final template_data summary:")
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - template_data total_votes: {template_data.get('total_votes', 'MISSING')}"
-            )
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - template_data unique_voters: {template_data.get('unique_voters', 'MISSING')}"
-            )
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - template_data results: {template_data.get('results', 'MISSING')}"
-            )
-            logger.info(
-                f"🔍 DASHBOARD DEBUG - template_data vote_data length: {len(template_data.get('vote_data', []))}"
-            )
+        logger.debug("🔍 DASHBOARD DEBUG - Final template_data summary:")
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - template_data total_votes: {template_data.get('total_votes', 'MISSING')}"
+        )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - template_data unique_voters: {template_data.get('unique_voters', 'MISSING')}"
+        )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - template_data results: {template_data.get('results', 'MISSING')}"
+        )
+        logger.debug(
+            f"🔍 DASHBOARD DEBUG - template_data vote_data length: {len(template_data.get('vote_data', []))}"
+        )
 
-            return templates.TemplateResponse(
-                "htmx/components/poll_dashboard.html",
-                {"request": request, **template_data},
-            )
-        finally:
-            db.close()
+        return templates.TemplateResponse(
+            "htmx/components/poll_dashboard.html",
+            {"request": request, **template_data},
+        )
 
     # Cache miss - generate dashboard data
     logger.debug(f"🔍 DASHBOARD CACHE MISS - Generating dashboard for poll {poll_id}")
@@ -4265,7 +4101,19 @@ async def get_poll_dashboard_htmx(
         # This allows poll creators to see who voted while maintaining anonymity for other users
         show_usernames_to_creator = True
 
-        # Prepare vote data with Discord usernames (with caching)
+        # Resolve every voter's Discord username and avatar in one batch
+        discord_users = {}
+        cached_avatars = {}
+        if bot:
+            resolver = get_discord_user_resolver()
+            discord_users = await resolver.resolve_users(
+                bot,
+                (TypeSafeColumn.get_string(vote, "user_id") for vote in votes),
+                guild_id=TypeSafeColumn.get_string(poll, "server_id"),
+            )
+            cached_avatars = await resolver.cache_avatars(discord_users)
+
+        # Prepare vote data with Discord usernames
         vote_data = []
         unique_users = set()
 
@@ -4275,56 +4123,17 @@ async def get_poll_dashboard_htmx(
                 option_index = TypeSafeColumn.get_int(vote, "option_index")
                 voted_at = TypeSafeColumn.get_datetime(vote, "voted_at")
 
-                # Get Discord user information with caching and avatar optimization
                 username = "Unknown User"
                 avatar_url = None
-                cached_avatar_url = None
-
                 if bot and user_id:
-                    # Check cache for Discord user data first
-                    cached_user = await enhanced_cache.get_cached_discord_user(user_id)
-                    if cached_user:
-                        username = cached_user.get("username", "Unknown User")
-                        avatar_url = cached_user.get("avatar_url")
+                    user_data = discord_users.get(user_id)
+                    if user_data:
+                        username = user_data.get("username") or username
+                        avatar_url = cached_avatars.get(user_id) or user_data.get(
+                            "avatar_url"
+                        )
                     else:
-                        # Fetch from Discord API and cache
-                        try:
-                            discord_user = await bot.fetch_user(int(user_id))
-                            if discord_user:
-                                username = (
-                                    discord_user.display_name or discord_user.name
-                                )
-                                avatar_url = (
-                                    discord_user.avatar.url
-                                    if discord_user.avatar
-                                    else None
-                                )
-
-                                # Cache Discord user data for 30 minutes
-                                user_data = {
-                                    "username": username,
-                                    "avatar_url": avatar_url,
-                                    "cached_at": datetime.now(pytz.UTC).isoformat(),
-                                }
-                                await enhanced_cache.cache_discord_user(
-                                    user_id, user_data
-                                )
-                        except Exception as e:
-                            logger.warning(
-                                f"Could not fetch Discord user {user_id}: {e}"
-                            )
-                            username = f"User {user_id[:8]}..."
-
-                    # Cache user avatar with deduplication and optimization
-                    if avatar_url:
-                        try:
-                            from .services.cache.avatar_cache_service import get_avatar_cache_service
-                            avatar_service = get_avatar_cache_service()
-                            cached_avatar_url = await avatar_service.cache_user_avatar(user_id, avatar_url, username)
-                            if cached_avatar_url:
-                                logger.debug(f"🖼️ AVATAR CACHED - User {user_id}: {cached_avatar_url}")
-                        except Exception as e:
-                            logger.warning(f"Error caching avatar for user {user_id}: {e}")
+                        username = fallback_username(user_id)
 
                 # Get option details
                 option_text = (
@@ -4342,7 +4151,7 @@ async def get_poll_dashboard_htmx(
                     {
                         "user_id": user_id,
                         "username": username,
-                        "avatar_url": cached_avatar_url or avatar_url,  # Use cached avatar if available
+                        "avatar_url": avatar_url,  # Locally cached avatar when available
                         "option_index": option_index,
                         "option_text": option_text,
                         "emoji": emoji,
@@ -4428,300 +4237,184 @@ async def get_poll_dashboard_htmx(
         db.close()
 
 
+async def _iter_vote_chunks(poll_id: int, chunk_size: int):
+    """Votes for a poll, newest first, in keyset-paginated chunks of plain rows"""
+    columns = (Vote.id, Vote.user_id, Vote.option_index, Vote.voted_at)
+    last = None
+    while True:
+        query = select(*columns).where(Vote.poll_id == poll_id, Vote.voted_at.is_not(None))
+        if last is not None:
+            query = query.where(
+                or_(
+                    Vote.voted_at < last.voted_at,
+                    and_(Vote.voted_at == last.voted_at, Vote.id < last.id),
+                )
+            )
+        # A short session per chunk, so a slow download doesn't hold a connection
+        async with get_async_db_session() as db:
+            rows = (
+                await db.execute(
+                    query.order_by(Vote.voted_at.desc(), Vote.id.desc()).limit(chunk_size)
+                )
+            ).all()
+        if not rows:
+            break
+        yield rows
+        last = rows[-1]
+
+    # Votes without a timestamp sort last, like ORDER BY voted_at DESC did
+    last_id = None
+    while True:
+        query = select(*columns).where(Vote.poll_id == poll_id, Vote.voted_at.is_(None))
+        if last_id is not None:
+            query = query.where(Vote.id < last_id)
+        async with get_async_db_session() as db:
+            rows = (
+                await db.execute(query.order_by(Vote.id.desc()).limit(chunk_size))
+            ).all()
+        if not rows:
+            break
+        yield rows
+        last_id = rows[-1].id
+
+
 async def export_poll_csv(
     poll_id: int,
     request: Request,
     bot,
     current_user: DiscordUser = Depends(require_auth),
 ):
-    """Export poll results as CSV - Poll creators always see usernames, even for anonymous polls"""
-    import csv
-    import io
-
-    # Add comprehensive debugging
-    logger.info(
-        f"🔍 CSV EXPORT DEBUG - Function called! Starting CSV export for poll {poll_id} by user {current_user.id}"
-    )
-    print(
-        f"🔍 CSV EXPORT DEBUG - Function called! Starting CSV export for poll {poll_id} by user {current_user.id}"
-    )
-
-    # Log request details
-    logger.info(f"🔍 CSV EXPORT DEBUG - Request method: {request.method}")
-    logger.info(f"🔍 CSV EXPORT DEBUG - Request URL: {request.url}")
-    logger.info(f"🔍 CSV EXPORT DEBUG - Request headers: {dict(request.headers)}")
-    print(f"🔍 CSV EXPORT DEBUG - Request method: {request.method}")
-    print(f"🔍 CSV EXPORT DEBUG - Request URL: {request.url}")
-    print(
-        f"🔍 CSV EXPORT DEBUG - User agent: {request.headers.get('user-agent', 'Not provided')}"
-    )
-
-    # Add function entry confirmation
-    logger.info(
-        "🔍 CSV EXPORT DEBUG - ✅ Function execution confirmed - we are inside export_poll_csv"
-    )
-    print(
-        "🔍 CSV EXPORT DEBUG - ✅ Function execution confirmed - we are inside export_poll_csv"
+    """Stream poll results as CSV - Poll creators always see usernames, even for anonymous polls"""
+    logger.debug(
+        f"🔍 CSV EXPORT DEBUG - Starting CSV export for poll {poll_id} by user {current_user.id}"
     )
 
-    db = get_db_session()
-    try:
-        logger.info("🔍 CSV EXPORT DEBUG - Database session created successfully")
-        print("🔍 CSV EXPORT DEBUG - Database session created successfully")
-
-        # Query for poll with detailed logging
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Querying for poll {poll_id} owned by user {current_user.id}"
-        )
-        print(
-            f"🔍 CSV EXPORT DEBUG - Querying for poll {poll_id} owned by user {current_user.id}"
-        )
-
+    async with get_async_db_session() as db:
         poll = (
-            db.query(Poll)
-            .filter(Poll.id == poll_id, Poll.creator_id == current_user.id)
-            .first()
-        )
-
-        if not poll:
-            logger.error(
-                f"🔍 CSV EXPORT DEBUG - Poll {poll_id} not found or access denied for user {current_user.id}"
-            )
-            print(
-                f"🔍 CSV EXPORT DEBUG - Poll {poll_id} not found or access denied for user {current_user.id}"
-            )
-            from fastapi import HTTPException
-
-            raise HTTPException(
-                status_code=404, detail="Poll not found or access denied"
+            await db.execute(
+                select(Poll).where(Poll.id == poll_id, Poll.creator_id == current_user.id)
             )
+        ).scalar_one_or_none()
 
-        logger.info(f"🔍 CSV EXPORT DEBUG - Poll found successfully: {poll.id}")
-        print(f"🔍 CSV EXPORT DEBUG - Poll found successfully: {poll.id}")
-
-        # Get poll basic info with debugging
-        poll_name = TypeSafeColumn.get_string(poll, "name", "Unknown Poll")
-        is_anonymous = TypeSafeColumn.get_bool(poll, "anonymous", False)
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Poll name: '{poll_name}', anonymous: {is_anonymous}"
-        )
-        print(
-            f"🔍 CSV EXPORT DEBUG - Poll name: '{poll_name}', anonymous: {is_anonymous}"
+    if not poll:
+        logger.error(
+            f"🔍 CSV EXPORT DEBUG - Poll {poll_id} not found or access denied for user {current_user.id}"
         )
+        from fastapi import HTTPException
 
-        # Get all votes for this poll with detailed logging
-        logger.info(f"🔍 CSV EXPORT DEBUG - Querying votes for poll {poll_id}")
-        print(f"🔍 CSV EXPORT DEBUG - Querying votes for poll {poll_id}")
+        raise HTTPException(status_code=404, detail="Poll not found or access denied")
 
-        votes = (
-            db.query(Vote)
-            .filter(Vote.poll_id == poll_id)
-            .order_by(Vote.voted_at.desc())
-            .all()
-        )
+    poll_name = TypeSafeColumn.get_string(poll, "name", "Unknown Poll")
+    is_anonymous = TypeSafeColumn.get_bool(poll, "anonymous", False)
+    server_id = TypeSafeColumn.get_string(poll, "server_id")
+    options = poll.options
+    emojis = poll.emojis
+    poll_type = "Anonymous" if is_anonymous else "Public"
 
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Found {len(votes)} votes for poll {poll_id}"
-        )
-        print(f"🔍 CSV EXPORT DEBUG - Found {len(votes)} votes for poll {poll_id}")
+    # Get user timezone for local time display
+    user_prefs = get_user_preferences(current_user.id)
+    user_timezone = user_prefs.get("default_timezone", "US/Eastern")
+
+    # Write header - include poll anonymity status for reference
+    header_row = [
+        "Poll Name",
+        "Poll Type",
+        "Voter Username",
+        "Voter ID",
+        "Option Selected",
+        "Option Index",
+        "Emoji",
+        "Vote Time (UTC)",
+        "Vote Time (Local)",
+    ]
 
-        # Get poll data with debugging
-        options = poll.options
-        emojis = poll.emojis
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Poll has {len(options)} options and {len(emojis)} emojis"
-        )
-        print(
-            f"🔍 CSV EXPORT DEBUG - Poll has {len(options)} options and {len(emojis)} emojis"
-        )
-
-        # Log first few options for debugging
-        for i, option in enumerate(options[:3]):
-            logger.info(f"🔍 CSV EXPORT DEBUG - Option {i}: '{option}'")
-            print(f"🔍 CSV EXPORT DEBUG - Option {i}: '{option}'")
-
-        # Create CSV content with debugging
-        logger.info("🔍 CSV EXPORT DEBUG - Creating CSV content")
-        print("🔍 CSV EXPORT DEBUG - Creating CSV content")
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header - include poll anonymity status for reference
-        header_row = [
-            "Poll Name",
-            "Poll Type",
-            "Voter Username",
-            "Voter ID",
-            "Option Selected",
-            "Option Index",
-            "Emoji",
-            "Vote Time (UTC)",
-            "Vote Time (Local)",
+    def vote_row(vote, discord_users) -> list:
+        user_id = vote.user_id
+        option_index = vote.option_index
+        voted_at = vote.voted_at
+
+        # Get Discord username - always shown to the poll creator
+        username = "Unknown User"
+        if bot and user_id:
+            user_data = discord_users.get(user_id)
+            username = (
+                user_data.get("username") if user_data else None
+            ) or fallback_username(user_id)
+
+        # Get option details
+        option_text = (
+            options[option_index] if option_index < len(options) else "Unknown Option"
+        )
+        emoji = (
+            emojis[option_index]
+            if option_index < len(emojis)
+            else POLL_EMOJIS[min(option_index, len(POLL_EMOJIS) - 1)]
+        )
+
+        # Format times
+        utc_time = "Unknown"
+        local_time = "Unknown"
+        if voted_at and isinstance(voted_at, datetime):
+            utc_time = voted_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+            local_time = format_datetime_for_user(voted_at, user_timezone)
+
+        return [
+            poll_name,
+            poll_type,
+            username,  # Always show username to poll creator
+            user_id,
+            option_text,
+            option_index,
+            emoji,
+            utc_time,
+            local_time,
         ]
-        writer.writerow(header_row)
-        logger.info(f"🔍 CSV EXPORT DEBUG - CSV header written: {header_row}")
-        print("🔍 CSV EXPORT DEBUG - CSV header written successfully")
-
-        # Get user timezone for local time display
-        logger.info("🔍 CSV EXPORT DEBUG - Getting user preferences for timezone")
-        print("🔍 CSV EXPORT DEBUG - Getting user preferences for timezone")
-
-        user_prefs = get_user_preferences(current_user.id)
-        user_timezone = user_prefs.get("default_timezone", "US/Eastern")
-        logger.info(f"🔍 CSV EXPORT DEBUG - User timezone: {user_timezone}")
-        print(f"🔍 CSV EXPORT DEBUG - User timezone: {user_timezone}")
 
-        poll_type = "Anonymous" if is_anonymous else "Public"
-        logger.info(f"🔍 CSV EXPORT DEBUG - Poll type: {poll_type}")
-        print(f"🔍 CSV EXPORT DEBUG - Poll type: {poll_type}")
-
-        # Write vote data - IMPORTANT: Poll creators always see usernames, even for anonymous polls
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Processing {len(votes)} votes for CSV export"
-        )
-        print(f"🔍 CSV EXPORT DEBUG - Processing {len(votes)} votes for CSV export")
+    async def csv_chunks():
+        encoder = CsvChunkEncoder()
+        yield encoder.encode([header_row])
 
         processed_votes = 0
         failed_votes = 0
-
-        for i, vote in enumerate(votes):
-            try:
-                logger.debug(
-                    f"🔍 CSV EXPORT DEBUG - Processing vote {i + 1}/{len(votes)}"
-                )
-
-                user_id = TypeSafeColumn.get_string(vote, "user_id")
-                option_index = TypeSafeColumn.get_int(vote, "option_index")
-                voted_at = TypeSafeColumn.get_datetime(vote, "voted_at")
-
-                if i < 3:  # Log details for first 3 votes
-                    logger.info(
-                        f"🔍 CSV EXPORT DEBUG - Vote {i + 1}: user_id={user_id}, option_index={option_index}, voted_at={voted_at}"
-                    )
-                    print(
-                        f"🔍 CSV EXPORT DEBUG - Vote {i + 1}: user_id={user_id}, option_index={option_index}"
+        try:
+            async for votes in _iter_vote_chunks(poll_id, EXPORT_CHUNK_SIZE):
+                # Resolve this chunk's voter usernames in one batch
+                discord_users = {}
+                if bot:
+                    discord_users = await get_discord_user_resolver().resolve_users(
+                        bot, (vote.user_id for vote in votes), guild_id=server_id
                     )
 
-                # Get Discord username - always fetch for poll creator
-                username = "Unknown User"
-                if bot and user_id:
+                rows = []
+                for vote in votes:
                     try:
-                        logger.debug(
-                            f"🔍 CSV EXPORT DEBUG - Fetching Discord user {user_id}"
-                        )
-                        discord_user = await bot.fetch_user(int(user_id))
-                        if discord_user:
-                            username = discord_user.display_name or discord_user.name
-                            if i < 3:  # Log details for first 3 users
-                                logger.info(
-                                    f"🔍 CSV EXPORT DEBUG - Fetched username for vote {i + 1}: '{username}'"
-                                )
-                                print(
-                                    f"🔍 CSV EXPORT DEBUG - Fetched username for vote {i + 1}: '{username}'"
-                                )
+                        rows.append(vote_row(vote, discord_users))
                     except Exception as e:
-                        logger.warning(
-                            f"🔍 CSV EXPORT DEBUG - Could not fetch Discord user {user_id}: {e}"
+                        failed_votes += 1
+                        logger.error(
+                            f"🔍 CSV EXPORT DEBUG - Error processing vote {vote.id} for CSV export: {e}"
                         )
-                        username = f"User {user_id[:8]}..."
-
-                # Get option details
-                option_text = (
-                    options[option_index]
-                    if option_index < len(options)
-                    else "Unknown Option"
-                )
-                emoji = (
-                    emojis[option_index]
-                    if option_index < len(emojis)
-                    else POLL_EMOJIS[min(option_index, len(POLL_EMOJIS) - 1)]
-                )
-
-                # Format times
-                utc_time = "Unknown"
-                local_time = "Unknown"
-                if voted_at and isinstance(voted_at, datetime):
-                    utc_time = voted_at.strftime("%Y-%m-%d %H:%M:%S UTC")
-                    local_time = format_datetime_for_user(voted_at, user_timezone)
-
-                # Write the row
-                row_data = [
-                    poll_name,
-                    poll_type,
-                    username,  # Always show username to poll creator
-                    user_id,
-                    option_text,
-                    option_index,
-                    emoji,
-                    utc_time,
-                    local_time,
-                ]
-                writer.writerow(row_data)
-                processed_votes += 1
-
-                if i < 3:  # Log details for first 3 rows
-                    logger.info(
-                        f"🔍 CSV EXPORT DEBUG - Row {i + 1} written: {row_data[:4]}..."
-                    )  # Log first 4 fields
-                    print(f"🔍 CSV EXPORT DEBUG - Row {i + 1} written successfully")
-
-            except Exception as e:
-                failed_votes += 1
-                logger.error(
-                    f"🔍 CSV EXPORT DEBUG - Error processing vote {i + 1} for CSV export: {e}"
-                )
-                print(f"🔍 CSV EXPORT DEBUG - Error processing vote {i + 1}: {e}")
-                continue
+                processed_votes += len(rows)
+                yield encoder.encode(rows)
+        except Exception as e:
+            # Headers are already sent; all we can do is end the download early
+            logger.error(f"❌ CSV EXPORT DEBUG - Error streaming CSV for poll {poll_id}: {e}")
+            logger.exception("Full traceback for CSV export error:")
+            return
 
-        logger.info(
-            f"🔍 CSV EXPORT DEBUG - Vote processing complete: {processed_votes} successful, {failed_votes} failed"
-        )
-        print(
+        logger.debug(
             f"🔍 CSV EXPORT DEBUG - Vote processing complete: {processed_votes} successful, {failed_votes} failed"
         )
 
-        # Prepare response
-        logger.info("🔍 CSV EXPORT DEBUG - Preparing CSV response")
-        print("🔍 CSV EXPORT DEBUG - Preparing CSV response")
-
-        output.seek(0)
-        csv_content = output.getvalue()
-        csv_size = len(csv_content)
-
-        logger.info(f"🔍 CSV EXPORT DEBUG - CSV content size: {csv_size} characters")
-        print(f"🔍 CSV EXPORT DEBUG - CSV content size: {csv_size} characters")
-
-        # Create filename
-        safe_poll_name = "".join(
-            c for c in poll_name if c.isalnum() or c in (" ", "-", "_")
-        ).rstrip()
-        filename = f"poll_results_{safe_poll_name}_{poll_id}.csv"
-
-        logger.info(f"🔍 CSV EXPORT DEBUG - Generated filename: '{filename}'")
-        print(f"🔍 CSV EXPORT DEBUG - Generated filename: '{filename}'")
-
-        # CSV content ready for response
-        # Return CSV as a file download
-        from fastapi.responses import Response
-
-        headers = {
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Type": "text/csv",
-            "Cache-Control": "no-cache"
-        }
+    # Create filename
+    safe_poll_name = "".join(
+        c for c in poll_name if c.isalnum() or c in (" ", "-", "_")
+    ).rstrip()
+    filename = f"poll_results_{safe_poll_name}_{poll_id}.csv"
 
-        logger.info("🔍 CSV EXPORT DEBUG - Returning CSV Response with attachment headers")
-        print("🔍 CSV EXPORT DEBUG - Returning CSV Response with attachment headers")
-        return Response(content=csv_content, media_type="text/csv", headers=headers)
-
-    except Exception as e:
-        logger.error(f"❌ CSV EXPORT DEBUG - Error exporting CSV for poll {poll_id}: {e}")
-        logger.exception("Full traceback for CSV export error:")
-        from fastapi import HTTPException
-        raise HTTPException(status_code=500, detail=f"Error exporting CSV: {str(e)}")
-    finally:
-        db.close()
+    return streaming_download(
+        csv_chunks(), filename, media_type="text/csv", compress=wants_gzip(request)
+    )
 
 
 async def export_poll_json_htmx(
@@ -5270,49 +4963,10 @@ async def update_poll_htmx(
 
         db.commit()
 
-        # Update scheduled jobs
-        try:
-            scheduler.remove_job(f"open_poll_{poll_id}")
-        except Exception as e:
-            logger.debug(f"Job open_poll_{poll_id} not found or already removed: {e}")
-        try:
-            scheduler.remove_job(f"close_poll_{poll_id}")
-        except Exception as e:
-            logger.debug(f"Job close_poll_{poll_id} not found or already removed: {e}")
-
-        # Reschedule jobs using unified opening service
-        from .background_tasks import close_poll
+        # The sweeper opens/closes from the updated open_time/close_time
+        from .poll_schedule_sweeper import get_poll_schedule_sweeper
 
-        # Create wrapper function for scheduled poll opening using unified service
-        async def open_poll_scheduled_wrapper(poll_id):
-            """Wrapper function for scheduled poll opening using unified service"""
-            from .services.poll.poll_open_service import poll_opening_service
-            
-            result = await poll_opening_service.open_poll_unified(
-                poll_id=poll_id,
-                reason="scheduled",
-                bot_instance=bot
-            )
-            if not result["success"]:
-                logger.error(f"❌ SCHEDULED OPEN {poll_id} - Failed: {result.get('error')}")
-            else:
-                logger.info(f"✅ SCHEDULED OPEN {poll_id} - Success: {result.get('message')}")
-            return result
-
-        if open_dt > datetime.now(pytz.UTC):
-            scheduler.add_job(
-                open_poll_scheduled_wrapper,
-                DateTrigger(run_date=open_dt),
-                args=[poll_id],
-                id=f"open_poll_{poll_id}",
-            )
-
-        scheduler.add_job(
-            close_poll,
-            DateTrigger(run_date=close_dt),
-            args=[poll_id],
-            id=f"close_poll_{poll_id}",
-        )
+        get_poll_schedule_sweeper().wake()
 
         logger.info(f"Successfully updated poll {poll_id}")
 
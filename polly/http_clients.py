@@ -0,0 +1,148 @@
+"""
+Polly HTTP Clients
+Shared, pooled outbound HTTP clients for avatars, OAuth and Turnstile.
+
+Every outbound call used to open its own ``httpx.AsyncClient`` or
+``aiohttp.ClientSession``, paying a fresh TCP + TLS handshake each time. The
+registry keeps one keep-alive ``httpx.AsyncClient`` per host (so connection
+limits apply per host), negotiates HTTP/2 when the ``h2`` package is
+installed, and records per-host latency. It is started and closed by
+``web_app.lifespan``; clients are also created lazily so callers outside the
+web process still work.
+"""
+
+import importlib.util
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+H2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class HostStats:
+    """Request counters and recent latencies for one host"""
+
+    def __init__(self, window: int = 200):
+        self.requests = 0
+        self.errors = 0
+        self.status_classes: Dict[str, int] = {}
+        self.http_versions: Dict[str, int] = {}
+        self._latencies_ms: Deque[float] = deque(maxlen=window)
+
+    def record(self, latency_ms: float, response: Optional[httpx.Response]) -> None:
+        self.requests += 1
+        self._latencies_ms.append(latency_ms)
+        if response is None:
+            self.errors += 1
+            return
+        status_class = f"{response.status_code // 100}xx"
+        self.status_classes[status_class] = self.status_classes.get(status_class, 0) + 1
+        self.http_versions[response.http_version] = self.http_versions.get(response.http_version, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        latencies = sorted(self._latencies_ms)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "status_classes": dict(self.status_classes),
+            "http_versions": dict(self.http_versions),
+            "avg_ms": round(sum(latencies) / len(latencies), 1) if latencies else 0.0,
+            "p95_ms": round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))], 1) if latencies else 0.0,
+            "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+        }
+
+
+class HttpClientRegistry:
+    """One pooled ``httpx.AsyncClient`` per outbound host"""
+
+    def __init__(self):
+        # Configuration
+        self.max_connections_per_host = config("HTTP_MAX_CONNECTIONS_PER_HOST", default=10, cast=int)
+        self.max_keepalive_per_host = config("HTTP_MAX_KEEPALIVE_PER_HOST", default=5, cast=int)
+        self.keepalive_expiry = config("HTTP_KEEPALIVE_EXPIRY", default=30.0, cast=float)
+        self.timeout = config("HTTP_TIMEOUT", default=10.0, cast=float)
+        self.http2 = config("HTTP2_ENABLED", default=True, cast=bool) and H2_AVAILABLE
+
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self.started = False
+
+    def start(self) -> None:
+        """Mark the registry live (web_app.lifespan startup)"""
+        self.started = True
+        logger.info(
+            f"🌐 HTTP CLIENTS - Registry started (http2={self.http2}, "
+            f"{self.max_connections_per_host} connections/host)"
+        )
+
+    async def aclose(self) -> None:
+        """Close every pooled client (web_app.lifespan shutdown)"""
+        clients, self._clients = self._clients, {}
+        for host, client in clients.items():
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"⚠️ HTTP CLIENTS - Error closing client for {host}: {e}")
+        self.started = False
+
+    def get_client(self, host: str) -> httpx.AsyncClient:
+        """Pooled client for ``host``, created on first use"""
+        client = self._clients.get(host)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_keepalive_per_host,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+            )
+            self._clients[host] = client
+        return client
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send a request on the host's pooled client and record its latency"""
+        host = urlsplit(url).netloc
+        stats = self._stats.setdefault(host, HostStats())
+        started = time.perf_counter()
+        response = None
+        try:
+            response = await self.get_client(host).request(method, url, **kwargs)
+            return response
+        finally:
+            stats.record((time.perf_counter() - started) * 1000, response)
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "started": self.started,
+            "http2": self.http2,
+            "open_clients": sum(1 for client in self._clients.values() if not client.is_closed),
+            "hosts": {host: stats.get_stats() for host, stats in self._stats.items()},
+        }
+
+
+# Global registry instance
+_http_client_registry: Optional[HttpClientRegistry] = None
+
+
+def get_http_client_registry() -> HttpClientRegistry:
+    """Get or create the HTTP client registry"""
+    global _http_client_registry
+    if _http_client_registry is None:
+        _http_client_registry = HttpClientRegistry()
+    return _http_client_registry
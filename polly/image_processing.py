@@ -0,0 +1,308 @@
+"""
+Polly Image Processing
+Runs Pillow decode/transpose/resize/encode work in a process pool.
+
+Static page image compression and avatar optimization used to run Pillow
+synchronously inside ``async def``s, so a large upload stalled the event loop
+(and with it votes and the Discord gateway) for hundreds of milliseconds.
+Jobs are now submitted to a ``ProcessPoolExecutor`` behind a bounded queue;
+the job functions below are module-level so they pickle into the workers and
+only import Pillow there. JPEGs are decoded with ``draft()`` so the decoder
+downscales by 1/2, 1/4 or 1/8 during decode instead of resizing full-size
+pixels afterwards.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Image processing imports (optional dependencies)
+try:
+    from PIL import Image, ImageOps
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+    logger.warning("PIL/Pillow not available - image processing disabled")
+
+
+class ImageQueueFullError(Exception):
+    """No room in the image processing queue within the configured wait"""
+
+
+def _draft_for_box(img, box: Tuple[int, int]) -> bool:
+    """Let the JPEG decoder downscale while decoding; returns True if it did"""
+    if img.format != "JPEG" or (img.width <= box[0] and img.height <= box[1]):
+        return False
+    # Square box: EXIF rotation may swap width and height after decoding
+    side = max(box)
+    original_size = img.size
+    img.draft(img.mode, (side, side))
+    return img.size != original_size
+
+
+def compress_image_file(source_path: str, dest_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Worker job: compress ``source_path`` into ``dest_path``.
+
+    ``options`` carries max_width, max_height, jpeg_quality, webp_quality,
+    progressive_jpeg and png_optimize. Returns timing and size details.
+    """
+    started = time.perf_counter()
+    dest_extension = os.path.splitext(dest_path)[1].lower()
+    max_box = (options["max_width"], options["max_height"])
+
+    with Image.open(source_path) as img:
+        original_size = img.size
+        drafted = _draft_for_box(img, max_box)
+
+        # Auto-orient image based on EXIF data (this decodes the image)
+        img = ImageOps.exif_transpose(img)
+        decoded = time.perf_counter()
+
+        # Handle transparency for different formats
+        has_transparency = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
+        if dest_extension == '.webp':
+            # WebP supports transparency, keep RGBA if needed
+            if img.mode not in ('RGBA', 'RGB', 'L'):
+                img = img.convert('RGBA' if has_transparency else 'RGB')
+        elif dest_extension in ('.jpg', '.jpeg'):
+            # JPEG doesn't support transparency, convert to RGB with white background
+            if has_transparency:
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[-1])
+                img = background
+            elif img.mode not in ('RGB', 'L'):
+                img = img.convert('RGB')
+        elif dest_extension == '.png':
+            # PNG supports transparency, preserve it
+            if img.mode not in ('RGBA', 'RGB', 'L'):
+                img = img.convert('RGBA' if has_transparency else 'RGB')
+
+        # Resize after mode conversion so palette images get LANCZOS too
+        if img.width > max_box[0] or img.height > max_box[1]:
+            img.thumbnail(max_box, Image.Resampling.LANCZOS)
+        resized = time.perf_counter()
+
+        # Determine save format and options based on destination extension
+        if dest_extension == '.webp':
+            save_format = 'WebP'
+            save_options = {
+                'quality': options["webp_quality"],
+                'method': 6,  # Compression method (0-6, higher = better compression)
+                'lossless': False,
+                'optimize': True,
+            }
+        elif dest_extension in ('.jpg', '.jpeg'):
+            save_format = 'JPEG'
+            save_options = {
+                'quality': options["jpeg_quality"],
+                'optimize': True,
+                'progressive': options["progressive_jpeg"],
+                'subsampling': 0,  # Better quality subsampling
+                'qtables': 'web_high',  # Optimized quantization tables
+            }
+        elif dest_extension == '.png':
+            save_format = 'PNG'
+            save_options = {'optimize': options["png_optimize"], 'compress_level': 9}
+        else:
+            save_format = img.format or 'JPEG'
+            save_options = {'optimize': True}
+
+        img.save(dest_path, format=save_format, **save_options)
+        final_size = img.size
+
+    finished = time.perf_counter()
+    return {
+        "format": save_format,
+        "original_size": original_size,
+        "size": final_size,
+        "drafted": drafted,
+        "decode_ms": (decoded - started) * 1000,
+        "resize_ms": (resized - decoded) * 1000,
+        "encode_ms": (finished - resized) * 1000,
+        "worker_ms": (finished - started) * 1000,
+    }
+
+
+def optimize_avatar_bytes(image_data: bytes, target_format: str, quality: int) -> Dict[str, Any]:
+    """Worker job: re-encode avatar bytes as ``target_format``; returns data and timings"""
+    started = time.perf_counter()
+
+    with Image.open(BytesIO(image_data)) as img:
+        # Handle transparency and animation
+        if getattr(img, 'is_animated', False) and target_format == 'webp':
+            # Keep animated avatars as GIF for compatibility
+            target_format = 'gif'
+
+        # Auto-orient based on EXIF (this decodes the image)
+        img = ImageOps.exif_transpose(img)
+        decoded = time.perf_counter()
+
+        # Convert format if needed
+        if target_format == 'webp':
+            if img.mode == 'P':
+                img = img.convert('RGBA')
+        elif target_format in ('jpg', 'jpeg'):
+            if img.mode in ('RGBA', 'LA', 'P'):
+                # Convert to RGB with white background for JPEG
+                if img.mode == 'P':
+                    img = img.convert('RGBA')
+                background = Image.new('RGB', img.size, (255, 255, 255))
+                background.paste(img, mask=img.split()[-1])
+                img = background
+
+        output_buffer = BytesIO()
+        if target_format == 'webp':
+            img.save(output_buffer, format='WebP', quality=quality, optimize=True)
+        elif target_format in ('jpg', 'jpeg'):
+            img.save(output_buffer, format='JPEG', quality=quality, optimize=True)
+        elif target_format == 'png':
+            img.save(output_buffer, format='PNG', optimize=True)
+        elif target_format == 'gif':
+            img.save(output_buffer, format='GIF', optimize=True)
+        else:
+            img.save(output_buffer, format=img.format or 'PNG', optimize=True)
+
+    finished = time.perf_counter()
+    return {
+        "data": output_buffer.getvalue(),
+        "format": target_format,
+        "drafted": False,
+        "decode_ms": (decoded - started) * 1000,
+        "encode_ms": (finished - decoded) * 1000,
+        "worker_ms": (finished - started) * 1000,
+    }
+
+
+class ImageProcessingService:
+    """Bounded queue in front of a process pool for Pillow jobs"""
+
+    def __init__(self):
+        # Configuration (0 workers runs jobs in a single background thread)
+        self.workers = max(
+            0, config("IMAGE_PROCESS_WORKERS", default=min(2, os.cpu_count() or 1), cast=int)
+        )
+        self.queue_size = max(1, config("IMAGE_PROCESS_QUEUE_SIZE", default=16, cast=int))
+        self.queue_timeout = config("IMAGE_PROCESS_QUEUE_TIMEOUT", default=10.0, cast=float)
+        self.start_method = config("IMAGE_PROCESS_START_METHOD", default="spawn")
+
+        self._executor: Optional[Executor] = None
+        # Queued + running jobs; callers wait for a slot up to queue_timeout
+        self._slots = asyncio.Semaphore(self.queue_size)
+        self._pending = 0
+
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.jobs_rejected = 0
+        self.jobs_drafted = 0
+        self.pool_restarts = 0
+        self._recent: Deque[Dict[str, Any]] = deque(maxlen=50)
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.workers > 0:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+                logger.info(f"🖼️ IMAGE PROCESSING - Started process pool with {self.workers} worker(s)")
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="polly-image")
+        return self._executor
+
+    async def run(self, kind: str, func: Callable[..., Dict[str, Any]], *args) -> Dict[str, Any]:
+        """Run a worker job and return its result; raises ImageQueueFullError when saturated"""
+        if not PIL_AVAILABLE:
+            raise RuntimeError("PIL/Pillow not available")
+
+        submitted = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            self.jobs_rejected += 1
+            raise ImageQueueFullError(f"Image queue full ({self.queue_size} jobs)")
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            try:
+                result = await loop.run_in_executor(self._get_executor(), func, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM on a huge image); start a fresh pool next time
+                self._executor = None
+                self.pool_restarts += 1
+                raise
+        except Exception:
+            self.jobs_failed += 1
+            raise
+        finally:
+            self._pending -= 1
+            self._slots.release()
+
+        self.jobs_completed += 1
+        if result.get("drafted"):
+            self.jobs_drafted += 1
+        timing = {
+            "kind": kind,
+            "total_ms": round((time.perf_counter() - submitted) * 1000, 1),
+            "worker_ms": round(result.get("worker_ms", 0.0), 1),
+            "decode_ms": round(result.get("decode_ms", 0.0), 1),
+            "encode_ms": round(result.get("encode_ms", 0.0), 1),
+            "drafted": bool(result.get("drafted")),
+        }
+        self._recent.append(timing)
+        logger.debug(f"🖼️ IMAGE PROCESSING - {kind} job: {timing}")
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (lifespan shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        recent = list(self._recent)
+        totals = sorted(job["total_ms"] for job in recent)
+        return {
+            "pil_available": PIL_AVAILABLE,
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "pending": self._pending,
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "jobs_rejected": self.jobs_rejected,
+            "jobs_drafted": self.jobs_drafted,
+            "pool_restarts": self.pool_restarts,
+            "avg_total_ms": round(sum(totals) / len(totals), 1) if totals else 0.0,
+            "p95_total_ms": totals[min(len(totals) - 1, int(len(totals) * 0.95))] if totals else 0.0,
+            "avg_worker_ms": (
+                round(sum(job["worker_ms"] for job in recent) / len(recent), 1) if recent else 0.0
+            ),
+            "recent_jobs": recent[-10:],
+        }
+
+
+# Global service instance
+_image_processing_service: Optional[ImageProcessingService] = None
+
+
+def get_image_processing_service() -> ImageProcessingService:
+    """Get or create the image processing service instance"""
+    global _image_processing_service
+    if _image_processing_service is None:
+        _image_processing_service = ImageProcessingService()
+    return _image_processing_service
@@ -1,99 +1,369 @@
 """
 IP Blocking System
 Manages blocked IPs and provides functionality to block repeat attackers.
+
+Blocks expire after ``IP_BLOCK_DURATION`` and can cover single IPs, CIDR
+ranges or every prefix announced by an ASN. They are shared between workers
+through a Redis hash; each worker keeps an immutable snapshot that
+``is_blocked`` reads without locking. Writes build a new snapshot and swap
+the reference, and a background loop pushes local changes to Redis and
+reloads the shared set every ``IP_BLOCK_SYNC_INTERVAL`` seconds. Ranges
+are indexed by prefix length, so a lookup costs at most one dict probe per
+distinct prefix length in use.
 """
 
-import time
+import asyncio
+import ipaddress
+import json
 import logging
-from typing import Set, Dict
-from collections import defaultdict
 import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from decouple import config
 
 logger = logging.getLogger(__name__)
 
+IP_BLOCKS_KEY = "polly:ip_blocks"
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+IPAddress = Union[ipaddress.IPv4Address, ipaddress.IPv6Address]
+
+
+@dataclass(frozen=True)
+class BlockEntry:
+    """A blocked address or network"""
+
+    network: str  # "203.0.113.7" for single IPs, "198.51.100.0/24" for ranges
+    expires_at: float  # Epoch seconds; 0 means never
+    reason: str = ""
+    asn: Optional[int] = None
+    created_at: float = 0.0
+
+    def is_expired(self, now: float) -> bool:
+        return bool(self.expires_at) and self.expires_at <= now
+
+
+def _normalize_network(network: str) -> Tuple[str, IPNetwork]:
+    """Canonical key (plain address for single hosts) and parsed network"""
+    parsed = ipaddress.ip_network(network.strip(), strict=False)
+    if parsed.prefixlen == parsed.max_prefixlen:
+        return str(parsed.network_address), parsed
+    return str(parsed), parsed
+
+
+def _parse_ip(ip: str) -> Optional[IPAddress]:
+    try:
+        address = ipaddress.ip_address(ip)
+    except ValueError:
+        return None
+    # Dual-stack sockets report IPv4 clients as ::ffff:a.b.c.d
+    if address.version == 6 and address.ipv4_mapped is not None:
+        return address.ipv4_mapped
+    return address
+
+
+class PrefixTable:
+    """Immutable longest-prefix-first lookup over blocked networks"""
+
+    def __init__(self, entries: Iterable[BlockEntry]):
+        self.entries: Dict[str, BlockEntry] = {}
+        # version -> prefix length -> network bits -> entry
+        tables: Dict[int, Dict[int, Dict[int, BlockEntry]]] = {4: {}, 6: {}}
+        for entry in entries:
+            key, network = _normalize_network(entry.network)
+            self.entries[key] = entry
+            shift = network.max_prefixlen - network.prefixlen
+            tables[network.version].setdefault(network.prefixlen, {})[
+                int(network.network_address) >> shift
+            ] = entry
+
+        self._tables = {
+            version: tuple(
+                (prefix_len, (32 if version == 4 else 128) - prefix_len, table[prefix_len])
+                for prefix_len in sorted(table, reverse=True)
+            )
+            for version, table in tables.items()
+        }
+        # Only exact hosts blocked: a string lookup is enough
+        self._exact_only = all(
+            prefix_len == (32 if version == 4 else 128)
+            for version, levels in self._tables.items()
+            for prefix_len, _, _ in levels
+        )
+
+    def lookup(self, ip: str, now: float) -> Optional[BlockEntry]:
+        """Most specific unexpired block covering ``ip``"""
+        if not self.entries:
+            return None
+        if self._exact_only:
+            entry = self.entries.get(ip)
+            if entry is not None and not entry.is_expired(now):
+                return entry
+            if ":" not in ip:
+                return None
+
+        address = _parse_ip(ip)
+        if address is None:
+            return None
+        value = int(address)
+        for _, shift, table in self._tables[address.version]:
+            entry = table.get(value >> shift)
+            if entry is not None and not entry.is_expired(now):
+                return entry
+        return None
+
 
 class IPBlocker:
     """
-    Simple in-memory IP blocking system.
-    In production, this should be backed by Redis or a database.
+    Expiring IP/CIDR/ASN blocks shared across workers through Redis.
+    Request-path lookups read an immutable snapshot without locking.
     """
 
     def __init__(self):
-        self._blocked_ips: Set[str] = set()
-        self._violation_counts: Dict[str, int] = defaultdict(int)
-        self._violation_timestamps: Dict[str, float] = {}
-        self._lock = threading.Lock()
-
         # Configuration
-        self.max_violations = 5  # Block after 5 violations
-        self.violation_window = 3600  # 1 hour window
-        self.block_duration = 86400  # Block for 24 hours
+        self.max_violations = config("IP_BLOCK_MAX_VIOLATIONS", default=5, cast=int)
+        self.violation_window = config("IP_BLOCK_VIOLATION_WINDOW", default=3600, cast=int)
+        self.block_duration = config("IP_BLOCK_DURATION", default=86400, cast=int)
+        self.max_tracked_ips = config("IP_BLOCK_MAX_TRACKED", default=10000, cast=int)
+        self.sync_interval = config("IP_BLOCK_SYNC_INTERVAL", default=15.0, cast=float)
 
+        self._snapshot = PrefixTable(())
+        # Serializes writers only; readers use whatever snapshot is current
+        self._write_lock = threading.Lock()
+        # ip -> [weighted count, last violation time], least recently seen first
+        self._violations: "OrderedDict[str, List[float]]" = OrderedDict()
+        # Local changes not yet written to Redis: ("set", entry) / ("del", network)
+        self._pending: Deque[Tuple[str, Any]] = deque(maxlen=1000)
+        self._sync_task: Optional[asyncio.Task] = None
+        self.last_sync: Optional[float] = None
+        self.sync_errors = 0
+
+    # Request path
     def is_blocked(self, ip: str) -> bool:
         """Check if an IP is currently blocked"""
-        with self._lock:
-            return ip in self._blocked_ips
+        return self._snapshot.lookup(ip, time.time()) is not None
+
+    def get_block(self, ip: str) -> Optional[BlockEntry]:
+        """The block covering ``ip``, if any"""
+        return self._snapshot.lookup(ip, time.time())
 
     def record_violation(self, ip: str, severity: str = "MEDIUM") -> bool:
         """
         Record a security violation for an IP.
         Returns True if the IP should be blocked.
         """
-        with self._lock:
-            current_time = time.time()
-
-            # Clean old violations outside the window
-            if ip in self._violation_timestamps:
-                if (
-                    current_time - self._violation_timestamps[ip]
-                    > self.violation_window
-                ):
-                    self._violation_counts[ip] = 0
-
-            # Record the violation
-            self._violation_counts[ip] += self._get_violation_weight(severity)
-            self._violation_timestamps[ip] = current_time
-
-            # Check if we should block this IP
-            if self._violation_counts[ip] >= self.max_violations:
-                self._blocked_ips.add(ip)
-                logger.warning(
-                    f"IP {ip} blocked after {self._violation_counts[ip]} violations"
-                )
-                return True
+        current_time = time.time()
+        with self._write_lock:
+            record = self._violations.pop(ip, None)
+            # Reset the count once the IP has been quiet for a full window
+            if record is None or current_time - record[1] > self.violation_window:
+                record = [0, current_time]
+            record[0] += self._get_violation_weight(severity)
+            record[1] = current_time
+            self._violations[ip] = record
+            while len(self._violations) > self.max_tracked_ips:
+                self._violations.popitem(last=False)
+            count = record[0]
 
-            return False
+        if count >= self.max_violations and _parse_ip(ip) is not None:
+            self.block(ip, reason=f"{int(count)} violation points")
+            logger.warning(f"IP {ip} blocked after {int(count)} violations")
+            return True
+        return False
 
     def _get_violation_weight(self, severity: str) -> int:
         """Get the weight of a violation based on severity"""
         weights = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
         return weights.get(severity, 2)
 
-    def unblock_ip(self, ip: str) -> bool:
-        """Manually unblock an IP"""
-        with self._lock:
-            if ip in self._blocked_ips:
-                self._blocked_ips.remove(ip)
-                self._violation_counts[ip] = 0
-                logger.info(f"IP {ip} manually unblocked")
-                return True
+    # Management
+    def block(
+        self, network: str, duration: Optional[int] = None, reason: str = "", asn: Optional[int] = None
+    ) -> BlockEntry:
+        """Block an IP or CIDR range for ``duration`` seconds (0 = until unblocked)"""
+        key, _ = _normalize_network(network)
+        duration = self.block_duration if duration is None else duration
+        now = time.time()
+        entry = BlockEntry(key, now + duration if duration else 0.0, reason, asn, now)
+        self._apply([entry], [])
+        self._pending.append(("set", entry))
+        return entry
+
+    def block_asn(
+        self, asn: int, prefixes: Iterable[str], duration: Optional[int] = None, reason: str = ""
+    ) -> List[BlockEntry]:
+        """Block every prefix announced by ``asn``"""
+        return [self.block(prefix, duration, reason or f"AS{asn}", asn=asn) for prefix in prefixes]
+
+    def unblock(self, network: str) -> bool:
+        """Remove a block; returns False if it wasn't blocked"""
+        try:
+            key, _ = _normalize_network(network)
+        except ValueError:
             return False
+        if key not in self._snapshot.entries:
+            return False
+        self._apply([], [key])
+        self._pending.append(("del", key))
+        with self._write_lock:
+            self._violations.pop(key, None)
+        return True
+
+    def unblock_ip(self, ip: str) -> bool:
+        """Manually unblock an IP (or range)"""
+        if self.unblock(ip):
+            logger.info(f"IP {ip} manually unblocked")
+            return True
+        return False
+
+    def _apply(self, upserts: Iterable[BlockEntry], removals: Iterable[str]) -> None:
+        """Build and publish a new snapshot"""
+        with self._write_lock:
+            entries = dict(self._snapshot.entries)
+            for entry in upserts:
+                entries[entry.network] = entry
+            for key in removals:
+                entries.pop(key, None)
+            now = time.time()
+            self._snapshot = PrefixTable(e for e in entries.values() if not e.is_expired(now))
 
     def get_blocked_ips(self) -> Set[str]:
-        """Get all currently blocked IPs"""
-        with self._lock:
-            return self._blocked_ips.copy()
+        """Get all currently blocked IPs and ranges"""
+        now = time.time()
+        return {key for key, entry in self._snapshot.entries.items() if not entry.is_expired(now)}
+
+    def get_block_details(self) -> List[Dict[str, Any]]:
+        """Active blocks with expiry and reason, for admin pages"""
+        now = time.time()
+        return [
+            asdict(entry)
+            for entry in sorted(self._snapshot.entries.values(), key=lambda e: e.created_at, reverse=True)
+            if not entry.is_expired(now)
+        ]
 
     def get_violation_count(self, ip: str) -> int:
         """Get violation count for an IP"""
-        with self._lock:
-            return self._violation_counts.get(ip, 0)
-
-    def cleanup_old_blocks(self):
-        """Clean up old blocks (should be called periodically)"""
-        # For now, we'll keep blocks indefinitely
-        # In production, you'd want to implement time-based expiration
-        pass
+        record = self._violations.get(ip)
+        if record is None or time.time() - record[1] > self.violation_window:
+            return 0
+        return int(record[0])
+
+    def cleanup_old_blocks(self) -> int:
+        """Drop expired blocks and stale violation counts; returns blocks removed"""
+        now = time.time()
+        expired = [key for key, entry in self._snapshot.entries.items() if entry.is_expired(now)]
+        if expired:
+            self._apply([], expired)
+        with self._write_lock:
+            stale = [ip for ip, (_, last) in self._violations.items() if now - last > self.violation_window]
+            for ip in stale:
+                del self._violations[ip]
+        return len(expired)
+
+    # Redis sharing
+    def start(self) -> None:
+        """Start the Redis sync loop (web_app startup)"""
+        if self._sync_task is None or self._sync_task.done():
+            self._sync_task = asyncio.get_running_loop().create_task(self._sync_loop())
+
+    async def stop(self) -> None:
+        """Flush pending changes and stop the sync loop (web_app shutdown)"""
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+        try:
+            await self.sync()
+        except Exception as e:
+            logger.warning(f"⚠️ IP BLOCKER - Final sync failed: {e}")
+
+    async def _sync_loop(self) -> None:
+        while True:
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.sync_errors += 1
+                logger.warning(f"⚠️ IP BLOCKER - Redis sync failed, keeping local blocks: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    async def sync(self) -> None:
+        """Push local changes to Redis, then adopt the shared block list"""
+        try:
+            from .redis_client import get_redis_client
+        except ImportError:
+            from redis_client import get_redis_client
+
+        redis_client = await get_redis_client()
+        if not redis_client.is_connected:
+            self.cleanup_old_blocks()
+            return
+
+        # Push pending writes and read the shared hash in one round-trip.
+        # Redis errors propagate from the pipeline: the writes stay queued and
+        # the current snapshot is kept (a failed read is not an empty list).
+        pending = list(self._pending)
+        try:
+            async with redis_client.pipeline() as pipe:
+                if pipe is None:
+                    self.cleanup_old_blocks()
+                    return
+                for action, value in pending:
+                    if action == "set":
+                        pipe.hset(IP_BLOCKS_KEY, value.network, json.dumps(asdict(value)))
+                    else:
+                        pipe.hdel(IP_BLOCKS_KEY, value)
+                pipe.hgetall(IP_BLOCKS_KEY)
+                results = await pipe.execute()
+        except Exception:
+            self.cleanup_old_blocks()
+            raise
+        written = {id(item) for item in pending}
+        while self._pending and id(self._pending[0]) in written:
+            self._pending.popleft()
+
+        now = time.time()
+        shared, expired = [], []
+        for key, raw in results[-1].items():
+            try:
+                entry = BlockEntry(**json.loads(raw))
+            except (TypeError, ValueError):
+                logger.warning(f"⚠️ IP BLOCKER - Ignoring malformed block entry for {key}")
+                continue
+            (expired if entry.is_expired(now) else shared).append(entry)
+        if expired:
+            await redis_client.hdel(IP_BLOCKS_KEY, *(entry.network for entry in expired))
+
+        with self._write_lock:
+            entries = {entry.network: entry for entry in shared}
+            # Changes made while we were talking to Redis go out next time
+            for action, value in self._pending:
+                if action == "set":
+                    entries[value.network] = value
+                else:
+                    entries.pop(value, None)
+            self._snapshot = PrefixTable(entries.values())
+        self.cleanup_old_blocks()
+        self.last_sync = now
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        entries = self._snapshot.entries
+        return {
+            "blocked": len(self.get_blocked_ips()),
+            "ranges": sum(1 for key in entries if "/" in key),
+            "tracked_ips": len(self._violations),
+            "pending_writes": len(self._pending),
+            "last_sync": self.last_sync,
+            "sync_errors": self.sync_errors,
+        }
 
 
 # Global IP blocker instance
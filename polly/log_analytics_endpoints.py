@@ -37,7 +37,8 @@ async def get_log_analytics_api(
             "overview": analytics,
             "error_trends": error_trends,
             "generated_at": datetime.now().isoformat(),
-            "analysis_period_days": days
+            "analysis_period_days": days,
+            "index": pandas_log_analyzer.index.get_stats()
         }
         
         return JSONResponse(content={
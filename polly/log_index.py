@@ -0,0 +1,292 @@
+"""
+Polly Log Index
+Incremental, offset-tracking index of the application log files.
+
+The log analyzer used to re-read every log file from byte zero and build a
+dict per line on each super admin request. The index remembers how far it
+has read each file (and which file that was, so rotation and truncation are
+noticed), parses only the lines appended since the last refresh with
+vectorized pandas string operations, and keeps per-hour/per-level rollups so
+trend queries don't have to touch individual entries.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from decouple import config
+from pandas.api.types import union_categoricals
+
+logger = logging.getLogger(__name__)
+
+# "2024-01-01 12:00:00,123 - [logger.name - ]LEVEL - message"; JSON lines are read separately
+LOG_LINE_PATTERN = (
+    r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ - "
+    r"(?:[\w.]+ - )?(DEBUG|INFO|WARNING|ERROR|CRITICAL) - (.+)$"
+)
+
+ERROR_KEYWORDS = ("error", "exception", "failed", "traceback", "critical", "warning", "timeout", "refused")
+
+# Message metadata; for each field the first pattern that matches wins
+POLL_ID_PATTERNS = (r"poll[_\s]?(?:id)?[:\s]+(\d+)", r"poll\s*=\s*(\d+)", r"#(\d+)")
+USER_ID_PATTERNS = (r"user[_\s]?(?:id)?[:\s]+(\d+)", r"@(\d+)", r"creator[_\s]?(?:id)?[:\s]+(\d+)")
+SERVER_ID_PATTERNS = (r"server[_\s]?(?:id)?[:\s]+(\d+)", r"guild[_\s]?(?:id)?[:\s]+(\d+)")
+HTTP_REQUEST_PATTERN = r"(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+([/\w\-\{\}]+)"
+ENDPOINT_PATTERNS = (r"endpoint[:\s]+([/\w\-\{\}]+)", r"route[:\s]+([/\w\-\{\}]+)")
+STATUS_CODE_PATTERNS = (r"status[:\s]+(\d{3})", r"HTTP[:\s]+(\d{3})", r"response[:\s]+(\d{3})")
+RESPONSE_TIME_PATTERNS = (
+    r"(\d+(?:\.\d+)?)\s*ms",
+    r"(\d+(?:\.\d+)?)\s*milliseconds",
+    r"took\s+(\d+(?:\.\d+)?)\s*ms",
+    r"duration[:\s]+(\d+(?:\.\d+)?)\s*ms",
+)
+
+CATEGORY_COLUMNS = ("level", "file")
+
+
+def _json_entry(line: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """(timestamp, level, message) of a JSON-lines record (see logging_setup)"""
+    try:
+        entry = json.loads(line)
+        timestamp = str(entry["timestamp"])[:19].replace("T", " ")
+        return timestamp, str(entry["level"]), str(entry["message"])
+    except (ValueError, KeyError, TypeError):
+        return None, None, None
+
+
+def _first_match(messages: pd.Series, patterns: Sequence[str], found: Optional[pd.Series] = None) -> pd.Series:
+    """First capture of the first matching pattern per message (NaN if none)"""
+    if found is None:
+        found = pd.Series(np.nan, index=messages.index, dtype=object)
+    for pattern in patterns:
+        missing = found.isna()
+        if not missing.any():
+            break
+        found = found.fillna(messages[missing].str.extract(pattern, flags=re.IGNORECASE, expand=False))
+    return found
+
+
+def _optional_strings(values: pd.Series, index: pd.Index) -> pd.Series:
+    """Object column with None (not NaN) for missing values, like the old per-row dicts"""
+    values = values.reindex(index)
+    return values.astype(object).where(values.notna(), None)
+
+
+def parse_log_lines(
+    text: str,
+    source: str,
+    first_line: int,
+    previous_timestamp: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    Parse a block of complete log lines into index rows.
+    Unstructured lines (tracebacks, prints) take the timestamp of the entry
+    before them.
+    """
+    lines = pd.Series(text.split("\n"), dtype=object).str.strip()
+    line_numbers = np.arange(first_line, first_line + len(lines))
+    non_empty = (lines.str.len() > 0).to_numpy()
+    lines = lines[non_empty].reset_index(drop=True)
+    if lines.empty:
+        return pd.DataFrame()
+
+    parts = lines.str.extract(LOG_LINE_PATTERN)
+    json_lines = lines[lines.str.startswith("{")]
+    if not json_lines.empty:
+        parts = parts.fillna(pd.DataFrame([_json_entry(line) for line in json_lines], index=json_lines.index))
+    structured = parts[0].notna()
+
+    timestamps = pd.to_datetime(parts[0], format="%Y-%m-%d %H:%M:%S", errors="coerce").ffill()
+    if previous_timestamp is not None:
+        timestamps = timestamps.fillna(previous_timestamp)
+    timestamps = timestamps.fillna(pd.Timestamp.now().floor("s"))
+
+    levels = parts[1].where(structured, "UNSTRUCTURED")
+    messages = parts[2].where(structured, lines)
+
+    # Metadata only comes from structured entries
+    meta = messages[structured]
+    is_error = meta.str.lower().str.contains("|".join(ERROR_KEYWORDS), regex=True)
+    poll_ids = pd.to_numeric(_first_match(meta, POLL_ID_PATTERNS), errors="coerce")
+    user_ids = _first_match(meta, USER_ID_PATTERNS)
+    server_ids = _first_match(meta, SERVER_ID_PATTERNS)
+    requests = meta.str.extract(HTTP_REQUEST_PATTERN, flags=re.IGNORECASE)
+    endpoints = _first_match(meta, ENDPOINT_PATTERNS, found=(requests[0] + " " + requests[1]).astype(object))
+    status_codes = pd.to_numeric(_first_match(meta, STATUS_CODE_PATTERNS), errors="coerce")
+    response_times = pd.to_numeric(_first_match(meta, RESPONSE_TIME_PATTERNS), errors="coerce")
+
+    index = lines.index
+    poll_ids = poll_ids.reindex(index)
+    frame = pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "level": levels.astype("category"),
+            "message": messages,
+            "file": pd.Categorical([source] * len(index)),
+            "line_number": pd.to_numeric(line_numbers[non_empty], downcast="integer"),
+            "message_length": pd.to_numeric(messages.str.len(), downcast="integer"),
+            "is_error": is_error.reindex(index, fill_value=False).astype(bool),
+            "has_poll_id": poll_ids.notna(),
+            "has_user_id": user_ids.reindex(index).notna(),
+            "has_server_id": server_ids.reindex(index).notna(),
+            "poll_id": poll_ids,
+            "user_id": _optional_strings(user_ids, index),
+            "server_id": _optional_strings(server_ids, index),
+            "endpoint": _optional_strings(endpoints, index),
+            "status_code": status_codes.reindex(index),
+            "response_time": response_times.reindex(index),
+        }
+    )
+    return frame
+
+
+@dataclass
+class LogFileState:
+    """How far a log file has been indexed"""
+
+    path: str
+    file_id: Optional[Tuple[int, int]] = None  # (st_dev, st_ino)
+    offset: int = 0
+    lines: int = 0
+    last_timestamp: Optional[pd.Timestamp] = None
+    rotations: int = 0
+
+
+class LogIndex:
+    """In-memory index of log entries, refreshed from the files' appended bytes"""
+
+    def __init__(self, log_files: Sequence[str]):
+        # Configuration
+        self.retention_days = config("LOG_INDEX_RETENTION_DAYS", default=30, cast=int)
+        self.read_chunk_bytes = config("LOG_INDEX_CHUNK_BYTES", default=16 * 1024 * 1024, cast=int)
+
+        self.log_files = list(log_files)
+        self._files: Dict[str, LogFileState] = {}
+        self._frame = pd.DataFrame()
+        # Parsed but not yet merged into _frame
+        self._chunks: List[pd.DataFrame] = []
+        # (hour, level) -> entries, errors; kept beyond the entry retention
+        self._rollups = pd.DataFrame(
+            {"entries": pd.Series(dtype="int64"), "errors": pd.Series(dtype="int64")},
+            index=pd.MultiIndex.from_arrays([pd.DatetimeIndex([]), pd.Index([], dtype=object)], names=["hour", "level"]),
+        )
+        # Refreshes run from the analyzer's thread pool
+        self._lock = threading.Lock()
+
+        self.refreshes = 0
+        self.bytes_indexed = 0
+        self.last_refresh_ms = 0.0
+
+    def refresh(self) -> pd.DataFrame:
+        """Index lines appended since the last refresh; returns every indexed entry"""
+        with self._lock:
+            started = time.perf_counter()
+            for path in self.log_files:
+                try:
+                    self._refresh_file(path)
+                except Exception as e:
+                    logger.error(f"Error indexing log file {path}: {e}")
+            if self._chunks:
+                self._compact()
+            self.refreshes += 1
+            self.last_refresh_ms = (time.perf_counter() - started) * 1000
+            return self._frame
+
+    def _refresh_file(self, path: str) -> None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return
+
+        state = self._files.setdefault(path, LogFileState(path))
+        file_id = (stat.st_dev, stat.st_ino)
+        if state.file_id != file_id or stat.st_size < state.offset:
+            # New file, rotated (different inode) or truncated in place
+            if state.file_id is not None:
+                state.rotations += 1
+                logger.info(f"Log file {path} was rotated, indexing the new file from the start")
+            state.file_id = file_id
+            state.offset = 0
+            state.lines = 0
+
+        if stat.st_size == state.offset:
+            return
+
+        with open(path, "rb") as f:
+            f.seek(state.offset)
+            buffer = b""
+            while True:
+                data = f.read(self.read_chunk_bytes)
+                if not data:
+                    break
+                buffer += data
+                end = buffer.rfind(b"\n")
+                if end < 0:
+                    continue
+                self._ingest(state, buffer[:end])
+                buffer = buffer[end + 1 :]
+            # A trailing partial line is picked up once its newline is written
+
+    def _ingest(self, state: LogFileState, raw: bytes) -> None:
+        """Parse complete lines (without the final newline) and advance the file state"""
+        text = raw.decode("utf-8", errors="replace")
+        frame = parse_log_lines(text, state.path, state.lines + 1, state.last_timestamp)
+        state.offset += len(raw) + 1
+        state.lines += text.count("\n") + 1
+        self.bytes_indexed += len(raw) + 1
+        if frame.empty:
+            return
+
+        state.last_timestamp = frame["timestamp"].iloc[-1]
+        self._chunks.append(frame)
+
+        hourly = frame.groupby([frame["timestamp"].dt.floor("h"), frame["level"].astype(str)]).agg(
+            entries=("is_error", "size"), errors=("is_error", "sum")
+        )
+        hourly.index.names = ["hour", "level"]
+        self._rollups = self._rollups.add(hourly, fill_value=0).astype("int64")
+
+    def _compact(self) -> None:
+        """Merge parsed chunks into the index and drop entries past retention"""
+        frames = ([self._frame] if not self._frame.empty else []) + self._chunks
+        combined = pd.concat(frames, ignore_index=True)
+        for column in CATEGORY_COLUMNS:
+            combined[column] = union_categoricals([frame[column] for frame in frames])
+
+        cutoff = pd.Timestamp.now() - pd.Timedelta(days=self.retention_days)
+        if combined["timestamp"].min() < cutoff:
+            combined = combined[combined["timestamp"] >= cutoff].reset_index(drop=True)
+
+        self._frame = combined
+        self._chunks = []
+
+    def get_rollups(self, since: Optional[datetime] = None) -> pd.DataFrame:
+        """Per-hour/per-level entry and error counts (hour resolution)"""
+        with self._lock:
+            rollups = self._rollups
+        if since is not None:
+            hours = rollups.index.get_level_values("hour")
+            rollups = rollups[hours >= pd.Timestamp(since).floor("h")]
+        return rollups
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and refresh metrics"""
+        return {
+            "entries": len(self._frame),
+            "bytes_indexed": self.bytes_indexed,
+            "refreshes": self.refreshes,
+            "last_refresh_ms": round(self.last_refresh_ms, 2),
+            "rollup_hours": int(self._rollups.index.get_level_values("hour").nunique()),
+            "files": {
+                path: {"offset": state.offset, "lines": state.lines, "rotations": state.rotations}
+                for path, state in self._files.items()
+            },
+        }
@@ -0,0 +1,248 @@
+"""
+Polly Logging Setup
+Non-blocking logging: records are queued by the calling thread and written
+by a background listener thread with size- or time-based rotation.
+
+Handlers (the rotating file and the console) only run on the listener
+thread, so logging from the event loop never waits on file I/O. Records
+below WARNING from chatty loggers can be sampled (``LOG_SAMPLING``, e.g.
+``polly.htmx_endpoints=0.1``) or capped per second (``LOG_RATE_CAPS``, e.g.
+``polly.discord_bot=20``); logger names match their children too. With
+``LOG_FORMAT=json`` the file gets one JSON object per line, which the log
+index reads directly.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from decouple import config
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# LogRecord attributes that aren't user-supplied ``extra`` fields
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """One JSON object per line: timestamp, level, logger, message, extras"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+def _parse_logger_settings(value: str, cast) -> Dict[str, Any]:
+    """'polly.a=0.1,polly.b=0.5' -> {'polly.a': 0.1, 'polly.b': 0.5}"""
+    settings = {}
+    for item in value.split(","):
+        name, _, setting = item.strip().partition("=")
+        if name and setting:
+            settings[name.strip()] = cast(setting.strip())
+    return settings
+
+
+class HotPathFilter(logging.Filter):
+    """Sampling and per-second caps for sub-WARNING records of chatty loggers"""
+
+    def __init__(self, sample_rates: Dict[str, float], rate_caps: Dict[str, int]):
+        super().__init__()
+        self.sample_rates = sample_rates
+        self.rate_caps = rate_caps
+        # logger name -> (sample rate, cap, configured name it matched)
+        self._resolved: Dict[str, Tuple[float, Optional[int], Optional[str]]] = {}
+        # configured name -> [window start second, records in window]
+        self._windows: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self.sampled_out: Dict[str, int] = {}
+        self.capped: Dict[str, int] = {}
+
+    def _resolve(self, name: str) -> Tuple[float, Optional[int], Optional[str]]:
+        resolved = self._resolved.get(name)
+        if resolved is None:
+            rate, cap, matched = 1.0, None, None
+            # Most specific configured ancestor wins
+            candidate = name
+            while candidate:
+                if candidate in self.sample_rates or candidate in self.rate_caps:
+                    rate = self.sample_rates.get(candidate, 1.0)
+                    cap = self.rate_caps.get(candidate)
+                    matched = candidate
+                    break
+                candidate = candidate.rpartition(".")[0]
+            resolved = self._resolved[name] = (rate, cap, matched)
+        return resolved
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate, cap, matched = self._resolve(record.name)
+        if matched is None:
+            return True
+
+        if rate < 1.0 and random.random() >= rate:
+            self.sampled_out[matched] = self.sampled_out.get(matched, 0) + 1
+            return False
+
+        if cap is not None:
+            second = int(time.monotonic())
+            with self._lock:
+                window = self._windows.setdefault(matched, [second, 0])
+                if window[0] != second:
+                    window[0], window[1] = second, 0
+                window[1] += 1
+                if window[1] > cap:
+                    self.capped[matched] = self.capped.get(matched, 0) + 1
+                    return False
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops (and counts) records when the queue is full"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args in the calling thread but keep the traceback separate,
+        # so the listener's formatter (text or JSON) decides how to render it
+        message = record.getMessage()
+        exception = record.exc_text
+        if record.exc_info:
+            exception = logging.Formatter().formatException(record.exc_info)
+        record = copy.copy(record)
+        record.msg = record.message = message
+        record.args = None
+        record.exc_info = None
+        record.exc_text = exception
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingSetup:
+    """Queue-based root logging with a rotating file and the console"""
+
+    def __init__(self, log_file: str = "logs/polly.log"):
+        # Configuration
+        self.log_file = log_file
+        self.log_format = config("LOG_FORMAT", default="text").lower()
+        self.rotation = config("LOG_ROTATION", default="size").lower()
+        self.max_bytes = config("LOG_MAX_BYTES", default=50 * 1024 * 1024, cast=int)
+        self.backup_count = config("LOG_BACKUP_COUNT", default=10, cast=int)
+        self.rotate_when = config("LOG_ROTATE_WHEN", default="midnight")
+        self.queue_size = config("LOG_QUEUE_SIZE", default=10000, cast=int)
+        self.sample_rates = _parse_logger_settings(config("LOG_SAMPLING", default=""), float)
+        self.rate_caps = _parse_logger_settings(config("LOG_RATE_CAPS", default=""), int)
+
+        self.queue: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        self.queue_handler: Optional[DroppingQueueHandler] = None
+        self.hot_path_filter: Optional[HotPathFilter] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    def _file_handler(self) -> logging.Handler:
+        directory = os.path.dirname(self.log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.rotation == "time":
+            return logging.handlers.TimedRotatingFileHandler(
+                self.log_file, when=self.rotate_when, backupCount=self.backup_count, encoding="utf-8"
+            )
+        return logging.handlers.RotatingFileHandler(
+            self.log_file, maxBytes=self.max_bytes, backupCount=self.backup_count, encoding="utf-8"
+        )
+
+    def start(self) -> None:
+        """Route the root logger through the queue and start the listener"""
+        if self.listener is not None:
+            return
+
+        file_handler = self._file_handler()
+        if self.log_format == "json":
+            file_handler.setFormatter(JsonLinesFormatter())
+        else:
+            file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+        self.queue_handler = DroppingQueueHandler(self.queue)
+        self.hot_path_filter = HotPathFilter(self.sample_rates, self.rate_caps)
+        self.queue_handler.addFilter(self.hot_path_filter)
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+
+        self.listener = logging.handlers.QueueListener(
+            self.queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Flush queued records and stop the listener"""
+        if self.listener is None:
+            return
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        self.listener = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "format": self.log_format,
+            "rotation": self.rotation,
+            "queued": self.queue.qsize(),
+            "queue_size": self.queue_size,
+            "dropped": self.queue_handler.dropped if self.queue_handler else 0,
+            "sampled_out": dict(self.hot_path_filter.sampled_out) if self.hot_path_filter else {},
+            "rate_capped": dict(self.hot_path_filter.capped) if self.hot_path_filter else {},
+        }
+
+
+# Global logging setup instance
+_logging_setup: Optional[LoggingSetup] = None
+
+
+def configure_logging(log_file: str = "logs/polly.log") -> LoggingSetup:
+    """Configure queue-based logging once for the process"""
+    global _logging_setup
+    if _logging_setup is None:
+        _logging_setup = LoggingSetup(log_file)
+        _logging_setup.start()
+    return _logging_setup
+
+
+def get_logging_setup() -> Optional[LoggingSetup]:
+    """The active logging setup, if configure_logging has run"""
+    return _logging_setup
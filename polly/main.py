@@ -4,8 +4,6 @@ Streamlined entry point that imports functionality from modular components.
 """
 
 from .web_app import create_app
-import os
-import logging
 from dotenv import load_dotenv
 
 # Load environment variables first
@@ -14,14 +12,10 @@ load_dotenv()
 # Import debug configuration and initialize it early
 from .debug_config import init_debug_config, get_debug_logger
 
-# Setup logging directories
-os.makedirs("logs", exist_ok=True)
+from .logging_setup import configure_logging
 
-# Configure basic logging structure (level will be set by debug config)
-logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("logs/polly.log"), logging.StreamHandler()],
-)
+# Queue-based logging with rotation (level will be set by debug config)
+configure_logging("logs/polly.log")
 
 # Initialize debug configuration (this will set appropriate log levels)
 init_debug_config()
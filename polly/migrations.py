@@ -22,6 +22,117 @@ DEFAULT_DB_PATH = config("DB_PATH", default="./db/polly.db")
 # Default emojis for polls
 DEFAULT_POLL_EMOJIS = ["🇦", "🇧", "🇨", "🇩", "🇪", "🇫", "🇬", "🇭", "🇮", "🇯"]
 
+# poll_tallies row holding whole-poll totals (count = vote rows, unique_voters = distinct users)
+POLL_TOTAL_TALLY_INDEX = -1
+
+# Triggers keeping poll_tallies in step with votes, inside the same transaction
+# as the vote write. Shared by migration 13 and Base.metadata.create_all.
+# Each NOT EXISTS check excludes the changed row itself so that inserts,
+# deletes and updates (delete OLD + insert NEW) all count distinct voters the same way.
+POLL_TALLY_TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_votes_tally_insert AFTER INSERT ON votes
+    BEGIN
+        INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+        VALUES (NEW.poll_id, NEW.option_index, 1, 1)
+        ON CONFLICT (poll_id, option_index) DO UPDATE SET
+            count = count + 1,
+            unique_voters = unique_voters + NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = NEW.poll_id AND option_index = NEW.option_index
+                AND user_id = NEW.user_id AND id != NEW.id
+            );
+        INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+        VALUES (NEW.poll_id, -1, 1, 1)
+        ON CONFLICT (poll_id, option_index) DO UPDATE SET
+            count = count + 1,
+            unique_voters = unique_voters + NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = NEW.poll_id
+                AND user_id = NEW.user_id AND id != NEW.id
+            );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_votes_tally_delete AFTER DELETE ON votes
+    BEGIN
+        UPDATE poll_tallies SET
+            count = count - 1,
+            unique_voters = unique_voters - NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = OLD.poll_id AND option_index = OLD.option_index
+                AND user_id = OLD.user_id AND id != OLD.id
+            )
+        WHERE poll_id = OLD.poll_id AND option_index = OLD.option_index;
+        UPDATE poll_tallies SET
+            count = count - 1,
+            unique_voters = unique_voters - NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = OLD.poll_id
+                AND user_id = OLD.user_id AND id != OLD.id
+            )
+        WHERE poll_id = OLD.poll_id AND option_index = -1;
+        DELETE FROM poll_tallies WHERE poll_id = OLD.poll_id AND count <= 0;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_votes_tally_update AFTER UPDATE OF poll_id, user_id, option_index ON votes
+    WHEN OLD.poll_id IS NOT NEW.poll_id OR OLD.user_id IS NOT NEW.user_id
+        OR OLD.option_index IS NOT NEW.option_index
+    BEGIN
+        UPDATE poll_tallies SET
+            count = count - 1,
+            unique_voters = unique_voters - NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = OLD.poll_id AND option_index = OLD.option_index
+                AND user_id = OLD.user_id AND id != OLD.id
+            )
+        WHERE poll_id = OLD.poll_id AND option_index = OLD.option_index;
+        UPDATE poll_tallies SET
+            count = count - 1,
+            unique_voters = unique_voters - NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = OLD.poll_id
+                AND user_id = OLD.user_id AND id != OLD.id
+            )
+        WHERE poll_id = OLD.poll_id AND option_index = -1;
+        DELETE FROM poll_tallies WHERE poll_id = OLD.poll_id AND count <= 0;
+        INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+        VALUES (NEW.poll_id, NEW.option_index, 1, 1)
+        ON CONFLICT (poll_id, option_index) DO UPDATE SET
+            count = count + 1,
+            unique_voters = unique_voters + NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = NEW.poll_id AND option_index = NEW.option_index
+                AND user_id = NEW.user_id AND id != NEW.id
+            );
+        INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+        VALUES (NEW.poll_id, -1, 1, 1)
+        ON CONFLICT (poll_id, option_index) DO UPDATE SET
+            count = count + 1,
+            unique_voters = unique_voters + NOT EXISTS (
+                SELECT 1 FROM votes WHERE poll_id = NEW.poll_id
+                AND user_id = NEW.user_id AND id != NEW.id
+            );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_polls_tally_delete AFTER DELETE ON polls
+    BEGIN
+        DELETE FROM poll_tallies WHERE poll_id = OLD.id;
+    END
+    """,
+]
+
+# Recompute poll_tallies from votes. "{where}" is "" for every poll or
+# "WHERE poll_id = ?" for one poll (parameters repeat once per statement).
+POLL_TALLY_REBUILD_SQL = [
+    "DELETE FROM poll_tallies {where}",
+    """
+    INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+    SELECT poll_id, option_index, COUNT(*), COUNT(DISTINCT user_id)
+    FROM votes {where} GROUP BY poll_id, option_index
+    """,
+    """
+    INSERT INTO poll_tallies (poll_id, option_index, count, unique_voters)
+    SELECT poll_id, -1, COUNT(*), COUNT(DISTINCT user_id)
+    FROM votes {where} GROUP BY poll_id
+    """,
+]
+
 
 class DatabaseMigrator:
     """Handles database migrations and initialization"""
@@ -122,6 +233,50 @@ class DatabaseMigrator:
                     "ALTER TABLE polls ADD COLUMN max_choices INTEGER"
                 ],
             },
+            {
+                "version": 12,
+                "name": "add_hot_path_indexes",
+                "description": "Add composite and unique indexes for vote, message and creator lookups",
+                "sql": [
+                    # Loading a poll's votes (relationship is ordered by voted_at)
+                    "CREATE INDEX IF NOT EXISTS ix_votes_poll_voted_at ON votes (poll_id, voted_at)",
+                    # Dashboard poll lists: creator + status filter, newest first
+                    "CREATE INDEX IF NOT EXISTS ix_polls_creator_status_created ON polls (creator_id, status, created_at)",
+                    # Super admin list and active/scheduled scans
+                    "CREATE INDEX IF NOT EXISTS ix_polls_status_created ON polls (status, created_at)",
+                ],
+                "post_migration": self._create_unique_lookup_indexes,
+            },
+            {
+                "version": 13,
+                "name": "add_poll_tallies",
+                "description": "Add trigger-maintained per-option vote tallies",
+                "sql": [
+                    """
+                    CREATE TABLE IF NOT EXISTS poll_tallies (
+                        poll_id INTEGER NOT NULL,
+                        option_index INTEGER NOT NULL,
+                        count INTEGER NOT NULL DEFAULT 0,
+                        unique_voters INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (poll_id, option_index),
+                        FOREIGN KEY(poll_id) REFERENCES polls (id)
+                    )
+                    """,
+                    *POLL_TALLY_TRIGGERS_SQL,
+                ],
+                "post_migration": self._backfill_poll_tallies,
+            },
+            {
+                "version": 14,
+                "name": "add_poll_due_time_indexes",
+                "description": "Add status + open/close time indexes for the poll due-time sweeper",
+                "sql": [
+                    # Scheduled polls whose open_time has passed
+                    "CREATE INDEX IF NOT EXISTS ix_polls_status_open_time ON polls (status, open_time)",
+                    # Scheduled/active polls whose close_time has passed
+                    "CREATE INDEX IF NOT EXISTS ix_polls_status_close_time ON polls (status, close_time)",
+                ],
+            },
         ]
 
     def _get_initial_schema_sql(self) -> List[str]:
@@ -235,6 +390,57 @@ class DatabaseMigrator:
                 except (json.JSONDecodeError, TypeError) as e:
                     logger.warning(f"Could not parse options for poll {poll_id}: {e}")
 
+    # (index name, table, columns) for lookups that must be unique
+    UNIQUE_LOOKUP_INDEXES = [
+        # Vote collection: poll + user (+ option) lookups; also covers
+        # per-option counts for a poll without touching the table
+        ("ux_votes_poll_user_option", "votes", ("poll_id", "user_id", "option_index")),
+        # on_reaction_add / safeguard: poll by Discord message ID
+        ("ux_polls_message_id", "polls", ("message_id",)),
+    ]
+
+    def _create_unique_lookup_indexes(self, cursor: sqlite3.Cursor) -> None:
+        """Create unique lookup indexes, falling back to plain indexes on duplicates.
+
+        Existing databases may already contain duplicate rows (e.g. a vote
+        recorded twice by an old race). Rather than fail the migration or
+        delete data, those databases get a non-unique index with the same
+        columns so the lookups are still indexed.
+        """
+        for index_name, table, columns in self.UNIQUE_LOOKUP_INDEXES:
+            column_list = ", ".join(columns)
+            not_null = " AND ".join(f"{column} IS NOT NULL" for column in columns)
+            cursor.execute(
+                f"""
+                SELECT COUNT(*) FROM (
+                    SELECT 1 FROM {table} WHERE {not_null}
+                    GROUP BY {column_list} HAVING COUNT(*) > 1
+                )
+                """
+            )
+            duplicates = cursor.fetchone()[0]
+
+            if duplicates:
+                fallback_name = index_name.replace("ux_", "ix_", 1)
+                logger.warning(
+                    f"{duplicates} duplicate ({column_list}) groups in {table}; "
+                    f"creating non-unique index {fallback_name} instead of {index_name}"
+                )
+                cursor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {fallback_name} ON {table} ({column_list})"
+                )
+            else:
+                cursor.execute(
+                    f"CREATE UNIQUE INDEX IF NOT EXISTS {index_name} ON {table} ({column_list})"
+                )
+
+    def _backfill_poll_tallies(self, cursor: sqlite3.Cursor) -> None:
+        """Populate poll_tallies from the votes already in the database"""
+        for sql in POLL_TALLY_REBUILD_SQL:
+            cursor.execute(sql.format(where=""))
+        cursor.execute("SELECT COUNT(DISTINCT poll_id) FROM poll_tallies")
+        logger.info(f"Backfilled vote tallies for {cursor.fetchone()[0]} polls")
+
     def database_exists(self) -> bool:
         """Check if database file exists"""
         return Path(self.db_path).exists()
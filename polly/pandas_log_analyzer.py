@@ -4,8 +4,7 @@ Advanced log parsing and analysis using pandas for better performance and analyt
 """
 
 import logging
-import os
-import re
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Tuple
@@ -14,6 +13,8 @@ import asyncio
 from concurrent.futures import ThreadPoolExecutor
 import functools
 
+from .log_index import LogIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,9 +27,8 @@ class PandasLogAnalyzer:
             "logs/polly.log", 
             "logs/dev.log"
         ]
-        self.log_pattern = re.compile(
-            r'^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),\d+ - (\w+) - (.+)$'
-        )
+        # Parses only what was appended to the log files since the last request
+        self.index = LogIndex(self.log_files)
         self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="log_parser")
     
     def parse_logs_to_dataframe(
@@ -37,95 +37,12 @@ class PandasLogAnalyzer:
         level_filter: Optional[str] = None,
         search_filter: Optional[str] = None
     ) -> pd.DataFrame:
-        """Parse all log files into a pandas DataFrame for advanced analysis"""
-        
-        all_log_data = []
-        
-        for log_file in self.log_files:
-            if not os.path.exists(log_file):
-                continue
-                
-            try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, 1):
-                        line = line.strip()
-                        if not line:
-                            continue
-                        
-                        # Parse structured log entry
-                        match = self.log_pattern.match(line)
-                        if match:
-                            timestamp_str, level, message = match.groups()
-                            
-                            try:
-                                timestamp = pd.to_datetime(timestamp_str, format='%Y-%m-%d %H:%M:%S')
-                            except ValueError:
-                                timestamp = pd.Timestamp.now()
-                            
-                            log_entry = {
-                                'timestamp': timestamp,
-                                'level': level,
-                                'message': message,
-                                'file': log_file,
-                                'line_number': line_num,
-                                'message_length': len(message),
-                                'hour': timestamp.hour,
-                                'day_of_week': timestamp.day_name(),
-                                'date': timestamp.date()
-                            }
-                            
-                            # Extract additional metadata from message
-                            log_entry.update(self._extract_message_metadata(message))
-                            
-                            all_log_data.append(log_entry)
-                        else:
-                            # Handle unstructured log lines
-                            timestamp = pd.Timestamp.now()
-                            unstructured_entry = {
-                                'timestamp': timestamp,
-                                'level': 'UNSTRUCTURED',
-                                'message': line,
-                                'file': log_file,
-                                'line_number': line_num,
-                                'message_length': len(line),
-                                'hour': timestamp.hour,
-                                'day_of_week': timestamp.day_name(),
-                                'date': timestamp.date(),
-                                'is_error': False,
-                                'has_poll_id': False,
-                                'has_user_id': False,
-                                'has_server_id': False,
-                                'poll_id': None,
-                                'user_id': None,
-                                'server_id': None,
-                                'endpoint': None,
-                                'status_code': None,
-                                'response_time': None
-                            }
-                            all_log_data.append(unstructured_entry)
-                            
-            except Exception as e:
-                logger.error(f"Error parsing log file {log_file}: {e}")
-                continue
+        """Filtered log entries from the incremental index, most recent first"""
         
-        if not all_log_data:
+        df = self.index.refresh()
+        if df.empty:
             return pd.DataFrame()
         
-        # Create DataFrame with optimized dtypes for performance
-        df = pd.DataFrame(all_log_data)
-        
-        # Optimize data types for better performance (pandas best practice)
-        if not df.empty:
-            # Convert categorical columns for memory efficiency
-            df['level'] = df['level'].astype('category')
-            df['file'] = df['file'].astype('category')
-            df['day_of_week'] = df['day_of_week'].astype('category')
-            
-            # Optimize numeric columns
-            df['line_number'] = pd.to_numeric(df['line_number'], downcast='integer')
-            df['message_length'] = pd.to_numeric(df['message_length'], downcast='integer')
-            df['hour'] = pd.to_numeric(df['hour'], downcast='integer')
-        
         # Apply filters
         if time_cutoff:
             df = df[df['timestamp'] >= time_cutoff]
@@ -139,106 +56,12 @@ class PandasLogAnalyzer:
         # Sort by timestamp (most recent first)
         df = df.sort_values('timestamp', ascending=False)
         
-        return df
-    
-    def _extract_message_metadata(self, message: str) -> Dict[str, Any]:
-        """Extract metadata from log message content with enhanced patterns"""
-        metadata = {
-            'is_error': False,
-            'has_poll_id': False,
-            'has_user_id': False,
-            'has_server_id': False,
-            'poll_id': None,
-            'user_id': None,
-            'server_id': None,
-            'endpoint': None,
-            'status_code': None,
-            'response_time': None
-        }
-        
-        # Enhanced error detection with more patterns
-        error_keywords = ['error', 'exception', 'failed', 'traceback', 'critical', 'warning', 'timeout', 'refused']
-        metadata['is_error'] = any(keyword in message.lower() for keyword in error_keywords)
-        
-        # Enhanced poll ID extraction with multiple patterns
-        poll_patterns = [
-            r'poll[_\s]?(?:id)?[:\s]+(\d+)',
-            r'poll\s*=\s*(\d+)',
-            r'#(\d+)',  # Poll ID in format #123
-        ]
-        for pattern in poll_patterns:
-            poll_match = re.search(pattern, message, re.IGNORECASE)
-            if poll_match:
-                metadata['has_poll_id'] = True
-                metadata['poll_id'] = int(poll_match.group(1))
-                break
-        
-        # Enhanced user ID extraction
-        user_patterns = [
-            r'user[_\s]?(?:id)?[:\s]+(\d+)',
-            r'@(\d+)',  # Discord mention format
-            r'creator[_\s]?(?:id)?[:\s]+(\d+)'
-        ]
-        for pattern in user_patterns:
-            user_match = re.search(pattern, message, re.IGNORECASE)
-            if user_match:
-                metadata['has_user_id'] = True
-                metadata['user_id'] = user_match.group(1)
-                break
-        
-        # Enhanced server/guild ID extraction
-        server_patterns = [
-            r'server[_\s]?(?:id)?[:\s]+(\d+)',
-            r'guild[_\s]?(?:id)?[:\s]+(\d+)'
-        ]
-        for pattern in server_patterns:
-            server_match = re.search(pattern, message, re.IGNORECASE)
-            if server_match:
-                metadata['has_server_id'] = True
-                metadata['server_id'] = server_match.group(1)
-                break
-        
-        # Enhanced HTTP endpoint extraction
-        endpoint_patterns = [
-            r'(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\s+([/\w\-\{\}]+)',
-            r'endpoint[:\s]+([/\w\-\{\}]+)',
-            r'route[:\s]+([/\w\-\{\}]+)'
-        ]
-        for pattern in endpoint_patterns:
-            endpoint_match = re.search(pattern, message, re.IGNORECASE)
-            if endpoint_match:
-                if len(endpoint_match.groups()) == 2:
-                    metadata['endpoint'] = f"{endpoint_match.group(1)} {endpoint_match.group(2)}"
-                else:
-                    metadata['endpoint'] = endpoint_match.group(1)
-                break
-        
-        # Enhanced status code extraction
-        status_patterns = [
-            r'status[:\s]+(\d{3})',
-            r'HTTP[:\s]+(\d{3})',
-            r'response[:\s]+(\d{3})'
-        ]
-        for pattern in status_patterns:
-            status_match = re.search(pattern, message, re.IGNORECASE)
-            if status_match:
-                metadata['status_code'] = int(status_match.group(1))
-                break
-        
-        # Enhanced response time extraction
-        time_patterns = [
-            r'(\d+(?:\.\d+)?)\s*ms',
-            r'(\d+(?:\.\d+)?)\s*milliseconds',
-            r'took\s+(\d+(?:\.\d+)?)\s*ms',
-            r'duration[:\s]+(\d+(?:\.\d+)?)\s*ms'
-        ]
-        for pattern in time_patterns:
-            time_match = re.search(pattern, message, re.IGNORECASE)
-            if time_match:
-                metadata['response_time'] = float(time_match.group(1))
-                break
-        
-        return metadata
+        # Calendar columns are only derived for the rows a query returns
+        return df.assign(
+            hour=pd.to_numeric(df['timestamp'].dt.hour, downcast='integer'),
+            day_of_week=df['timestamp'].dt.day_name().astype('category'),
+            date=df['timestamp'].dt.date,
+        )
     
     def get_log_analytics(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Generate comprehensive log analytics from DataFrame with enhanced metrics"""
@@ -431,8 +254,8 @@ class PandasLogAnalyzer:
         # Apply category and severity filters after initial parsing
         if not df.empty:
             # Add category and severity columns for filtering
-            df['category'] = df.apply(lambda row: self._categorize_log_entry(row), axis=1)
-            df['severity_score'] = df.apply(lambda row: self._calculate_severity_score(row), axis=1)
+            df['category'] = self._categorize_log_entries(df)
+            df['severity_score'] = self._calculate_severity_scores(df)
             
             # Apply category filter
             if category_filter:
@@ -472,8 +295,8 @@ class PandasLogAnalyzer:
                     'endpoint': str(row['endpoint']) if row.get('endpoint') is not None and not pd.isna(row['endpoint']) else None,
                     'status_code': int(row['status_code']) if row.get('status_code') is not None and not pd.isna(row['status_code']) else None,
                     'response_time': float(row['response_time']) if row.get('response_time') is not None and not pd.isna(row['response_time']) else None,
-                    'severity_score': self._calculate_severity_score(row),
-                    'category': self._categorize_log_entry(row)
+                    'severity_score': int(row['severity_score']),
+                    'category': row['category']
                 }
             }
             log_entries.append(log_entry)
@@ -509,10 +332,8 @@ class PandasLogAnalyzer:
         }
         return level_map.get(level.upper(), 20)
     
-    def _calculate_severity_score(self, row) -> int:
-        """Calculate severity score (0-100) based on log entry characteristics"""
-        score = 0
-        
+    def _calculate_severity_scores(self, df: pd.DataFrame) -> pd.Series:
+        """Severity score (0-100) per log entry based on its characteristics"""
         # Base score from log level
         level_scores = {
             'DEBUG': 5,
@@ -522,60 +343,50 @@ class PandasLogAnalyzer:
             'CRITICAL': 90,
             'UNSTRUCTURED': 15
         }
-        score += level_scores.get(str(row.get('level', 'INFO')).upper(), 10)
+        score = df['level'].astype(str).str.upper().map(level_scores).fillna(10)
         
         # Add points for error indicators
-        if row.get('is_error', False):
-            score += 20
+        score += np.where(df['is_error'], 20, 0)
         
         # Add points for slow performance
-        if row.get('response_time') and float(row.get('response_time', 0)) > 1000:
-            score += 15
+        score += np.where(df['response_time'] > 1000, 15, 0)
         
         # Add points for HTTP error status codes
-        status_code = row.get('status_code')
-        if status_code:
-            if status_code >= 500:
-                score += 25
-            elif status_code >= 400:
-                score += 15
+        status_code = df['status_code']
+        score += np.select([status_code >= 500, status_code >= 400], [25, 15], default=0)
         
         # Cap at 100
-        return min(score, 100)
+        return score.clip(upper=100).astype(int)
     
-    def _categorize_log_entry(self, row) -> str:
-        """Categorize log entry into functional areas"""
-        message = str(row.get('message', '')).lower()
-        
-        # Poll-related operations
-        if row.get('has_poll_id') or any(keyword in message for keyword in ['poll', 'vote', 'option']):
-            return 'poll_operations'
-        
-        # Discord bot operations
-        if any(keyword in message for keyword in ['discord', 'bot', 'guild', 'channel', 'user']):
-            return 'discord_operations'
-        
-        # HTTP/API operations
-        if row.get('endpoint') or any(keyword in message for keyword in ['http', 'api', 'request', 'response']):
-            return 'api_operations'
-        
-        # Database operations
-        if any(keyword in message for keyword in ['database', 'db', 'sql', 'query']):
-            return 'database_operations'
-        
-        # Authentication/Security
-        if any(keyword in message for keyword in ['auth', 'login', 'token', 'permission', 'security']):
-            return 'auth_security'
-        
-        # System/Infrastructure
-        if any(keyword in message for keyword in ['redis', 'cache', 'memory', 'startup', 'shutdown']):
-            return 'system_infrastructure'
-        
-        # Error handling
-        if row.get('is_error') or any(keyword in message for keyword in ['error', 'exception', 'failed']):
-            return 'error_handling'
-        
-        return 'general'
+    def _categorize_log_entries(self, df: pd.DataFrame) -> pd.Series:
+        """Categorize log entries into functional areas (first matching area wins)"""
+        message = df['message'].str.lower()
+        
+        def mentions(*keywords: str) -> pd.Series:
+            return message.str.contains('|'.join(keywords), regex=True, na=False)
+        
+        areas = [
+            # Poll-related operations
+            ('poll_operations', df['has_poll_id'] | mentions('poll', 'vote', 'option')),
+            # Discord bot operations
+            ('discord_operations', mentions('discord', 'bot', 'guild', 'channel', 'user')),
+            # HTTP/API operations
+            ('api_operations', df['endpoint'].notna() | mentions('http', 'api', 'request', 'response')),
+            # Database operations
+            ('database_operations', mentions('database', 'db', 'sql', 'query')),
+            # Authentication/Security
+            ('auth_security', mentions('auth', 'login', 'token', 'permission', 'security')),
+            # System/Infrastructure
+            ('system_infrastructure', mentions('redis', 'cache', 'memory', 'startup', 'shutdown')),
+            # Error handling
+            ('error_handling', df['is_error'] | mentions('error', 'exception', 'failed')),
+        ]
+        categories = np.select(
+            [condition.to_numpy(dtype=bool) for _, condition in areas],
+            [name for name, _ in areas],
+            default='general'
+        )
+        return pd.Series(categories, index=df.index)
     
     async def get_filtered_logs_async(
         self,
@@ -656,16 +467,21 @@ class PandasLogAnalyzer:
         return json.dumps(analytics, indent=2, default=str)
     
     def get_error_trends(self, days: int = 7) -> Dict[str, Any]:
-        """Analyze error trends over time"""
+        """Analyze error trends over time from the index's hourly rollups"""
         cutoff = datetime.now() - timedelta(days=days)
-        df = self.parse_logs_to_dataframe(time_cutoff=cutoff)
+        self.index.refresh()
+        rollups = self.index.get_rollups(since=cutoff)
         
-        if df.empty:
+        if rollups.empty:
             return {'daily_errors': {}, 'error_types': {}, 'trend': 'stable'}
         
         # Group errors by date
-        error_df = df[df['is_error'] == True]
-        daily_errors = error_df.groupby('date').size()
+        errors = rollups['errors']
+        daily_errors = errors.groupby(rollups.index.get_level_values('hour').date).sum()
+        daily_errors = daily_errors[daily_errors > 0]
+        error_types = errors.groupby(level='level').sum().sort_values(ascending=False)
+        total_errors = int(errors.sum())
+        total_entries = int(rollups['entries'].sum())
         
         # Analyze trend
         if len(daily_errors) > 1:
@@ -683,10 +499,10 @@ class PandasLogAnalyzer:
         
         return {
             'daily_errors': {str(date): int(count) for date, count in daily_errors.items()},
-            'error_types': {level: int(count) for level, count in error_df['level'].value_counts().items()},
+            'error_types': {level: int(count) for level, count in error_types.items() if count > 0},
             'trend': trend,
-            'total_errors': int(len(error_df)),
-            'error_rate': round((len(error_df) / len(df)) * 100, 2) if len(df) > 0 else 0
+            'total_errors': total_errors,
+            'error_rate': round((total_errors / total_entries) * 100, 2) if total_entries > 0 else 0
         }
 
 
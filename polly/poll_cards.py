@@ -0,0 +1,175 @@
+"""
+Polly Poll Cards
+Lightweight read model for the dashboard poll list.
+
+The poll list only needs a handful of columns and a vote total per poll, so
+instead of loading full ``Poll`` rows (and their votes) it selects just the
+card columns joined to the whole-poll ``poll_tallies`` row in one query.
+Cards are compact ``__slots__`` records that expose the same attribute and
+``get_total_votes()`` interface the card templates already use, and they
+round-trip through the Redis poll-list cache.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func, select
+
+try:
+    from .database import Poll, PollTally
+    from .migrations import POLL_TOTAL_TALLY_INDEX
+except ImportError:
+    from database import Poll, PollTally  # type: ignore
+    from migrations import POLL_TOTAL_TALLY_INDEX  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+POLL_STATUS_CLASSES = {
+    "active": "bg-success",
+    "scheduled": "bg-warning",
+    "closed": "bg-danger",
+}
+
+_DATETIME_FIELDS = ("open_time", "close_time", "created_at")
+
+
+class PollCard:
+    """Card columns and vote total for one poll"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "question",
+        "status",
+        "server_name",
+        "channel_name",
+        "anonymous",
+        "multiple_choice",
+        "open_time",
+        "close_time",
+        "created_at",
+        "total_votes",
+    )
+
+    def __init__(
+        self,
+        id: int,
+        name: str,
+        question: str,
+        status: str,
+        server_name: Optional[str],
+        channel_name: Optional[str],
+        anonymous: bool,
+        multiple_choice: bool,
+        open_time: Optional[datetime],
+        close_time: Optional[datetime],
+        created_at: Optional[datetime],
+        total_votes: int,
+    ):
+        self.id = id
+        self.name = name
+        self.question = question
+        self.status = status
+        self.server_name = server_name
+        self.channel_name = channel_name
+        self.anonymous = anonymous
+        self.multiple_choice = multiple_choice
+        self.open_time = open_time
+        self.close_time = close_time
+        self.created_at = created_at
+        self.total_votes = total_votes
+
+    @property
+    def status_class(self) -> str:
+        return POLL_STATUS_CLASSES.get(self.status, "bg-secondary")
+
+    def get_total_votes(self) -> int:
+        """Same meaning as Poll.get_total_votes (unique voters for multiple choice)"""
+        return self.total_votes
+
+    def to_cache_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form for the poll-list cache"""
+        data = {field: getattr(self, field) for field in self.__slots__}
+        for field in _DATETIME_FIELDS:
+            if data[field] is not None:
+                data[field] = data[field].isoformat()
+        return data
+
+    @classmethod
+    def from_cache_dict(cls, data: Dict[str, Any]) -> "PollCard":
+        """Rebuild a card from ``to_cache_dict`` output"""
+        values = {field: data.get(field) for field in cls.__slots__}
+        for field in _DATETIME_FIELDS:
+            value = values[field]
+            if value:
+                try:
+                    values[field] = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                except (ValueError, AttributeError):
+                    values[field] = None
+            else:
+                values[field] = None
+        values["anonymous"] = bool(values["anonymous"])
+        values["multiple_choice"] = bool(values["multiple_choice"])
+        values["total_votes"] = values["total_votes"] or 0
+        return cls(**values)
+
+
+def poll_cards_query(creator_id: str, status: Optional[str] = None):
+    """SELECT for a creator's poll cards, newest first"""
+    stmt = (
+        select(
+            Poll.id,
+            Poll.name,
+            Poll.question,
+            Poll.status,
+            Poll.server_name,
+            Poll.channel_name,
+            Poll.anonymous,
+            Poll.multiple_choice,
+            Poll.open_time,
+            Poll.close_time,
+            Poll.created_at,
+            func.coalesce(PollTally.count, 0),
+            func.coalesce(PollTally.unique_voters, 0),
+        )
+        .outerjoin(
+            PollTally,
+            and_(
+                PollTally.poll_id == Poll.id,
+                PollTally.option_index == POLL_TOTAL_TALLY_INDEX,
+            ),
+        )
+        .where(Poll.creator_id == creator_id)
+    )
+    if status:
+        stmt = stmt.where(Poll.status == status)
+    return stmt.order_by(Poll.created_at.desc())
+
+
+def _card_from_row(row) -> PollCard:
+    (
+        poll_id, name, question, status, server_name, channel_name,
+        anonymous, multiple_choice, open_time, close_time, created_at,
+        vote_count, unique_voters,
+    ) = row
+    return PollCard(
+        id=poll_id,
+        name=name,
+        question=question,
+        status=status,
+        server_name=server_name,
+        channel_name=channel_name,
+        anonymous=bool(anonymous),
+        multiple_choice=bool(multiple_choice),
+        open_time=open_time,
+        close_time=close_time,
+        created_at=created_at,
+        total_votes=unique_voters if multiple_choice else vote_count,
+    )
+
+
+async def load_poll_cards(db, creator_id: str, status: Optional[str] = None) -> List[PollCard]:
+    """Load a creator's poll cards with one query on an AsyncSession"""
+    result = await db.execute(poll_cards_query(creator_id, status))
+    return [_card_from_row(row) for row in result.all()]
@@ -0,0 +1,127 @@
+"""
+Polly Poll Message Updater
+Debounced, coalescing Discord embed updates for live vote counts.
+
+Every recorded vote asks for the poll embed to be refreshed. Instead of one
+``message.edit`` per vote, requests are coalesced per poll so at most one
+edit is sent per window (``POLL_EMBED_UPDATE_INTERVAL`` seconds). The poll is
+reloaded on the DB thread pool when the edit actually runs, so the edit
+always carries the latest vote counts without blocking the event loop.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from decouple import config
+from sqlalchemy.orm import selectinload
+
+try:
+    from .database import Poll, run_in_db_session
+    from .discord_utils import update_poll_message
+except ImportError:
+    from database import Poll, run_in_db_session  # type: ignore
+    from discord_utils import update_poll_message  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class PollMessageUpdateCoalescer:
+    """Allows at most one embed edit per poll per window, always with fresh counts"""
+
+    def __init__(self):
+        # Configuration
+        self.min_interval = config("POLL_EMBED_UPDATE_INTERVAL", default=2.0, cast=float)
+
+        # poll_id -> monotonic time of the last edit
+        self._last_edit: Dict[int, float] = {}
+        # poll_id -> scheduled edit task
+        self._scheduled: Dict[int, asyncio.Task] = {}
+
+        # Metrics
+        self.requests_received = 0
+        self.edits_sent = 0
+        self.edits_failed = 0
+        self.edits_saved = 0
+
+    def request_update(self, bot, poll_id: int) -> None:
+        """Ask for the poll embed to be refreshed; returns immediately"""
+        self.requests_received += 1
+
+        if poll_id in self._scheduled:
+            # An edit is already queued and will pick up this vote
+            self.edits_saved += 1
+            return
+
+        now = time.monotonic()
+        delay = max(0.0, self._last_edit.get(poll_id, 0.0) + self.min_interval - now)
+        self._scheduled[poll_id] = asyncio.create_task(
+            self._run_update(bot, poll_id, delay)
+        )
+
+    async def _run_update(self, bot, poll_id: int, delay: float) -> None:
+        try:
+            if delay:
+                await asyncio.sleep(delay)
+        finally:
+            # Unschedule before editing so votes landing during the edit
+            # queue a follow-up edit for the next window
+            self._scheduled.pop(poll_id, None)
+        self._last_edit[poll_id] = time.monotonic()
+
+        try:
+            poll = await run_in_db_session(
+                lambda db: db.query(Poll)
+                .options(selectinload(Poll.tallies))
+                .filter(Poll.id == poll_id)
+                .first()
+            )
+            if not poll:
+                self._last_edit.pop(poll_id, None)
+                return
+
+            if await update_poll_message(bot, poll):
+                self.edits_sent += 1
+                logger.debug(f"✅ Poll message updated for poll {poll_id}")
+            else:
+                self.edits_failed += 1
+        except Exception as e:
+            self.edits_failed += 1
+            logger.error(f"❌ Failed to update poll message for poll {poll_id}: {e}")
+
+        # Forget polls that have gone quiet so the map stays small
+        cutoff = time.monotonic() - max(self.min_interval * 10, 60.0)
+        for stale_poll_id in [
+            pid for pid, at in self._last_edit.items()
+            if at < cutoff and pid not in self._scheduled
+        ]:
+            del self._last_edit[stale_poll_id]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "update_requests": self.requests_received,
+            "edits_sent": self.edits_sent,
+            "edits_failed": self.edits_failed,
+            "edits_saved": self.edits_saved,
+            "pending_edits": len(self._scheduled),
+            "min_interval_seconds": self.min_interval,
+        }
+
+
+# Global coalescer instance
+_poll_message_updater: Optional[PollMessageUpdateCoalescer] = None
+
+
+def get_poll_message_updater() -> PollMessageUpdateCoalescer:
+    """Get or create the poll message update coalescer instance"""
+    global _poll_message_updater
+    if _poll_message_updater is None:
+        _poll_message_updater = PollMessageUpdateCoalescer()
+    return _poll_message_updater
+
+
+def request_poll_message_update(bot, poll_id: int) -> None:
+    """Queue a coalesced embed refresh for ``poll_id``"""
+    get_poll_message_updater().request_update(bot, poll_id)
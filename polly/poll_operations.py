@@ -20,17 +20,17 @@ from PIL import Image
 
 # Handle both relative and absolute imports for direct execution
 try:
-    from .validators import PollValidator, VoteValidator
+    from .validators import PollValidator
     from .error_handler import PollErrorHandler, DiscordErrorHandler, critical_operation
-    from .database import get_db_session, Poll, Vote, TypeSafeColumn
+    from .database import get_db_session, Poll, TypeSafeColumn
 except ImportError:
     # Fallback for direct execution
     import sys
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from validators import PollValidator, VoteValidator
+    from validators import PollValidator
     from error_handler import PollErrorHandler, DiscordErrorHandler, critical_operation
-    from database import get_db_session, Poll, Vote, TypeSafeColumn
+    from database import get_db_session, Poll, TypeSafeColumn
     
 logger = logging.getLogger(__name__)
 
@@ -453,257 +453,26 @@ class BulletproofPollOperations:
     async def bulletproof_vote_collection(
         self, poll_id: int, user_id: str, option_index: int
     ) -> Dict[str, Any]:
-        """Ultra-bulletproof vote collection with atomic transactions and integrity checks."""
-        vote_recorded = False
-        retry_count = 0
-        max_retries = 3
-        vote_action = "unknown"  # Initialize vote_action
+        """Ultra-bulletproof vote collection with atomic transactions and integrity checks.
 
-        while retry_count < max_retries and not vote_recorded:
-            try:
-                retry_count += 1
-                logger.debug(
-                    f"Vote collection attempt {retry_count} for poll {poll_id}, user {user_id}"
-                )
-
-                # Step 1: Atomic database transaction with isolation
-                db = get_db_session()
-                try:
-                    # Use database transaction with proper isolation
-                    db.begin()
-
-                    # Step 1a: Get poll with row-level locking to prevent race conditions
-                    poll = (
-                        db.query(Poll)
-                        .filter(Poll.id == poll_id)
-                        .with_for_update()
-                        .first()
-                    )
-                    if not poll:
-                        db.rollback()
-                        return {"success": False, "error": "Poll not found"}
-
-                    if TypeSafeColumn.get_string(poll, "status") != "active":
-                        db.rollback()
-                        return {
-                            "success": False,
-                            "error": f"Poll is not active (status: {TypeSafeColumn.get_string(poll, 'status')})",
-                        }
-
-                    # Step 1b: Validate vote data using existing validator,
-                    # adopting the normalized (user_id, option_index) so any
-                    # whitespace stripping persists into the recorded Vote row.
-                    try:
-                        user_id, option_index = VoteValidator.validate_vote_data(
-                            poll, user_id, option_index
-                        )
-                    except Exception as e:
-                        db.rollback()
-                        return {"success": False, "error": str(e)}
-
-                    # Step 2: Bulletproof vote recording with multiple choice support
-                    multiple_choice_value = TypeSafeColumn.get_bool(
-                        poll, "multiple_choice", False
-                    )
-                    if multiple_choice_value:
-                        # Multiple choice: Check if user already voted for this specific option
-                        existing_vote = (
-                            db.query(Vote)
-                            .filter(
-                                Vote.poll_id == poll_id,
-                                Vote.user_id == user_id,
-                                Vote.option_index == option_index,
-                            )
-                            .with_for_update()
-                            .first()
-                        )
-
-                        if existing_vote:
-                            # User already voted for this option - remove the vote (toggle off)
-                            db.delete(existing_vote)
-                            vote_action = "removed"
-                            logger.debug(
-                                f"Removed vote for user {user_id}: option {option_index}"
-                            )
-                        else:
-                            # User hasn't voted for this option - add the vote
-                            vote = Vote(
-                                poll_id=poll_id,
-                                user_id=user_id,
-                                option_index=option_index,
-                            )
-                            db.add(vote)
-                            vote_action = "added"
-                            logger.debug(
-                                f"Added vote for user {user_id}: option {option_index}"
-                            )
-                    else:
-                        # Single choice: Replace any existing vote
-                        existing_vote = (
-                            db.query(Vote)
-                            .filter(Vote.poll_id == poll_id, Vote.user_id == user_id)
-                            .with_for_update()
-                            .first()
-                        )
-
-                        if existing_vote:
-                            # Check if user is clicking the same option they already voted for
-                            if existing_vote.option_index == option_index:
-                                # User clicked the same option they already voted for
-                                vote_action = "already_recorded"
-                                logger.debug(
-                                    f"User {user_id} clicked same option {option_index} they already voted for"
-                                )
-                                # Don't modify the database - vote is already recorded correctly
-                            else:
-                                # User is changing their vote to a different option
-                                vote_action = "updated"
-                                old_option = existing_vote.option_index
-                                setattr(existing_vote, "option_index", option_index)
-                                setattr(
-                                    existing_vote, "voted_at", datetime.now(timezone.utc)
-                                )
-                                logger.debug(
-                                    f"Updated vote for user {user_id}: {old_option} -> {option_index}"
-                                )
-                        else:
-                            # Create new vote atomically
-                            vote_action = "created"
-                            vote = Vote(
-                                poll_id=poll_id,
-                                user_id=user_id,
-                                option_index=option_index,
-                            )
-                            db.add(vote)
-                            logger.debug(
-                                f"Created new vote for user {user_id}: option {option_index}"
-                            )
-
-                    # Step 3: Commit transaction atomically
-                    db.commit()
-                    vote_recorded = True
-
-                    # Step 4: Verify vote was recorded correctly
-                    if vote_action == "removed":
-                        # For removed votes, verify the vote no longer exists
-                        verification_vote = (
-                            db.query(Vote)
-                            .filter(
-                                Vote.poll_id == poll_id,
-                                Vote.user_id == user_id,
-                                Vote.option_index == option_index,
-                            )
-                            .first()
-                        )
-
-                        if verification_vote:
-                            logger.error(
-                                f"Vote removal verification failed for poll {poll_id}, user {user_id}"
-                            )
-                            return {
-                                "success": False,
-                                "error": "Vote removal verification failed",
-                            }
-                    elif vote_action == "already_recorded":
-                        # For already_recorded votes, just verify the vote exists with correct option
-                        # No database changes were made, so just verify the existing vote is correct
-                        verification_vote = (
-                            db.query(Vote)
-                            .filter(
-                                Vote.poll_id == poll_id, Vote.user_id == user_id
-                            )
-                            .first()
-                        )
-
-                        if (
-                            not verification_vote
-                            or verification_vote.option_index != option_index
-                        ):
-                            logger.error(
-                                f"Already recorded vote verification failed for poll {poll_id}, user {user_id}"
-                            )
-                            return {
-                                "success": False,
-                                "error": "Already recorded vote verification failed",
-                            }
-                    else:
-                        # For added/updated/created votes, verify the vote exists with correct option
-                        multiple_choice_verification = TypeSafeColumn.get_bool(
-                            poll, "multiple_choice", False
-                        )
-                        if multiple_choice_verification is True:
-                            # Multiple choice: verify specific vote exists
-                            verification_vote = (
-                                db.query(Vote)
-                                .filter(
-                                    Vote.poll_id == poll_id,
-                                    Vote.user_id == user_id,
-                                    Vote.option_index == option_index,
-                                )
-                                .first()
-                            )
-                        else:
-                            # Single choice: verify user has exactly one vote with correct option
-                            verification_vote = (
-                                db.query(Vote)
-                                .filter(
-                                    Vote.poll_id == poll_id, Vote.user_id == user_id
-                                )
-                                .first()
-                            )
-
-                        if (
-                            not verification_vote
-                            or verification_vote.option_index != option_index
-                        ):
-                            logger.error(
-                                f"Vote verification failed for poll {poll_id}, user {user_id}"
-                            )
-                            return {
-                                "success": False,
-                                "error": "Vote verification failed",
-                            }
-
-                    logger.info(
-                        f"Successfully {vote_action} vote for poll {poll_id}, user {user_id}, option {option_index}"
-                    )
-
-                except Exception as db_error:
-                    db.rollback()
-                    logger.warning(
-                        f"Database error on attempt {retry_count}: {db_error}"
-                    )
-                    if retry_count >= max_retries:
-                        raise db_error
-                    # Wait briefly before retry to avoid rapid-fire retries
-                    await asyncio.sleep(0.1 * retry_count)
-                    continue
+        Votes go through the batched ingestion queue, which coalesces
+        concurrent votes into one transaction per poll per micro-batch and
+        retries the batch on database errors. The returned dict is this
+        vote's own result (``action`` is one of added/removed for multiple
+        choice polls, created/updated/already_recorded for single choice).
+        """
+        from .vote_ingestion import get_vote_ingestion_queue
 
-                finally:
-                    db.close()
+        logger.debug(
+            f"Queueing vote for poll {poll_id}, user {user_id}, option {option_index}"
+        )
+        result = await get_vote_ingestion_queue().submit(poll_id, user_id, option_index)
 
-            except Exception as e:
-                logger.error(f"Vote collection attempt {retry_count} failed: {e}")
-                if retry_count >= max_retries:
-                    return {
-                        "success": False,
-                        "error": f"Vote collection failed after {max_retries} attempts: {str(e)}",
-                    }
-                # Wait before retry
-                await asyncio.sleep(0.1 * retry_count)
-
-        if vote_recorded:
-            return {
-                "success": True,
-                "message": f"Vote {vote_action} successfully after {retry_count} attempt(s)",
-                "action": vote_action,
-                "attempts": retry_count,
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Failed to record vote after {max_retries} attempts",
-            }
+        if result["success"]:
+            logger.info(
+                f"Successfully {result['action']} vote for poll {poll_id}, user {user_id}, option {option_index}"
+            )
+        return result
 
     @critical_operation("bulletproof_poll_closure")
     async def bulletproof_poll_closure(
@@ -0,0 +1,203 @@
+"""
+Polly Poll Results Stream
+Server-Sent Events push for live poll results.
+
+Open poll pages subscribe to a per-poll notification queue instead of
+polling. Whenever votes are committed (or a poll changes state) the poll is
+announced on an in-process pub/sub; each subscribed stream re-renders its
+results fragment and pushes it only if it changed. Announcements are also
+published on a Redis channel so streams held by other web workers wake up too.
+"""
+
+import asyncio
+import logging
+import uuid
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+POLL_RESULTS_CHANNEL = "polly:poll_results"
+
+
+def format_sse(event: str, data: str) -> str:
+    """Encode one SSE message (multi-line data gets one ``data:`` line per line)"""
+    lines = "\n".join(f"data: {line}" for line in str(data).splitlines() or [""])
+    return f"event: {event}\n{lines}\n\n"
+
+
+class PollResultsBroadcaster:
+    """In-process pub/sub of "poll results changed" with Redis fan-out across workers"""
+
+    def __init__(self):
+        # Configuration
+        self.heartbeat_interval = config("SSE_HEARTBEAT_SECONDS", default=15.0, cast=float)
+        self.redis_fanout = config("SSE_REDIS_FANOUT", default=True, cast=bool)
+
+        # Identifies our own messages on the Redis channel
+        self.worker_id = uuid.uuid4().hex
+        # poll_id -> queues of the streams watching it
+        self._subscribers: Dict[int, Set[asyncio.Queue]] = {}
+        self._listener_task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.notifications = 0
+        self.remote_notifications = 0
+        self.fragments_pushed = 0
+        self.pushes_skipped = 0
+
+    def subscribe(self, poll_id: int) -> asyncio.Queue:
+        """Register a stream for ``poll_id``; the queue receives a token per change"""
+        # maxsize=1: changes that land while a stream is rendering coalesce into one
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._subscribers.setdefault(poll_id, set()).add(queue)
+        if self.redis_fanout and (self._listener_task is None or self._listener_task.done()):
+            self._listener_task = asyncio.create_task(self._listen_remote())
+        return queue
+
+    def unsubscribe(self, poll_id: int, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(poll_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[poll_id]
+
+    def _deliver(self, poll_id: int) -> None:
+        for queue in self._subscribers.get(poll_id, ()):
+            if queue.empty():
+                queue.put_nowait(poll_id)
+
+    async def publish(self, poll_id: int) -> None:
+        """Wake local streams for ``poll_id`` and announce it to other workers"""
+        self.notifications += 1
+        self._deliver(poll_id)
+
+        if not self.redis_fanout:
+            return
+        try:
+            from .redis_client import get_redis_client
+
+            redis_client = await get_redis_client()
+            await redis_client.publish(POLL_RESULTS_CHANNEL, f"{self.worker_id}:{poll_id}")
+        except Exception as e:
+            logger.debug(f"Could not publish poll {poll_id} results change to Redis: {e}")
+
+    async def _listen_remote(self) -> None:
+        """Relay other workers' announcements while any stream is subscribed"""
+        from .redis_client import get_redis_client
+
+        while self._subscribers:
+            pubsub = None
+            try:
+                redis_client = await get_redis_client()
+                pubsub = await redis_client.pubsub()
+                if pubsub is None:
+                    await asyncio.sleep(5)
+                    continue
+                await pubsub.subscribe(POLL_RESULTS_CHANNEL)
+
+                while self._subscribers:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if not message or message.get("type") != "message":
+                        continue
+                    origin, _, poll_id = str(message["data"]).partition(":")
+                    if origin != self.worker_id and poll_id.isdigit():
+                        self.remote_notifications += 1
+                        self._deliver(int(poll_id))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ Poll results Redis listener error, retrying: {e}")
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    async def stream(
+        self,
+        poll_id: int,
+        render: Callable[[], Awaitable[Tuple[Optional[str], bool]]],
+        is_disconnected: Callable[[], Awaitable[bool]],
+    ) -> AsyncIterator[str]:
+        """Yield SSE messages for ``poll_id`` until the client leaves or the poll closes.
+
+        ``render`` returns ``(fragment, finished)``; a ``None`` fragment ends the
+        stream (poll gone or access lost). A ``results`` event carries the
+        fragment and is only sent when it differs from the last one pushed; a
+        ``tally`` event follows so other elements on the page can refresh.
+        """
+        queue = self.subscribe(poll_id)
+        last_fragment = None
+        try:
+            while True:
+                fragment, finished = await render()
+                if fragment is None:
+                    return
+
+                if fragment != last_fragment:
+                    self.fragments_pushed += 1
+                    last_fragment = fragment
+                    yield format_sse("results", fragment)
+                    yield format_sse("tally", str(poll_id))
+                else:
+                    self.pushes_skipped += 1
+
+                if finished:
+                    # Results are final: ask EventSource not to reconnect soon
+                    yield "retry: 86400000\n\n"
+                    return
+
+                while True:
+                    try:
+                        await asyncio.wait_for(queue.get(), timeout=self.heartbeat_interval)
+                        break
+                    except asyncio.TimeoutError:
+                        if await is_disconnected():
+                            return
+                        yield ": keepalive\n\n"
+        finally:
+            self.unsubscribe(poll_id, queue)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "open_streams": sum(len(queues) for queues in self._subscribers.values()),
+            "polls_watched": len(self._subscribers),
+            "notifications": self.notifications,
+            "remote_notifications": self.remote_notifications,
+            "fragments_pushed": self.fragments_pushed,
+            "pushes_skipped": self.pushes_skipped,
+        }
+
+
+# Global broadcaster instance
+_poll_results_broadcaster: Optional[PollResultsBroadcaster] = None
+
+
+def get_poll_results_broadcaster() -> PollResultsBroadcaster:
+    """Get or create the poll results broadcaster instance"""
+    global _poll_results_broadcaster
+    if _poll_results_broadcaster is None:
+        _poll_results_broadcaster = PollResultsBroadcaster()
+    return _poll_results_broadcaster
+
+
+async def notify_poll_results_changed(poll_id: int) -> None:
+    """Drop cached live results for ``poll_id`` and wake its result streams"""
+    try:
+        from .services.cache.enhanced_cache_service import get_enhanced_cache_service
+
+        redis_client = await get_enhanced_cache_service()._get_redis()
+        if redis_client:
+            await redis_client.cache_delete_many(
+                [f"live_poll_results:{poll_id}", f"poll_dashboard:{poll_id}"]
+            )
+    except Exception as e:
+        logger.debug(f"Could not invalidate live results cache for poll {poll_id}: {e}")
+
+    await get_poll_results_broadcaster().publish(poll_id)
@@ -0,0 +1,263 @@
+"""
+Polly Poll Schedule Sweeper
+Opens and closes polls when they come due, straight from the database.
+
+Replaces the per-poll APScheduler ``DateTrigger`` jobs (which lived only in
+memory and had to be rebuilt from every scheduled/active poll on restart).
+The sweeper asks the database for the next due ``open_time``/``close_time``
+(index-backed MIN queries on migration 14's status + time indexes), sleeps
+until then, and dispatches whatever is due. Nothing is lost on restart and
+startup cost does not grow with the number of future polls.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytz
+from decouple import config
+from sqlalchemy import func
+
+try:
+    from .database import get_db_session, run_db, Poll
+except ImportError:
+    from database import get_db_session, run_db, Poll  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+OPEN = "open"
+CLOSE = "close"
+# Statuses whose close_time still has to be acted on
+CLOSABLE_STATUSES = ("scheduled", "active")
+
+
+def _utc_now_naive() -> datetime:
+    """Current UTC time in the naive form poll times are stored in"""
+    return datetime.now(pytz.UTC).replace(tzinfo=None)
+
+
+def _load_due_polls(now: datetime, limit: int) -> List[Tuple[str, int]]:
+    """Blocking: (action, poll_id) for polls whose close or open time has passed"""
+    db = get_db_session()
+    try:
+        closes = (
+            db.query(Poll.id)
+            .filter(Poll.status.in_(CLOSABLE_STATUSES), Poll.close_time <= now)
+            .order_by(Poll.close_time)
+            .limit(limit)
+            .all()
+        )
+        opens = (
+            db.query(Poll.id)
+            .filter(
+                Poll.status == "scheduled",
+                Poll.open_time <= now,
+                Poll.close_time > now,
+            )
+            .order_by(Poll.open_time)
+            .limit(limit)
+            .all()
+        )
+        return [(CLOSE, row[0]) for row in closes] + [(OPEN, row[0]) for row in opens]
+    finally:
+        db.close()
+
+
+def _load_next_due_time() -> Optional[datetime]:
+    """Blocking: earliest pending open_time/close_time, or None"""
+    db = get_db_session()
+    try:
+        next_open = (
+            db.query(func.min(Poll.open_time)).filter(Poll.status == "scheduled").scalar()
+        )
+        next_close = (
+            db.query(func.min(Poll.close_time))
+            .filter(Poll.status.in_(CLOSABLE_STATUSES))
+            .scalar()
+        )
+        candidates = [t for t in (next_open, next_close) if t is not None]
+        if not candidates:
+            return None
+        return min(t.replace(tzinfo=None) if t.tzinfo else t for t in candidates)
+    finally:
+        db.close()
+
+
+class PollScheduleSweeper:
+    """Single loop that opens/closes due polls instead of one job per poll"""
+
+    def __init__(self):
+        # Configuration
+        self.max_interval_seconds = config("POLL_SWEEP_MAX_INTERVAL", default=30.0, cast=float)
+        self.batch_size = config("POLL_SWEEP_BATCH_SIZE", default=50, cast=int)
+        self.concurrency = max(1, config("POLL_SWEEP_CONCURRENCY", default=4, cast=int))
+        self.min_retry_seconds = config("POLL_SWEEP_MIN_RETRY", default=5.0, cast=float)
+        self.max_retry_seconds = config("POLL_SWEEP_MAX_RETRY", default=600.0, cast=float)
+
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        # (action, poll_id) currently being handled
+        self._in_flight: Set[Tuple[str, int]] = set()
+        # (action, poll_id) -> (attempts, monotonic time it may be retried)
+        self._retry: Dict[Tuple[str, int], Tuple[int, float]] = {}
+
+        self.sweeps = 0
+        self.opens_dispatched = 0
+        self.closes_dispatched = 0
+        self.dispatch_errors = 0
+        self.last_sweep_at: Optional[datetime] = None
+        self.next_due_at: Optional[datetime] = None
+
+    def start(self) -> None:
+        """Start the sweep loop (idempotent)"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+            logger.info("⏰ Poll schedule sweeper started")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def wake(self) -> None:
+        """Recompute the next due time now (a poll was created, edited or reopened)"""
+        self._wakeup.set()
+
+    def _is_backing_off(self, key: Tuple[str, int], now: float) -> bool:
+        entry = self._retry.get(key)
+        return entry is not None and entry[1] > now
+
+    def _record_attempt(self, key: Tuple[str, int]) -> None:
+        """A due poll was dispatched; if it is still due next sweep, back off"""
+        attempts = self._retry.get(key, (0, 0.0))[0] + 1
+        delay = min(self.min_retry_seconds * 2 ** (attempts - 1), self.max_retry_seconds)
+        self._retry[key] = (attempts, time.monotonic() + delay)
+
+    async def _dispatch(self, bot, action: str, poll_id: int) -> None:
+        key = (action, poll_id)
+        try:
+            async with self._semaphore:
+                if action == CLOSE:
+                    from .background_tasks import close_poll
+
+                    self.closes_dispatched += 1
+                    await close_poll(poll_id)
+                else:
+                    from .services.poll.poll_open_service import poll_opening_service
+
+                    self.opens_dispatched += 1
+                    result = await poll_opening_service.open_poll_unified(
+                        poll_id=poll_id, reason="scheduled", bot_instance=bot
+                    )
+                    if not result["success"]:
+                        logger.error(f"❌ SCHEDULED OPEN {poll_id} - Failed: {result.get('error')}")
+                    else:
+                        logger.info(f"✅ SCHEDULED OPEN {poll_id} - Success: {result.get('message')}")
+        except Exception as e:
+            self.dispatch_errors += 1
+            logger.error(f"❌ Poll sweeper: Error handling {action} for poll {poll_id}: {e}")
+        finally:
+            self._in_flight.discard(key)
+            # Re-check due times once this poll's status has moved on
+            self.wake()
+
+    async def run_once(self, bot) -> int:
+        """Dispatch every due poll that isn't already in flight; return how many"""
+        due = await run_db(_load_due_polls, _utc_now_naive(), self.batch_size)
+        self.sweeps += 1
+        self.last_sweep_at = datetime.now(pytz.UTC)
+
+        # Forget retry state for polls that are no longer due
+        due_keys = set(due)
+        for key in list(self._retry):
+            if key not in due_keys:
+                del self._retry[key]
+
+        now = time.monotonic()
+        dispatched = 0
+        for key in due:
+            if key in self._in_flight or self._is_backing_off(key, now):
+                continue
+            action, poll_id = key
+            self._in_flight.add(key)
+            self._record_attempt(key)
+            asyncio.create_task(self._dispatch(bot, action, poll_id))
+            dispatched += 1
+        return dispatched
+
+    async def _seconds_until_next(self) -> float:
+        next_due = await run_db(_load_next_due_time)
+        self.next_due_at = next_due
+        delay = self.max_interval_seconds
+        if next_due is not None:
+            # Overdue polls left after a sweep are in flight (their completion
+            # wakes us) or backing off (wait for the earliest retry)
+            delay = min(delay, (next_due - _utc_now_naive()).total_seconds())
+        if delay <= 0:
+            now = time.monotonic()
+            retry_at = [at for _, at in self._retry.values() if at > now]
+            delay = min(retry_at) - now if retry_at else self.min_retry_seconds
+        return max(0.1, min(delay, self.max_interval_seconds))
+
+    async def run(self) -> None:
+        """Main loop: sleep until the next poll is due, then dispatch it"""
+        from .discord_bot import get_bot_instance
+
+        while True:
+            try:
+                bot = get_bot_instance()
+                if not bot or not bot.is_ready():
+                    # Opening/closing needs Discord; due polls wait in the DB
+                    await asyncio.sleep(self.min_retry_seconds)
+                    continue
+
+                self._wakeup.clear()
+                dispatched = await self.run_once(bot)
+                if dispatched:
+                    logger.info(f"⏰ Poll sweeper: Dispatched {dispatched} due poll action(s)")
+
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=await self._seconds_until_next()
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Poll sweeper: Critical error in sweep loop: {e}")
+                await asyncio.sleep(self.min_retry_seconds)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "running": self._task is not None and not self._task.done(),
+            "sweeps": self.sweeps,
+            "opens_dispatched": self.opens_dispatched,
+            "closes_dispatched": self.closes_dispatched,
+            "dispatch_errors": self.dispatch_errors,
+            "in_flight": len(self._in_flight),
+            "backing_off": len(self._retry),
+            "last_sweep_at": self.last_sweep_at.isoformat() if self.last_sweep_at else None,
+            "next_due_at": self.next_due_at.isoformat() if self.next_due_at else None,
+        }
+
+
+# Global sweeper instance
+_poll_schedule_sweeper: Optional[PollScheduleSweeper] = None
+
+
+def get_poll_schedule_sweeper() -> PollScheduleSweeper:
+    """Get or create the poll schedule sweeper instance"""
+    global _poll_schedule_sweeper
+    if _poll_schedule_sweeper is None:
+        _poll_schedule_sweeper = PollScheduleSweeper()
+    return _poll_schedule_sweeper
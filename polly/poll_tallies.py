@@ -0,0 +1,127 @@
+"""
+Polly Poll Tallies
+Rebuild and verify the trigger-maintained poll_tallies table.
+
+Normal vote writes keep poll_tallies current through database triggers
+(see migration 13). These helpers exist for repair and auditing: rebuilding
+recomputes rows from the votes table, verifying reports any drift.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+
+try:
+    from .database import get_db_session
+    from .migrations import POLL_TALLY_REBUILD_SQL, POLL_TOTAL_TALLY_INDEX
+except ImportError:
+    from database import get_db_session  # type: ignore
+    from migrations import POLL_TALLY_REBUILD_SQL, POLL_TOTAL_TALLY_INDEX  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def _poll_filter(poll_id: Optional[int]) -> Tuple[str, Dict[str, Any]]:
+    if poll_id is None:
+        return "", {}
+    return "WHERE poll_id = :poll_id", {"poll_id": poll_id}
+
+
+def rebuild_poll_tallies(db, poll_id: Optional[int] = None) -> int:
+    """Recompute tallies from votes for one poll (or all); returns rows written"""
+    where, params = _poll_filter(poll_id)
+    for sql in POLL_TALLY_REBUILD_SQL:
+        db.execute(text(sql.format(where=where)), params)
+    db.commit()
+
+    rows = db.execute(
+        text(f"SELECT COUNT(*) FROM poll_tallies {where}"), params
+    ).scalar()
+    logger.info(
+        f"🔄 Rebuilt poll tallies for {'poll ' + str(poll_id) if poll_id is not None else 'all polls'} ({rows} rows)"
+    )
+    return rows
+
+
+def verify_poll_tallies(db, poll_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Compare tallies with counts from votes; returns one entry per mismatched row"""
+    where, params = _poll_filter(poll_id)
+
+    expected = {}
+    for row in db.execute(
+        text(
+            f"""
+            SELECT poll_id, option_index, COUNT(*), COUNT(DISTINCT user_id)
+            FROM votes {where} GROUP BY poll_id, option_index
+            """
+        ),
+        params,
+    ):
+        expected[(row[0], row[1])] = (row[2], row[3])
+    for row in db.execute(
+        text(
+            f"""
+            SELECT poll_id, COUNT(*), COUNT(DISTINCT user_id)
+            FROM votes {where} GROUP BY poll_id
+            """
+        ),
+        params,
+    ):
+        expected[(row[0], POLL_TOTAL_TALLY_INDEX)] = (row[1], row[2])
+
+    actual = {
+        (row[0], row[1]): (row[2], row[3])
+        for row in db.execute(
+            text(
+                f"SELECT poll_id, option_index, count, unique_voters FROM poll_tallies {where}"
+            ),
+            params,
+        )
+    }
+
+    mismatches = []
+    for key in sorted(set(expected) | set(actual)):
+        if expected.get(key, (0, 0)) != actual.get(key, (0, 0)):
+            mismatches.append(
+                {
+                    "poll_id": key[0],
+                    "option_index": key[1],
+                    "expected": expected.get(key, (0, 0)),
+                    "actual": actual.get(key, (0, 0)),
+                }
+            )
+
+    if mismatches:
+        logger.warning(f"⚠️ Found {len(mismatches)} poll tally mismatches")
+    return mismatches
+
+
+if __name__ == "__main__":
+    # Command line usage: python -m polly.poll_tallies [verify|rebuild] [poll_id]
+    import sys
+
+    action = sys.argv[1] if len(sys.argv) > 1 else "verify"
+    target_poll_id = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    if action not in ("verify", "rebuild"):
+        print("Usage: python -m polly.poll_tallies [verify|rebuild] [poll_id]")
+        sys.exit(2)
+
+    db = get_db_session()
+    try:
+        if action == "rebuild":
+            rows = rebuild_poll_tallies(db, target_poll_id)
+            print(f"✅ Rebuilt poll tallies ({rows} rows)")
+
+        problems = verify_poll_tallies(db, target_poll_id)
+        for problem in problems:
+            print(
+                f"❌ poll {problem['poll_id']} option {problem['option_index']}: "
+                f"expected (count, unique_voters)={problem['expected']}, found {problem['actual']}"
+            )
+        if problems:
+            sys.exit(1)
+        print("✅ Poll tallies match votes")
+    finally:
+        db.close()
@@ -0,0 +1,255 @@
+"""
+Polly Rate Limiter
+Per-client GCRA rate limiting shared across workers through Redis.
+
+The old limiter kept two deques of timestamps per client IP in each worker:
+memory grew with every scanner that ever connected, and every worker
+enforced its own limits. Limits are now tracked with GCRA (generic cell rate
+algorithm): a client's state is a single "theoretical arrival time" per
+bucket, updated atomically by a Lua script in Redis and expiring as soon as
+the client is back to a full burst. The per-minute and per-hour limits are
+checked in one script call. If Redis is unavailable the limiter falls back
+to the same algorithm in a bounded in-process LRU, retrying Redis in the
+background.
+
+Requests are sorted into cost classes: the realtime polling endpoints get
+their own bucket so they don't use up the budget for page loads and form
+posts.
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Window lengths for the two limits of each bucket, in milliseconds
+MINUTE_MS = 60_000
+HOUR_MS = 3_600_000
+
+# KEYS: one GCRA key per window. ARGV[1]: cost, then emission interval and
+# burst tolerance (ms) per key. Every key must allow the request before any
+# is updated. Returns {allowed, retry_after_ms}.
+GCRA_LUA = """
+local now_parts = redis.call('TIME')
+local now = tonumber(now_parts[1]) * 1000 + tonumber(now_parts[2]) / 1000
+local cost = tonumber(ARGV[1])
+local new_tats = {}
+local retry_after = 0
+for i, key in ipairs(KEYS) do
+    local emission = tonumber(ARGV[i * 2])
+    local tolerance = tonumber(ARGV[i * 2 + 1])
+    local tat = tonumber(redis.call('GET', key))
+    if not tat or tat < now then
+        tat = now
+    end
+    local new_tat = tat + emission * cost
+    local allow_at = new_tat - tolerance
+    if allow_at > now then
+        retry_after = math.max(retry_after, allow_at - now)
+    end
+    new_tats[i] = new_tat
+end
+if retry_after > 0 then
+    return {0, math.ceil(retry_after)}
+end
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, string.format('%.3f', new_tats[i]), 'PX', math.max(1, math.ceil(new_tats[i] - now)))
+end
+return {1, 0}
+"""
+
+# Realtime polling endpoints (HTMX refresh every few seconds)
+REALTIME_PATHS = re.compile(r"^/htmx/(?:polls-realtime|poll/[^/]+/results-realtime)$")
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+@dataclass(frozen=True)
+class BucketLimits:
+    """Requests allowed per minute and per hour for one bucket"""
+
+    per_minute: int
+    per_hour: int
+
+    def windows(self) -> Tuple[Tuple[str, float, float], ...]:
+        """(suffix, emission interval ms, burst tolerance ms) per window"""
+        return (
+            ("m", MINUTE_MS / self.per_minute, MINUTE_MS),
+            ("h", HOUR_MS / self.per_hour, HOUR_MS),
+        )
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    bucket: str
+    retry_after: float = 0.0  # seconds
+
+
+class RateLimiter:
+    """GCRA limits per client IP and bucket; Redis first, local LRU fallback"""
+
+    def __init__(self, requests_per_minute: Optional[int] = None, requests_per_hour: Optional[int] = None):
+        # Configuration
+        default = BucketLimits(
+            requests_per_minute or config("RATE_LIMIT_PER_MINUTE", default=60, cast=int),
+            requests_per_hour or config("RATE_LIMIT_PER_HOUR", default=1000, cast=int),
+        )
+        realtime = BucketLimits(
+            config("RATE_LIMIT_REALTIME_PER_MINUTE", default=240, cast=int),
+            config("RATE_LIMIT_REALTIME_PER_HOUR", default=7200, cast=int),
+        )
+        self.buckets: Dict[str, BucketLimits] = {"default": default, "realtime": realtime}
+        self.write_cost = config("RATE_LIMIT_WRITE_COST", default=1, cast=int)
+        self.use_redis = config("RATE_LIMIT_REDIS_ENABLED", default=True, cast=bool)
+        self.redis_timeout = config("RATE_LIMIT_REDIS_TIMEOUT", default=0.25, cast=float)
+        self.redis_retry_interval = config("RATE_LIMIT_REDIS_RETRY", default=5.0, cast=float)
+        self.max_local_keys = config("RATE_LIMIT_LOCAL_MAX_KEYS", default=10000, cast=int)
+
+        # key -> theoretical arrival time (monotonic ms), least recently used first
+        self._local: "OrderedDict[str, float]" = OrderedDict()
+        self._redis_retry_at = 0.0
+        self._reconnect_task: Optional[asyncio.Task] = None
+
+        self.allowed = 0
+        self.limited: Dict[str, int] = {name: 0 for name in self.buckets}
+        self.redis_checks = 0
+        self.local_checks = 0
+        self.redis_errors = 0
+        self.local_evictions = 0
+
+    def classify(self, method: str, path: str) -> Tuple[str, int]:
+        """Bucket name and cost for a request"""
+        if REALTIME_PATHS.match(path):
+            return "realtime", 1
+        if method in WRITE_METHODS:
+            return "default", self.write_cost
+        return "default", 1
+
+    async def hit(self, client_ip: str, method: str = "GET", path: str = "/") -> RateLimitDecision:
+        """Count a request against its bucket and decide whether to allow it"""
+        bucket, cost = self.classify(method, path)
+        limits = self.buckets[bucket]
+
+        allowed, retry_after_ms = None, 0.0
+        if self.use_redis and time.monotonic() >= self._redis_retry_at:
+            result = await self._check_redis(client_ip, bucket, limits, cost)
+            if result is not None:
+                allowed, retry_after_ms = result
+        if allowed is None:
+            allowed, retry_after_ms = self._check_local(client_ip, bucket, limits, cost)
+
+        if allowed:
+            self.allowed += 1
+        else:
+            self.limited[bucket] += 1
+        return RateLimitDecision(allowed, bucket, retry_after_ms / 1000)
+
+    async def is_rate_limited(self, client_ip: str, method: str = "GET", path: str = "/") -> bool:
+        """Check if client is rate limited (counts the request)"""
+        return not (await self.hit(client_ip, method, path)).allowed
+
+    async def _check_redis(
+        self, client_ip: str, bucket: str, limits: BucketLimits, cost: int
+    ) -> Optional[Tuple[bool, float]]:
+        try:
+            from .redis_client import get_redis_client
+        except ImportError:
+            from redis_client import get_redis_client
+
+        try:
+            client = await asyncio.wait_for(get_redis_client(), timeout=self.redis_timeout)
+            if not client.is_connected:
+                self._schedule_reconnect(client)
+                return None
+
+            keys, args = [], [cost]
+            for suffix, emission, tolerance in limits.windows():
+                keys.append(f"polly:ratelimit:{bucket}:{suffix}:{client_ip}")
+                args.extend([emission, tolerance])
+            result = await asyncio.wait_for(
+                client.run_script(GCRA_LUA, keys, args), timeout=self.redis_timeout
+            )
+            if result is None:
+                return None
+            self.redis_checks += 1
+            return bool(int(result[0])), float(result[1])
+        except Exception as e:
+            # Stop trying Redis on the request path for a while
+            self.redis_errors += 1
+            self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+            logger.warning(f"⚠️ RATE LIMITER - Redis unavailable, using local limits: {e}")
+            return None
+
+    def _schedule_reconnect(self, client) -> None:
+        """Reconnect in the background instead of making a request wait for it"""
+        self._redis_retry_at = time.monotonic() + self.redis_retry_interval
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = asyncio.create_task(client.connect())
+
+    def _check_local(
+        self, client_ip: str, bucket: str, limits: BucketLimits, cost: int
+    ) -> Tuple[bool, float]:
+        self.local_checks += 1
+        now = time.monotonic() * 1000
+        new_tats = []
+        retry_after = 0.0
+        for suffix, emission, tolerance in limits.windows():
+            key = f"{bucket}:{suffix}:{client_ip}"
+            tat = max(self._local.get(key, now), now)
+            new_tat = tat + emission * cost
+            if new_tat - tolerance > now:
+                retry_after = max(retry_after, new_tat - tolerance - now)
+            new_tats.append((key, new_tat))
+
+        if retry_after > 0:
+            return False, retry_after
+
+        for key, new_tat in new_tats:
+            self._local[key] = new_tat
+            self._local.move_to_end(key)
+        while len(self._local) > self.max_local_keys:
+            self._local.popitem(last=False)
+            self.local_evictions += 1
+        return True, 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "backend": "local" if not self.use_redis or time.monotonic() < self._redis_retry_at else "redis",
+            "buckets": {
+                name: {"per_minute": limits.per_minute, "per_hour": limits.per_hour}
+                for name, limits in self.buckets.items()
+            },
+            "allowed": self.allowed,
+            "limited": dict(self.limited),
+            "redis_checks": self.redis_checks,
+            "local_checks": self.local_checks,
+            "redis_errors": self.redis_errors,
+            "local_keys": len(self._local),
+            "local_evictions": self.local_evictions,
+        }
+
+
+# Limiter of the most recently built app, reported by the health endpoint
+_rate_limiter: Optional[RateLimiter] = None
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Get the application rate limiter, creating one if no app registered it"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimiter()
+    return _rate_limiter
+
+
+def set_rate_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Register the limiter serving requests (None resets it)"""
+    global _rate_limiter
+    _rate_limiter = limiter
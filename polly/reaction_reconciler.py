@@ -0,0 +1,240 @@
+"""
+Polly Reaction Reconciler
+Event-driven replacement for the full-scan reaction safeguard.
+
+Gateway ``raw_reaction_add`` events on known poll messages (active polls seen
+by the last sweep, plus polls posted since) mark them as dirty. After a short
+grace period (so ``on_reaction_add`` can record the vote and remove the
+reaction itself) only those messages are rescanned for leftover reactions.
+A slow fallback sweep re-checks active polls with a per-poll adaptive backoff
+to catch events missed while the gateway was disconnected.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Scan callback: given a message ID, rescan it and return the number of
+# unprocessed reactions that were handled, or None if the message is not an
+# active poll (it is then dropped from tracking).
+ScanCallback = Callable[[int], Awaitable[Optional[int]]]
+# Sweep callback: return the message IDs of all currently active polls.
+ActiveMessagesCallback = Callable[[], Awaitable[Iterable[int]]]
+
+
+class RestCallMeter:
+    """Sliding one-minute window of Discord REST calls made by the reconciler"""
+
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self._calls: Deque[float] = deque()
+        self.total_calls = 0
+
+    def record(self, count: int = 1) -> None:
+        """Record ``count`` REST calls made now"""
+        now = time.monotonic()
+        for _ in range(count):
+            self._calls.append(now)
+        self.total_calls += count
+        self._prune(now)
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window_seconds
+        while self._calls and self._calls[0] < cutoff:
+            self._calls.popleft()
+
+    def calls_per_minute(self) -> int:
+        """Number of REST calls made during the last window"""
+        self._prune(time.monotonic())
+        return len(self._calls)
+
+
+class ReactionReconciler:
+    """Schedules reaction rescans for dirty poll messages only"""
+
+    def __init__(self):
+        # Configuration
+        self.grace_seconds = config("RECONCILER_GRACE_SECONDS", default=3.0, cast=float)
+        self.min_backoff_seconds = config("RECONCILER_MIN_BACKOFF", default=5.0, cast=float)
+        self.max_backoff_seconds = config("RECONCILER_MAX_BACKOFF", default=600.0, cast=float)
+        self.sweep_interval_seconds = config(
+            "RECONCILER_SWEEP_INTERVAL", default=60.0, cast=float
+        )
+
+        # Message IDs of active polls; reactions on anything else are ignored
+        self._poll_messages: Set[int] = set()
+        # message_id -> monotonic time the rescan is due
+        self._dirty: Dict[int, float] = {}
+        # message_id -> current backoff for the fallback sweep
+        self._backoff: Dict[int, float] = {}
+        # message_id -> monotonic time the fallback sweep may next rescan it
+        self._next_sweep: Dict[int, float] = {}
+        self._wakeup = asyncio.Event()
+        self._last_sweep = 0.0
+
+        self.rest_meter = RestCallMeter()
+        self.events_received = 0
+        self.events_ignored = 0
+        self.scans_performed = 0
+        self.reactions_reconciled = 0
+
+    def mark_dirty(self, message_id: int, delay: Optional[float] = None) -> None:
+        """Schedule a rescan of ``message_id`` after ``delay`` (default: grace period)"""
+        due = time.monotonic() + (self.grace_seconds if delay is None else delay)
+        current = self._dirty.get(message_id)
+        # Keep the earlier due time so a steady stream of reactions can't
+        # postpone the rescan indefinitely
+        if current is None or due < current:
+            self._dirty[message_id] = due
+        self._wakeup.set()
+
+    def track(self, message_id: int) -> None:
+        """Register a newly posted poll message before the next sweep sees it"""
+        self._poll_messages.add(message_id)
+
+    def on_raw_reaction(self, message_id: int) -> None:
+        """Gateway hook for ``on_raw_reaction_add``"""
+        self.events_received += 1
+        if message_id not in self._poll_messages:
+            # Not a poll message: don't spend a DB lookup on it
+            self.events_ignored += 1
+            return
+        self.mark_dirty(message_id)
+
+    def forget(self, message_id: int) -> None:
+        """Stop tracking a message (poll closed or deleted)"""
+        self._poll_messages.discard(message_id)
+        self._dirty.pop(message_id, None)
+        self._backoff.pop(message_id, None)
+        self._next_sweep.pop(message_id, None)
+
+    def _record_result(self, message_id: int, processed: int) -> None:
+        """Adapt the per-poll backoff to what the last rescan found"""
+        now = time.monotonic()
+        if processed > 0:
+            # Found leftovers: users are still voting and something is being
+            # missed, so look again soon
+            backoff = self.min_backoff_seconds
+            self.reactions_reconciled += processed
+            self.mark_dirty(message_id, delay=backoff)
+        else:
+            backoff = min(
+                self._backoff.get(message_id, self.min_backoff_seconds / 2) * 2,
+                self.max_backoff_seconds,
+            )
+        self._backoff[message_id] = backoff
+        self._next_sweep[message_id] = now + backoff
+
+    async def _sweep(self, list_active_messages: ActiveMessagesCallback) -> None:
+        """Mark active polls whose backoff has elapsed as dirty"""
+        now = time.monotonic()
+        known_before = set(self._poll_messages)
+        active = set(await list_active_messages())
+        # Keep polls posted while the query was running
+        self._poll_messages = active | (self._poll_messages - known_before)
+
+        for message_id in list(self._backoff.keys()):
+            if message_id not in active:
+                self.forget(message_id)
+
+        for message_id in active:
+            if self._next_sweep.get(message_id, 0.0) <= now:
+                self.mark_dirty(message_id, delay=0)
+
+    def _pop_due(self) -> List[int]:
+        now = time.monotonic()
+        due = [mid for mid, at in self._dirty.items() if at <= now]
+        for message_id in due:
+            del self._dirty[message_id]
+        return due
+
+    def _seconds_until_next(self) -> float:
+        now = time.monotonic()
+        next_sweep_in = self._last_sweep + self.sweep_interval_seconds - now
+        if self._dirty:
+            return max(0.0, min(min(self._dirty.values()) - now, next_sweep_in))
+        return max(0.0, next_sweep_in)
+
+    async def run(
+        self,
+        scan: ScanCallback,
+        list_active_messages: ActiveMessagesCallback,
+        is_ready: Callable[[], bool],
+    ) -> None:
+        """Main loop: rescan dirty messages as they come due"""
+        while True:
+            try:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=self._seconds_until_next()
+                    )
+                    # Woken by a new event; loop around to recompute deadlines
+                    continue
+                except asyncio.TimeoutError:
+                    pass
+
+                if not is_ready():
+                    # Dirty messages stay queued until the gateway is back
+                    await asyncio.sleep(5)
+                    continue
+
+                if time.monotonic() - self._last_sweep >= self.sweep_interval_seconds:
+                    self._last_sweep = time.monotonic()
+                    try:
+                        await self._sweep(list_active_messages)
+                    except Exception as sweep_error:
+                        logger.error(f"❌ Reconciler: Fallback sweep failed: {sweep_error}")
+
+                for message_id in self._pop_due():
+                    try:
+                        processed = await scan(message_id)
+                        self.scans_performed += 1
+                    except Exception as scan_error:
+                        logger.error(
+                            f"❌ Reconciler: Error rescanning message {message_id}: {scan_error}"
+                        )
+                        processed = 0
+
+                    if processed is None:
+                        self.forget(message_id)
+                    else:
+                        self._record_result(message_id, processed)
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"❌ Reconciler: Critical error in reconciler loop: {e}")
+                await asyncio.sleep(1)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "rest_calls_per_minute": self.rest_meter.calls_per_minute(),
+            "rest_calls_total": self.rest_meter.total_calls,
+            "events_received": self.events_received,
+            "events_ignored": self.events_ignored,
+            "scans_performed": self.scans_performed,
+            "reactions_reconciled": self.reactions_reconciled,
+            "dirty_messages": len(self._dirty),
+            "tracked_polls": len(self._backoff),
+            "known_poll_messages": len(self._poll_messages),
+        }
+
+
+# Global reconciler instance
+_reaction_reconciler: Optional[ReactionReconciler] = None
+
+
+def get_reaction_reconciler() -> ReactionReconciler:
+    """Get or create the reaction reconciler instance"""
+    global _reaction_reconciler
+    if _reaction_reconciler is None:
+        _reaction_reconciler = ReactionReconciler()
+    return _reaction_reconciler
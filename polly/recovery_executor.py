@@ -0,0 +1,281 @@
+"""
+Polly Recovery Executor
+Runs per-poll startup recovery work concurrently within a Discord REST budget.
+
+Startup recovery used to walk polls one at a time with fixed sleeps between
+every API call, so a restart with many polls took minutes regardless of how
+much rate-limit headroom Discord actually reported. The executor instead:
+
+- runs jobs on a bounded number of workers, soonest-closing polls first
+- charges each REST request a recovery worker makes against a token bucket
+  (via the bot's aiohttp ``http_trace``; live bot traffic is never held)
+- adapts that bucket to the rate-limit headers on every Discord response:
+  a 429 halves the rate and a global 429 pauses recovery for ``Retry-After``,
+  while successful responses slowly raise it back to the configured ceiling
+- records progress and an ETA per phase for the super-admin dashboard
+
+discord.py still enforces per-route buckets itself; the budget keeps
+recovery from crowding out live traffic on the shared global limit.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+import aiohttp
+import pytz
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+# Set inside recovery workers so the HTTP trace only throttles their requests
+_recovery_request: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "recovery_request", default=False
+)
+
+# (priority, poll_id, job) - lower priority runs first
+RecoveryJob = Tuple[float, int, Callable[[int], Awaitable[Any]]]
+
+
+def _header_float(headers: Mapping[str, str], name: str) -> Optional[float]:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DiscordRateBudget:
+    """Token bucket for recovery REST calls, tuned by Discord's rate-limit headers"""
+
+    def __init__(self):
+        # Configuration
+        self.max_rate = config("RECOVERY_MAX_RPS", default=20.0, cast=float)
+        self.min_rate = min(config("RECOVERY_MIN_RPS", default=1.0, cast=float), self.max_rate)
+        self.rate_step = config("RECOVERY_RPS_STEP", default=0.5, cast=float)
+
+        self.rate = self.max_rate
+        self._tokens = self.max_rate
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+        self.requests_charged = 0
+        self.responses_observed = 0
+        self.buckets_exhausted = 0
+        self.rate_limited = 0
+        self.global_rate_limited = 0
+        self.last_retry_after: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait for one request's worth of budget"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if self._paused_until > now:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self.requests_charged += 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def observe(self, status: int, headers: Mapping[str, str]) -> None:
+        """Feed one Discord response's status and rate-limit headers"""
+        self.responses_observed += 1
+        if status == 429:
+            retry_after = (
+                _header_float(headers, "Retry-After")
+                or _header_float(headers, "X-RateLimit-Reset-After")
+                or 1.0
+            )
+            is_global = (
+                headers.get("X-RateLimit-Global", "").lower() == "true"
+                or headers.get("X-RateLimit-Scope") == "global"
+            )
+            self.on_rate_limited(retry_after, is_global)
+        elif status < 400:
+            if _header_float(headers, "X-RateLimit-Remaining") == 0:
+                # discord.py waits out the bucket itself; just note we hit it
+                self.buckets_exhausted += 1
+            self.rate = min(self.max_rate, self.rate + self.rate_step)
+
+    def on_rate_limited(self, retry_after: float, is_global: bool = False) -> None:
+        """Multiplicative decrease; a global limit also pauses all recovery calls"""
+        self.rate_limited += 1
+        self.last_retry_after = retry_after
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = min(self._tokens, 0.0)
+        if is_global:
+            self.global_rate_limited += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+        logger.warning(
+            f"⚠️ RECOVERY BUDGET - Discord rate limit (global={is_global}, retry_after={retry_after:.2f}s), "
+            f"recovery rate now {self.rate:.1f} req/s"
+        )
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """aiohttp trace for ``commands.Bot(http_trace=...)``"""
+        trace = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            if _recovery_request.get():
+                await self.acquire()
+
+        async def on_request_end(session, ctx, params):
+            self.observe(params.response.status, params.response.headers)
+
+        trace.on_request_start.append(on_request_start)
+        trace.on_request_end.append(on_request_end)
+        return trace
+
+    def get_stats(self) -> Dict[str, Any]:
+        paused_for = self._paused_until - time.monotonic()
+        return {
+            "rate_per_second": round(self.rate, 2),
+            "max_rate_per_second": self.max_rate,
+            "paused_seconds": round(paused_for, 2) if paused_for > 0 else 0.0,
+            "requests_charged": self.requests_charged,
+            "responses_observed": self.responses_observed,
+            "buckets_exhausted": self.buckets_exhausted,
+            "rate_limited": self.rate_limited,
+            "global_rate_limited": self.global_rate_limited,
+            "last_retry_after": self.last_retry_after,
+        }
+
+
+class RecoveryProgress:
+    """Progress of one recovery phase"""
+
+    def __init__(self, phase: str, total: int):
+        self.phase = phase
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.in_flight: Set[int] = set()
+        self.started_at = datetime.now(pytz.UTC)
+        self.finished_at: Optional[datetime] = None
+        self._started = time.monotonic()
+
+    @property
+    def done(self) -> int:
+        return self.completed + self.failed
+
+    def eta_seconds(self) -> Optional[float]:
+        """Remaining time at the phase's average rate so far"""
+        if self.finished_at is not None:
+            return 0.0
+        if self.done == 0:
+            return None
+        elapsed = time.monotonic() - self._started
+        return (self.total - self.done) * elapsed / self.done
+
+    def get_stats(self) -> Dict[str, Any]:
+        eta = self.eta_seconds()
+        return {
+            "phase": self.phase,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "in_flight": sorted(self.in_flight),
+            "percent": round(100.0 * self.done / self.total, 1) if self.total else 100.0,
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "running": self.finished_at is None,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class RecoveryExecutor:
+    """Bounded-concurrency, priority-ordered runner for per-poll recovery jobs"""
+
+    def __init__(self, budget: Optional[DiscordRateBudget] = None):
+        # Configuration
+        self.concurrency = max(1, config("RECOVERY_CONCURRENCY", default=4, cast=int))
+
+        self.budget = budget or get_discord_rate_budget()
+        # Most recent run of each phase, in the order phases first ran
+        self.phases: Dict[str, RecoveryProgress] = {}
+
+    async def run(self, phase: str, jobs: Iterable[RecoveryJob]) -> RecoveryProgress:
+        """Run ``jobs`` lowest priority value first; returns the phase's progress"""
+        queue: List[Tuple[float, int, int, Callable[[int], Awaitable[Any]]]] = []
+        for seq, (priority, poll_id, job) in enumerate(jobs):
+            heapq.heappush(queue, (priority, seq, poll_id, job))
+
+        progress = RecoveryProgress(phase, len(queue))
+        self.phases[phase] = progress
+        logger.info(
+            f"🚀 RECOVERY EXECUTOR - {phase}: {progress.total} poll(s), {self.concurrency} worker(s)"
+        )
+
+        async def worker():
+            _recovery_request.set(True)
+            while queue:
+                _, _, poll_id, job = heapq.heappop(queue)
+                progress.in_flight.add(poll_id)
+                try:
+                    await job(poll_id)
+                    progress.completed += 1
+                except Exception as e:
+                    progress.failed += 1
+                    logger.error(f"❌ RECOVERY EXECUTOR - {phase}: poll {poll_id} failed: {e}")
+                finally:
+                    progress.in_flight.discard(poll_id)
+
+        try:
+            await asyncio.gather(
+                *(worker() for _ in range(min(self.concurrency, progress.total)))
+            )
+        finally:
+            progress.finished_at = datetime.now(pytz.UTC)
+
+        elapsed = (progress.finished_at - progress.started_at).total_seconds()
+        logger.info(
+            f"✅ RECOVERY EXECUTOR - {phase}: {progress.completed} done, "
+            f"{progress.failed} failed in {elapsed:.1f}s"
+        )
+        return progress
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        phases = [progress.get_stats() for progress in self.phases.values()]
+        return {
+            "concurrency": self.concurrency,
+            "running": any(phase["running"] for phase in phases),
+            "phases": phases,
+            "budget": self.budget.get_stats(),
+        }
+
+
+# Global instances
+_discord_rate_budget: Optional[DiscordRateBudget] = None
+_recovery_executor: Optional[RecoveryExecutor] = None
+
+
+def get_discord_rate_budget() -> DiscordRateBudget:
+    """Get or create the recovery REST budget"""
+    global _discord_rate_budget
+    if _discord_rate_budget is None:
+        _discord_rate_budget = DiscordRateBudget()
+    return _discord_rate_budget
+
+
+def get_recovery_executor() -> RecoveryExecutor:
+    """Get or create the recovery executor instance"""
+    global _recovery_executor
+    if _recovery_executor is None:
+        _recovery_executor = RecoveryExecutor()
+    return _recovery_executor
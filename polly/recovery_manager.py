@@ -7,30 +7,54 @@ Handles vote collection, database syncing, poll state restoration, and cache war
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List
 import pytz
 import discord
 from discord.ext import commands
+from sqlalchemy.orm import joinedload
 
 # Handle both relative and absolute imports for direct execution
 try:
-    from .database import get_db_session, Poll, Vote, TypeSafeColumn, POLL_EMOJIS
+    from .database import get_db_session, run_db, Poll, TypeSafeColumn, POLL_EMOJIS
     from .discord_utils import update_poll_message
     from .poll_operations import BulletproofPollOperations
-    from .background_tasks import close_poll
+    from .background_tasks import close_poll, _has_recorded_vote
+    from .recovery_executor import get_recovery_executor
 except ImportError:
     # Fallback for direct execution
     import sys
     import os
     sys.path.insert(0, os.path.dirname(__file__))
-    from database import get_db_session, Poll, Vote, TypeSafeColumn, POLL_EMOJIS
+    from database import get_db_session, run_db, Poll, TypeSafeColumn, POLL_EMOJIS
     from discord_utils import update_poll_message
     from poll_operations import BulletproofPollOperations
-    from background_tasks import close_poll
+    from background_tasks import close_poll, _has_recorded_vote
+    from recovery_executor import get_recovery_executor
 
 logger = logging.getLogger(__name__)
 
 
+def _load_active_polls() -> List[Poll]:
+    """Blocking: active polls with their votes, soonest close_time first"""
+    db = get_db_session()
+    try:
+        return (
+            db.query(Poll)
+            .options(joinedload(Poll.votes))
+            .filter(Poll.status == "active")
+            .order_by(Poll.close_time)
+            .all()
+        )
+    finally:
+        db.close()
+
+
+def _close_time_priority(poll: Poll) -> float:
+    """Executor priority: polls closest to closing are recovered first"""
+    close_time = poll.close_time
+    return close_time.timestamp() if close_time else float("inf")
+
+
 class RecoveryManager:
     """Comprehensive recovery manager for bot restart scenarios"""
     
@@ -132,26 +156,21 @@ class RecoveryManager:
         """Recover all active polls and ensure they have proper reactions"""
         logger.info("🗳️ RECOVERY MANAGER - Recovering active polls")
         
-        db = get_db_session()
-        try:
-            # Get all active polls
-            active_polls = db.query(Poll).filter(Poll.status == "active").all()
-            logger.info(f"📊 RECOVERY MANAGER - Found {len(active_polls)} active polls to recover")
-            
-            for poll in active_polls:
-                try:
-                    await self._recover_single_poll(poll)
-                    self.recovery_stats["polls_recovered"] += 1
-                except Exception as e:
-                    self.recovery_stats["errors_encountered"] += 1
-                    poll_id = TypeSafeColumn.get_int(poll, "id")
-                    logger.error(f"❌ RECOVERY MANAGER - Failed to recover poll {poll_id}: {e}")
-                    continue
-            
-            logger.info(f"✅ RECOVERY MANAGER - Recovered {self.recovery_stats['polls_recovered']} active polls")
-            
-        finally:
-            db.close()
+        active_polls = await run_db(_load_active_polls)
+        logger.info(f"📊 RECOVERY MANAGER - Found {len(active_polls)} active polls to recover")
+        polls_by_id = {TypeSafeColumn.get_int(poll, "id"): poll for poll in active_polls}
+        
+        async def recover(poll_id: int):
+            await self._recover_single_poll(polls_by_id[poll_id])
+            self.recovery_stats["polls_recovered"] += 1
+        
+        progress = await get_recovery_executor().run(
+            "active_polls",
+            ((_close_time_priority(poll), poll_id, recover) for poll_id, poll in polls_by_id.items()),
+        )
+        self.recovery_stats["errors_encountered"] += progress.failed
+        
+        logger.info(f"✅ RECOVERY MANAGER - Recovered {self.recovery_stats['polls_recovered']} active polls")
     
     async def _recover_single_poll(self, poll: Poll):
         """Recover a single active poll"""
@@ -165,6 +184,8 @@ class RecoveryManager:
         # Check if poll should still be active
         now = datetime.now(pytz.UTC)
         close_time = poll.close_time
+        if close_time and close_time.tzinfo is None:
+            close_time = pytz.UTC.localize(close_time)
         
         if close_time and close_time <= now:
             # Poll should have closed - close it now
@@ -281,9 +302,6 @@ class RecoveryManager:
                     reactions_added += 1
                     logger.debug(f"➕ RECOVERY MANAGER - Added missing reaction {emoji} to poll {poll_id}")
                     
-                    # Small delay to avoid rate limiting
-                    await asyncio.sleep(0.1)
-                    
                 except Exception as e:
                     logger.warning(f"⚠️ RECOVERY MANAGER - Failed to add reaction {emoji} to poll {poll_id}: {e}")
         
@@ -307,42 +325,37 @@ class RecoveryManager:
     
     async def _single_reaction_sync_pass(self):
         """Single pass of reaction synchronization"""
-        db = get_db_session()
-        try:
-            active_polls = db.query(Poll).filter(Poll.status == "active").all()
+        active_polls = await run_db(_load_active_polls)
+        polls_by_id = {TypeSafeColumn.get_int(poll, "id"): poll for poll in active_polls}
+        
+        async def sync(poll_id: int):
+            poll = polls_by_id[poll_id]
+            message_id = TypeSafeColumn.get_string(poll, "message_id")
+            channel_id = TypeSafeColumn.get_string(poll, "channel_id")
             
-            for poll in active_polls:
-                try:
-                    poll_id = TypeSafeColumn.get_int(poll, "id")
-                    message_id = TypeSafeColumn.get_string(poll, "message_id")
-                    channel_id = TypeSafeColumn.get_string(poll, "channel_id")
-                    
-                    if not message_id or not channel_id:
-                        continue
-                    
-                    # Get Discord message
-                    channel = self.bot.get_channel(int(channel_id))
-                    if not channel or not isinstance(channel, discord.TextChannel):
-                        continue
-                    
-                    try:
-                        message = await channel.fetch_message(int(message_id))
-                    except discord.NotFound:
-                        continue
-                    except Exception:
-                        continue
-                    
-                    # Process reactions
-                    votes_synced = await self._sync_poll_reactions(poll, message)
-                    self.recovery_stats["votes_synced"] += votes_synced
-                    
-                except Exception as e:
-                    poll_id = TypeSafeColumn.get_int(poll, "id", 0) if poll else 0
-                    logger.warning(f"⚠️ RECOVERY MANAGER - Error syncing poll {poll_id}: {e}")
-                    continue
+            if not message_id or not channel_id:
+                return
+            
+            # Get Discord message
+            channel = self.bot.get_channel(int(channel_id))
+            if not channel or not isinstance(channel, discord.TextChannel):
+                return
+            
+            try:
+                message = await channel.fetch_message(int(message_id))
+            except discord.NotFound:
+                return
+            
+            # Process reactions
+            votes_synced = await self._sync_poll_reactions(poll, message)
+            self.recovery_stats["votes_synced"] += votes_synced
         
-        finally:
-            db.close()
+        progress = await get_recovery_executor().run(
+            "reaction_sync",
+            ((_close_time_priority(poll), poll_id, sync) for poll_id, poll in polls_by_id.items()),
+        )
+        if progress.failed:
+            logger.warning(f"⚠️ RECOVERY MANAGER - Reaction sync failed for {progress.failed} poll(s)")
     
     async def _sync_poll_reactions(self, poll: Poll, message: discord.Message) -> int:
         """Sync reactions for a single poll"""
@@ -366,35 +379,21 @@ class RecoveryManager:
                     
                     try:
                         # Check if vote is already recorded
-                        db = get_db_session()
-                        try:
-                            existing_vote = (
-                                db.query(Vote)
-                                .filter(
-                                    Vote.poll_id == poll_id,
-                                    Vote.user_id == str(user.id),
-                                )
-                                .first()
+                        if not await run_db(_has_recorded_vote, poll_id, str(user.id)):
+                            # Vote missing - record it
+                            result = await self.bulletproof_ops.bulletproof_vote_collection(
+                                poll_id, str(user.id), option_index
                             )
                             
-                            if not existing_vote:
-                                # Vote missing - record it
-                                result = await self.bulletproof_ops.bulletproof_vote_collection(
-                                    poll_id, str(user.id), option_index
-                                )
+                            if result["success"]:
+                                votes_synced += 1
+                                logger.debug(f"🔄 RECOVERY MANAGER - Synced missing vote for user {user.id} on poll {poll_id}")
                                 
-                                if result["success"]:
-                                    votes_synced += 1
-                                    logger.debug(f"🔄 RECOVERY MANAGER - Synced missing vote for user {user.id} on poll {poll_id}")
-                                    
-                                    # Remove reaction after recording vote
-                                    try:
-                                        await reaction.remove(user)
-                                    except Exception:
-                                        pass
-                        
-                        finally:
-                            db.close()
+                                # Remove reaction after recording vote
+                                try:
+                                    await reaction.remove(user)
+                                except Exception:
+                                    pass
                     
                     except Exception as e:
                         logger.warning(f"⚠️ RECOVERY MANAGER - Error syncing vote for user {user.id}: {e}")
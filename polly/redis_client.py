@@ -5,13 +5,28 @@ Provides Redis connection and caching functionality for Polly.
 
 import json
 import logging
-from typing import Any, Optional, Dict, List
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Dict, List, Tuple
 import redis.asyncio as redis
 from redis.exceptions import RedisError, ConnectionError
 from decouple import config
 
 logger = logging.getLogger(__name__)
 
+# Keys per UNLINK/MGET when walking a pattern, and SCAN page size hint
+CLEAR_PATTERN_CHUNK_SIZE = 500
+
+
+def _encode(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+
+def _decode(value: Any) -> Any:
+    try:
+        return json.loads(value)
+    except (json.JSONDecodeError, TypeError):
+        return value
+
 
 class RedisClient:
     """Redis client wrapper with connection management and caching utilities"""
@@ -25,6 +40,8 @@ class RedisClient:
 
         self._client: Optional[redis.Redis] = None
         self._connected = False
+        # Lua script text -> registered script (bound to the current client)
+        self._scripts: Dict[str, Any] = {}
 
     async def connect(self) -> bool:
         """Establish connection to Redis server"""
@@ -53,6 +70,7 @@ class RedisClient:
 
             # Test connection
             await self._client.ping()
+            self._scripts = {}
             self._connected = True
             logger.info(f"Connected to Redis at {self.redis_host}:{self.redis_port}")
             return True
@@ -87,8 +105,7 @@ class RedisClient:
             return False
 
         try:
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value)
+            value = _encode(value)
 
             if ttl:
                 result = await self._client.setex(key, ttl, value)
@@ -132,6 +149,71 @@ class RedisClient:
             logger.error(f"Redis DELETE error for keys {keys}: {e}")
             return 0
 
+    async def unlink(self, *keys: str) -> int:
+        """Delete keys without blocking Redis on large values (memory freed in background)"""
+        if not keys or not await self._ensure_connected():
+            return 0
+
+        try:
+            return await self._client.unlink(*keys)
+        except RedisError as e:
+            logger.error(f"Redis UNLINK error for {len(keys)} keys: {e}")
+            return 0
+
+    # Multi-key operations
+    async def mget(self, keys: List[str], default: Any = None) -> List[Any]:
+        """Get several keys in one round-trip; values are returned in key order"""
+        if not keys:
+            return []
+        if not await self._ensure_connected():
+            return [default] * len(keys)
+
+        try:
+            values = await self._client.mget(keys)
+        except RedisError as e:
+            logger.error(f"Redis MGET error for {len(keys)} keys: {e}")
+            return [default] * len(keys)
+
+        return [default if value is None else _decode(value) for value in values]
+
+    async def mset_with_ttl(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several keys (optionally all with the same TTL) in one pipelined round-trip.
+
+        Returns False for an empty mapping, like ``cache_set_many``: nothing was written.
+        """
+        if not mapping:
+            return False
+        if not await self._ensure_connected():
+            return False
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in mapping.items():
+                    pipe.set(key, _encode(value), ex=ttl)
+                results = await pipe.execute()
+            return all(results)
+        except RedisError as e:
+            logger.error(f"Redis pipelined SET error for {len(mapping)} keys: {e}")
+            return False
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = False) -> AsyncIterator[Any]:
+        """Queue commands and send them in one round-trip.
+
+        Yields a redis-py pipeline, or ``None`` if Redis is unavailable.
+        Commands still queued when the block exits are executed then; call
+        ``await pipe.execute()`` inside the block to read their results.
+        Redis errors propagate to the caller.
+        """
+        if not await self._ensure_connected():
+            yield None
+            return
+
+        async with self._client.pipeline(transaction=transaction) as pipe:
+            yield pipe
+            if len(pipe):
+                await pipe.execute()
+
     async def exists(self, key: str) -> bool:
         """Check if key exists"""
         if not await self._ensure_connected():
@@ -309,6 +391,40 @@ class RedisClient:
             logger.error(f"Redis LLEN error for list {name}: {e}")
             return 0
 
+    # Pub/sub operations
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message; returns the number of subscribers that received it"""
+        if not await self._ensure_connected():
+            return 0
+
+        try:
+            return await self._client.publish(channel, message)
+        except RedisError as e:
+            logger.error(f"Redis publish error for channel {channel}: {e}")
+            return 0
+
+    async def pubsub(self) -> Optional[redis.client.PubSub]:
+        """Get a PubSub object on this connection pool, or None if Redis is unavailable"""
+        if not await self._ensure_connected():
+            return None
+        return self._client.pubsub(ignore_subscribe_messages=True)
+
+    # Scripting
+    async def run_script(self, script: str, keys: List[str], args: List[Any]) -> Any:
+        """Run a Lua script atomically (EVALSHA, loading it on first use).
+
+        Returns ``None`` if Redis is unavailable. Redis errors propagate to
+        the caller, which usually has its own fallback.
+        """
+        if not await self._ensure_connected():
+            return None
+
+        registered = self._scripts.get(script)
+        if registered is None:
+            registered = self._client.register_script(script)
+            self._scripts[script] = registered
+        return await registered(keys=keys, args=args)
+
     # Cache-specific methods
     async def cache_set(self, key: str, value: Any, ttl: int = 3600) -> bool:
         """Cache a value with default 1-hour TTL"""
@@ -325,23 +441,64 @@ class RedisClient:
         cache_key = f"cache:{key}"
         return bool(await self.delete(cache_key))
 
-    async def cache_clear_pattern(self, pattern: str) -> int:
-        """Clear cache keys matching pattern"""
+    async def cache_get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several cached values with one MGET; missing keys are omitted"""
+        values = await self.mget([f"cache:{key}" for key in keys])
+        return {key: value for key, value in zip(keys, values) if value is not None}
+
+    async def cache_set_many(self, mapping: Dict[str, Any], ttl: int = 3600) -> bool:
+        """Cache several values with the same TTL in one pipelined round-trip"""
+        return await self.mset_with_ttl(
+            {f"cache:{key}": value for key, value in mapping.items()}, ttl
+        )
+
+    async def cache_delete_many(self, keys: List[str]) -> int:
+        """Delete several cached values in one round-trip"""
+        return await self.unlink(*[f"cache:{key}" for key in keys])
+
+    async def cache_scan_values(self, pattern: str) -> AsyncIterator[Tuple[str, Any]]:
+        """Yield ``(key, value)`` for cache keys matching pattern, one MGET per SCAN chunk"""
         if not await self._ensure_connected():
-            return 0
+            return
 
+        chunk: List[str] = []
         try:
-            cache_pattern = f"cache:{pattern}"
-            keys = []
-            async for key in self._client.scan_iter(match=cache_pattern):
-                keys.append(key)
+            async for key in self._client.scan_iter(
+                match=f"cache:{pattern}", count=CLEAR_PATTERN_CHUNK_SIZE
+            ):
+                chunk.append(key)
+                if len(chunk) >= CLEAR_PATTERN_CHUNK_SIZE:
+                    for item in zip(chunk, await self.mget(chunk)):
+                        yield item
+                    chunk = []
+            if chunk:
+                for item in zip(chunk, await self.mget(chunk)):
+                    yield item
+        except RedisError as e:
+            logger.error(f"Redis cache scan error for {pattern}: {e}")
 
-            if keys:
-                return await self.delete(*keys)
+    async def cache_clear_pattern(self, pattern: str) -> int:
+        """Clear cache keys matching pattern, unlinking in chunks while scanning"""
+        if not await self._ensure_connected():
             return 0
+
+        cache_pattern = f"cache:{pattern}"
+        deleted = 0
+        chunk: List[str] = []
+        try:
+            async for key in self._client.scan_iter(
+                match=cache_pattern, count=CLEAR_PATTERN_CHUNK_SIZE
+            ):
+                chunk.append(key)
+                if len(chunk) >= CLEAR_PATTERN_CHUNK_SIZE:
+                    deleted += await self._client.unlink(*chunk)
+                    chunk = []
+            if chunk:
+                deleted += await self._client.unlink(*chunk)
+            return deleted
         except RedisError as e:
             logger.error(f"Redis cache clear pattern error for {pattern}: {e}")
-            return 0
+            return deleted
 
 
 # Global Redis client instance
@@ -0,0 +1,271 @@
+"""
+Security Pipeline Middleware
+Single pure-ASGI middleware running every per-request security check in one pass.
+
+Replaces the stack of ``BaseHTTPMiddleware`` layers (authentication, rate
+limiting, security headers, Turnstile). Each of those layers wrapped the
+downstream app in its own task and memory stream, which cost time on every
+request and broke streaming responses such as the CSV and log downloads.
+Here the checks run in order against the raw ASGI scope, a short-circuit
+response is sent directly, and security headers are injected by wrapping
+``send`` so response bodies are passed through untouched.
+
+Stage order: IP checks (rate limit, blocked IPs), attack analysis, auth,
+Turnstile, then the app with header injection. Attack analysis (the old
+``EnhancedSecurityMiddleware`` rules) was never mounted; it is off unless
+``SECURITY_ATTACK_ANALYSIS`` is enabled. Frozen copies of the old layers live
+in ``benchmarks/legacy_middleware.py`` for overhead comparisons only.
+"""
+
+import logging
+import math
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from decouple import config
+from fastapi.responses import JSONResponse
+from starlette.datastructures import Headers
+from starlette.requests import Request, cookie_parser
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .auth import AUTH_STATE_ATTR, authenticate_token
+from .auth_middleware import is_auth_exempt, is_protected_route, unauthenticated_response
+from .enhanced_security_middleware import AttackAnalyzer
+from .ip_blocker import get_ip_blocker
+from .rate_limiter import RateLimiter, set_rate_limiter
+from .security_middleware import SECURITY_HEADERS
+from .turnstile_middleware import TurnstileVerifier
+
+logger = logging.getLogger(__name__)
+
+# A stage returns a response to short-circuit, or None to continue
+Stage = Callable[["RequestContext"], Awaitable[Optional[Callable]]]
+
+
+class RequestContext:
+    """Per-request values shared by the stages, computed at most once"""
+
+    def __init__(self, scope: Scope, receive: Receive):
+        self.scope = scope
+        self.receive = receive
+        self.path: str = scope["path"]
+        self.method: str = scope["method"]
+        self.headers = Headers(scope=scope)
+        self._client_ip: Optional[str] = None
+
+    @property
+    def client_ip(self) -> str:
+        """Client IP address, handling proxies"""
+        if self._client_ip is None:
+            forwarded_for = self.headers.get("x-forwarded-for")
+            if forwarded_for:
+                self._client_ip = forwarded_for.split(",")[0].strip()
+            else:
+                client = self.scope.get("client")
+                self._client_ip = self.headers.get("x-real-ip") or (client[0] if client else "unknown")
+        return self._client_ip
+
+    @property
+    def query_string(self) -> str:
+        return self.scope.get("query_string", b"").decode("latin-1")
+
+    async def buffer_body(self) -> bytes:
+        """Read the whole body and make ``receive`` replay it for the app"""
+        upstream = self.receive
+        chunks = []
+        more_body = True
+        while more_body:
+            message = await upstream()
+            chunks.append(message.get("body", b""))
+            more_body = message.get("more_body", False)
+        body = b"".join(chunks)
+        self.receive = self.replay(body, upstream)
+        return body
+
+    @staticmethod
+    def replay(body: bytes, upstream: Receive) -> Receive:
+        """``receive`` that yields ``body`` once, then defers to ``upstream`` (disconnects)"""
+        replayed = False
+
+        async def receive() -> Message:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            return await upstream()
+
+        return receive
+
+
+class SecurityPipelineMiddleware:
+    """IP checks, attack analysis, auth, Turnstile and security headers in one ASGI layer"""
+
+    def __init__(
+        self, app: ASGIApp, requests_per_minute: Optional[int] = None, requests_per_hour: Optional[int] = None
+    ):
+        self.app = app
+        # Each app gets its own local buckets; registered for the health endpoint
+        self.rate_limiter = RateLimiter(requests_per_minute, requests_per_hour)
+        set_rate_limiter(self.rate_limiter)
+        self.turnstile = TurnstileVerifier()
+        self.attack_analyzer = (
+            AttackAnalyzer() if config("SECURITY_ATTACK_ANALYSIS", default=False, cast=bool) else None
+        )
+
+        self._header_names = {name.lower().encode("latin-1") for name in SECURITY_HEADERS}
+        self._raw_headers: List[Tuple[bytes, bytes]] = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in SECURITY_HEADERS.items()
+        ]
+        self._stages: List[Tuple[str, Stage]] = [
+            ("rate limiting", self._check_rate_limit),
+            ("blocked IPs", self._check_blocked_ip),
+        ]
+        if self.attack_analyzer is not None:
+            self._stages.append(("attack analysis", self._check_attacks))
+        self._stages.append(("authentication", self._check_auth))
+        if self.turnstile.enabled:
+            self._stages.append(("turnstile", self._check_turnstile))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        ctx = RequestContext(scope, receive)
+        send_with_headers = self._with_security_headers(send)
+
+        for name, stage in self._stages:
+            try:
+                response = await stage(ctx)
+            except Exception as e:
+                # Don't crash on a failing check; the remaining stages still run
+                try:
+                    # Safely extract error message, avoiding problematic characters
+                    err_msg = repr(str(e)[:200])  # Limit length and use repr for safety
+                except Exception:
+                    err_msg = "unprintable_exception"
+                logger.error(f"Security pipeline {name} error from {ctx.client_ip}: {err_msg}")
+                continue
+            if response is not None:
+                await response(scope, ctx.receive, send_with_headers)
+                return
+
+        await self.app(scope, ctx.receive, send_with_headers)
+
+    def _with_security_headers(self, send: Send) -> Send:
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [
+                    header for header in message.get("headers", []) if header[0].lower() not in self._header_names
+                ]
+                headers.extend(self._raw_headers)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        return send_wrapper
+
+    async def _check_rate_limit(self, ctx: RequestContext):
+        # Skip rate limiting for static files and health checks
+        if ctx.path.startswith("/static/") or ctx.path == "/health":
+            return None
+        decision = await self.rate_limiter.hit(ctx.client_ip, ctx.method, ctx.path)
+        if not decision.allowed:
+            logger.info(f"Rate limit exceeded ({decision.bucket}) for {ctx.client_ip} on {ctx.path}")
+            return JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded. Please try again later."},
+                headers={"Retry-After": str(max(1, math.ceil(decision.retry_after)))},
+            )
+        return None
+
+    async def _check_blocked_ip(self, ctx: RequestContext):
+        # Skip checks for static files, health checks and trusted IPs
+        if ctx.path.startswith("/static/") or ctx.path == "/health":
+            return None
+        client_ip = ctx.client_ip
+        if client_ip in AttackAnalyzer.TRUSTED_IPS:
+            return None
+        if get_ip_blocker().is_blocked(client_ip):
+            logger.warning(f"BLOCKED IP attempted access: {client_ip} -> {ctx.path}")
+            return JSONResponse(status_code=403, content={"detail": "Access denied"})
+        return None
+
+    async def _check_attacks(self, ctx: RequestContext):
+        # Skip checks for static files, health checks and trusted IPs
+        if ctx.path.startswith("/static/") or ctx.path == "/health":
+            return None
+        client_ip = ctx.client_ip
+        if client_ip in self.attack_analyzer.TRUSTED_IPS:
+            return None
+
+        is_malicious, severity, reason = self.attack_analyzer.analyze(
+            ctx.path, ctx.query_string, ctx.headers
+        )
+        if not is_malicious:
+            return None
+
+        logger.warning(f"SECURITY BLOCK [{severity}] from {client_ip}: {reason}")
+        # High-traffic endpoints are still blocked but don't count toward an IP block
+        if not self.attack_analyzer.is_high_traffic(ctx.path):
+            if get_ip_blocker().record_violation(client_ip, severity):
+                logger.critical(f"IP {client_ip} has been BLOCKED due to repeated violations")
+        return JSONResponse(status_code=403, content={"detail": "Access denied"})
+
+    async def _check_auth(self, ctx: RequestContext):
+        if not is_protected_route(ctx.path) or is_auth_exempt(ctx.path):
+            return None
+
+        token = cookie_parser(ctx.headers.get("cookie", "")).get("access_token")
+        user = authenticate_token(token) if token else None
+        if not token:
+            logger.info(f"No token found for protected route: {ctx.path}")
+        elif user is None:
+            logger.info(f"Invalid/expired token for route: {ctx.path}")
+        else:
+            # get_current_user picks this up instead of decoding again
+            ctx.scope.setdefault("state", {})[AUTH_STATE_ATTR] = user
+            return None
+        return unauthenticated_response(ctx.path, ctx.headers.get("hx-request") == "true")
+
+    async def _check_turnstile(self, ctx: RequestContext):
+        if not self.turnstile.needs_verification(ctx.method, ctx.path):
+            return None
+
+        # Check for Turnstile token in form data or headers
+        turnstile_token = None
+        if ctx.method == "POST":
+            try:
+                upstream = ctx.receive
+                body = await ctx.buffer_body()
+                # Parse from a separate replay so the app still receives the body
+                form_data = await Request(ctx.scope, RequestContext.replay(body, upstream)).form()
+                turnstile_token = form_data.get("cf-turnstile-response")
+            except Exception:
+                logger.warning(f"Failed to parse form data from {ctx.client_ip}: form parsing error")
+
+        # Also check headers (for AJAX requests and passive tokens)
+        turnstile_token = (
+            turnstile_token
+            or ctx.headers.get("cf-turnstile-response")
+            or ctx.headers.get("x-turnstile-token")
+        )
+
+        if not turnstile_token:
+            # STRICT MODE: Block requests without tokens to protected endpoints
+            logger.warning(
+                f"No Turnstile token provided from {ctx.client_ip} for protected endpoint {ctx.path} - BLOCKING"
+            )
+            return JSONResponse(
+                status_code=403,
+                content={"detail": "Bot verification required - no token provided"},
+            )
+
+        if await self.turnstile.verify_turnstile_token(turnstile_token, ctx.client_ip):
+            logger.debug(f"Valid Turnstile token from {ctx.client_ip} for {ctx.path}")
+            return None
+
+        logger.warning(f"Invalid Turnstile token from {ctx.client_ip} for {ctx.path}")
+        return JSONResponse(
+            status_code=403,
+            content={"detail": "Bot verification failed - invalid token"},
+        )
@@ -6,9 +6,11 @@ Services related to caching operations.
 from .enhanced_cache_service import get_enhanced_cache_service
 from .cache_service import get_cache_service
 from .avatar_cache_service import AvatarCacheService
+from .local_cache import get_local_cache
 
 __all__ = [
     'get_enhanced_cache_service',
     'get_cache_service', 
-    'AvatarCacheService'
+    'AvatarCacheService',
+    'get_local_cache'
 ]
\ No newline at end of file
@@ -5,27 +5,23 @@ Handles Discord user avatar caching with space optimization and deduplication.
 
 import asyncio
 import logging
-import aiohttp
 import aiofiles
+import httpx
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from urllib.parse import urlparse
 try:
     from .enhanced_cache_service import get_enhanced_cache_service
+    from ...image_processing import PIL_AVAILABLE, get_image_processing_service, optimize_avatar_bytes
+    from ...http_clients import get_http_client_registry
 except ImportError:
     from ...enhanced_cache_service import get_enhanced_cache_service  # type: ignore
+    from image_processing import PIL_AVAILABLE, get_image_processing_service, optimize_avatar_bytes  # type: ignore
+    from http_clients import get_http_client_registry  # type: ignore
 
 logger = logging.getLogger(__name__)
 
-# Image processing imports (optional dependencies)
-try:
-    from PIL import Image, ImageOps
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    logger.warning("PIL/Pillow not available - avatar image optimization disabled")
-
 
 class AvatarCacheService:
     """
@@ -124,24 +120,23 @@ class AvatarCacheService:
             try:
                 logger.debug(f"🔽 AVATAR DOWNLOAD - Starting download: {avatar_url}")
                 
-                async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.download_timeout)) as session:
-                    async with session.get(avatar_url) as response:
-                        if response.status == 200:
-                            content = await response.read()
-                            
-                            # Log download size (no size limit enforced)
-                            size_mb = len(content) / (1024 * 1024)
-                            if size_mb > self.max_file_size_mb:
-                                logger.info(f"⚠️ AVATAR DOWNLOAD - Avatar too large ({size_mb:.1f}MB > {self.max_file_size_mb}MB): {avatar_url}")
-                                return None
-                            
-                            logger.info(f"✅ AVATAR DOWNLOAD - Downloaded {size_mb:.1f}MB: {avatar_url}")
-                            return content
-                        else:
-                            logger.info(f"⚠️ AVATAR DOWNLOAD - HTTP {response.status}: {avatar_url}")
-                            return None
+                response = await get_http_client_registry().get(avatar_url, timeout=self.download_timeout)
+                if response.status_code == 200:
+                    content = response.content
+                    
+                    # Log download size (no size limit enforced)
+                    size_mb = len(content) / (1024 * 1024)
+                    if size_mb > self.max_file_size_mb:
+                        logger.info(f"⚠️ AVATAR DOWNLOAD - Avatar too large ({size_mb:.1f}MB > {self.max_file_size_mb}MB): {avatar_url}")
+                        return None
+                    
+                    logger.info(f"✅ AVATAR DOWNLOAD - Downloaded {size_mb:.1f}MB: {avatar_url}")
+                    return content
+                else:
+                    logger.info(f"⚠️ AVATAR DOWNLOAD - HTTP {response.status_code}: {avatar_url}")
+                    return None
                             
-            except asyncio.TimeoutError:
+            except httpx.TimeoutException:
                 logger.info(f"⏰ AVATAR DOWNLOAD - Timeout downloading: {avatar_url}")
                 return None
             except Exception as e:
@@ -149,75 +144,23 @@ class AvatarCacheService:
                 return None
     
     async def _optimize_avatar_image(self, image_data: bytes, target_format: str) -> Optional[bytes]:
-        """Optimize avatar image with compression and resizing"""
+        """Optimize avatar image with compression, off the event loop in the image pool"""
         if not PIL_AVAILABLE:
             return image_data  # Return original if PIL not available
         
         try:
-            # Load image
-            from io import BytesIO
-            image_buffer = BytesIO(image_data)
+            result = await get_image_processing_service().run(
+                "avatar", optimize_avatar_bytes, image_data, target_format, self.compression_quality
+            )
+            optimized_data = result["data"]
             
-            with Image.open(image_buffer) as img:
-                # Handle transparency and animation
-                is_animated = getattr(img, 'is_animated', False)
-                
-                if is_animated and target_format != 'gif':
-                    # For animated images, keep as GIF or extract first frame
-                    if target_format in ['webp', 'png']:
-                        # WebP supports animation, PNG doesn't
-                        if target_format == 'webp':
-                            target_format = 'gif'  # Keep as GIF for compatibility
-                        else:
-                            # Extract first frame for static formats
-                            img.seek(0)
-                
-                # Auto-orient based on EXIF
-                img = ImageOps.exif_transpose(img)
-                
-                # Skip resizing - keep original dimensions to avoid attribute errors
-                logger.debug(f"📏 AVATAR SIZE - Keeping original size: {img.size}")
-                
-                # Convert format if needed
-                if target_format == 'webp':
-                    if img.mode in ('RGBA', 'LA'):
-                        # Keep transparency for WebP
-                        pass
-                    elif img.mode == 'P':
-                        img = img.convert('RGBA')
-                elif target_format in ['jpg', 'jpeg']:
-                    if img.mode in ('RGBA', 'LA', 'P'):
-                        # Convert to RGB with white background for JPEG
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                        img = background
-                
-                # Save optimized image
-                output_buffer = BytesIO()
-                
-                if target_format == 'webp':
-                    img.save(output_buffer, format='WebP', quality=self.compression_quality, optimize=True)
-                elif target_format in ['jpg', 'jpeg']:
-                    img.save(output_buffer, format='JPEG', quality=self.compression_quality, optimize=True)
-                elif target_format == 'png':
-                    img.save(output_buffer, format='PNG', optimize=True)
-                elif target_format == 'gif':
-                    img.save(output_buffer, format='GIF', optimize=True)
-                else:
-                    # Fallback to original format
-                    img.save(output_buffer, format=img.format or 'PNG', optimize=True)
-                
-                optimized_data = output_buffer.getvalue()
-                
-                original_size = len(image_data)
-                optimized_size = len(optimized_data)
-                compression_ratio = ((original_size - optimized_size) / original_size * 100) if original_size > 0 else 0
-                
-                logger.info(f"🗜️ AVATAR OPTIMIZE - {original_size/1024:.1f}KB -> {optimized_size/1024:.1f}KB ({compression_ratio:.1f}% reduction)")
-                
-                return optimized_data
+            original_size = len(image_data)
+            optimized_size = len(optimized_data)
+            compression_ratio = ((original_size - optimized_size) / original_size * 100) if original_size > 0 else 0
+            
+            logger.info(f"🗜️ AVATAR OPTIMIZE - {original_size/1024:.1f}KB -> {optimized_size/1024:.1f}KB ({compression_ratio:.1f}% reduction, {result['worker_ms']:.0f}ms)")
+            
+            return optimized_data
                 
         except Exception as e:
             logger.error(f"❌ AVATAR OPTIMIZE - Error optimizing image: {e}")
@@ -259,7 +202,11 @@ class AvatarCacheService:
                     local_path = hash_mapping.get("local_path")
                     if local_path and Path(local_path).exists():
                         # Add this user to the hash mapping
-                        await self.enhanced_cache.add_user_to_avatar_hash(avatar_hash, user_id)
+                        users = hash_mapping.get("users", [])
+                        if user_id not in users:
+                            users.append(user_id)
+                            hash_mapping["users"] = users
+                            hash_mapping["updated_at"] = datetime.now().isoformat()
                         
                         # Update user's avatar metadata
                         avatar_metadata = {
@@ -270,7 +217,9 @@ class AvatarCacheService:
                             "format": hash_mapping.get("format", "unknown"),
                             "username": username or "Unknown"
                         }
-                        await self.enhanced_cache.cache_avatar_metadata(user_id, avatar_metadata)
+                        await self.enhanced_cache.cache_avatar_entries(
+                            user_id, avatar_metadata, avatar_hash, hash_mapping
+                        )
                         
                         logger.info(f"♻️ AVATAR CACHE - Using deduplicated avatar for user {user_id} (hash: {avatar_hash})")
                         return f"/static/avatars/{Path(local_path).relative_to(self.cache_dir)}"
@@ -310,9 +259,9 @@ class AvatarCacheService:
                 "format": target_format,
                 "username": username or "Unknown"
             }
-            await self.enhanced_cache.cache_avatar_metadata(user_id, avatar_metadata)
             
-            # Update hash mapping for deduplication
+            # Update hash mapping for deduplication (written together with the metadata)
+            hash_info = None
             if self.enable_deduplication:
                 hash_info = {
                     "local_path": str(avatar_path),
@@ -320,7 +269,9 @@ class AvatarCacheService:
                     "format": target_format,
                     "users": [user_id]
                 }
-                await self.enhanced_cache.cache_avatar_hash_mapping(avatar_hash, hash_info)
+            await self.enhanced_cache.cache_avatar_entries(
+                user_id, avatar_metadata, avatar_hash, hash_info
+            )
             
             # Return URL path
             relative_path = avatar_path.relative_to(self.cache_dir)
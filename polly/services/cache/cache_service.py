@@ -8,8 +8,10 @@ from typing import Any, Optional, Dict, List
 from datetime import datetime
 try:
     from ...redis_client import get_redis_client
+    from .local_cache import get_local_cache
 except ImportError:
     from polly.redis_client import get_redis_client  # type: ignore
+    from polly.services.cache.local_cache import get_local_cache  # type: ignore
 
 logger = logging.getLogger(__name__)
 
@@ -31,165 +33,132 @@ class CacheService:
             logger.error(f"Failed to get Redis client: {e}")
             return None
 
+    # Two-tier access: hot namespaces are served from the in-process L1 cache
+    async def _cache_get(self, key: str) -> Any:
+        """Get a cached value, checking the L1 cache before Redis"""
+        local_cache = get_local_cache()
+        use_l1 = local_cache.handles(key)
+        if use_l1:
+            hit, value = local_cache.get(key)
+            if hit:
+                return value
+
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return None
+
+        value = await redis_client.cache_get(key)
+        if use_l1 and value is not None:
+            local_cache.set(key, value)
+        return value
+
+    async def _cache_set(self, key: str, value: Any, ttl: int) -> bool:
+        """Cache a value in Redis and refresh it in L1 (other workers drop their copy)"""
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return False
+
+        result = await redis_client.cache_set(key, value, ttl)
+        local_cache = get_local_cache()
+        await local_cache.invalidate(key)
+        if result and local_cache.handles(key):
+            local_cache.set(key, value, ttl)
+        return result
+
+    async def _cache_delete(self, *keys: str) -> int:
+        """Delete cached values from Redis and from every worker's L1 cache"""
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return 0
+
+        count = await redis_client.cache_delete_many(list(keys))
+        await get_local_cache().invalidate(*keys)
+        return count
+
     # User Preferences Caching
     async def cache_user_preferences(
         self, user_id: str, preferences: Dict[str, Any]
     ) -> bool:
         """Cache user preferences"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"user_prefs:{user_id}"
-        return await redis_client.cache_set(cache_key, preferences, self.user_prefs_ttl)
+        return await self._cache_set(f"user_prefs:{user_id}", preferences, self.user_prefs_ttl)
 
     async def get_cached_user_preferences(
         self, user_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get cached user preferences"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"user_prefs:{user_id}"
-        return await redis_client.cache_get(cache_key)
+        return await self._cache_get(f"user_prefs:{user_id}")
 
     async def invalidate_user_preferences(self, user_id: str) -> bool:
         """Invalidate cached user preferences"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"user_prefs:{user_id}"
-        return await redis_client.cache_delete(cache_key)
+        return bool(await self._cache_delete(f"user_prefs:{user_id}"))
 
     # Guild Data Caching
     async def cache_user_guilds(
         self, user_id: str, guilds: List[Dict[str, Any]]
     ) -> bool:
         """Cache user's guild data"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"user_guilds:{user_id}"
-        return await redis_client.cache_set(cache_key, guilds, self.guild_data_ttl)
+        return await self._cache_set(f"user_guilds:{user_id}", guilds, self.guild_data_ttl)
 
     async def get_cached_user_guilds(
         self, user_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached user guild data"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"user_guilds:{user_id}"
-        return await redis_client.cache_get(cache_key)
+        return await self._cache_get(f"user_guilds:{user_id}")
 
     async def invalidate_user_guilds(self, user_id: str) -> bool:
         """Invalidate cached user guild data"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"user_guilds:{user_id}"
-        return await redis_client.cache_delete(cache_key)
+        return bool(await self._cache_delete(f"user_guilds:{user_id}"))
 
     # Guild Channels Caching
     async def cache_guild_channels(
         self, guild_id: str, channels: List[Dict[str, Any]]
     ) -> bool:
         """Cache guild channels"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_channels:{guild_id}"
-        return await redis_client.cache_set(cache_key, channels, self.guild_data_ttl)
+        return await self._cache_set(f"guild_channels:{guild_id}", channels, self.guild_data_ttl)
 
     async def get_cached_guild_channels(
         self, guild_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached guild channels"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"guild_channels:{guild_id}"
-        return await redis_client.cache_get(cache_key)
+        return await self._cache_get(f"guild_channels:{guild_id}")
 
     async def invalidate_guild_channels(self, guild_id: str) -> bool:
         """Invalidate cached guild channels"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_channels:{guild_id}"
-        return await redis_client.cache_delete(cache_key)
+        return bool(await self._cache_delete(f"guild_channels:{guild_id}"))
 
     # Guild Roles Caching
     async def cache_guild_roles(
         self, guild_id: str, roles: List[Dict[str, Any]]
     ) -> bool:
         """Cache guild roles"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_roles:{guild_id}"
-        return await redis_client.cache_set(cache_key, roles, self.guild_data_ttl)
+        return await self._cache_set(f"guild_roles:{guild_id}", roles, self.guild_data_ttl)
 
     async def get_cached_guild_roles(
         self, guild_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached guild roles"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"guild_roles:{guild_id}"
-        return await redis_client.cache_get(cache_key)
+        return await self._cache_get(f"guild_roles:{guild_id}")
 
     async def invalidate_guild_roles(self, guild_id: str) -> bool:
         """Invalidate cached guild roles"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_roles:{guild_id}"
-        return await redis_client.cache_delete(cache_key)
+        return bool(await self._cache_delete(f"guild_roles:{guild_id}"))
 
     # Guild Emojis Caching
     async def cache_guild_emojis(
         self, guild_id: str, emojis: List[Dict[str, Any]]
     ) -> bool:
         """Cache guild emojis"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_emojis:{guild_id}"
-        return await redis_client.cache_set(cache_key, emojis, self.guild_data_ttl)
+        return await self._cache_set(f"guild_emojis:{guild_id}", emojis, self.guild_data_ttl)
 
     async def get_cached_guild_emojis(
         self, guild_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached guild emojis"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"guild_emojis:{guild_id}"
-        return await redis_client.cache_get(cache_key)
+        return await self._cache_get(f"guild_emojis:{guild_id}")
 
     async def invalidate_guild_emojis(self, guild_id: str) -> bool:
         """Invalidate cached guild emojis"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_emojis:{guild_id}"
-        return await redis_client.cache_delete(cache_key)
+        return bool(await self._cache_delete(f"guild_emojis:{guild_id}"))
 
     # Poll Data Caching
     async def cache_poll_results(self, poll_id: int, results: Dict[str, Any]) -> bool:
@@ -331,41 +300,19 @@ class CacheService:
     # Bulk Operations
     async def invalidate_user_cache(self, user_id: str) -> int:
         """Invalidate all cached data for a user"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return 0
-
-        patterns = [
+        return await self._cache_delete(
             f"user_prefs:{user_id}",
             f"user_guilds:{user_id}",
             f"user_stats:{user_id}",
-        ]
-
-        count = 0
-        for pattern in patterns:
-            if await redis_client.cache_delete(pattern):
-                count += 1
-
-        return count
+        )
 
     async def invalidate_guild_cache(self, guild_id: str) -> int:
         """Invalidate all cached data for a guild"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return 0
-
-        patterns = [
+        return await self._cache_delete(
             f"guild_channels:{guild_id}",
             f"guild_roles:{guild_id}",
             f"guild_emojis:{guild_id}",
-        ]
-
-        count = 0
-        for pattern in patterns:
-            if await redis_client.cache_delete(pattern):
-                count += 1
-
-        return count
+        )
 
     async def clear_all_cache(self) -> int:
         """Clear all cache data (use with caution)"""
@@ -373,6 +320,7 @@ class CacheService:
         if not redis_client:
             return 0
 
+        await get_local_cache().clear()
         return await redis_client.cache_clear_pattern("*")
 
     # Health Check
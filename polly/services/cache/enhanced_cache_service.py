@@ -3,6 +3,7 @@ Enhanced Cache Service Module
 Provides extended caching functionality with longer TTLs specifically for Discord rate limiting prevention.
 """
 
+import json
 import logging
 from typing import Any, Optional, Dict, List
 from datetime import datetime, timedelta
@@ -61,12 +62,9 @@ class EnhancedCacheService(CacheService):
         self, guild_id: str, emojis: List[Dict[str, Any]]
     ) -> bool:
         """Cache guild emojis with extended TTL to prevent Discord rate limiting"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_emojis_extended:{guild_id}"
-        success = await redis_client.cache_set(cache_key, emojis, self.guild_emojis_ttl)
+        success = await self._cache_set(
+            f"guild_emojis_extended:{guild_id}", emojis, self.guild_emojis_ttl
+        )
 
         if success:
             logger.info(
@@ -79,12 +77,7 @@ class EnhancedCacheService(CacheService):
         self, guild_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached guild emojis with extended TTL"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"guild_emojis_extended:{guild_id}"
-        cached_emojis = await redis_client.cache_get(cache_key)
+        cached_emojis = await self._cache_get(f"guild_emojis_extended:{guild_id}")
 
         if cached_emojis:
             logger.debug(
@@ -264,6 +257,34 @@ class EnhancedCacheService(CacheService):
             await redis_client.cache_delete(f"discord_user:{user_id}")
             return None
 
+    async def get_cached_discord_users(self, user_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get cached Discord user data for many users with one MGET"""
+        redis_client = await self._get_redis()
+        if not redis_client or not user_ids:
+            return {}
+
+        from ...data_utils import sanitize_data_for_json
+
+        cached = await redis_client.cache_get_many(
+            [f"discord_user:{user_id}" for user_id in user_ids]
+        )
+        users = {}
+        for key, user_data in cached.items():
+            if isinstance(user_data, dict):
+                users[key.split(":", 1)[1]] = sanitize_data_for_json(user_data)
+        return users
+
+    async def cache_discord_users(self, users: Dict[str, Dict[str, Any]]) -> bool:
+        """Cache Discord user data for many users in one pipelined write"""
+        redis_client = await self._get_redis()
+        if not redis_client or not users:
+            return False
+
+        return await redis_client.cache_set_many(
+            {f"discord_user:{user_id}": data for user_id, data in users.items()},
+            self.discord_user_ttl,
+        )
+
     # Avatar Caching with Deduplication and Space Optimization
     async def cache_avatar_metadata(self, user_id: str, avatar_data: Dict[str, Any]) -> bool:
         """
@@ -348,6 +369,41 @@ class EnhancedCacheService(CacheService):
             await redis_client.cache_delete(cache_key)
             return None
 
+    async def cache_avatar_entries(
+        self,
+        user_id: str,
+        avatar_data: Dict[str, Any],
+        avatar_hash: Optional[str] = None,
+        file_info: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Write a user's avatar metadata and its hash mapping in one pipelined round-trip"""
+        redis_client = await self._get_redis()
+        if not redis_client:
+            return False
+
+        now = datetime.now().isoformat()
+        avatar_data["cached_at"] = now
+        try:
+            async with redis_client.pipeline() as pipe:
+                if pipe is None:
+                    return False
+                pipe.set(
+                    f"cache:avatar_metadata:{user_id}",
+                    json.dumps(avatar_data),
+                    ex=self.discord_user_ttl,
+                )
+                if avatar_hash and file_info is not None:
+                    file_info.setdefault("created_at", now)
+                    pipe.set(
+                        f"cache:avatar_hash:{avatar_hash}",
+                        json.dumps(file_info),
+                        ex=self.discord_user_ttl * 2,
+                    )
+                return all(await pipe.execute())
+        except Exception as e:
+            logger.warning(f"Error caching avatar entries for user {user_id}: {e}")
+            return False
+
     async def add_user_to_avatar_hash(self, avatar_hash: str, user_id: str) -> bool:
         """Add a user ID to an existing avatar hash mapping"""
         hash_mapping = await self.get_cached_avatar_hash_mapping(avatar_hash)
@@ -399,47 +455,34 @@ class EnhancedCacheService(CacheService):
         }
 
         try:
-            # Count cached avatar metadata
-            avatar_metadata_keys = []
+            # Count cached avatar metadata (keys only, values aren't needed)
             if redis_client._client:
-                async for key in redis_client._client.scan_iter(match="cache:avatar_metadata:*"):
-                    avatar_metadata_keys.append(key)
-            
-            stats["total_cached_users"] = len(avatar_metadata_keys)
-
-            # Count unique avatar hashes
-            avatar_hash_keys = []
-            if redis_client._client:
-                async for key in redis_client._client.scan_iter(match="cache:avatar_hash:*"):
-                    avatar_hash_keys.append(key)
-            
-            stats["total_unique_avatars"] = len(avatar_hash_keys)
+                async for _key in redis_client._client.scan_iter(
+                    match="cache:avatar_metadata:*", count=500
+                ):
+                    stats["total_cached_users"] += 1
 
-            # Calculate storage and deduplication stats
+            # Count unique avatar hashes and calculate storage and deduplication stats
             total_file_size = 0
             total_logical_size = 0  # What size would be without deduplication
             format_counts = {}
 
-            for key in avatar_hash_keys:
-                try:
-                    hash_data = await redis_client._client.get(key)
-                    if hash_data:
-                        import json
-                        hash_info = json.loads(hash_data)
-                        
-                        file_size = hash_info.get("file_size", 0)
-                        users_count = len(hash_info.get("users", []))
-                        format_type = hash_info.get("format", "unknown")
-                        
-                        total_file_size += file_size
-                        total_logical_size += file_size * users_count  # Size if each user had separate file
-                        
-                        format_counts[format_type] = format_counts.get(format_type, 0) + 1
-                        
-                except Exception as e:
-                    logger.warning(f"Error processing avatar hash key {key}: {e}")
+            async for key, hash_info in redis_client.cache_scan_values("avatar_hash:*"):
+                stats["total_unique_avatars"] += 1
+                if not isinstance(hash_info, dict):
+                    if hash_info is not None:
+                        logger.warning(f"Error processing avatar hash key {key}: not a JSON object")
                     continue
 
+                file_size = hash_info.get("file_size", 0)
+                users_count = len(hash_info.get("users", []))
+                format_type = hash_info.get("format", "unknown")
+
+                total_file_size += file_size
+                total_logical_size += file_size * users_count  # Size if each user had separate file
+
+                format_counts[format_type] = format_counts.get(format_type, 0) + 1
+
             stats["total_storage_bytes"] = total_file_size
             stats["deduplication_savings"] = total_logical_size - total_file_size
             stats["format_breakdown"] = format_counts
@@ -480,58 +523,45 @@ class EnhancedCacheService(CacheService):
         try:
             cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
             
-            # Get all avatar hash mappings
-            avatar_hash_keys = []
-            if redis_client._client:
-                async for key in redis_client._client.scan_iter(match="cache:avatar_hash:*"):
-                    avatar_hash_keys.append(key)
+            # Walk all avatar hash mappings, collecting orphans to unlink in one call
+            orphans = []
+            async for key, hash_info in redis_client.cache_scan_values("avatar_hash:*"):
+                if not isinstance(hash_info, dict):
+                    continue
 
-            for key in avatar_hash_keys:
-                try:
-                    hash_data = await redis_client._client.get(key)
-                    if not hash_data:
+                users = hash_info.get("users", [])
+                created_at_str = hash_info.get("created_at")
+                updated_at_str = hash_info.get("updated_at", created_at_str)
+
+                # Check if this hash has no users and is old enough
+                if len(users) == 0 and updated_at_str:
+                    try:
+                        updated_at = datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
+                    except ValueError as date_error:
+                        logger.warning(f"Error parsing date for avatar hash cleanup: {date_error}")
+                        cleanup_stats["errors"] += 1
                         continue
-                        
-                    import json
-                    hash_info = json.loads(hash_data)
-                    
-                    users = hash_info.get("users", [])
-                    created_at_str = hash_info.get("created_at")
-                    updated_at_str = hash_info.get("updated_at", created_at_str)
-                    
-                    # Check if this hash has no users and is old enough
-                    if len(users) == 0 and updated_at_str:
+                    if updated_at < cutoff_time:
+                        orphans.append((key, hash_info))
+
+            cleanup_stats["orphaned_hashes_found"] = len(orphans)
+            if orphans and await redis_client.unlink(*[key for key, _ in orphans]):
+                for key, hash_info in orphans:
+                    cleanup_stats["orphaned_hashes_cleaned"] += 1
+                    cleanup_stats["storage_freed_bytes"] += hash_info.get("file_size", 0)
+
+                    # Also try to delete the actual file if path is provided
+                    local_path = hash_info.get("local_path")
+                    if local_path:
                         try:
-                            updated_at = datetime.fromisoformat(updated_at_str.replace("Z", "+00:00"))
-                            if updated_at < cutoff_time:
-                                cleanup_stats["orphaned_hashes_found"] += 1
-                                
-                                # Delete the hash mapping
-                                file_size = hash_info.get("file_size", 0)
-                                if await redis_client._client.delete(key):
-                                    cleanup_stats["orphaned_hashes_cleaned"] += 1
-                                    cleanup_stats["storage_freed_bytes"] += file_size
-                                    
-                                    # Also try to delete the actual file if path is provided
-                                    local_path = hash_info.get("local_path")
-                                    if local_path:
-                                        try:
-                                            from pathlib import Path
-                                            file_path = Path(local_path)
-                                            if file_path.exists():
-                                                file_path.unlink()
-                                                logger.info(f"🧹 AVATAR CLEANUP - Deleted orphaned avatar file: {local_path}")
-                                        except Exception as file_error:
-                                            logger.warning(f"Error deleting orphaned avatar file {local_path}: {file_error}")
-                                            cleanup_stats["errors"] += 1
-                        except ValueError as date_error:
-                            logger.warning(f"Error parsing date for avatar hash cleanup: {date_error}")
+                            from pathlib import Path
+                            file_path = Path(local_path)
+                            if file_path.exists():
+                                file_path.unlink()
+                                logger.info(f"🧹 AVATAR CLEANUP - Deleted orphaned avatar file: {local_path}")
+                        except Exception as file_error:
+                            logger.warning(f"Error deleting orphaned avatar file {local_path}: {file_error}")
                             cleanup_stats["errors"] += 1
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing avatar hash for cleanup {key}: {e}")
-                    cleanup_stats["errors"] += 1
-                    continue
 
             logger.info(f"🧹 AVATAR CLEANUP - Found {cleanup_stats['orphaned_hashes_found']} orphaned, cleaned {cleanup_stats['orphaned_hashes_cleaned']}, freed {cleanup_stats['storage_freed_bytes']/1024/1024:.1f}MB")
 
@@ -589,23 +619,29 @@ class EnhancedCacheService(CacheService):
     async def invalidate_poll_related_cache(self, poll_id: int) -> int:
         """Invalidate all poll-related cached data when poll is updated"""
         redis_client = await self._get_redis()
-        if not redis_client:
-            return 0
-
-        patterns = [
-            f"live_poll_results:{poll_id}",
-            f"poll_dashboard:{poll_id}",
-            f"poll_results:{poll_id}",  # From base cache service
-        ]
 
         count = 0
-        for pattern in patterns:
-            if await redis_client.cache_delete(pattern):
-                count += 1
+        if redis_client:
+            count = await redis_client.cache_delete_many(
+                [
+                    f"live_poll_results:{poll_id}",
+                    f"poll_dashboard:{poll_id}",
+                    f"poll_results:{poll_id}",  # From base cache service
+                ]
+            )
+
+            logger.info(
+                f"Invalidated {count} poll-related cache entries for poll {poll_id}"
+            )
+
+        # Poll state changed: wake any open live-results streams
+        try:
+            from polly.poll_results_stream import get_poll_results_broadcaster
+
+            await get_poll_results_broadcaster().publish(poll_id)
+        except Exception as e:
+            logger.debug(f"Could not notify result streams for poll {poll_id}: {e}")
 
-        logger.info(
-            f"Invalidated {count} poll-related cache entries for poll {poll_id}"
-        )
         return count
 
     # Cache Statistics and Monitoring
@@ -651,13 +687,8 @@ class EnhancedCacheService(CacheService):
         self, guild_id: str, roles: List[Dict[str, Any]]
     ) -> bool:
         """Cache guild roles specifically for role ping functionality with extended TTL"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return False
-
-        cache_key = f"guild_roles_ping:{guild_id}"
-        success = await redis_client.cache_set(
-            cache_key, roles, self.guild_info_ttl
+        success = await self._cache_set(
+            f"guild_roles_ping:{guild_id}", roles, self.guild_info_ttl
         )  # 30 minutes
 
         if success:
@@ -671,12 +702,7 @@ class EnhancedCacheService(CacheService):
         self, guild_id: str
     ) -> Optional[List[Dict[str, Any]]]:
         """Get cached guild roles for role ping functionality"""
-        redis_client = await self._get_redis()
-        if not redis_client:
-            return None
-
-        cache_key = f"guild_roles_ping:{guild_id}"
-        cached_roles = await redis_client.cache_get(cache_key)
+        cached_roles = await self._cache_get(f"guild_roles_ping:{guild_id}")
 
         if cached_roles:
             logger.debug(
@@ -725,24 +751,16 @@ class EnhancedCacheService(CacheService):
         if not redis_client:
             return 0
 
-        patterns = [
+        count = await self._cache_delete(
             f"guild_roles:{guild_id}",
             f"guild_roles_ping:{guild_id}",
-        ]
-
-        count = 0
-        for pattern in patterns:
-            if await redis_client.cache_delete(pattern):
-                count += 1
+        )
 
         # Also invalidate role validation cache for this guild
         try:
-            if redis_client._client:
-                async for key in redis_client._client.scan_iter(
-                    match=f"cache:role_validation:{guild_id}:*"
-                ):
-                    if await redis_client._client.delete(key):
-                        count += 1
+            count += await redis_client.cache_clear_pattern(
+                f"role_validation:{guild_id}:*"
+            )
         except Exception as e:
             logger.warning(
                 f"Error invalidating role validation cache for guild {guild_id}: {e}"
@@ -0,0 +1,226 @@
+"""
+Local Cache Module
+In-process L1 cache in front of Redis for small, hot cache keys.
+
+Only namespaces listed in ``L1_NAMESPACE_TTLS`` are held locally (user
+preferences, guild channels/roles/emojis and similar lookups read on every
+form render). Entries expire after the namespace TTL and the cache is bounded
+by entry count with LRU eviction. Every write or delete through the cache
+services drops the key locally and announces it on a Redis pub/sub channel so
+other workers drop their copies too.
+"""
+
+import asyncio
+import copy
+import json
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+CACHE_INVALIDATION_CHANNEL = "polly:cache_invalidate"
+
+# Namespace (cache key prefix before the first ":") -> L1 TTL in seconds.
+# Kept well below the Redis TTLs: the L1 copy only has to absorb bursts of reads.
+L1_NAMESPACE_TTLS: Dict[str, float] = {
+    "user_prefs": 30,
+    "user_guilds": 30,
+    "guild_channels": 60,
+    "guild_roles": 60,
+    "guild_roles_ping": 60,
+    "guild_emojis": 120,
+    "guild_emojis_extended": 120,
+}
+
+# Sentinel broadcast key meaning "drop everything"
+_CLEAR_ALL = "*"
+
+
+def _namespace(key: str) -> str:
+    return key.split(":", 1)[0]
+
+
+class _NamespaceStats:
+    __slots__ = ("hits", "misses", "evictions", "invalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+
+class LocalCache:
+    """Size-bounded TTL/LRU cache with cross-worker invalidation over Redis pub/sub"""
+
+    def __init__(self):
+        # Configuration
+        self.enabled = config("CACHE_L1_ENABLED", default=True, cast=bool)
+        self.max_entries = config("CACHE_L1_MAX_ENTRIES", default=2048, cast=int)
+        self.redis_fanout = config("CACHE_L1_REDIS_FANOUT", default=True, cast=bool)
+
+        # Identifies our own messages on the Redis channel
+        self.worker_id = uuid.uuid4().hex
+        # key -> (expires_at, value), least recently used first
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._stats: Dict[str, _NamespaceStats] = {
+            namespace: _NamespaceStats() for namespace in L1_NAMESPACE_TTLS
+        }
+        self._listener_task: Optional[asyncio.Task] = None
+        self.remote_invalidations = 0
+
+    def handles(self, key: str) -> bool:
+        """True if ``key`` belongs to an L1-cached namespace"""
+        return self.enabled and _namespace(key) in L1_NAMESPACE_TTLS
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)``; values are copies so callers can't mutate the cache"""
+        stats = self._stats[_namespace(key)]
+        entry = self._entries.get(key)
+        if entry is None:
+            stats.misses += 1
+            return False, None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            stats.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        stats.hits += 1
+        return True, copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` for the namespace TTL (or ``ttl`` if shorter)"""
+        namespace_ttl = L1_NAMESPACE_TTLS[_namespace(key)]
+        ttl = namespace_ttl if ttl is None else min(ttl, namespace_ttl)
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._stats[_namespace(evicted)].evictions += 1
+
+        self._ensure_listener()
+
+    def discard(self, keys: Iterable[str]) -> None:
+        """Drop keys locally (no broadcast)"""
+        for key in keys:
+            if key == _CLEAR_ALL:
+                self._entries.clear()
+                continue
+            if self._entries.pop(key, None) is not None:
+                self._stats[_namespace(key)].invalidations += 1
+
+    async def invalidate(self, *keys: str) -> None:
+        """Drop keys here and on every other worker"""
+        keys = tuple(key for key in keys if key == _CLEAR_ALL or self.handles(key))
+        if not keys or not self.enabled:
+            return
+        self.discard(keys)
+
+        if not self.redis_fanout:
+            return
+        try:
+            from ...redis_client import get_redis_client
+
+            redis_client = await get_redis_client()
+            await redis_client.publish(
+                CACHE_INVALIDATION_CHANNEL,
+                json.dumps({"origin": self.worker_id, "keys": list(keys)}),
+            )
+        except Exception as e:
+            logger.debug(f"Could not broadcast L1 cache invalidation: {e}")
+
+    async def clear(self) -> None:
+        """Drop every L1 entry here and on every other worker"""
+        await self.invalidate(_CLEAR_ALL)
+
+    def _ensure_listener(self) -> None:
+        if not self.redis_fanout:
+            return
+        if self._listener_task is not None and not self._listener_task.done():
+            return
+        try:
+            self._listener_task = asyncio.get_running_loop().create_task(
+                self._listen_remote()
+            )
+        except RuntimeError:
+            # No running loop (sync caller); the next async set() starts it
+            pass
+
+    async def _listen_remote(self) -> None:
+        """Apply other workers' invalidations while we hold L1 entries"""
+        from ...redis_client import get_redis_client
+
+        while True:
+            pubsub = None
+            try:
+                redis_client = await get_redis_client()
+                pubsub = await redis_client.pubsub()
+                if pubsub is None:
+                    # Can't hear other workers: stop trusting local copies
+                    self._entries.clear()
+                    await asyncio.sleep(5)
+                    continue
+                await pubsub.subscribe(CACHE_INVALIDATION_CHANNEL)
+
+                while True:
+                    message = await pubsub.get_message(timeout=1.0)
+                    if not message or message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != self.worker_id:
+                        self.remote_invalidations += 1
+                        self.discard(payload.get("keys", ()))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️ L1 cache invalidation listener error, retrying: {e}")
+                self._entries.clear()
+                await asyncio.sleep(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.aclose()
+                    except Exception:
+                        pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-namespace hit/miss/eviction counters for admin pages"""
+        namespaces = {}
+        for namespace, stats in self._stats.items():
+            lookups = stats.hits + stats.misses
+            namespaces[namespace] = {
+                "hits": stats.hits,
+                "misses": stats.misses,
+                "evictions": stats.evictions,
+                "invalidations": stats.invalidations,
+                "hit_rate": (stats.hits / lookups * 100) if lookups else 0.0,
+                "ttl": L1_NAMESPACE_TTLS[namespace],
+            }
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "remote_invalidations": self.remote_invalidations,
+            "namespaces": namespaces,
+        }
+
+
+# Global local cache instance (shared by all cache services in this process)
+_local_cache: Optional[LocalCache] = None
+
+
+def get_local_cache() -> LocalCache:
+    """Get or create the L1 cache instance"""
+    global _local_cache
+    if _local_cache is None:
+        _local_cache = LocalCache()
+    return _local_cache
@@ -7,12 +7,24 @@ import logging
 from typing import Dict, Any, Optional
 import discord
 
-from polly.database import get_db_session, Poll, TypeSafeColumn
+from sqlalchemy.orm import joinedload
+
+from polly.database import run_in_db_session, Poll, TypeSafeColumn
 from polly.error_handler import PollErrorHandler
 
 logger = logging.getLogger(__name__)
 
 
+def _load_poll_with_votes(db, poll_id: int) -> Optional[Poll]:
+    """Load a poll with its votes eagerly so it stays usable once detached"""
+    return (
+        db.query(Poll)
+        .options(joinedload(Poll.votes))
+        .filter(Poll.id == poll_id)
+        .first()
+    )
+
+
 class PollClosureService:
     """Unified service for closing polls with consistent procedures"""
 
@@ -48,18 +60,9 @@ class PollClosureService:
                 logger.error(f"❌ UNIFIED CLOSE {poll_id} - Bot instance not available")
                 return {"success": False, "error": "Bot instance not available"}
 
-            # STEP 1: Get poll data BEFORE closing it
-            db = get_db_session()
-            poll = None
+            # STEP 1: Get poll data BEFORE closing it (on the DB thread pool)
             try:
-                from sqlalchemy.orm import joinedload
-
-                poll = (
-                    db.query(Poll)
-                    .options(joinedload(Poll.votes))
-                    .filter(Poll.id == poll_id)
-                    .first()
-                )
+                poll = await run_in_db_session(lambda db: _load_poll_with_votes(db, poll_id))
                 if not poll:
                     logger.error(f"❌ UNIFIED CLOSE {poll_id} - Poll not found in database")
                     return {"success": False, "error": "Poll not found"}
@@ -70,7 +73,7 @@ class PollClosureService:
                     logger.info(f"ℹ️ UNIFIED CLOSE {poll_id} - Poll already closed, skipping")
                     return {"success": True, "message": "Poll was already closed", "already_closed": True}
 
-                # Extract poll data while still attached to session
+                # Extract poll data (columns stay loaded on the detached instance)
                 message_id = TypeSafeColumn.get_string(poll, "message_id")
                 channel_id = TypeSafeColumn.get_string(poll, "channel_id")
                 poll_name = TypeSafeColumn.get_string(poll, "name", "Unknown")
@@ -81,8 +84,6 @@ class PollClosureService:
                 logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error fetching poll data: {e}")
                 # Return a generic database error without exposing internal exception details
                 return {"success": False, "error": "Database error while fetching poll data"}
-            finally:
-                db.close()
 
             # STEP 2: Close poll in database using bulletproof operations
             try:
@@ -110,231 +111,225 @@ class PollClosureService:
                 }
 
             # STEP 3: Get fresh poll data and update the existing message to show it's closed FIRST
-            db = get_db_session()
             try:
-                from sqlalchemy.orm import joinedload
-
-                fresh_poll = (
-                    db.query(Poll)
-                    .options(joinedload(Poll.votes))
-                    .filter(Poll.id == poll_id)
-                    .first()
-                )
-                if fresh_poll:
-                    # Update the poll embed to show it's closed with final results BEFORE clearing reactions
-                    try:
-                        from polly.discord_utils import update_poll_message
-                        await update_poll_message(bot_instance, fresh_poll)
-                        logger.info(f"✅ UNIFIED CLOSE {poll_id} - Updated poll message to show closed status with final results")
-                    except Exception as update_error:
-                        logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error updating poll message: {update_error}")
-                        # Continue with closure process even if message update fails
-
-                # STEP 4: Clear reactions from Discord message AFTER updating the embed
-                if message_id and channel_id:
-                    try:
-                        channel = bot_instance.get_channel(int(channel_id))
-                        if channel and isinstance(channel, discord.TextChannel):
-                            try:
-                                message = await channel.fetch_message(int(message_id))
-                                if message:
-                                    # Clear all reactions from the poll message
-                                    await message.clear_reactions()
-                                    logger.info(f"✅ UNIFIED CLOSE {poll_id} - Cleared all reactions from Discord message")
-                                else:
-                                    logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find message {message_id}")
-                            except discord.NotFound:
-                                logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Message {message_id} not found (may have been deleted)")
-                            except discord.Forbidden:
-                                logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - No permission to clear reactions")
-                            except Exception as reaction_error:
-                                logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error clearing reactions: {reaction_error}")
-                        else:
-                            logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find or access channel {channel_id}")
-                    except Exception as channel_error:
-                        logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error accessing channel: {channel_error}")
-
-                # Continue with fresh_poll processing for role ping notifications
-                if fresh_poll:
-                    # Send role ping notification if enabled and configured for poll closure
-                    ping_role_enabled = TypeSafeColumn.get_bool(fresh_poll, "ping_role_enabled", False)
-                    ping_role_id = TypeSafeColumn.get_string(fresh_poll, "ping_role_id")
-                    ping_role_on_close = TypeSafeColumn.get_bool(fresh_poll, "ping_role_on_close", False)
-                    ping_role_name = TypeSafeColumn.get_string(fresh_poll, "ping_role_name", "Unknown Role")
-
-                    if ping_role_enabled and ping_role_id and ping_role_on_close:
+                fresh_poll = await run_in_db_session(lambda db: _load_poll_with_votes(db, poll_id))
+            except Exception as e:
+                logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error reloading poll after closure: {e}")
+                fresh_poll = None
+
+            if fresh_poll:
+                # Update the poll embed to show it's closed with final results BEFORE clearing reactions
+                try:
+                    from polly.discord_utils import update_poll_message
+                    await update_poll_message(bot_instance, fresh_poll)
+                    logger.info(f"✅ UNIFIED CLOSE {poll_id} - Updated poll message to show closed status with final results")
+                except Exception as update_error:
+                    logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error updating poll message: {update_error}")
+                    # Continue with closure process even if message update fails
+
+            # STEP 4: Clear reactions from Discord message AFTER updating the embed
+            if message_id and channel_id:
+                try:
+                    channel = bot_instance.get_channel(int(channel_id))
+                    if channel and isinstance(channel, discord.TextChannel):
                         try:
-                            poll_channel_id = TypeSafeColumn.get_string(fresh_poll, "channel_id")
-                            if poll_channel_id:
-                                channel = bot_instance.get_channel(int(poll_channel_id))
-                                if channel and isinstance(channel, discord.TextChannel):
-                                    poll_name = TypeSafeColumn.get_string(fresh_poll, "name", "Unknown Poll")
-                                    role_id = str(ping_role_id)
-
-                                    # Build the closing notification: role mention + final
-                                    # results embed in a single message, matching the
-                                    # open path's atomic role-ping-with-content style.
-                                    fallback_content = f"📊 **Poll '{poll_name}' has ended!**"
-
-                                    # Explicitly allow the configured role mention so the
-                                    # ping isn't suppressed by the client/bot default
-                                    # AllowedMentions policy. Pre-resolve the role on the
-                                    # guild and only attempt the mention if the role still
-                                    # exists and Discord would actually deliver the ping
-                                    # (role mentionable, or bot has Mention Everyone).
-                                    # That way the "Will ping role …" log reflects reality
-                                    # rather than always firing for a parseable id.
-                                    no_mentions = discord.AllowedMentions.none()
-                                    role_mention_attempted = False
-                                    allowed_mentions = no_mentions
-                                    message_content = fallback_content
-                                    try:
-                                        role_id_int = int(role_id)
-                                        guild = getattr(channel, "guild", None)
-                                        role_obj = guild.get_role(role_id_int) if guild else None
-
-                                        # Resolve the bot's guild Member to check
-                                        # mention_everyone. `guild.me` is normally
-                                        # populated regardless of the members intent,
-                                        # but fall back to `get_member(bot.user.id)`
-                                        # for setups where it isn't cached.
-                                        bot_member = None
-                                        if guild:
-                                            bot_member = guild.me
-                                            if bot_member is None and bot_instance.user is not None:
-                                                bot_member = guild.get_member(bot_instance.user.id)
-
-                                        if bot_member is not None:
-                                            can_mention_everyone = bool(
-                                                channel.permissions_for(bot_member).mention_everyone
+                            message = await channel.fetch_message(int(message_id))
+                            if message:
+                                # Clear all reactions from the poll message
+                                await message.clear_reactions()
+                                logger.info(f"✅ UNIFIED CLOSE {poll_id} - Cleared all reactions from Discord message")
+                            else:
+                                logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find message {message_id}")
+                        except discord.NotFound:
+                            logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Message {message_id} not found (may have been deleted)")
+                        except discord.Forbidden:
+                            logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - No permission to clear reactions")
+                        except Exception as reaction_error:
+                            logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error clearing reactions: {reaction_error}")
+                    else:
+                        logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find or access channel {channel_id}")
+                except Exception as channel_error:
+                    logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error accessing channel: {channel_error}")
+
+            # Continue with fresh_poll processing for role ping notifications
+            if fresh_poll:
+                # Send role ping notification if enabled and configured for poll closure
+                ping_role_enabled = TypeSafeColumn.get_bool(fresh_poll, "ping_role_enabled", False)
+                ping_role_id = TypeSafeColumn.get_string(fresh_poll, "ping_role_id")
+                ping_role_on_close = TypeSafeColumn.get_bool(fresh_poll, "ping_role_on_close", False)
+                ping_role_name = TypeSafeColumn.get_string(fresh_poll, "ping_role_name", "Unknown Role")
+
+                if ping_role_enabled and ping_role_id and ping_role_on_close:
+                    try:
+                        poll_channel_id = TypeSafeColumn.get_string(fresh_poll, "channel_id")
+                        if poll_channel_id:
+                            channel = bot_instance.get_channel(int(poll_channel_id))
+                            if channel and isinstance(channel, discord.TextChannel):
+                                poll_name = TypeSafeColumn.get_string(fresh_poll, "name", "Unknown Poll")
+                                role_id = str(ping_role_id)
+
+                                # Build the closing notification: role mention + final
+                                # results embed in a single message, matching the
+                                # open path's atomic role-ping-with-content style.
+                                fallback_content = f"📊 **Poll '{poll_name}' has ended!**"
+
+                                # Explicitly allow the configured role mention so the
+                                # ping isn't suppressed by the client/bot default
+                                # AllowedMentions policy. Pre-resolve the role on the
+                                # guild and only attempt the mention if the role still
+                                # exists and Discord would actually deliver the ping
+                                # (role mentionable, or bot has Mention Everyone).
+                                # That way the "Will ping role …" log reflects reality
+                                # rather than always firing for a parseable id.
+                                no_mentions = discord.AllowedMentions.none()
+                                role_mention_attempted = False
+                                allowed_mentions = no_mentions
+                                message_content = fallback_content
+                                try:
+                                    role_id_int = int(role_id)
+                                    guild = getattr(channel, "guild", None)
+                                    role_obj = guild.get_role(role_id_int) if guild else None
+
+                                    # Resolve the bot's guild Member to check
+                                    # mention_everyone. `guild.me` is normally
+                                    # populated regardless of the members intent,
+                                    # but fall back to `get_member(bot.user.id)`
+                                    # for setups where it isn't cached.
+                                    bot_member = None
+                                    if guild:
+                                        bot_member = guild.me
+                                        if bot_member is None and bot_instance.user is not None:
+                                            bot_member = guild.get_member(bot_instance.user.id)
+
+                                    if bot_member is not None:
+                                        can_mention_everyone = bool(
+                                            channel.permissions_for(bot_member).mention_everyone
+                                        )
+                                    else:
+                                        # Permissions are unknown — be optimistic
+                                        # and let the discord.Forbidden fallback
+                                        # handle the case where the bot really
+                                        # can't ping the role.
+                                        can_mention_everyone = True
+
+                                    if role_obj is None:
+                                        logger.warning(
+                                            f"⚠️ UNIFIED CLOSE {poll_id} - Configured role {role_id} not found in guild; posting without role ping"
+                                        )
+                                    elif not role_obj.mentionable and not can_mention_everyone:
+                                        logger.warning(
+                                            f"⚠️ UNIFIED CLOSE {poll_id} - Role {ping_role_name} ({role_id}) is not mentionable and bot lacks Mention Everyone; posting without role ping"
+                                        )
+                                    else:
+                                        allowed_mentions = discord.AllowedMentions(
+                                            everyone=False,
+                                            users=False,
+                                            roles=[role_obj],
+                                        )
+                                        message_content = f"<@&{role_id}> {fallback_content}"
+                                        role_mention_attempted = True
+                                except (ValueError, TypeError):
+                                    logger.warning(
+                                        f"⚠️ UNIFIED CLOSE {poll_id} - Invalid role ID format: {role_id!r}; posting without role ping"
+                                    )
+
+                                try:
+                                    from polly.discord_utils import create_poll_results_embed
+                                    results_embed = await create_poll_results_embed(fresh_poll)
+                                except Exception as embed_error:
+                                    logger.error(
+                                        f"❌ UNIFIED CLOSE {poll_id} - Failed to build results embed for closure notification: {embed_error}"
+                                    )
+                                    results_embed = None
+
+                                if role_mention_attempted:
+                                    logger.info(
+                                        f"🔔 UNIFIED CLOSE {poll_id} - Will ping role {ping_role_name} ({role_id}) for poll closure"
+                                    )
+
+                                # `fallback_content` interpolates the user-controlled
+                                # poll name, so every fallback send reuses the
+                                # `no_mentions` policy declared above to prevent an
+                                # "@everyone" or arbitrary role/user mention smuggled
+                                # into the poll name from being pinged.
+
+                                # Send the closure notification with graceful
+                                # error handling. discord.Forbidden can mean the
+                                # bot can't send at all, can't ping the role, or
+                                # lacks Embed Links — try progressively cheaper
+                                # variants until one works.
+                                try:
+                                    await channel.send(
+                                        content=message_content,
+                                        embed=results_embed,
+                                        allowed_mentions=allowed_mentions,
+                                    )
+                                    logger.info(f"✅ UNIFIED CLOSE {poll_id} - Sent closure notification")
+                                except discord.Forbidden as send_forbidden:
+                                    logger.warning(
+                                        f"⚠️ UNIFIED CLOSE {poll_id} - Closure send forbidden, attempting fallbacks: {send_forbidden}"
+                                    )
+
+                                    embed_fallback_handled = False
+                                    # Only retry without the role mention if we
+                                    # actually attempted one — otherwise the
+                                    # primary send is already the no-mention
+                                    # variant and a retry would be identical.
+                                    if role_mention_attempted:
+                                        try:
+                                            await channel.send(
+                                                content=fallback_content,
+                                                embed=results_embed,
+                                                allowed_mentions=no_mentions,
                                             )
-                                        else:
-                                            # Permissions are unknown — be optimistic
-                                            # and let the discord.Forbidden fallback
-                                            # handle the case where the bot really
-                                            # can't ping the role.
-                                            can_mention_everyone = True
-
-                                        if role_obj is None:
-                                            logger.warning(
-                                                f"⚠️ UNIFIED CLOSE {poll_id} - Configured role {role_id} not found in guild; posting without role ping"
+                                            logger.info(
+                                                f"✅ UNIFIED CLOSE {poll_id} - Sent fallback notification without role ping"
                                             )
-                                        elif not role_obj.mentionable and not can_mention_everyone:
+                                            embed_fallback_handled = True
+                                        except discord.Forbidden as embed_forbidden:
                                             logger.warning(
-                                                f"⚠️ UNIFIED CLOSE {poll_id} - Role {ping_role_name} ({role_id}) is not mentionable and bot lacks Mention Everyone; posting without role ping"
+                                                f"⚠️ UNIFIED CLOSE {poll_id} - Embed fallback forbidden, retrying as plain text: {embed_forbidden}"
                                             )
-                                        else:
-                                            allowed_mentions = discord.AllowedMentions(
-                                                everyone=False,
-                                                users=False,
-                                                roles=[role_obj],
+                                        except Exception as fallback_error:
+                                            # Log the failure but still drop through
+                                            # to the plain-text fallback so a transient
+                                            # HTTP/embed glitch doesn't leave users
+                                            # with no closure notification.
+                                            logger.error(
+                                                f"❌ UNIFIED CLOSE {poll_id} - Embed fallback notification failed, retrying as plain text: {fallback_error}"
                                             )
-                                            message_content = f"<@&{role_id}> {fallback_content}"
-                                            role_mention_attempted = True
-                                    except (ValueError, TypeError):
-                                        logger.warning(
-                                            f"⚠️ UNIFIED CLOSE {poll_id} - Invalid role ID format: {role_id!r}; posting without role ping"
-                                        )
-
-                                    try:
-                                        from polly.discord_utils import create_poll_results_embed
-                                        results_embed = await create_poll_results_embed(fresh_poll)
-                                    except Exception as embed_error:
-                                        logger.error(
-                                            f"❌ UNIFIED CLOSE {poll_id} - Failed to build results embed for closure notification: {embed_error}"
-                                        )
-                                        results_embed = None
-
-                                    if role_mention_attempted:
-                                        logger.info(
-                                            f"🔔 UNIFIED CLOSE {poll_id} - Will ping role {ping_role_name} ({role_id}) for poll closure"
-                                        )
-
-                                    # `fallback_content` interpolates the user-controlled
-                                    # poll name, so every fallback send reuses the
-                                    # `no_mentions` policy declared above to prevent an
-                                    # "@everyone" or arbitrary role/user mention smuggled
-                                    # into the poll name from being pinged.
-
-                                    # Send the closure notification with graceful
-                                    # error handling. discord.Forbidden can mean the
-                                    # bot can't send at all, can't ping the role, or
-                                    # lacks Embed Links — try progressively cheaper
-                                    # variants until one works.
-                                    try:
-                                        await channel.send(
-                                            content=message_content,
-                                            embed=results_embed,
-                                            allowed_mentions=allowed_mentions,
-                                        )
-                                        logger.info(f"✅ UNIFIED CLOSE {poll_id} - Sent closure notification")
-                                    except discord.Forbidden as send_forbidden:
-                                        logger.warning(
-                                            f"⚠️ UNIFIED CLOSE {poll_id} - Closure send forbidden, attempting fallbacks: {send_forbidden}"
-                                        )
 
-                                        embed_fallback_handled = False
-                                        # Only retry without the role mention if we
-                                        # actually attempted one — otherwise the
-                                        # primary send is already the no-mention
-                                        # variant and a retry would be identical.
-                                        if role_mention_attempted:
-                                            try:
-                                                await channel.send(
-                                                    content=fallback_content,
-                                                    embed=results_embed,
-                                                    allowed_mentions=no_mentions,
-                                                )
-                                                logger.info(
-                                                    f"✅ UNIFIED CLOSE {poll_id} - Sent fallback notification without role ping"
-                                                )
-                                                embed_fallback_handled = True
-                                            except discord.Forbidden as embed_forbidden:
-                                                logger.warning(
-                                                    f"⚠️ UNIFIED CLOSE {poll_id} - Embed fallback forbidden, retrying as plain text: {embed_forbidden}"
-                                                )
-                                            except Exception as fallback_error:
-                                                # Log the failure but still drop through
-                                                # to the plain-text fallback so a transient
-                                                # HTTP/embed glitch doesn't leave users
-                                                # with no closure notification.
-                                                logger.error(
-                                                    f"❌ UNIFIED CLOSE {poll_id} - Embed fallback notification failed, retrying as plain text: {fallback_error}"
-                                                )
-
-                                        if not embed_fallback_handled:
-                                            # Plain-text fallback: bot likely lacks
-                                            # Embed Links (or never had a mention to
-                                            # drop). Send without an embed so users
-                                            # still see that the poll closed.
-                                            try:
-                                                await channel.send(
-                                                    content=fallback_content,
-                                                    allowed_mentions=no_mentions,
-                                                )
-                                                logger.info(
-                                                    f"✅ UNIFIED CLOSE {poll_id} - Sent plain-text fallback notification"
-                                                )
-                                            except Exception as plain_error:
-                                                logger.error(
-                                                    f"❌ UNIFIED CLOSE {poll_id} - Plain-text fallback also failed: {plain_error}"
-                                                )
-                                    except Exception as send_error:
-                                        logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error sending closure notification: {send_error}")
-                                else:
-                                    logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find or access channel {poll_channel_id}")
+                                    if not embed_fallback_handled:
+                                        # Plain-text fallback: bot likely lacks
+                                        # Embed Links (or never had a mention to
+                                        # drop). Send without an embed so users
+                                        # still see that the poll closed.
+                                        try:
+                                            await channel.send(
+                                                content=fallback_content,
+                                                allowed_mentions=no_mentions,
+                                            )
+                                            logger.info(
+                                                f"✅ UNIFIED CLOSE {poll_id} - Sent plain-text fallback notification"
+                                            )
+                                        except Exception as plain_error:
+                                            logger.error(
+                                                f"❌ UNIFIED CLOSE {poll_id} - Plain-text fallback also failed: {plain_error}"
+                                            )
+                                except Exception as send_error:
+                                    logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error sending closure notification: {send_error}")
                             else:
-                                logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - No channel ID found for role ping notification")
-                        except Exception as ping_error:
-                            logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error in role ping notification process: {ping_error}")
-                    elif ping_role_enabled and ping_role_id and not ping_role_on_close:
-                        logger.info(f"ℹ️ UNIFIED CLOSE {poll_id} - Role ping enabled but ping_role_on_close is disabled")
-                    elif ping_role_enabled and not ping_role_id:
-                        logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Role ping enabled but no role ID configured")
-                else:
-                    logger.error(f"❌ UNIFIED CLOSE {poll_id} - Poll not found for message update")
-            finally:
-                db.close()
+                                logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Could not find or access channel {poll_channel_id}")
+                        else:
+                            logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - No channel ID found for role ping notification")
+                    except Exception as ping_error:
+                        logger.error(f"❌ UNIFIED CLOSE {poll_id} - Error in role ping notification process: {ping_error}")
+                elif ping_role_enabled and ping_role_id and not ping_role_on_close:
+                    logger.info(f"ℹ️ UNIFIED CLOSE {poll_id} - Role ping enabled but ping_role_on_close is disabled")
+                elif ping_role_enabled and not ping_role_id:
+                    logger.warning(f"⚠️ UNIFIED CLOSE {poll_id} - Role ping enabled but no role ID configured")
+            else:
+                logger.error(f"❌ UNIFIED CLOSE {poll_id} - Poll not found for message update")
 
             # STEP 5: Generate static content for closed poll
             try:
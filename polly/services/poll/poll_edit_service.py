@@ -336,51 +336,15 @@ class PollEditService:
         new_close_time: datetime, 
         poll_status: str
     ) -> Dict[str, Any]:
-        """Update scheduler jobs when close_time is edited"""
+        """Wake the schedule sweeper so an edited close_time takes effect"""
         try:
-            logger.info(f"🕒 SCHEDULER UPDATE {poll_id} - Starting scheduler update for new close time: {new_close_time}")
+            logger.info(f"🕒 SCHEDULER UPDATE {poll_id} - New close time: {new_close_time}")
             
-            # Only update scheduler for active and scheduled polls
+            # Only active and scheduled polls are still waiting to close
             if poll_status not in ["active", "scheduled"]:
                 logger.info(f"ℹ️ SCHEDULER UPDATE {poll_id} - No scheduler update needed for {poll_status} polls")
                 return {"success": True, "message": f"No scheduler update needed for {poll_status} polls"}
             
-            # Get scheduler instance
-            from ...background_tasks import get_scheduler
-            scheduler = get_scheduler()
-            
-            if not scheduler:
-                logger.error(f"❌ SCHEDULER UPDATE {poll_id} - Scheduler instance not available")
-                return {"success": False, "error": "Scheduler instance not available"}
-                
-            if not scheduler.running:
-                logger.error(f"❌ SCHEDULER UPDATE {poll_id} - Scheduler is not running")
-                return {"success": False, "error": "Scheduler is not running"}
-            
-            # Import required modules
-            from ...timezone_scheduler_fix import TimezoneAwareScheduler
-            from ...background_tasks import close_poll
-            
-            # Get poll timezone from database
-            db = get_db_session()
-            try:
-                poll = db.query(Poll).filter(Poll.id == poll_id).first()
-                if not poll:
-                    logger.error(f"❌ SCHEDULER UPDATE {poll_id} - Poll not found")
-                    return {"success": False, "error": "Poll not found"}
-                    
-                poll_timezone = TypeSafeColumn.get_string(poll, "timezone", "UTC")
-                
-            finally:
-                db.close()
-            
-            # Remove existing close job if it exists
-            close_job_id = f"close_poll_{poll_id}"
-            existing_job = scheduler.get_job(close_job_id)
-            if existing_job:
-                scheduler.remove_job(close_job_id)
-                logger.info(f"🗑️ SCHEDULER UPDATE {poll_id} - Removed existing close job")
-            
             # Check if new close time is in the future
             current_time = datetime.now(pytz.UTC)
             if new_close_time <= current_time:
@@ -391,27 +355,17 @@ class PollEditService:
                     "new_close_time": new_close_time.isoformat()
                 }
             
-            # Schedule new close job using timezone-aware scheduler
-            tz_scheduler = TimezoneAwareScheduler(scheduler)
-            success = tz_scheduler.schedule_poll_closing(
-                poll_id, new_close_time, poll_timezone, close_poll
-            )
-            
-            if success:
-                logger.info(f"✅ SCHEDULER UPDATE {poll_id} - Successfully scheduled new close time: {new_close_time}")
-                return {
-                    "success": True,
-                    "message": f"Poll {poll_id} rescheduled to close at {new_close_time}",
-                    "new_close_time": new_close_time.isoformat(),
-                    "timezone": poll_timezone
-                }
-            else:
-                logger.error(f"❌ SCHEDULER UPDATE {poll_id} - Failed to schedule new close job")
-                return {
-                    "success": False,
-                    "error": f"Failed to schedule new close time for poll {poll_id}",
-                    "new_close_time": new_close_time.isoformat()
-                }
+            # The sweeper closes polls from the stored close_time; wake it so
+            # it recomputes its next due time
+            from ...poll_schedule_sweeper import get_poll_schedule_sweeper
+
+            get_poll_schedule_sweeper().wake()
+            logger.info(f"✅ SCHEDULER UPDATE {poll_id} - Poll will close at {new_close_time}")
+            return {
+                "success": True,
+                "message": f"Poll {poll_id} rescheduled to close at {new_close_time}",
+                "new_close_time": new_close_time.isoformat(),
+            }
                 
         except Exception as e:
             logger.error(f"❌ SCHEDULER UPDATE {poll_id} - Error updating scheduler: {e}")
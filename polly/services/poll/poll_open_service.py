@@ -4,9 +4,7 @@ Unified poll opening procedures for consistent behavior across all opening metho
 """
 
 import logging
-from datetime import datetime
 from typing import Dict, Any, Optional
-import pytz
 import discord
 from pathlib import Path
 
@@ -232,46 +230,14 @@ class PollOpeningService:
             finally:
                 db.close()
 
-            # STEP 7: Schedule poll closure if not already scheduled
+            # STEP 7: The schedule sweeper closes the poll at its stored close_time;
+            # wake it so the new active poll's close_time is picked up now
             try:
-                from ...background_tasks import get_scheduler
-                from ...timezone_scheduler_fix import TimezoneAwareScheduler
-                
-                scheduler = get_scheduler()
-                if scheduler and scheduler.running:
-                    # Check if close job already exists
-                    close_job_id = f"close_poll_{poll_id}"
-                    existing_job = scheduler.get_job(close_job_id)
-                    
-                    if not existing_job:
-                        # Get poll close time and schedule closure
-                        db = get_db_session()
-                        try:
-                            poll = db.query(Poll).filter(Poll.id == poll_id).first()
-                            if poll:
-                                poll_close_time = poll.close_time_aware
-                                poll_timezone = TypeSafeColumn.get_string(poll, "timezone", "UTC")
-                                
-                                if poll_close_time and poll_close_time > datetime.now(pytz.UTC):
-                                    from ...background_tasks import close_poll
-                                    
-                                    tz_scheduler = TimezoneAwareScheduler(scheduler)
-                                    success = tz_scheduler.schedule_poll_closing(
-                                        poll_id, poll_close_time, poll_timezone, close_poll
-                                    )
-                                    
-                                    if success:
-                                        logger.info(f"✅ UNIFIED OPEN {poll_id} - Scheduled poll closure")
-                                    else:
-                                        logger.warning(f"⚠️ UNIFIED OPEN {poll_id} - Failed to schedule poll closure")
-                                        
-                        finally:
-                            db.close()
-                    else:
-                        logger.info(f"ℹ️ UNIFIED OPEN {poll_id} - Poll closure already scheduled")
-                        
+                from ...poll_schedule_sweeper import get_poll_schedule_sweeper
+
+                get_poll_schedule_sweeper().wake()
             except Exception as schedule_error:
-                logger.error(f"❌ UNIFIED OPEN {poll_id} - Error scheduling poll closure: {schedule_error}")
+                logger.error(f"❌ UNIFIED OPEN {poll_id} - Error waking poll schedule sweeper: {schedule_error}")
                 # Don't fail the opening process if scheduling fails
 
             # STEP 8: Cache management - invalidate stale caches and warm new ones
@@ -209,48 +209,15 @@ class PollReopeningService:
                     "error": "Discord update failed due to an internal error.",
                 }
 
-            # STEP 6: Schedule poll closure if extended
-            if extend_minutes and extend_minutes > 0:
-                try:
-                    from ...background_tasks import get_scheduler
-                    from ...timezone_scheduler_fix import TimezoneAwareScheduler
-                    
-                    scheduler = get_scheduler()
-                    if scheduler and scheduler.running:
-                        # Remove any existing close job
-                        close_job_id = f"close_poll_{poll_id}"
-                        existing_job = scheduler.get_job(close_job_id)
-                        if existing_job:
-                            scheduler.remove_job(close_job_id)
-                            logger.info(f"🗑️ UNIFIED REOPEN {poll_id} - Removed existing close job")
-                        
-                        # Schedule new close job
-                        db = get_db_session()
-                        try:
-                            poll = db.query(Poll).filter(Poll.id == poll_id).first()
-                            if poll:
-                                poll_close_time = poll.close_time_aware
-                                poll_timezone = TypeSafeColumn.get_string(poll, "timezone", "UTC")
-                                
-                                # Ensure we have a proper datetime object
-                                if poll_close_time and isinstance(poll_close_time, datetime) and poll_close_time > datetime.now(pytz.UTC):
-                                    from ...background_tasks import close_poll
-                                    
-                                    tz_scheduler = TimezoneAwareScheduler(scheduler)
-                                    success = tz_scheduler.schedule_poll_closing(
-                                        poll_id, poll_close_time, poll_timezone, close_poll
-                                    )
-                                    
-                                    if success:
-                                        logger.info(f"✅ UNIFIED REOPEN {poll_id} - Scheduled new poll closure")
-                                    else:
-                                        logger.warning(f"⚠️ UNIFIED REOPEN {poll_id} - Failed to schedule new poll closure")
-                        finally:
-                            db.close()
-                            
-                except Exception as schedule_error:
-                    logger.error(f"❌ UNIFIED REOPEN {poll_id} - Error scheduling poll closure: {schedule_error}")
-                    # Don't fail the reopening process if scheduling fails
+            # STEP 6: The schedule sweeper closes the reopened poll at its stored
+            # close_time; wake it so a new or extended close_time is picked up now
+            try:
+                from ...poll_schedule_sweeper import get_poll_schedule_sweeper
+
+                get_poll_schedule_sweeper().wake()
+            except Exception as schedule_error:
+                logger.error(f"❌ UNIFIED REOPEN {poll_id} - Error waking poll schedule sweeper: {schedule_error}")
+                # Don't fail the reopening process if scheduling fails
 
             # STEP 7: Cache management - invalidate stale caches
             try:
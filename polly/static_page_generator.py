@@ -16,24 +16,18 @@ try:
     from .htmx_endpoints import format_datetime_for_user
     from .database import get_db_session, Poll, Vote, TypeSafeColumn
     from .services.cache.enhanced_cache_service import get_enhanced_cache_service
-    from .services.cache.avatar_cache_service import get_avatar_cache_service
     from .data_utils import sanitize_data_for_json
+    from .discord_user_resolver import fallback_username, get_discord_user_resolver
+    from .image_processing import PIL_AVAILABLE, compress_image_file, get_image_processing_service
 except ImportError:
     from htmx_endpoints import format_datetime_for_user  # type: ignore
     from database import get_db_session, Poll, Vote, TypeSafeColumn  # type: ignore
     from enhanced_cache_service import get_enhanced_cache_service  # type: ignore
-    from avatar_cache_service import get_avatar_cache_service  # type: ignore
     from data_utils import sanitize_data_for_json  # type: ignore
+    from discord_user_resolver import fallback_username, get_discord_user_resolver  # type: ignore
+    from image_processing import PIL_AVAILABLE, compress_image_file, get_image_processing_service  # type: ignore
 logger = logging.getLogger(__name__)
 
-# Image compression imports (optional dependencies)
-try:
-    from PIL import Image, ImageOps
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    logger.warning("PIL/Pillow not available - image compression disabled")
-
 # Browser automation imports for dashboard screenshots (optional dependencies)
 # DISABLED: Screenshot functionality completely disabled per user request
 # try:
@@ -101,6 +95,19 @@ class StaticPageGenerator:
         filename = f"poll_{poll_id}_data.json"
         return self.static_dir / filename
         
+    async def _resolve_voters(self, bot, poll, votes):
+        """Resolve all voters' usernames and cache their avatars in one batch"""
+        if not bot:
+            return {}, {}
+        resolver = get_discord_user_resolver()
+        discord_users = await resolver.resolve_users(
+            bot,
+            (TypeSafeColumn.get_string(vote, "user_id") for vote in votes),
+            guild_id=TypeSafeColumn.get_string(poll, "server_id"),
+        )
+        cached_avatars = await resolver.cache_avatars(discord_users)
+        return discord_users, cached_avatars
+
     async def generate_static_poll_details(self, poll_id: int, bot=None) -> bool:
         """Generate static poll details page (identical to current details page with dashboard)"""
         try:
@@ -132,7 +139,7 @@ class StaticPageGenerator:
                 # Prepare vote data with real Discord usernames and cached avatars (never anonymize for static pages)
                 vote_data = []
                 unique_users = set()
-                avatar_cache = get_avatar_cache_service()
+                discord_users, cached_avatars = await self._resolve_voters(bot, poll, votes)
                 
                 for vote in votes:
                     try:
@@ -140,36 +147,15 @@ class StaticPageGenerator:
                         option_index = TypeSafeColumn.get_int(vote, "option_index")
                         voted_at = TypeSafeColumn.get_datetime(vote, "voted_at")
                         
-                        # Always fetch real Discord username for static pages (never anonymize)
+                        # Always show real Discord username for static pages (never anonymize)
                         username = "Unknown User"
                         avatar_url = None
-                        
-                        if bot and user_id:
-                            try:
-                                # Check if bot is ready before attempting to fetch user
-                                if hasattr(bot, 'is_ready') and bot.is_ready():
-                                    # Additional rate limiting protection in static generator
-                                    import asyncio
-                                    await asyncio.sleep(0.1)  # Extra 100ms delay for safety
-                                    
-                                    discord_user = await bot.fetch_user(int(user_id))
-                                    if discord_user:
-                                        username = discord_user.display_name or discord_user.name
-                                        # Get cached avatar URL
-                                        if discord_user.avatar:
-                                            original_avatar_url = discord_user.avatar.url
-                                            cached_avatar_url = await avatar_cache.cache_user_avatar(
-                                                user_id, original_avatar_url, username
-                                            )
-                                            avatar_url = cached_avatar_url or original_avatar_url
-                                else:
-                                    logger.warning(f"Discord bot not ready, using fallback username for user {user_id}")
-                                    username = f"User {user_id[:8]}..."
-                            except Exception as e:
-                                logger.warning(f"Could not fetch Discord user {user_id} for static generation: {e}")
-                                username = f"User {user_id[:8]}..."
+                        user_data = discord_users.get(user_id)
+                        if user_data:
+                            username = user_data.get("username") or username
+                            avatar_url = cached_avatars.get(user_id) or user_data.get("avatar_url")
                         elif user_id:
-                            username = f"User {user_id[:8]}..."
+                            username = fallback_username(user_id)
                         
                         # Get option details
                         option_text = options[option_index] if option_index < len(options) else "Unknown Option"
@@ -273,7 +259,7 @@ class StaticPageGenerator:
                 # Prepare vote data with real Discord usernames and cached avatars (never anonymize for static pages)
                 vote_data = []
                 unique_users = set()
-                avatar_cache = get_avatar_cache_service()
+                discord_users, cached_avatars = await self._resolve_voters(bot, poll, votes)
                 
                 for vote in votes:
                     try:
@@ -281,36 +267,15 @@ class StaticPageGenerator:
                         option_index = TypeSafeColumn.get_int(vote, "option_index")
                         voted_at = TypeSafeColumn.get_datetime(vote, "voted_at")
                         
-                        # Always fetch real Discord username for static pages (never anonymize)
+                        # Always show real Discord username for static pages (never anonymize)
                         username = "Unknown User"
                         avatar_url = None
-                        
-                        if bot and user_id:
-                            try:
-                                # Check if bot is ready before attempting to fetch user
-                                if hasattr(bot, 'is_ready') and bot.is_ready():
-                                    # Additional rate limiting protection in static generator
-                                    import asyncio
-                                    await asyncio.sleep(0.1)  # Extra 100ms delay for safety
-                                    
-                                    discord_user = await bot.fetch_user(int(user_id))
-                                    if discord_user:
-                                        username = discord_user.display_name or discord_user.name
-                                        # Get cached avatar URL
-                                        if discord_user.avatar:
-                                            original_avatar_url = discord_user.avatar.url
-                                            cached_avatar_url = await avatar_cache.cache_user_avatar(
-                                                user_id, original_avatar_url, username
-                                            )
-                                            avatar_url = cached_avatar_url or original_avatar_url
-                                else:
-                                    logger.warning(f"Discord bot not ready, using fallback username for user {user_id}")
-                                    username = f"User {user_id[:8]}..."
-                            except Exception as e:
-                                logger.warning(f"Could not fetch Discord user {user_id} for static generation: {e}")
-                                username = f"User {user_id[:8]}..."
+                        user_data = discord_users.get(user_id)
+                        if user_data:
+                            username = user_data.get("username") or username
+                            avatar_url = cached_avatars.get(user_id) or user_data.get("avatar_url")
                         elif user_id:
-                            username = f"User {user_id[:8]}..."
+                            username = fallback_username(user_id)
                         
                         # Get option details
                         option_text = options[option_index] if option_index < len(options) else "Unknown Option"
@@ -673,7 +638,8 @@ class StaticPageGenerator:
 
     async def _compress_and_copy_image(self, source_path: Path, dest_path: Path, original_extension: str) -> bool:
         """
-        Enhanced image compression with WebP support and better optimization
+        Enhanced image compression with WebP support and better optimization.
+        Runs in the shared image processing pool so Pillow never blocks the event loop.
         
         Returns: True if successful, False if failed
         """
@@ -681,85 +647,28 @@ class StaticPageGenerator:
             return False
             
         try:
-            # Open image
-            with Image.open(source_path) as img:
-                # Handle transparency for different formats
-                has_transparency = img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info)
-                
-                # Convert image mode for optimal compression
-                if self.enable_webp_conversion and dest_path.suffix.lower() == '.webp':
-                    # WebP supports transparency, keep RGBA if needed
-                    if img.mode == 'P':
-                        img = img.convert('RGBA' if has_transparency else 'RGB')
-                    elif img.mode not in ('RGBA', 'RGB', 'L'):
-                        img = img.convert('RGBA' if has_transparency else 'RGB')
-                elif dest_path.suffix.lower() in ['.jpg', '.jpeg']:
-                    # JPEG doesn't support transparency, convert to RGB with white background
-                    if has_transparency:
-                        background = Image.new('RGB', img.size, (255, 255, 255))
-                        if img.mode == 'P':
-                            img = img.convert('RGBA')
-                        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                        img = background
-                    elif img.mode not in ('RGB', 'L'):
-                        img = img.convert('RGB')
-                elif dest_path.suffix.lower() == '.png':
-                    # PNG supports transparency, preserve it
-                    if img.mode == 'P':
-                        img = img.convert('RGBA' if has_transparency else 'RGB')
-                    elif img.mode not in ('RGBA', 'RGB', 'L'):
-                        img = img.convert('RGBA' if has_transparency else 'RGB')
-                
-                # Auto-orient image based on EXIF data
-                if PIL_AVAILABLE:
-                    img = ImageOps.exif_transpose(img)
-                
-                # Resize if image is too large
-                original_size = img.size
-                if img.width > self.max_width or img.height > self.max_height:
-                    # Use high-quality resampling
-                    img.thumbnail((self.max_width, self.max_height), Image.Resampling.LANCZOS)
-                    logger.info(f"📏 IMAGE RESIZE - Resized from {original_size} to {img.size}")
-                
-                # Determine save format and options based on destination extension
-                dest_extension = dest_path.suffix.lower()
-                
-                if dest_extension == '.webp' and self.enable_webp_conversion:
-                    # WebP format - excellent compression with quality
-                    save_format = 'WebP'
-                    save_options = {
-                        'quality': self.webp_quality,
-                        'method': 6,  # Compression method (0-6, higher = better compression)
-                        'lossless': False,  # Use lossy compression for better file size
-                        'optimize': True
-                    }
-                elif dest_extension in ['.jpg', '.jpeg']:
-                    # JPEG format - good compression for photos
-                    save_format = 'JPEG'
-                    save_options = {
-                        'quality': self.compression_quality,
-                        'optimize': True,
-                        'progressive': self.progressive_jpeg,
-                        'subsampling': 0,  # Better quality subsampling
-                        'qtables': 'web_high'  # Optimized quantization tables
-                    }
-                elif dest_extension == '.png':
-                    # PNG format - lossless with optimization
-                    save_format = 'PNG'
-                    save_options = {
-                        'optimize': self.png_optimize,
-                        'compress_level': 9  # Maximum PNG compression (0-9)
-                    }
-                else:
-                    # Fallback to original format
-                    save_format = img.format or 'JPEG'
-                    save_options = {'optimize': True}
-                
-                # Save compressed image
-                img.save(dest_path, format=save_format, **save_options)
-                
-                logger.info(f"🗜️ IMAGE COMPRESS - Compressed {source_path.name} -> {dest_path.name} (format: {save_format})")
-                return True
+            result = await get_image_processing_service().run(
+                "static_image",
+                compress_image_file,
+                str(source_path),
+                str(dest_path),
+                {
+                    "max_width": self.max_width,
+                    "max_height": self.max_height,
+                    "jpeg_quality": self.compression_quality,
+                    "webp_quality": self.webp_quality,
+                    "progressive_jpeg": self.progressive_jpeg,
+                    "png_optimize": self.png_optimize,
+                },
+            )
+            
+            if result["size"] != result["original_size"]:
+                logger.info(f"📏 IMAGE RESIZE - Resized from {result['original_size']} to {result['size']}")
+            logger.info(
+                f"🗜️ IMAGE COMPRESS - Compressed {source_path.name} -> {dest_path.name} "
+                f"(format: {result['format']}, {result['worker_ms']:.0f}ms{', drafted' if result['drafted'] else ''})"
+            )
+            return True
                 
         except Exception as e:
             logger.error(f"❌ IMAGE COMPRESS - Error compressing image {source_path}: {e}")
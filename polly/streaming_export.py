@@ -0,0 +1,81 @@
+"""
+Polly Streaming Export
+Helpers for exports that are written to the client as they are produced.
+
+Exports walk their rows in fixed-size chunks and encode each chunk as soon
+as it is read, so memory use depends on the chunk size rather than on the
+size of the export. Responses can optionally be gzip-compressed on the fly;
+every chunk is flushed so the client keeps receiving data.
+"""
+
+import csv
+import io
+import zlib
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Optional, Sequence, Union
+
+from decouple import config
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+# Rows read from the database per chunk
+EXPORT_CHUNK_SIZE = config("EXPORT_CHUNK_SIZE", default=1000, cast=int)
+
+Chunk = Union[str, bytes]
+
+
+class CsvChunkEncoder:
+    """Encodes batches of rows to CSV text, reusing one buffer"""
+
+    def __init__(self):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def encode(self, rows: Iterable[Sequence[Any]]) -> str:
+        self._writer.writerows(rows)
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return text
+
+
+def wants_gzip(request: Request) -> bool:
+    """Gzip the export if asked for (?gzip=1) and the client accepts it"""
+    requested = request.query_params.get("gzip", "").lower() in ("1", "true", "yes")
+    return requested and "gzip" in request.headers.get("accept-encoding", "").lower()
+
+
+async def encode_chunks(chunks: AsyncIterable[Chunk], compress: bool = False) -> AsyncIterator[bytes]:
+    """UTF-8 encode (and optionally gzip) chunks as they are produced"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31) if compress else None
+    async for chunk in chunks:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        if not data:
+            continue
+        if compressor is None:
+            yield data
+        else:
+            # Sync flush so the client can decompress what it has so far
+            yield compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+    if compressor is not None:
+        yield compressor.flush()
+
+
+def streaming_download(
+    chunks: AsyncIterable[Chunk],
+    filename: str,
+    media_type: str,
+    compress: bool = False,
+    headers: Optional[dict] = None,
+) -> StreamingResponse:
+    """Attachment response that streams ``chunks`` to the client"""
+    response_headers = {
+        "Content-Disposition": f'attachment; filename="{filename}"',
+        "Cache-Control": "no-cache",
+        # Tell nginx not to buffer the whole export before sending it on
+        "X-Accel-Buffering": "no",
+    }
+    if compress:
+        response_headers["Content-Encoding"] = "gzip"
+        response_headers["Vary"] = "Accept-Encoding"
+    response_headers.update(headers or {})
+    return StreamingResponse(encode_chunks(chunks, compress), media_type=media_type, headers=response_headers)
@@ -7,7 +7,7 @@ import logging
 from typing import List, Optional, Dict, Any
 from fastapi import HTTPException, Depends
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import desc, func
+from sqlalchemy import desc, func, or_, select
 from datetime import datetime, timedelta
 import pytz
 from decouple import config
@@ -59,6 +59,35 @@ async def require_super_admin(
 class SuperAdminService:
     """Service for super admin operations"""
     
+    @staticmethod
+    def _poll_summary(poll, vote_count: int, unique_voters: int) -> Dict[str, Any]:
+        """Poll fields shown in listings and exports"""
+        return {
+            "id": poll.id,
+            "name": TypeSafeColumn.get_string(poll, "name"),
+            "question": TypeSafeColumn.get_string(poll, "question"),
+            "status": TypeSafeColumn.get_string(poll, "status"),
+            "server_id": TypeSafeColumn.get_string(poll, "server_id"),
+            "server_name": TypeSafeColumn.get_string(poll, "server_name"),
+            "channel_id": TypeSafeColumn.get_string(poll, "channel_id"),
+            "channel_name": TypeSafeColumn.get_string(poll, "channel_name"),
+            "creator_id": TypeSafeColumn.get_string(poll, "creator_id"),
+            "message_id": TypeSafeColumn.get_string(poll, "message_id"),
+            "open_time": TypeSafeColumn.get_datetime(poll, "open_time"),
+            "close_time": TypeSafeColumn.get_datetime(poll, "close_time"),
+            "created_at": TypeSafeColumn.get_datetime(poll, "created_at"),
+            "timezone": TypeSafeColumn.get_string(poll, "timezone", "UTC"),
+            "anonymous": TypeSafeColumn.get_bool(poll, "anonymous"),
+            "multiple_choice": TypeSafeColumn.get_bool(poll, "multiple_choice"),
+            "options": poll.options,
+            "emojis": poll.emojis,
+            "vote_count": int(vote_count),
+            "unique_voters": int(unique_voters),
+            "image_path": TypeSafeColumn.get_string(poll, "image_path"),
+            "ping_role_enabled": TypeSafeColumn.get_bool(poll, "ping_role_enabled"),
+            "ping_role_name": TypeSafeColumn.get_string(poll, "ping_role_name"),
+        }
+
     @staticmethod
     def get_all_polls(
         db_session,
@@ -141,34 +170,10 @@ class SuperAdminService:
             results = query.offset(offset).limit(limit).all()
             
             # PERFORMANCE OPTIMIZATION 4: Batch process results without individual queries
-            poll_data = []
-            for poll, vote_count, unique_voters in results:
-                poll_dict = {
-                    "id": poll.id,
-                    "name": TypeSafeColumn.get_string(poll, "name"),
-                    "question": TypeSafeColumn.get_string(poll, "question"),
-                    "status": TypeSafeColumn.get_string(poll, "status"),
-                    "server_id": TypeSafeColumn.get_string(poll, "server_id"),
-                    "server_name": TypeSafeColumn.get_string(poll, "server_name"),
-                    "channel_id": TypeSafeColumn.get_string(poll, "channel_id"),
-                    "channel_name": TypeSafeColumn.get_string(poll, "channel_name"),
-                    "creator_id": TypeSafeColumn.get_string(poll, "creator_id"),
-                    "message_id": TypeSafeColumn.get_string(poll, "message_id"),
-                    "open_time": TypeSafeColumn.get_datetime(poll, "open_time"),
-                    "close_time": TypeSafeColumn.get_datetime(poll, "close_time"),
-                    "created_at": TypeSafeColumn.get_datetime(poll, "created_at"),
-                    "timezone": TypeSafeColumn.get_string(poll, "timezone", "UTC"),
-                    "anonymous": TypeSafeColumn.get_bool(poll, "anonymous"),
-                    "multiple_choice": TypeSafeColumn.get_bool(poll, "multiple_choice"),
-                    "options": poll.options,
-                    "emojis": poll.emojis,
-                    "vote_count": int(vote_count),
-                    "unique_voters": int(unique_voters),
-                    "image_path": TypeSafeColumn.get_string(poll, "image_path"),
-                    "ping_role_enabled": TypeSafeColumn.get_bool(poll, "ping_role_enabled"),
-                    "ping_role_name": TypeSafeColumn.get_string(poll, "ping_role_name"),
-                }
-                poll_data.append(poll_dict)
+            poll_data = [
+                SuperAdminService._poll_summary(poll, vote_count, unique_voters)
+                for poll, vote_count, unique_voters in results
+            ]
             
             return {
                 "polls": poll_data,
@@ -182,6 +187,71 @@ class SuperAdminService:
             logger.error(f"Error getting all polls: {e}")
             raise
     
+    @staticmethod
+    async def get_poll_export_page(
+        db_session,
+        after_id: int = 0,
+        limit: int = 1000,
+        since: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """One keyset page of polls (id > after_id) with their vote aggregates.
+
+        With ``since``, only polls created, closing or voted on at or after
+        that time are included.
+        """
+        query = select(Poll).where(Poll.id > after_id)
+        if since is not None:
+            voted_since = select(Vote.poll_id).where(Vote.voted_at >= since)
+            query = query.where(
+                or_(
+                    Poll.created_at >= since,
+                    Poll.close_time >= since,
+                    Poll.id.in_(voted_since),
+                )
+            )
+        polls = (
+            await db_session.execute(query.order_by(Poll.id).limit(limit))
+        ).scalars().all()
+        if not polls:
+            return []
+
+        # Aggregates for the whole page in two grouped queries
+        poll_ids = [poll.id for poll in polls]
+        totals = {
+            row.poll_id: row
+            for row in await db_session.execute(
+                select(
+                    Vote.poll_id,
+                    func.count(Vote.id).label("vote_count"),
+                    func.count(func.distinct(Vote.user_id)).label("unique_voters"),
+                    func.max(Vote.voted_at).label("last_vote_at"),
+                )
+                .where(Vote.poll_id.in_(poll_ids))
+                .group_by(Vote.poll_id)
+            )
+        }
+        option_counts: Dict[int, Dict[int, int]] = {}
+        for row in await db_session.execute(
+            select(Vote.poll_id, Vote.option_index, func.count(Vote.id).label("votes"))
+            .where(Vote.poll_id.in_(poll_ids))
+            .group_by(Vote.poll_id, Vote.option_index)
+        ):
+            option_counts.setdefault(row.poll_id, {})[row.option_index] = row.votes
+
+        page = []
+        for poll in polls:
+            total = totals.get(poll.id)
+            poll_dict = SuperAdminService._poll_summary(
+                poll,
+                total.vote_count if total else 0,
+                total.unique_voters if total else 0,
+            )
+            counts = option_counts.get(poll.id, {})
+            poll_dict["option_counts"] = [counts.get(i, 0) for i in range(len(poll_dict["options"]))]
+            poll_dict["last_vote_at"] = total.last_vote_at if total else None
+            page.append(poll_dict)
+        return page
+
     @staticmethod
     def get_system_stats(db_session) -> Dict[str, Any]:
         """Get system-wide statistics - ULTRA PERFORMANCE OPTIMIZED"""
@@ -5,14 +5,15 @@ API endpoints for super admin dashboard functionality.
 
 import logging
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from fastapi import Request, Depends, HTTPException, Query
 from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from typing import Optional
 
 from .super_admin import require_super_admin, super_admin_service, DiscordUser
-from .database import get_db_session
+from .database import get_db_session, get_async_db_session
+from .streaming_export import EXPORT_CHUNK_SIZE, streaming_download, wants_gzip
 
 logger = logging.getLogger(__name__)
 templates = Jinja2Templates(directory="templates")
@@ -667,6 +668,10 @@ async def get_redis_stats_htmx(
                 stats_data["error"] = str(e)
         else:
             stats_data["error"] = "Redis client not initialized or not connected"
+
+        # In-process L1 cache counters for this worker
+        from .services.cache.local_cache import get_local_cache
+        stats_data["l1_cache"] = get_local_cache().get_stats()
         
         return templates.TemplateResponse(
             "htmx/super_admin_redis_stats.html",
@@ -684,49 +689,131 @@ async def get_redis_stats_htmx(
         )
 
 
-async def export_system_data_api(
+async def get_recovery_progress_htmx(
     request: Request,
     current_user: DiscordUser = Depends(require_super_admin)
+) -> HTMLResponse:
+    """HTMX endpoint for startup recovery progress and ETA"""
+    try:
+        from .recovery_executor import get_recovery_executor
+
+        return templates.TemplateResponse(
+            "htmx/super_admin_recovery_progress.html",
+            {
+                "request": request,
+                "recovery": get_recovery_executor().get_stats()
+            }
+        )
+
+    except Exception as e:
+        logger.error(f"Error getting recovery progress: {e}")
+        return HTMLResponse(
+            content="<div class='alert alert-danger'>Error loading recovery progress</div>",
+            status_code=500
+        )
+
+
+def _parse_export_since(since: Optional[str]) -> Optional[datetime]:
+    """ISO timestamp cursor -> naive UTC datetime, as stored in the database"""
+    if not since:
+        return None
+    try:
+        parsed = datetime.fromisoformat(since.strip().replace("Z", "+00:00"))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid 'since' timestamp")
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+async def export_system_data_api(
+    request: Request,
+    current_user: DiscordUser = Depends(require_super_admin),
+    export_format: str = "json",
+    since: Optional[str] = None,
+    after_id: int = 0,
 ) -> StreamingResponse:
-    """Export comprehensive system data"""
+    """Stream a system export, walking polls in keyset-paginated pages.
+
+    ``export_format`` is ``json`` (one document) or ``ndjson`` (one record per
+    line). ``since`` limits polls to those changed since an earlier export's
+    ``next_since``; ``after_id`` resumes after a poll id.
+    """
+    ndjson = export_format == "ndjson"
+    since_dt = _parse_export_since(since)
+    generated_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
     try:
         db = get_db_session()
         try:
-            # Get all system data
             stats = super_admin_service.get_system_stats(db)
-            all_polls = super_admin_service.get_all_polls(db, limit=10000)
-            
-            export_data = {
-                "export_info": {
-                    "generated_at": datetime.now().isoformat(),
-                    "generated_by": current_user.username,
-                    "version": "1.0"
-                },
-                "system_stats": stats,
-                "polls_summary": {
-                    "total_count": all_polls["total_count"],
-                    "polls": all_polls["polls"]
-                }
-            }
-            
-            def generate_export():
-                yield json.dumps(export_data, indent=2, default=str)
-            
-            filename = f"polly_system_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            
-            return StreamingResponse(
-                generate_export(),
-                media_type="application/json",
-                headers={"Content-Disposition": f"attachment; filename={filename}"}
-            )
-            
         finally:
             db.close()
-            
     except Exception as e:
         logger.error(f"Error exporting system data: {e}")
         raise HTTPException(status_code=500, detail="Error generating system export")
 
+    export_info = {
+        "generated_at": generated_at.isoformat(),
+        "generated_by": current_user.username,
+        "version": "1.1",
+        "since": since_dt.isoformat() if since_dt else None,
+        # Pass this back as ?since= to export only what changed after this one
+        "next_since": generated_at.isoformat(),
+    }
+
+    def dumps(value) -> str:
+        return json.dumps(value, default=str)
+
+    async def export_chunks():
+        if ndjson:
+            yield dumps({"type": "export_info", **export_info}) + "\n"
+            yield dumps({"type": "system_stats", **stats}) + "\n"
+        else:
+            yield (
+                f'{{"export_info": {dumps(export_info)}, '
+                f'"system_stats": {dumps(stats)}, "polls_summary": {{"polls": ['
+            )
+
+        total_count, last_id, complete = 0, after_id, True
+        try:
+            while True:
+                # A short session per page, so a slow download doesn't hold a connection
+                async with get_async_db_session() as db:
+                    polls = await super_admin_service.get_poll_export_page(
+                        db, after_id=last_id, limit=EXPORT_CHUNK_SIZE, since=since_dt
+                    )
+                if not polls:
+                    break
+                if ndjson:
+                    yield "".join(dumps({"type": "poll", **poll}) + "\n" for poll in polls)
+                else:
+                    yield ("," if total_count else "") + ",".join(dumps(poll) for poll in polls)
+                total_count += len(polls)
+                last_id = polls[-1]["id"]
+        except Exception as e:
+            # Headers are already sent; close the document and mark it incomplete
+            logger.error(f"Error exporting system data after poll {last_id}: {e}")
+            complete = False
+
+        summary = {"total_count": total_count, "last_poll_id": last_id, "complete": complete}
+        if ndjson:
+            yield dumps({"type": "summary", **summary}) + "\n"
+        else:
+            yield "], " + dumps(summary)[1:] + "}\n"
+        logger.info(
+            f"📦 System export by {current_user.username}: {total_count} polls, complete={complete}"
+        )
+
+    extension = "ndjson" if ndjson else "json"
+    filename = f"polly_system_export_{generated_at.strftime('%Y%m%d_%H%M%S')}.{extension}"
+    return streaming_download(
+        export_chunks(),
+        filename,
+        media_type="application/x-ndjson" if ndjson else "application/json",
+        compress=wants_gzip(request),
+    )
+
 
 async def get_poll_edit_form_htmx(
     poll_id: int,
@@ -1007,11 +1094,21 @@ def add_super_admin_routes(app):
     ):
         return await get_redis_stats_htmx(request, current_user)
 
+    @app.get("/super-admin/htmx/recovery/progress", response_class=HTMLResponse)
+    async def super_admin_recovery_progress_htmx(
+        request: Request, current_user: DiscordUser = Depends(require_super_admin)
+    ):
+        return await get_recovery_progress_htmx(request, current_user)
+
     @app.get("/super-admin/api/export/system-data")
     async def super_admin_export_system_data(
-        request: Request, current_user: DiscordUser = Depends(require_super_admin)
+        request: Request,
+        export_format: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+        since: Optional[str] = Query(None),
+        after_id: int = Query(0, ge=0),
+        current_user: DiscordUser = Depends(require_super_admin),
     ):
-        return await export_system_data_api(request, current_user)
+        return await export_system_data_api(request, current_user, export_format, since, after_id)
 
     @app.get("/super-admin/htmx/poll/{poll_id}/edit", response_class=HTMLResponse)
     async def super_admin_poll_edit_form_htmx(
@@ -5,13 +5,20 @@ Fixes the issue where poll closing tasks don't adhere to the timezone chosen dur
 
 import pytz
 from datetime import datetime
-from apscheduler.triggers.date import DateTrigger
 from typing import Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _wake_sweeper() -> None:
+    try:
+        from .poll_schedule_sweeper import get_poll_schedule_sweeper
+    except ImportError:
+        from poll_schedule_sweeper import get_poll_schedule_sweeper  # type: ignore
+    get_poll_schedule_sweeper().wake()
+
+
 class TimezoneAwareScheduler:
     """
     Wrapper for APScheduler to handle timezone-aware scheduling correctly.
@@ -19,6 +26,9 @@ class TimezoneAwareScheduler:
     The core issue was that poll close_time is stored in UTC in the database,
     but when scheduling jobs, we need to ensure the scheduler interprets the
     time correctly based on the poll's original timezone.
+
+    Opening and closing are now driven by ``PollScheduleSweeper`` from the
+    stored UTC times; ``schedule_*`` validate the time and wake the sweeper.
     """
 
     def __init__(self, scheduler):
@@ -34,8 +44,8 @@ class TimezoneAwareScheduler:
             poll_id: The poll ID
             open_time: UTC datetime when poll should open
             poll_timezone: Original timezone the poll was created in
-            post_function: Function to call to post the poll
-            bot: Discord bot instance
+            post_function: Unused; the sweeper opens polls via the unified opening service
+            bot: Unused; kept for call-site compatibility
 
         Returns:
             bool: True if scheduled successfully, False otherwise
@@ -49,14 +59,10 @@ class TimezoneAwareScheduler:
             if open_time.tzinfo != pytz.UTC:
                 open_time = open_time.astimezone(pytz.UTC)
 
-            # Schedule using UTC time (APScheduler handles this correctly)
-            self.scheduler.add_job(
-                post_function,
-                DateTrigger(run_date=open_time),
-                args=[bot, poll_id],
-                id=f"open_poll_{poll_id}",
-                replace_existing=True,
-            )
+            # The poll row (status + UTC open_time) is the schedule: drop any
+            # legacy in-memory job and let the due-time sweeper pick it up
+            self._remove_job(f"open_poll_{poll_id}")
+            _wake_sweeper()
 
             logger.info(
                 f"✅ Scheduled poll {poll_id} to open at {open_time} UTC (original timezone: {poll_timezone})"
@@ -79,7 +85,7 @@ class TimezoneAwareScheduler:
             poll_id: The poll ID
             close_time: UTC datetime when poll should close
             poll_timezone: Original timezone the poll was created in
-            close_function: Function to call to close the poll
+            close_function: Unused; the sweeper closes polls via ``close_poll``
 
         Returns:
             bool: True if scheduled successfully, False otherwise
@@ -93,18 +99,10 @@ class TimezoneAwareScheduler:
             if close_time.tzinfo != pytz.UTC:
                 close_time = close_time.astimezone(pytz.UTC)
 
-            # CRITICAL FIX: Use UTC time directly for scheduling
-            # APScheduler's DateTrigger expects UTC when no timezone is specified
-            # The issue was that we were sometimes passing timezone-naive datetimes
-            # or not properly handling the timezone conversion
-
-            self.scheduler.add_job(
-                close_function,
-                DateTrigger(run_date=close_time),  # Use UTC time directly
-                args=[poll_id],
-                id=f"close_poll_{poll_id}",
-                replace_existing=True,
-            )
+            # CRITICAL FIX: Use UTC time directly for scheduling. The sweeper
+            # compares the stored UTC close_time, so no per-poll job is needed
+            self._remove_job(f"close_poll_{poll_id}")
+            _wake_sweeper()
 
             logger.info(
                 f"✅ Scheduled poll {poll_id} to close at {close_time} UTC (original timezone: {poll_timezone})"
@@ -115,6 +113,13 @@ class TimezoneAwareScheduler:
             logger.error(f"❌ Failed to schedule poll {poll_id} closing: {e}")
             return False
 
+    def _remove_job(self, job_id: str) -> None:
+        try:
+            if self.scheduler and self.scheduler.get_job(job_id):
+                self.scheduler.remove_job(job_id)
+        except Exception as e:
+            logger.debug(f"Could not remove legacy job {job_id}: {e}")
+
     def remove_poll_jobs(self, poll_id: int) -> tuple[bool, bool]:
         """
         Remove both opening and closing jobs for a poll.
@@ -0,0 +1,322 @@
+"""
+Polly Vote Ingestion
+Batched vote-ingestion pipeline with coalesced commits.
+
+Votes submitted by the reaction handlers are queued per poll and applied in
+micro-batches: one transaction per poll for every batch window (default 50 ms
+or 200 votes, whichever comes first). Each caller still receives its own
+per-vote result with the same toggle/replace semantics as a single-vote
+transaction. Batches run on a dedicated writer thread so the event loop (and
+the Discord gateway heartbeat) never blocks on SQLite.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from decouple import config
+
+try:
+    from .database import get_db_session, Poll, Vote, TypeSafeColumn
+    from .poll_results_stream import notify_poll_results_changed
+    from .validators import VoteValidator
+except ImportError:
+    from database import get_db_session, Poll, Vote, TypeSafeColumn  # type: ignore
+    from poll_results_stream import notify_poll_results_changed  # type: ignore
+    from validators import VoteValidator  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingVote:
+    """A vote waiting for the next batch commit"""
+
+    poll_id: int
+    user_id: str
+    option_index: int
+    future: "asyncio.Future[Dict[str, Any]]" = field(repr=False)
+
+
+class VoteIngestionQueue:
+    """Coalesces concurrent votes into one transaction per poll per batch"""
+
+    def __init__(self):
+        # Configuration
+        self.max_batch_size = config("VOTE_BATCH_MAX_SIZE", default=200, cast=int)
+        self.max_batch_delay = config("VOTE_BATCH_MAX_DELAY_MS", default=50, cast=int) / 1000
+        self.max_retries = 3
+
+        self._pending: Dict[int, List[PendingVote]] = {}
+        self._pending_count = 0
+        self._batch_full = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._notify_tasks: Set[asyncio.Task] = set()
+        # Single writer thread: SQLite serialises writers anyway, and one
+        # thread avoids lock contention between our own batches
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vote-ingest")
+
+        # Metrics
+        self.votes_submitted = 0
+        self.batches_committed = 0
+        self.largest_batch = 0
+
+    async def submit(self, poll_id: int, user_id: str, option_index: int) -> Dict[str, Any]:
+        """Queue a vote and wait for the result of the batch it lands in"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.setdefault(poll_id, []).append(
+            PendingVote(poll_id, user_id, option_index, future)
+        )
+        self._pending_count += 1
+        self.votes_submitted += 1
+
+        if self._pending_count >= self.max_batch_size:
+            self._batch_full.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+        return await future
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue batch by batch until it is empty"""
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), timeout=self.max_batch_delay)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_full.clear()
+
+            batches = self._pending
+            self._pending = {}
+            self._pending_count = 0
+
+            for poll_id, votes in batches.items():
+                for start in range(0, len(votes), self.max_batch_size):
+                    chunk = votes[start:start + self.max_batch_size]
+                    try:
+                        results = await self._apply_with_retries(poll_id, chunk)
+                    except Exception as e:
+                        logger.error(f"Vote batch for poll {poll_id} failed unexpectedly: {e}")
+                        results = [{"success": False, "error": str(e)} for _ in chunk]
+
+                    for pending, result in zip(chunk, results):
+                        if not pending.future.done():
+                            pending.future.set_result(result)
+
+                    if any(result["success"] for result in results):
+                        self._notify_results_changed(poll_id)
+
+    def _notify_results_changed(self, poll_id: int) -> None:
+        """Wake live result streams for a poll whose votes were just committed"""
+        task = asyncio.create_task(notify_poll_results_changed(poll_id))
+        # Hold a reference until done so the task is not garbage collected
+        self._notify_tasks.add(task)
+        task.add_done_callback(self._notify_tasks.discard)
+
+    async def _apply_with_retries(
+        self, poll_id: int, chunk: List[PendingVote]
+    ) -> List[Dict[str, Any]]:
+        """Apply a batch on the writer thread, retrying the whole transaction on DB errors"""
+        votes = [(pending.user_id, pending.option_index) for pending in chunk]
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                results = await loop.run_in_executor(
+                    self._executor, self._apply_batch, poll_id, votes
+                )
+                for result in results:
+                    if result["success"]:
+                        result["message"] = (
+                            f"Vote {result['action']} successfully after {attempt} attempt(s)"
+                        )
+                        result["attempts"] = attempt
+                self.batches_committed += 1
+                self.largest_batch = max(self.largest_batch, len(votes))
+                return results
+            except Exception as db_error:
+                logger.warning(
+                    f"Database error applying vote batch for poll {poll_id} "
+                    f"({len(votes)} votes) on attempt {attempt}: {db_error}"
+                )
+                if attempt >= self.max_retries:
+                    return [
+                        {
+                            "success": False,
+                            "error": f"Vote collection failed after {self.max_retries} attempts: {str(db_error)}",
+                        }
+                        for _ in votes
+                    ]
+                # Wait briefly before retry to avoid rapid-fire retries
+                await asyncio.sleep(0.1 * attempt)
+
+        return [{"success": False, "error": "Failed to record vote"} for _ in votes]
+
+    @staticmethod
+    def _apply_batch(poll_id: int, votes: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+        """Apply votes in submission order inside a single transaction.
+
+        Runs on the writer thread. Raises on database errors so the caller can
+        retry the batch; validation failures are reported per vote.
+        """
+        db = get_db_session()
+        try:
+            poll = db.query(Poll).filter(Poll.id == poll_id).with_for_update().first()
+            if not poll:
+                return [{"success": False, "error": "Poll not found"} for _ in votes]
+
+            status = TypeSafeColumn.get_string(poll, "status")
+            if status != "active":
+                return [
+                    {"success": False, "error": f"Poll is not active (status: {status})"}
+                    for _ in votes
+                ]
+
+            results: List[Optional[Dict[str, Any]]] = [None] * len(votes)
+            validated: List[Tuple[int, str, int]] = []
+            for i, (user_id, option_index) in enumerate(votes):
+                # Adopt the normalized (user_id, option_index) so any
+                # whitespace stripping persists into the recorded Vote row
+                try:
+                    user_id, option_index = VoteValidator.validate_vote_data(
+                        poll, user_id, option_index
+                    )
+                    validated.append((i, user_id, option_index))
+                except Exception as e:
+                    results[i] = {"success": False, "error": str(e)}
+
+            user_ids = {user_id for _, user_id, _ in validated}
+            existing_votes = (
+                db.query(Vote)
+                .filter(Vote.poll_id == poll_id, Vote.user_id.in_(user_ids))
+                .all()
+                if user_ids
+                else []
+            )
+
+            multiple_choice = TypeSafeColumn.get_bool(poll, "multiple_choice", False)
+            if multiple_choice:
+                # Multiple choice: each (user, option) pair toggles. Resolve
+                # the toggles in memory first and write only the net change,
+                # so an option toggled off and on again within one batch never
+                # issues a DELETE and INSERT for the same unique key.
+                initial: Dict[Tuple[str, int], Vote] = {
+                    (str(v.user_id), int(v.option_index)): v for v in existing_votes
+                }
+                present = set(initial.keys())
+                for i, user_id, option_index in validated:
+                    choice = (user_id, option_index)
+                    if choice in present:
+                        present.discard(choice)
+                        action = "removed"
+                    else:
+                        present.add(choice)
+                        action = "added"
+                    results[i] = {"success": True, "action": action}
+
+                for choice, vote in initial.items():
+                    if choice not in present:
+                        db.delete(vote)
+                for user_id, option_index in present - initial.keys():
+                    db.add(Vote(poll_id=poll_id, user_id=user_id, option_index=option_index))
+                expected = present
+            else:
+                # Single choice: replace any existing vote
+                by_user: Dict[str, Vote] = {}
+                for v in existing_votes:
+                    by_user.setdefault(str(v.user_id), v)
+                for i, user_id, option_index in validated:
+                    existing_vote = by_user.get(user_id)
+                    if existing_vote is None:
+                        by_user[user_id] = Vote(
+                            poll_id=poll_id, user_id=user_id, option_index=option_index
+                        )
+                        db.add(by_user[user_id])
+                        action = "created"
+                    elif existing_vote.option_index == option_index:
+                        # Vote is already recorded correctly - no change
+                        action = "already_recorded"
+                    else:
+                        setattr(existing_vote, "option_index", option_index)
+                        setattr(existing_vote, "voted_at", datetime.now(timezone.utc))
+                        action = "updated"
+                    results[i] = {"success": True, "action": action}
+                expected = {(user_id, int(v.option_index)) for user_id, v in by_user.items()}
+
+            db.commit()
+
+            # Verify the committed state matches what the batch produced,
+            # with one query for the whole batch
+            if user_ids:
+                recorded = {
+                    (str(user_id), int(option_index))
+                    for user_id, option_index in db.query(Vote.user_id, Vote.option_index)
+                    .filter(Vote.poll_id == poll_id, Vote.user_id.in_(user_ids))
+                    .all()
+                }
+                if multiple_choice:
+                    mismatched = expected ^ recorded
+                else:
+                    # Extra rows for a single-choice user are pre-existing
+                    # duplicates, not a failed write
+                    mismatched = expected - recorded
+                mismatched_users = {user_id for user_id, _ in mismatched}
+                for i, user_id, _ in validated:
+                    if user_id in mismatched_users:
+                        logger.error(
+                            f"Vote verification failed for poll {poll_id}, user {user_id}"
+                        )
+                        results[i] = {"success": False, "error": "Vote verification failed"}
+
+            logger.debug(
+                f"Committed batch of {len(votes)} vote(s) for poll {poll_id}"
+            )
+            return results  # type: ignore[return-value]
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def shutdown(self) -> None:
+        """Commit votes still queued, then stop the writer thread (lifespan shutdown)"""
+        if self._flush_task is not None and not self._flush_task.done():
+            try:
+                await self._flush_task
+            except Exception as e:
+                logger.error(f"Vote flush failed during shutdown: {e}")
+        if self._notify_tasks:
+            await asyncio.gather(*self._notify_tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Metrics for health/admin endpoints"""
+        return {
+            "votes_submitted": self.votes_submitted,
+            "batches_committed": self.batches_committed,
+            "largest_batch": self.largest_batch,
+            "pending_votes": self._pending_count,
+        }
+
+
+# Global vote ingestion queue instance
+_vote_ingestion_queue: Optional[VoteIngestionQueue] = None
+
+
+def get_vote_ingestion_queue() -> VoteIngestionQueue:
+    """Get or create the vote ingestion queue instance"""
+    global _vote_ingestion_queue
+    if _vote_ingestion_queue is None:
+        _vote_ingestion_queue = VoteIngestionQueue()
+    return _vote_ingestion_queue
+
+
+async def shutdown_vote_ingestion_queue() -> None:
+    """Flush and stop the vote ingestion queue if it was started"""
+    global _vote_ingestion_queue
+    if _vote_ingestion_queue is not None:
+        queue, _vote_ingestion_queue = _vote_ingestion_queue, None
+        await queue.shutdown()
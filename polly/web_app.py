@@ -31,9 +31,7 @@ from .auth import (
     save_user_to_db,
     DiscordUser,
 )
-from .security_middleware import RateLimitMiddleware, SecurityHeadersMiddleware
-from .turnstile_middleware import TurnstileSecurityMiddleware
-from .auth_middleware import AuthenticationMiddleware
+from .security_pipeline import SecurityPipelineMiddleware
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
@@ -441,6 +439,11 @@ async def start_background_tasks():
     except Exception as e:
         logger.error(f"Redis initialization error: {e} - continuing without Redis")
 
+    # Share IP blocks with other workers through Redis
+    from .ip_blocker import get_ip_blocker
+
+    get_ip_blocker().start()
+
     # Start background tasks
     # Note: Automatic bot owner notifications are initialized in discord_bot.py after bot is ready
     asyncio.create_task(start_scheduler())
@@ -504,10 +507,16 @@ async def shutdown_background_tasks():
     from .background_tasks import shutdown_scheduler
     from .discord_bot import shutdown_bot
     from .redis_client import close_redis_client
+    from .image_processing import get_image_processing_service
+    from .ip_blocker import get_ip_blocker
+    from .vote_ingestion import shutdown_vote_ingestion_queue
 
     # Shutdown tasks
     await shutdown_scheduler()
     await shutdown_bot()
+    await shutdown_vote_ingestion_queue()
+    get_image_processing_service().shutdown()
+    await get_ip_blocker().stop()
 
     # Close Redis connection
     try:
@@ -537,10 +546,17 @@ async def lifespan(app: FastAPI):
         logger.error(f"Database initialization error: {e}")
         raise
 
+    # Pooled outbound HTTP clients (OAuth, Turnstile, avatars)
+    from .http_clients import get_http_client_registry
+
+    http_clients = get_http_client_registry()
+    http_clients.start()
+
     await start_background_tasks()
     yield
     # Shutdown
     await shutdown_background_tasks()
+    await http_clients.aclose()
 
 
 def create_app() -> FastAPI:
@@ -550,13 +566,9 @@ def create_app() -> FastAPI:
     # Add global exception handlers to prevent crashes
     add_exception_handlers(app)
 
-    # Add security middleware (order matters - add in reverse order of execution)
-    app.add_middleware(TurnstileSecurityMiddleware)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(
-        RateLimitMiddleware, requests_per_minute=60, requests_per_hour=1000
-    )
-    app.add_middleware(AuthenticationMiddleware)
+    # Add security middleware (rate limiting, auth, Turnstile and headers in one ASGI layer)
+    # Limits come from RATE_LIMIT_* settings (defaults: 60/minute, 1000/hour)
+    app.add_middleware(SecurityPipelineMiddleware)
 
     # Mount static files
     app.mount("/static", StaticFiles(directory="static"), name="static")
@@ -846,7 +858,15 @@ def add_screenshot_routes(app: FastAPI):
                 
                 # For screenshots, we can show real usernames since it's for the poll creator
                 from .discord_bot import get_bot_instance
+                from .discord_user_resolver import fallback_username, get_discord_user_resolver
                 bot = get_bot_instance()
+                discord_users = {}
+                if bot:
+                    discord_users = await get_discord_user_resolver().resolve_users(
+                        bot,
+                        (TypeSafeColumn.get_string(vote, "user_id") for vote in votes),
+                        guild_id=TypeSafeColumn.get_string(poll, "server_id"),
+                    )
                 
                 for vote in votes:
                     try:
@@ -859,14 +879,12 @@ def add_screenshot_routes(app: FastAPI):
                         avatar_url = None
                         
                         if bot and user_id:
-                            try:
-                                discord_user = await bot.fetch_user(int(user_id))
-                                if discord_user:
-                                    username = discord_user.display_name or discord_user.name
-                                    avatar_url = discord_user.avatar.url if discord_user.avatar else None
-                            except Exception as e:
-                                logger.warning(f"Could not fetch Discord user {user_id}: {e}")
-                                username = f"User {user_id[:8]}..."
+                            user_data = discord_users.get(user_id)
+                            if user_data:
+                                username = user_data.get("username") or username
+                                avatar_url = user_data.get("avatar_url")
+                            else:
+                                username = fallback_username(user_id)
                         
                         # Get option details
                         option_text = options[option_index] if option_index < len(options) else "Unknown Option"
@@ -998,9 +1016,17 @@ def add_static_poll_routes(app: FastAPI):
                 vote_data = []
                 unique_users = set()
                 
-                # Get bot instance for fetching Discord usernames
+                # Resolve every voter's Discord username in one batch
                 from .discord_bot import get_bot_instance
+                from .discord_user_resolver import fallback_username, get_discord_user_resolver
                 bot = get_bot_instance()
+                discord_users = {}
+                if bot:
+                    discord_users = await get_discord_user_resolver().resolve_users(
+                        bot,
+                        (TypeSafeColumn.get_string(vote, "user_id") for vote in votes),
+                        guild_id=TypeSafeColumn.get_string(poll, "server_id"),
+                    )
                 
                 for vote in votes:
                     try:
@@ -1008,18 +1034,13 @@ def add_static_poll_routes(app: FastAPI):
                         option_index = TypeSafeColumn.get_int(vote, "option_index")
                         voted_at = TypeSafeColumn.get_datetime(vote, "voted_at")
                         
-                        # Always fetch real Discord username for static pages (never anonymize)
+                        # Always show real Discord username for static pages (never anonymize)
                         username = "Unknown User"
-                        if bot and user_id:
-                            try:
-                                discord_user = await bot.fetch_user(int(user_id))
-                                if discord_user:
-                                    username = discord_user.display_name or discord_user.name
-                            except Exception as e:
-                                logger.warning(f"Could not fetch Discord user {user_id} for static generation: {e}")
-                                username = f"User {user_id[:8]}..."
+                        user_data = discord_users.get(user_id)
+                        if user_data:
+                            username = user_data.get("username") or username
                         elif user_id:
-                            username = f"User {user_id[:8]}..."
+                            username = fallback_username(user_id)
                         
                         # Get option details
                         options = poll.options
@@ -1126,6 +1147,7 @@ def add_htmx_routes(app: FastAPI):
         get_poll_edit_form,
         get_poll_details_htmx,
         get_poll_results_realtime_htmx,
+        stream_poll_results_htmx,
         close_poll_htmx,
         delete_poll_htmx,
         get_guild_emojis_htmx,
@@ -1294,6 +1316,14 @@ def add_htmx_routes(app: FastAPI):
     ):
         return await get_poll_results_realtime_htmx(poll_id, request, current_user)
 
+    @app.get("/htmx/poll/{poll_id}/results-stream")
+    async def htmx_poll_results_stream(
+        poll_id: int,
+        request: Request,
+        current_user: DiscordUser = Depends(require_auth),
+    ):
+        return await stream_poll_results_htmx(poll_id, request, current_user)
+
     @app.post("/htmx/poll/{poll_id}/open-now", response_class=HTMLResponse)
     async def htmx_open_poll_now(
         poll_id: int,
@@ -11,39 +11,20 @@ from datetime import datetime
 from typing import Dict, List
 import argparse
 
+from polly.attack_matcher import SEVERITY_RANK, AttackMatcher
+
 
 class SecurityMonitor:
     """Monitor and analyze security-related log entries"""
 
-    def __init__(self):
-        self.attack_patterns = {
-            "php_rfi": r"allow_url_include.*auto_prepend_file.*php://input",
-            "phpunit_rce": r"phpunit.*eval-stdin\.php",
-            "php_files": r"\.php(\?|$)",
-            "path_traversal": r"\.\./",
-            "sql_injection": r"union\s+select|drop\s+table",
-            "xss_attempt": r"<script|javascript:",
-            "command_injection": r";\s*(cat|ls|pwd|whoami)",
-        }
+    # Parse log format: INFO:     172.20.0.1:43908 - "POST /path HTTP/1.1" 404 Not Found
+    LOG_PATTERN = re.compile(
+        r'INFO:\s+(\d+\.\d+\.\d+\.\d+):\d+\s+-\s+"(\w+)\s+([^"]+)\s+HTTP/[\d.]+"\s+(\d+)'
+    )
 
-        self.malicious_paths = {
-            "phpunit_paths": [
-                "vendor/phpunit",
-                "phpunit/phpunit",
-                "lib/phpunit",
-                "laravel/vendor/phpunit",
-                "www/vendor/phpunit",
-            ],
-            "common_attacks": [
-                "wp-admin",
-                "wp-login.php",
-                "phpmyadmin",
-                "config.php",
-                "xmlrpc.php",
-                ".env",
-                "hello.world",
-            ],
-        }
+    def __init__(self):
+        # Same rules the web app's attack analysis uses
+        self.matcher = AttackMatcher()
 
     def analyze_log_line(self, line: str) -> Dict:
         """Analyze a single log line for security threats"""
@@ -57,9 +38,7 @@ class SecurityMonitor:
             "severity": "low",
         }
 
-        # Parse log format: INFO:     172.20.0.1:43908 - "POST /path HTTP/1.1" 404 Not Found
-        log_pattern = r'INFO:\s+(\d+\.\d+\.\d+\.\d+):\d+\s+-\s+"(\w+)\s+([^"]+)\s+HTTP/[\d.]+"\s+(\d+)'
-        match = re.search(log_pattern, line)
+        match = self.LOG_PATTERN.search(line)
 
         if not match:
             return result
@@ -69,33 +48,18 @@ class SecurityMonitor:
         result["path"] = match.group(3)
         result["status"] = int(match.group(4))
 
-        # Check for attack patterns
-        full_request = result["path"]
+        # Check for attack patterns (one pass over path and query)
+        path, _, query = result["path"].partition("?")
+        matches = self.matcher.match_all(path, query)
 
-        for attack_type, pattern in self.attack_patterns.items():
-            if re.search(pattern, full_request, re.IGNORECASE):
-                result["attack_types"].append(attack_type)
-
-        # Check malicious paths
-        for category, paths in self.malicious_paths.items():
-            for path in paths:
-                if path in full_request.lower():
-                    result["attack_types"].append(category)
+        for attack in matches:
+            if attack.rule_id not in result["attack_types"]:
+                result["attack_types"].append(attack.rule_id)
 
         # Determine severity
-        if result["attack_types"]:
-            if any(
-                attack in ["php_rfi", "phpunit_rce", "sql_injection"]
-                for attack in result["attack_types"]
-            ):
-                result["severity"] = "high"
-            elif any(
-                attack in ["xss_attempt", "command_injection"]
-                for attack in result["attack_types"]
-            ):
-                result["severity"] = "medium"
-            else:
-                result["severity"] = "low"
+        if matches:
+            worst = max(matches, key=lambda attack: SEVERITY_RANK[attack.severity])
+            result["severity"] = worst.severity.lower()
 
         return result
 
@@ -208,10 +172,7 @@ class SecurityMonitor:
                     "  🔍 Multiple IPs attacking - possible distributed attack"
                 )
 
-            if any(
-                "phpunit" in attack_type
-                for attack_type in analysis["attack_type_stats"]
-            ):
+            if "phpunit_rce" in analysis["attack_type_stats"]:
                 report.append(
                     "  🛡️  PHPUnit RCE attempts blocked (not applicable to Python app)"
                 )
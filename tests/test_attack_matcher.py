@@ -0,0 +1,69 @@
+"""
+Attack matcher tests for Polly.
+"""
+
+import pytest
+
+from polly.attack_matcher import ATTACK_RULES, AttackMatcher
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return AttackMatcher()
+
+
+class TestAttackMatcher:
+    """Test rule identification, severity ordering and components."""
+
+    @pytest.mark.parametrize(
+        "path,query",
+        [
+            ("/", ""),
+            ("/dashboard", "page=2&per_page=25"),
+            ("/htmx/poll/12/details", "condition_id=3&timezone=America%2FNew_York"),
+            ("/htmx/polls", "q=ongoing+weekly+vote"),
+        ],
+    )
+    def test_benign_requests_pass(self, matcher, path, query):
+        assert matcher.match(path, query) is None
+
+    @pytest.mark.parametrize(
+        "path,query,rule_id,severity",
+        [
+            ("/vendor/phpunit/phpunit/src/Util/PHP/eval-stdin.php", "", "blocked_path", "HIGH"),
+            ("/blog/lib/phpunit/src/Util/PHP/eval-stdin.php", "", "phpunit_rce", "HIGH"),
+            ("/search", "q=1%27+UNION+SELECT+password", "sql_injection", "HIGH"),
+            ("/htmx/polls", "filter=%3Cscript%3Ealert(1)", "xss", "MEDIUM"),
+            ("/static/..%2F..%2Fetc/passwd", "", "path_traversal", "MEDIUM"),
+            ("/htmx/polls", "filter=a;cat%20/etc/passwd", "shell_command", "MEDIUM"),
+        ],
+    )
+    def test_attacks_identified(self, matcher, path, query, rule_id, severity):
+        match = matcher.match(path, query)
+
+        assert match is not None
+        assert (match.rule_id, match.severity) == (rule_id, severity)
+
+    def test_most_severe_rule_wins(self, matcher):
+        # Low-severity metacharacter first, SQL injection later in the query
+        match = matcher.match("/search", "a=`x`&q=drop+table+polls")
+
+        assert match.rule_id == "sql_injection"
+        assert [m.rule_id for m in matcher.match_all("/search", "a=`x`&q=drop+table+polls")] == [
+            "shell_metachar",
+            "shell_metachar",
+            "sql_injection",
+        ]
+
+    def test_headers_scanned(self, matcher):
+        headers = {"user-agent": "curl/8.0 php://input", "referer": "https://polly.example/?a=1&b=2"}
+
+        match = matcher.match("/", "", headers)
+
+        assert (match.rule_id, match.component) == ("php_rfi", "header")
+
+    def test_every_alternative_starts_with_literal(self):
+        # The single-pass speed relies on literal-led branches
+        for rule in ATTACK_RULES:
+            for pattern in rule.patterns:
+                assert pattern[0] not in "([.\\^" or pattern[:2] in ("\\.", "\\|", "\\$"), rule.rule_id
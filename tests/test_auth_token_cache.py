@@ -0,0 +1,81 @@
+"""
+Verified token cache tests for Polly.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from jose import ExpiredSignatureError, jwt
+from starlette.requests import Request
+
+from polly import auth
+from polly.auth import (
+    AUTH_STATE_ATTR,
+    DiscordUser,
+    VerifiedTokenCache,
+    create_access_token,
+    get_current_user,
+)
+
+
+def _token(user_id="1"):
+    return create_access_token(DiscordUser({"id": user_id, "username": "tester"}, [{"id": "42", "permissions": "8"}]))
+
+
+class TestVerifiedTokenCache:
+    """Test that tokens are verified once and reused until they expire."""
+
+    def test_repeat_tokens_skip_verification(self):
+        cache = VerifiedTokenCache(max_size=10)
+        token = _token()
+
+        with patch("polly.auth.jwt.decode", wraps=jwt.decode) as decode:
+            first = cache.verify(token)
+            second = cache.verify(token)
+
+        assert decode.call_count == 1
+        assert first[1] is second[1]
+        assert second[1].id == "1" and second[1].admin_guilds == ["42"]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_expired_entries_are_verified_again(self, monkeypatch):
+        cache = VerifiedTokenCache(max_size=10)
+        token = _token()
+        assert cache.verify(token) is not None
+
+        later = time.time() + 2 * 24 * 3600
+        monkeypatch.setattr(auth.time, "time", lambda: later)
+
+        # jose checks exp against its own clock, so simulate its verdict
+        with patch("polly.auth.jwt.decode", side_effect=ExpiredSignatureError) as decode:
+            assert cache.verify(token) is None
+        assert decode.call_count == 1
+        assert cache.get_stats()["size"] == 0
+
+    def test_invalid_tokens_are_not_cached(self):
+        cache = VerifiedTokenCache(max_size=10)
+        forged = jwt.encode({"sub": "1", "username": "x", "exp": time.time() + 60}, "wrong", algorithm="HS256")
+
+        assert cache.verify(forged) is None
+        assert cache.verify("not-a-token") is None
+        assert cache.get_stats()["rejected"] == 2
+        assert cache.get_stats()["size"] == 0
+
+    def test_cache_is_bounded(self):
+        cache = VerifiedTokenCache(max_size=2)
+
+        for user_id in ("1", "2", "3"):
+            cache.verify(_token(user_id))
+
+        stats = cache.get_stats()
+        assert (stats["size"], stats["evictions"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_current_user_reuses_middleware_session(self):
+        user = DiscordUser({"id": "7", "username": "tester"}, [])
+        request = Request({"type": "http", "headers": [], "state": {AUTH_STATE_ATTR: user}})
+
+        with patch("polly.auth.jwt.decode") as decode:
+            assert await get_current_user(request, None) is user
+        decode.assert_not_called()
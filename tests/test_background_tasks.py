@@ -6,7 +6,7 @@ Tests scheduler, background operations, and task management.
 import pytest
 from datetime import datetime, timedelta
 import pytz
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, patch
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 
 from polly.background_tasks import (
@@ -17,7 +17,6 @@ from polly.background_tasks import (
     close_poll,
     restore_scheduled_jobs,
     start_reaction_safeguard,
-    reaction_safeguard_task,
 )
 from polly.database import Poll
 
@@ -260,161 +259,6 @@ class TestPollOperations:
             mock_notify.assert_called_once()
 
 
-class TestJobRestoration:
-    """Test scheduled job restoration."""
-
-    @pytest.mark.asyncio
-    async def test_restore_scheduled_jobs_success(self, db_session, mock_scheduler):
-        """Test successful job restoration."""
-        # Create scheduled polls
-        now = datetime.now(pytz.UTC)
-        future_time = now + timedelta(hours=1)
-
-        poll1 = Poll(
-            name="Test Poll 1",
-            question="Question 1?",
-            options=["A", "B"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            open_time=future_time,
-            close_time=future_time + timedelta(hours=1),
-            status="scheduled",
-        )
-        poll2 = Poll(
-            name="Test Poll 2",
-            question="Question 2?",
-            options=["X", "Y"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            open_time=future_time + timedelta(hours=2),
-            close_time=future_time + timedelta(hours=3),
-            status="scheduled",
-        )
-
-        db_session.add_all([poll1, poll2])
-        db_session.commit()
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_scheduler", return_value=mock_scheduler),
-        ):
-            await restore_scheduled_jobs()
-
-            # Should add jobs for both polls (open and close for each)
-            assert mock_scheduler.add_job.call_count == 4
-
-    @pytest.mark.asyncio
-    async def test_restore_scheduled_jobs_past_polls(self, db_session, mock_scheduler):
-        """Test job restoration with past polls."""
-        # Create poll with past open time
-        now = datetime.now(pytz.UTC)
-        past_time = now - timedelta(hours=1)
-
-        poll = Poll(
-            name="Past Poll",
-            question="Past question?",
-            options=["A", "B"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            open_time=past_time,
-            close_time=now + timedelta(hours=1),
-            status="scheduled",
-        )
-
-        db_session.add(poll)
-        db_session.commit()
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_scheduler", return_value=mock_scheduler),
-            patch("polly.background_tasks.open_poll") as mock_open,
-        ):
-            await restore_scheduled_jobs()
-
-            # Should immediately open the poll
-            mock_open.assert_called_once_with(poll.id)
-
-    @pytest.mark.asyncio
-    async def test_restore_scheduled_jobs_active_polls(
-        self, db_session, mock_scheduler
-    ):
-        """Test job restoration with active polls."""
-        # Create active poll
-        now = datetime.now(pytz.UTC)
-
-        poll = Poll(
-            name="Active Poll",
-            question="Active question?",
-            options=["A", "B"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            open_time=now - timedelta(hours=1),
-            close_time=now + timedelta(hours=1),
-            status="active",
-        )
-
-        db_session.add(poll)
-        db_session.commit()
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_scheduler", return_value=mock_scheduler),
-        ):
-            await restore_scheduled_jobs()
-
-            # Should only add close job
-            mock_scheduler.add_job.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_restore_scheduled_jobs_database_error(self, mock_scheduler):
-        """Test job restoration with database error."""
-        with (
-            patch(
-                "polly.background_tasks.get_db_session",
-                side_effect=Exception("DB error"),
-            ),
-            patch("polly.background_tasks.notify_error_async") as mock_notify,
-        ):
-            await restore_scheduled_jobs()
-
-            mock_notify.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_restore_scheduled_jobs_timezone_error(
-        self, db_session, mock_scheduler
-    ):
-        """Test job restoration with timezone issues."""
-        # Create poll with naive datetime
-        poll = Poll(
-            name="Timezone Poll",
-            question="Timezone question?",
-            options=["A", "B"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            open_time=datetime.now(),  # Naive datetime
-            close_time=datetime.now() + timedelta(hours=1),  # Naive datetime
-            status="scheduled",
-        )
-
-        db_session.add(poll)
-        db_session.commit()
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_scheduler", return_value=mock_scheduler),
-            patch("polly.background_tasks.notify_error_async") as mock_notify,
-        ):
-            await restore_scheduled_jobs()
-
-            # Should handle timezone issues gracefully
-            # May or may not call notify_error depending on implementation
-
-
 class TestReactionSafeguard:
     """Test reaction safeguard functionality."""
 
@@ -425,98 +269,6 @@ class TestReactionSafeguard:
             await start_reaction_safeguard()
             mock_create_task.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_reaction_safeguard_task_success(self, db_session, mock_bot):
-        """Test reaction safeguard task execution."""
-        # Create active poll
-        poll = Poll(
-            name="Active Poll",
-            question="Question?",
-            options=["A", "B"],
-            emojis=["🇦", "🇧"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            message_id="777777777",
-            open_time=datetime.now(pytz.UTC) - timedelta(hours=1),
-            close_time=datetime.now(pytz.UTC) + timedelta(hours=1),
-            status="active",
-        )
-
-        db_session.add(poll)
-        db_session.commit()
-
-        # Mock Discord objects
-        mock_channel = Mock()
-        mock_message = Mock()
-        mock_message.reactions = []
-        mock_channel.fetch_message = AsyncMock(return_value=mock_message)
-        mock_bot.get_channel.return_value = mock_channel
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_bot_instance", return_value=mock_bot),
-            patch("asyncio.sleep", side_effect=Exception("Stop loop")),
-        ):  # Stop the infinite loop
-            try:
-                await reaction_safeguard_task()
-            except Exception:
-                pass  # Expected to stop the loop
-
-            mock_bot.get_channel.assert_called()
-            mock_channel.fetch_message.assert_called()
-
-    @pytest.mark.asyncio
-    async def test_reaction_safeguard_task_no_active_polls(self, db_session, mock_bot):
-        """Test reaction safeguard with no active polls."""
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_bot_instance", return_value=mock_bot),
-            patch("asyncio.sleep", side_effect=Exception("Stop loop")),
-        ):
-            try:
-                await reaction_safeguard_task()
-            except Exception:
-                pass  # Expected to stop the loop
-
-            # Should not try to fetch messages
-            mock_bot.get_channel.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_reaction_safeguard_task_discord_error(self, db_session, mock_bot):
-        """Test reaction safeguard with Discord error."""
-        # Create active poll
-        poll = Poll(
-            name="Active Poll",
-            question="Question?",
-            options=["A", "B"],
-            server_id="123456789",
-            channel_id="987654321",
-            creator_id="555555555",
-            message_id="777777777",
-            open_time=datetime.now(pytz.UTC) - timedelta(hours=1),
-            close_time=datetime.now(pytz.UTC) + timedelta(hours=1),
-            status="active",
-        )
-
-        db_session.add(poll)
-        db_session.commit()
-
-        # Mock Discord error
-        mock_bot.get_channel.side_effect = Exception("Discord error")
-
-        with (
-            patch("polly.background_tasks.get_db_session", return_value=db_session),
-            patch("polly.background_tasks.get_bot_instance", return_value=mock_bot),
-            patch("asyncio.sleep", side_effect=Exception("Stop loop")),
-        ):
-            try:
-                await reaction_safeguard_task()
-            except Exception:
-                pass  # Expected to stop the loop
-
-            # Should handle error gracefully
-
 
 class TestBackgroundTasksEdgeCases:
     """Test background tasks edge cases."""
@@ -16,10 +16,12 @@ from polly.database import (
     UserPreference,
     Guild,
     Channel,
+    PollTally,
     TypeSafeColumn,
     get_poll_emoji,
     POLL_EMOJIS,
 )
+from polly.poll_tallies import rebuild_poll_tallies, verify_poll_tallies
 from tests.emoji_utils import get_random_poll_emojis
 
 
@@ -615,6 +617,63 @@ class TestDatabaseIntegrity:
             db_session.commit()
 
 
+class TestPollTallies:
+    """Test trigger-maintained poll_tallies."""
+
+    def _tallies(self, db_session, poll_id):
+        return {
+            t.option_index: (t.count, t.unique_voters)
+            for t in db_session.query(PollTally).filter(PollTally.poll_id == poll_id)
+        }
+
+    def test_tallies_follow_vote_writes(self, db_session, sample_poll):
+        """Inserts, updates and deletes keep tallies in step."""
+        votes = [
+            Vote(poll_id=sample_poll.id, user_id="user1", option_index=0),
+            Vote(poll_id=sample_poll.id, user_id="user1", option_index=1),
+            Vote(poll_id=sample_poll.id, user_id="user2", option_index=0),
+        ]
+        db_session.add_all(votes)
+        db_session.commit()
+        assert self._tallies(db_session, sample_poll.id) == {
+            -1: (3, 2),
+            0: (2, 2),
+            1: (1, 1),
+        }
+
+        votes[2].option_index = 1
+        db_session.commit()
+        assert self._tallies(db_session, sample_poll.id) == {
+            -1: (3, 2),
+            0: (1, 1),
+            1: (2, 2),
+        }
+
+        db_session.query(Vote).filter(Vote.user_id == "user1").delete()
+        db_session.commit()
+        assert self._tallies(db_session, sample_poll.id) == {-1: (1, 1), 1: (1, 1)}
+        assert verify_poll_tallies(db_session) == []
+
+    def test_rebuild_repairs_drift(self, db_session, sample_poll):
+        """rebuild_poll_tallies recomputes rows that drifted from votes."""
+        db_session.add(Vote(poll_id=sample_poll.id, user_id="user1", option_index=2))
+        db_session.commit()
+        db_session.query(PollTally).filter(PollTally.option_index == 2).update(
+            {"count": 7}
+        )
+        db_session.commit()
+
+        mismatches = verify_poll_tallies(db_session, sample_poll.id)
+        assert len(mismatches) == 1
+        assert mismatches[0]["expected"] == (1, 1)
+        assert mismatches[0]["actual"] == (7, 1)
+
+        rebuild_poll_tallies(db_session, sample_poll.id)
+        assert verify_poll_tallies(db_session, sample_poll.id) == []
+        db_session.expire_all()
+        assert sample_poll.get_results()[2] == 1
+
+
 class TestAsyncDatabase:
     """Smoke tests for the async SQLAlchemy stack."""
 
@@ -665,4 +724,54 @@ class TestAsyncDatabase:
             await engine.dispose()
 
 
+
+class TestDatabaseThreadPool:
+    """Test the DB thread pool helpers and the event-loop guard."""
+
+    @pytest.mark.asyncio
+    async def test_run_db_runs_off_the_event_loop(self):
+        import threading
+
+        from polly.database import run_db
+
+        loop_thread = threading.get_ident()
+        worker_thread, total = await run_db(
+            lambda a, b=0: (threading.get_ident(), a + b), 2, b=3
+        )
+        assert total == 5
+        assert worker_thread != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_loop_guard_records_blocking_call_sites(self):
+        from polly import database as database_module
+
+        database_module._loop_guard_sites.clear()
+        # On the loop thread: recorded
+        database_module._warn_if_on_event_loop(None, None, "SELECT 1", (), None, False)
+        # On a DB pool thread: ignored
+        await database_module.run_db(
+            database_module._warn_if_on_event_loop, None, None, "SELECT 1", (), None, False
+        )
+        assert sum(database_module.get_db_loop_guard_stats().values()) == 1
+        database_module._loop_guard_sites.clear()
+
+
+class TestEngineFactory:
+    """Test the shared SQLite engine profile."""
+
+    def test_sqlite_connections_get_production_pragmas(self, tmp_path):
+        from sqlalchemy import text
+
+        from polly.database import SQLITE_BUSY_TIMEOUT_MS, create_db_engine
+
+        engine = create_db_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+        try:
+            with engine.connect() as conn:
+                assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+                assert conn.execute(text("PRAGMA busy_timeout")).scalar() == SQLITE_BUSY_TIMEOUT_MS
+                # NORMAL == 1
+                assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+        finally:
+            engine.dispose()
+
 # Confidence level: 10/10 - Comprehensive database model testing
@@ -282,7 +282,7 @@ class TestReactionHandling:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -364,7 +364,7 @@ class TestReactionHandling:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -406,7 +406,7 @@ class TestReactionHandling:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -448,7 +448,7 @@ class TestReactionHandling:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -488,7 +488,7 @@ class TestReactionHandling:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -591,7 +591,7 @@ class TestBotEdgeCases:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
         ):
             mock_ops = Mock()
@@ -686,7 +686,7 @@ class TestBotIntegration:
                 "polly.discord_bot.send_vote_confirmation_dm", new_callable=AsyncMock
             ) as mock_dm,
             patch(
-                "polly.discord_bot.update_poll_message", new_callable=AsyncMock
+                "polly.discord_bot.request_poll_message_update"
             ) as mock_update,
             patch("polly.discord_bot.DiscordEmojiHandler") as mock_emoji_handler,
         ):
@@ -0,0 +1,77 @@
+"""
+Discord user resolver tests for Polly.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from polly.discord_user_resolver import DiscordUserResolver
+from polly.services.cache import enhanced_cache_service
+
+
+def _user(name, avatar_url=None):
+    user = Mock()
+    user.display_name = name
+    user.name = name
+    user.avatar = Mock(url=avatar_url) if avatar_url else None
+    return user
+
+
+@pytest.fixture
+def user_cache(monkeypatch):
+    """Enhanced cache stub holding one cached user"""
+    cache = Mock()
+    cache.get_cached_discord_users = AsyncMock(
+        return_value={"1": {"username": "cached", "avatar_url": None}}
+    )
+    cache.cache_discord_users = AsyncMock(return_value=True)
+    monkeypatch.setattr(
+        enhanced_cache_service, "get_enhanced_cache_service", lambda: cache
+    )
+    return cache
+
+
+class TestDiscordUserResolver:
+    """Test batched voter username resolution."""
+
+    @pytest.mark.asyncio
+    async def test_resolves_each_user_once_by_cheapest_source(self, mock_bot, user_cache):
+        """Redis, then gateway caches, then one API fetch per remaining unique ID."""
+        guild = Mock()
+        guild.get_member = Mock(side_effect=lambda uid: _user("member") if uid == 2 else None)
+        mock_bot.get_guild.return_value = guild
+        mock_bot.get_user.return_value = None
+        mock_bot.is_ready = Mock(return_value=True)
+        mock_bot.fetch_user.side_effect = lambda uid: _user(f"fetched{uid}", "https://a/x.png")
+
+        resolver = DiscordUserResolver()
+        resolver.max_fetches_per_second = 0
+        users = await resolver.resolve_users(
+            mock_bot, ["1", "2", "3", "3", "4", "1"], guild_id="99"
+        )
+
+        assert users["1"]["username"] == "cached"
+        assert users["2"]["username"] == "member"
+        assert users["3"]["username"] == "fetched3"
+        assert users["4"]["avatar_url"] == "https://a/x.png"
+        assert mock_bot.fetch_user.await_count == 2
+        user_cache.get_cached_discord_users.assert_awaited_once_with(["1", "2", "3", "4"])
+        assert set(user_cache.cache_discord_users.await_args.args[0]) == {"2", "3", "4"}
+
+        stats = resolver.get_stats()
+        assert (stats["redis_hits"], stats["gateway_hits"], stats["api_fetches"]) == (1, 1, 2)
+
+    @pytest.mark.asyncio
+    async def test_failed_fetches_are_left_out(self, mock_bot, user_cache):
+        """Users the API can't return are omitted so callers use a placeholder."""
+        mock_bot.get_user.return_value = None
+        mock_bot.is_ready = Mock(return_value=True)
+        mock_bot.fetch_user.side_effect = Exception("Unknown User")
+
+        resolver = DiscordUserResolver()
+        resolver.max_fetches_per_second = 0
+        users = await resolver.resolve_users(mock_bot, ["1", "5"])
+
+        assert set(users) == {"1"}
+        assert resolver.get_stats()["api_failures"] == 1
+        user_cache.cache_discord_users.assert_not_awaited()
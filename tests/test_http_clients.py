@@ -0,0 +1,58 @@
+"""
+Shared HTTP client registry tests for Polly.
+"""
+
+import httpx
+import pytest
+
+from polly.http_clients import HttpClientRegistry
+
+
+def _registry_with_transport(handler):
+    registry = HttpClientRegistry()
+    transport = httpx.MockTransport(handler)
+    registry.get_client = lambda host: registry._clients.setdefault(
+        host, httpx.AsyncClient(transport=transport)
+    )
+    return registry
+
+
+class TestHttpClientRegistry:
+    """Test client reuse and per-host metrics."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_client_and_records_per_host(self):
+        def handler(request):
+            if request.url.host == "discord.com":
+                return httpx.Response(200, json={"ok": True})
+            return httpx.Response(503)
+
+        registry = _registry_with_transport(handler)
+
+        first = await registry.get("https://discord.com/api/users/@me")
+        await registry.post("https://discord.com/api/oauth2/token", data={"code": "x"})
+        await registry.get("https://cdn.discordapp.com/avatars/1/abc.png")
+
+        assert first.json() == {"ok": True}
+        assert len(registry._clients) == 2
+        hosts = registry.get_stats()["hosts"]
+        assert hosts["discord.com"]["requests"] == 2
+        assert hosts["discord.com"]["status_classes"] == {"2xx": 2}
+        assert hosts["cdn.discordapp.com"]["status_classes"] == {"5xx": 1}
+
+        await registry.aclose()
+        assert registry.get_stats()["open_clients"] == 0
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_count_as_errors(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        registry = _registry_with_transport(handler)
+
+        with pytest.raises(httpx.ConnectError):
+            await registry.get("https://challenges.cloudflare.com/turnstile/v0/siteverify")
+
+        stats = registry.get_stats()["hosts"]["challenges.cloudflare.com"]
+        assert stats["requests"] == 1 and stats["errors"] == 1
+        await registry.aclose()
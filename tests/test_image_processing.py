@@ -0,0 +1,96 @@
+"""
+Image processing pool tests for Polly.
+"""
+
+import asyncio
+import pytest
+from PIL import Image
+
+from polly.image_processing import (
+    ImageProcessingService,
+    ImageQueueFullError,
+    compress_image_file,
+    optimize_avatar_bytes,
+)
+
+OPTIONS = {
+    "max_width": 1200,
+    "max_height": 800,
+    "jpeg_quality": 80,
+    "webp_quality": 85,
+    "progressive_jpeg": True,
+    "png_optimize": True,
+}
+
+
+def _thread_service(queue_size=4, queue_timeout=1.0):
+    service = ImageProcessingService()
+    service.workers = 0  # Single background thread: no subprocesses in tests
+    service.queue_size = queue_size
+    service.queue_timeout = queue_timeout
+    service._slots = asyncio.Semaphore(queue_size)
+    return service
+
+
+class TestImageJobs:
+    """Test the worker job functions directly."""
+
+    def test_large_jpeg_is_drafted_and_fits_box(self, tmp_path):
+        source = tmp_path / "big.jpg"
+        Image.new("RGB", (4800, 3200), (200, 30, 30)).save(source, "JPEG")
+        dest = tmp_path / "out.webp"
+
+        result = compress_image_file(str(source), str(dest), OPTIONS)
+
+        assert result["drafted"]
+        assert result["original_size"] == (4800, 3200)
+        assert result["size"][0] <= 1200 and result["size"][1] <= 800
+        with Image.open(dest) as out:
+            assert out.format == "WEBP"
+
+    def test_transparent_png_to_jpeg_gets_white_background(self, tmp_path):
+        source = tmp_path / "clear.png"
+        Image.new("RGBA", (64, 64), (0, 0, 0, 0)).save(source, "PNG")
+        dest = tmp_path / "out.jpg"
+
+        result = compress_image_file(str(source), str(dest), OPTIONS)
+
+        assert not result["drafted"]
+        with Image.open(dest) as out:
+            assert out.getpixel((0, 0))[0] > 240
+
+    def test_avatar_bytes_reencoded(self, tmp_path):
+        source = tmp_path / "avatar.png"
+        Image.new("P", (128, 128)).save(source, "PNG")
+
+        result = optimize_avatar_bytes(source.read_bytes(), "webp", 85)
+
+        assert result["format"] == "webp"
+        assert result["data"][8:12] == b"WEBP"
+
+
+class TestImageProcessingService:
+    """Test queueing, timing stats and rejection."""
+
+    @pytest.mark.asyncio
+    async def test_run_records_timing(self, tmp_path):
+        source = tmp_path / "avatar.png"
+        Image.new("RGB", (32, 32)).save(source, "PNG")
+        service = _thread_service()
+
+        result = await service.run("avatar", optimize_avatar_bytes, source.read_bytes(), "png", 85)
+
+        stats = service.get_stats()
+        assert result["data"]
+        assert stats["jobs_completed"] == 1 and stats["pending"] == 0
+        assert stats["recent_jobs"][0]["kind"] == "avatar"
+        service.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self):
+        service = _thread_service(queue_size=1, queue_timeout=0.01)
+        await service._slots.acquire()  # Queue already full
+
+        with pytest.raises(ImageQueueFullError):
+            await service.run("avatar", optimize_avatar_bytes, b"", "png", 85)
+        assert service.get_stats()["jobs_rejected"] == 1
@@ -0,0 +1,165 @@
+"""
+IP blocker tests for Polly.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+
+from polly import ip_blocker as ip_blocker_module
+from polly.admin_endpoints import block_ip
+from polly.ip_blocker import IPBlocker
+
+
+class FakeRedis:
+    """Connected Redis client backed by a dict; pipelines fail while ``fail`` is set"""
+
+    is_connected = True
+
+    def __init__(self):
+        self.hashes = {}
+        self.fail = False
+
+    async def hdel(self, name, *keys):
+        for key in keys:
+            self.hashes.get(name, {}).pop(key, None)
+        return len(keys)
+
+    @asynccontextmanager
+    async def pipeline(self, transaction=False):
+        redis = self
+        ops = []
+
+        class Pipe:
+            def hset(self, name, key, value):
+                ops.append(lambda: redis.hashes.setdefault(name, {}).__setitem__(key, value))
+
+            def hdel(self, name, key):
+                ops.append(lambda: redis.hashes.get(name, {}).pop(key, None))
+
+            def hgetall(self, name):
+                ops.append(lambda: dict(redis.hashes.get(name, {})))
+
+            async def execute(self):
+                if redis.fail:
+                    raise RedisError("connection reset")
+                return [op() for op in ops]
+
+        yield Pipe()
+
+
+@pytest.fixture
+def blocker():
+    return IPBlocker()
+
+
+class TestIPBlocker:
+    """Test expiring blocks, range lookups and violation tracking."""
+
+    def test_block_expires(self, blocker, monkeypatch):
+        now = 1_000_000.0
+        monkeypatch.setattr(ip_blocker_module.time, "time", lambda: now)
+        blocker.block("203.0.113.7", duration=60)
+
+        assert blocker.is_blocked("203.0.113.7")
+        assert not blocker.is_blocked("203.0.113.8")
+
+        now += 61
+        assert not blocker.is_blocked("203.0.113.7")
+        assert blocker.cleanup_old_blocks() == 1
+        assert blocker.get_blocked_ips() == set()
+
+    def test_cidr_and_asn_ranges(self, blocker):
+        blocker.block("198.51.100.0/24", duration=60)
+        blocker.block_asn(64500, ["192.0.2.0/25", "2001:db8::/32"], duration=60)
+
+        assert blocker.is_blocked("198.51.100.200")
+        assert blocker.is_blocked("192.0.2.1")
+        assert not blocker.is_blocked("192.0.2.200")
+        assert blocker.get_block("2001:db8:1::5").asn == 64500
+        # IPv4-mapped IPv6 addresses match IPv4 blocks
+        assert blocker.is_blocked("::ffff:198.51.100.9")
+        assert not blocker.is_blocked("not-an-ip")
+
+    def test_longest_prefix_wins(self, blocker):
+        blocker.block("10.0.0.0/8", duration=60, reason="wide")
+        blocker.block("10.1.2.0/24", duration=60, reason="narrow")
+
+        assert blocker.get_block("10.1.2.3").reason == "narrow"
+        assert blocker.get_block("10.9.9.9").reason == "wide"
+
+    def test_invalid_network_rejected(self, blocker):
+        with pytest.raises(ValueError):
+            blocker.block("300.1.1.1")
+
+    def test_violations_block_ip(self, blocker):
+        results = [blocker.record_violation("203.0.113.9", "HIGH") for _ in range(2)]
+
+        assert results == [False, True]
+        assert blocker.is_blocked("203.0.113.9")
+        assert blocker.get_violation_count("203.0.113.9") == 6
+
+        assert blocker.unblock_ip("203.0.113.9")
+        assert not blocker.is_blocked("203.0.113.9")
+        assert not blocker.unblock_ip("203.0.113.9")
+
+    def test_violation_tracking_is_bounded(self, blocker):
+        blocker.max_tracked_ips = 100
+
+        for i in range(500):
+            blocker.record_violation(f"10.0.{i // 256}.{i % 256}", "LOW")
+
+        assert len(blocker._violations) == 100
+        assert blocker.get_violation_count("10.0.1.243") == 1
+        assert blocker.get_violation_count("10.0.0.0") == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_pending_writes(self, blocker):
+        blocker.block("203.0.113.7", duration=60)
+        blocker.unblock("203.0.113.7")
+        redis = FakeRedis()
+        redis.fail = True
+
+        async def get_client():
+            return redis
+
+        with patch("polly.redis_client.get_redis_client", get_client):
+            with pytest.raises(RedisError):
+                await blocker.sync()
+
+        assert [action for action, _ in blocker._pending] == ["set", "del"]
+
+    @pytest.mark.asyncio
+    async def test_failed_read_keeps_synced_blocks(self, blocker):
+        redis = FakeRedis()
+
+        async def get_client():
+            return redis
+
+        with patch("polly.redis_client.get_redis_client", get_client):
+            blocker.block("203.0.113.7", duration=60)
+            await blocker.sync()
+            assert not blocker._pending
+            assert "203.0.113.7" in redis.hashes[ip_blocker_module.IP_BLOCKS_KEY]
+
+            redis.fail = True
+            with pytest.raises(RedisError):
+                await blocker.sync()
+
+        assert blocker.is_blocked("203.0.113.7")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("duration", ["soon", -5])
+    async def test_admin_block_rejects_bad_duration(self, blocker, duration):
+        request = Mock()
+        request.json = AsyncMock(return_value={"network": "203.0.113.7", "duration": duration})
+
+        with patch("polly.admin_endpoints.get_ip_blocker", return_value=blocker):
+            with pytest.raises(HTTPException) as excinfo:
+                await block_ip(request, Mock(username="admin"))
+
+        assert excinfo.value.status_code == 400
+        assert not blocker.is_blocked("203.0.113.7")
@@ -0,0 +1,67 @@
+"""
+L1 (in-process) cache tests for Polly.
+"""
+
+import pytest
+
+from polly.services.cache import local_cache as local_cache_module
+from polly.services.cache.local_cache import LocalCache
+
+
+def _cache(max_entries=2048):
+    cache = LocalCache()
+    cache.enabled = True
+    cache.redis_fanout = False
+    cache.max_entries = max_entries
+    return cache
+
+
+class TestLocalCache:
+    """Test the TTL/LRU layer in front of Redis."""
+
+    def test_only_hot_namespaces_are_cached(self):
+        cache = _cache()
+        assert cache.handles("user_prefs:1")
+        assert cache.handles("guild_emojis_extended:2")
+        assert not cache.handles("poll_dashboard:3")
+
+    def test_hit_returns_copy_and_ttl_expires(self, monkeypatch):
+        """Callers can't mutate cached values; entries expire per namespace TTL."""
+        now = [1000.0]
+        monkeypatch.setattr(local_cache_module.time, "monotonic", lambda: now[0])
+        cache = _cache()
+
+        cache.set("user_prefs:1", {"tz": "UTC"})
+        hit, value = cache.get("user_prefs:1")
+        assert hit and value == {"tz": "UTC"}
+        value["tz"] = "changed"
+        assert cache.get("user_prefs:1")[1] == {"tz": "UTC"}
+
+        now[0] += local_cache_module.L1_NAMESPACE_TTLS["user_prefs"] + 1
+        assert cache.get("user_prefs:1") == (False, None)
+        assert cache.get_stats()["namespaces"]["user_prefs"]["hits"] == 2
+        assert cache.get_stats()["namespaces"]["user_prefs"]["misses"] == 1
+
+    def test_lru_eviction_counts_per_namespace(self):
+        cache = _cache(max_entries=2)
+        cache.set("guild_roles:1", [1])
+        cache.set("guild_channels:1", [2])
+        cache.get("guild_roles:1")  # guild_roles:1 is now most recently used
+        cache.set("user_prefs:1", {})
+
+        assert cache.get("guild_channels:1") == (False, None)
+        assert cache.get("guild_roles:1")[0]
+        assert cache.get_stats()["namespaces"]["guild_channels"]["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_clear(self):
+        cache = _cache()
+        cache.set("guild_emojis:1", [])
+        cache.set("guild_emojis:2", [])
+
+        await cache.invalidate("guild_emojis:1", "poll_dashboard:9")
+        assert cache.get("guild_emojis:1") == (False, None)
+        assert cache.get("guild_emojis:2")[0]
+
+        await cache.clear()
+        assert cache.get_stats()["entries"] == 0
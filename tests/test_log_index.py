@@ -0,0 +1,114 @@
+"""
+Incremental log index tests for Polly.
+"""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from polly.log_index import LogIndex, parse_log_lines
+
+
+def _line(when: datetime, level: str, message: str, name: str = "polly.web_app") -> str:
+    return f"{when:%Y-%m-%d %H:%M:%S},123 - {name} - {level} - {message}\n"
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "polly.log")
+
+
+class TestLogIndex:
+    """Test offset tracking, rotation handling and vectorized parsing."""
+
+    def test_only_appended_lines_are_parsed(self, log_path):
+        now = datetime.now().replace(microsecond=0)
+        with open(log_path, "w") as f:
+            f.write(_line(now, "INFO", "Poll 12 created by user: 42"))
+            f.write(_line(now, "ERROR", "Vote failed for poll_id: 12"))
+        index = LogIndex([log_path])
+
+        assert len(index.refresh()) == 2
+        first_offset = index.get_stats()["files"][log_path]["offset"]
+
+        with open(log_path, "a") as f:
+            f.write(_line(now, "WARNING", "Redis timeout after 250ms"))
+            # Partial line: indexed once its newline is written
+            f.write(_line(now, "INFO", "half written").rstrip("\n"))
+        df = index.refresh()
+
+        assert len(df) == 3
+        assert list(df["line_number"]) == [1, 2, 3]
+        assert index.get_stats()["bytes_indexed"] < os.path.getsize(log_path)
+        assert index.get_stats()["files"][log_path]["offset"] > first_offset
+
+        with open(log_path, "a") as f:
+            f.write("\n")
+        assert len(index.refresh()) == 4
+
+    def test_rotation_restarts_from_the_new_file(self, log_path):
+        now = datetime.now().replace(microsecond=0)
+        with open(log_path, "w") as f:
+            f.write(_line(now, "INFO", "before rotation"))
+        index = LogIndex([log_path])
+        index.refresh()
+
+        os.rename(log_path, log_path + ".1")
+        with open(log_path, "w") as f:
+            f.write(_line(now, "INFO", "after rotation"))
+        df = index.refresh()
+
+        assert list(df["message"]) == ["before rotation", "after rotation"]
+        assert list(df["line_number"]) == [1, 1]
+        assert index.get_stats()["files"][log_path]["rotations"] == 1
+
+    def test_metadata_extraction(self):
+        now = datetime(2024, 5, 1, 12, 30)
+        text = (
+            _line(now, "INFO", "GET /htmx/polls status: 200 took 35ms poll_id: 7 guild: 99")
+            + _line(now, "ERROR", "Traceback follows", name="__main__")
+            + '  File "polly/web_app.py", line 1, in <module>\n'
+        )
+
+        df = parse_log_lines(text.rstrip("\n"), "polly.log", 1)
+
+        request, error, traceback = df.to_dict("records")
+        assert request["endpoint"] == "GET /htmx/polls"
+        assert (request["status_code"], request["response_time"], request["poll_id"]) == (200, 35.0, 7)
+        assert request["server_id"] == "99" and request["user_id"] is None
+        assert error["level"] == "ERROR" and error["is_error"]
+        # Continuation lines inherit the timestamp of the entry they belong to
+        assert traceback["level"] == "UNSTRUCTURED"
+        assert traceback["timestamp"] == error["timestamp"]
+
+    def test_json_lines(self):
+        text = "\n".join(
+            [
+                '{"timestamp": "2024-05-01T12:30:00.123", "level": "ERROR", "logger": "polly.web_app", '
+                '"message": "Vote failed for poll_id: 3", "exception": "Traceback ..."}',
+                "{not json",
+            ]
+        )
+
+        entry, broken = parse_log_lines(text, "polly.log", 1).to_dict("records")
+
+        assert (entry["level"], entry["poll_id"], entry["is_error"]) == ("ERROR", 3, True)
+        assert entry["timestamp"] == datetime(2024, 5, 1, 12, 30)
+        assert broken["level"] == "UNSTRUCTURED"
+
+    def test_hourly_rollups(self, log_path):
+        base = datetime.now().replace(minute=0, second=0, microsecond=0) - timedelta(days=1)
+        with open(log_path, "w") as f:
+            f.write(_line(base, "INFO", "ok"))
+            f.write(_line(base + timedelta(minutes=5), "ERROR", "failed"))
+            f.write(_line(base + timedelta(hours=1), "ERROR", "exception"))
+        index = LogIndex([log_path])
+        index.refresh()
+
+        rollups = index.get_rollups(since=base)
+
+        assert int(rollups["entries"].sum()) == 3
+        assert int(rollups["errors"].sum()) == 2
+        assert rollups.loc[(base, "ERROR"), "errors"] == 1
+        assert index.get_rollups(since=base + timedelta(hours=2)).empty
@@ -0,0 +1,84 @@
+"""
+Queue-based logging setup tests for Polly.
+"""
+
+import json
+import logging
+import queue
+
+import pytest
+
+from polly import logging_setup
+from polly.logging_setup import DroppingQueueHandler, HotPathFilter, JsonLinesFormatter, LoggingSetup
+
+
+def _record(name="polly.htmx_endpoints", level=logging.INFO, msg="vote %s", args=(1,)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestLoggingSetup:
+    """Test JSON lines, hot-path sampling/caps and the non-blocking queue."""
+
+    def test_json_lines_format(self):
+        record = _record()
+        record.poll_id = 12
+
+        entry = json.loads(JsonLinesFormatter().format(record))
+
+        assert (entry["level"], entry["logger"], entry["message"]) == ("INFO", "polly.htmx_endpoints", "vote 1")
+        assert entry["poll_id"] == 12
+        assert entry["timestamp"][10] == "T"
+
+    def test_sampling_and_caps_spare_warnings(self, monkeypatch):
+        monkeypatch.setattr(logging_setup.time, "monotonic", lambda: 100.0)
+        hot_path = HotPathFilter({"polly.htmx_endpoints": 0.0}, {"polly.discord_bot": 3})
+
+        assert not hot_path.filter(_record("polly.htmx_endpoints.dashboard"))
+        assert hot_path.filter(_record("polly.htmx_endpoints", logging.WARNING))
+        assert hot_path.filter(_record("polly.web_app"))
+        assert [hot_path.filter(_record("polly.discord_bot")) for _ in range(5)] == [True] * 3 + [False] * 2
+        assert hot_path.sampled_out == {"polly.htmx_endpoints": 1}
+        assert hot_path.capped == {"polly.discord_bot": 2}
+
+    def test_full_queue_drops_instead_of_blocking(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+        for _ in range(5):
+            handler.handle(_record())
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+        assert handler.queue.get_nowait().getMessage() == "vote 1"
+
+    def test_listener_writes_rotating_json_file(self, tmp_path, monkeypatch, restore_root_logger):
+        monkeypatch.setenv("LOG_FORMAT", "json")
+        monkeypatch.setenv("LOG_MAX_BYTES", "2000")
+        log_file = tmp_path / "logs" / "polly.log"
+        setup = LoggingSetup(str(log_file))
+        setup.start()
+        logger = logging.getLogger("polly.test_logging")
+        logger.setLevel(logging.INFO)
+
+        for i in range(50):
+            logger.info("poll %d closed", i)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("close failed")
+        setup.stop()
+
+        lines = log_file.read_text().splitlines()
+        last = json.loads(lines[-1])
+        assert last["message"] == "close failed"
+        assert "ValueError: boom" in last["exception"]
+        assert (tmp_path / "logs" / "polly.log.1").exists()
+        assert setup.get_stats()["dropped"] == 0
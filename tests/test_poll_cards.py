@@ -0,0 +1,51 @@
+"""
+Poll card read model tests for Polly.
+"""
+
+from polly.database import Vote
+from polly.poll_cards import PollCard, _card_from_row, poll_cards_query
+
+
+class TestPollCards:
+    """Test the poll-card projection used by the dashboard poll list."""
+
+    def _load_cards(self, db_session, creator_id, status=None):
+        rows = db_session.execute(poll_cards_query(creator_id, status)).all()
+        return [_card_from_row(row) for row in rows]
+
+    def test_cards_carry_vote_totals(self, db_session, sample_poll):
+        """One query returns card columns and the poll's vote total."""
+        db_session.add_all(
+            [
+                Vote(poll_id=sample_poll.id, user_id="user1", option_index=0),
+                Vote(poll_id=sample_poll.id, user_id="user2", option_index=1),
+            ]
+        )
+        db_session.commit()
+
+        cards = self._load_cards(db_session, sample_poll.creator_id)
+        assert len(cards) == 1
+        card = cards[0]
+        assert card.id == sample_poll.id
+        assert card.name == sample_poll.name
+        assert card.status == "scheduled"
+        assert card.status_class == "bg-warning"
+        assert card.get_total_votes() == sample_poll.get_total_votes() == 2
+
+    def test_cards_without_votes_and_status_filter(self, db_session, sample_poll):
+        """Polls with no tally rows report zero; status filter is applied."""
+        assert self._load_cards(db_session, sample_poll.creator_id)[0].get_total_votes() == 0
+        assert self._load_cards(db_session, sample_poll.creator_id, "active") == []
+
+    def test_cache_round_trip(self, db_session, sample_poll):
+        """Cards survive serialization through the poll-list cache."""
+        card = self._load_cards(db_session, sample_poll.creator_id)[0]
+        restored = PollCard.from_cache_dict(card.to_cache_dict())
+
+        for field in PollCard.__slots__:
+            if field in ("open_time", "close_time", "created_at"):
+                assert getattr(restored, field).replace(tzinfo=None) == getattr(
+                    card, field
+                ).replace(tzinfo=None)
+            else:
+                assert getattr(restored, field) == getattr(card, field)
@@ -0,0 +1,93 @@
+"""
+Poll message updater tests for Polly.
+Tests that live embed refreshes are coalesced per poll per window.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+from polly import poll_message_updater as updater_module
+from polly.poll_message_updater import (
+    PollMessageUpdateCoalescer,
+    request_poll_message_update,
+)
+
+WINDOW = 0.05
+
+
+@pytest.fixture
+def coalescer(monkeypatch):
+    coalescer = PollMessageUpdateCoalescer()
+    coalescer.min_interval = WINDOW
+    monkeypatch.setattr(updater_module, "_poll_message_updater", coalescer)
+    return coalescer
+
+
+def _patch_edits(edit):
+    async def load_poll(func):
+        return Mock(id=1)
+
+    return (
+        patch.object(updater_module, "run_in_db_session", side_effect=load_poll),
+        patch.object(updater_module, "update_poll_message", side_effect=edit),
+    )
+
+
+async def _drain(coalescer):
+    while coalescer._scheduled:
+        await asyncio.gather(*coalescer._scheduled.values())
+
+
+class TestPollMessageUpdateCoalescer:
+    """Test debounced embed edits."""
+
+    @pytest.mark.asyncio
+    async def test_burst_sends_one_edit_per_window(self, coalescer):
+        edits = []
+
+        async def edit(bot, poll):
+            edits.append(poll.id)
+            return True
+
+        load, update = _patch_edits(edit)
+        with load, update:
+            for _ in range(10):
+                request_poll_message_update(None, 1)
+            await _drain(coalescer)
+
+        assert edits == [1]
+        assert coalescer.edits_sent == 1
+        assert coalescer.edits_saved == 9
+        assert coalescer.requests_received == 10
+
+    @pytest.mark.asyncio
+    async def test_vote_during_edit_schedules_one_follow_up(self, coalescer):
+        edit_started = asyncio.Event()
+        release = asyncio.Event()
+        edits = []
+
+        async def edit(bot, poll):
+            edits.append(poll.id)
+            edit_started.set()
+            await release.wait()
+            return True
+
+        load, update = _patch_edits(edit)
+        with load, update:
+            request_poll_message_update(None, 1)
+            first = coalescer._scheduled[1]
+            await edit_started.wait()
+
+            # Votes landing while the first edit is in flight
+            for _ in range(3):
+                request_poll_message_update(None, 1)
+            assert len(coalescer._scheduled) == 1
+
+            release.set()
+            await first
+            await _drain(coalescer)
+
+        assert edits == [1, 1]
+        assert coalescer.edits_sent == 2
+        assert coalescer.edits_saved == 2
@@ -0,0 +1,76 @@
+"""
+Live poll results stream tests for Polly.
+"""
+
+import asyncio
+import pytest
+
+from polly.poll_results_stream import PollResultsBroadcaster, format_sse
+
+
+def _broadcaster():
+    broadcaster = PollResultsBroadcaster()
+    broadcaster.redis_fanout = False
+    broadcaster.heartbeat_interval = 0.05
+    return broadcaster
+
+
+async def _never_disconnected():
+    return False
+
+
+class TestPollResultsBroadcaster:
+    """Test SSE fan-out of poll result changes."""
+
+    def test_format_sse_multiline(self):
+        """Every line of a fragment gets its own data field."""
+        assert format_sse("results", "<b>1</b>\n<i>2</i>") == (
+            "event: results\ndata: <b>1</b>\ndata: <i>2</i>\n\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_pushes_only_changed_fragments(self):
+        """Unchanged renders are skipped; a closed poll ends the stream."""
+        broadcaster = _broadcaster()
+        renders = iter([("A", False), ("A", False), ("B", False), ("B", True)])
+
+        async def render():
+            return next(renders)
+
+        messages = []
+
+        async def consume():
+            async for message in broadcaster.stream(1, render, _never_disconnected):
+                messages.append(message)
+
+        consumer = asyncio.create_task(consume())
+        for _ in range(3):
+            await asyncio.sleep(0.01)
+            await broadcaster.publish(1)
+        await asyncio.wait_for(consumer, timeout=1)
+
+        events = [m for m in messages if m.startswith("event: results")]
+        assert events == [format_sse("results", "A"), format_sse("results", "B")]
+        assert broadcaster.pushes_skipped == 2
+        assert broadcaster.get_stats()["open_streams"] == 0
+
+    @pytest.mark.asyncio
+    async def test_keepalive_and_disconnect(self):
+        """Idle streams send keepalives and stop once the client is gone."""
+        broadcaster = _broadcaster()
+        disconnected = asyncio.Event()
+
+        async def render():
+            return "A", False
+
+        async def is_disconnected():
+            return disconnected.is_set()
+
+        messages = []
+        async for message in broadcaster.stream(2, render, is_disconnected):
+            messages.append(message)
+            if message.startswith(": keepalive"):
+                disconnected.set()
+
+        assert messages[-1] == ": keepalive\n\n"
+        assert broadcaster.get_stats()["polls_watched"] == 0
@@ -0,0 +1,126 @@
+"""
+Poll schedule sweeper tests for Polly.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytz
+
+from polly import poll_schedule_sweeper as sweeper_module
+from polly.background_tasks import restore_scheduled_jobs
+from polly.database import Poll
+from polly.poll_schedule_sweeper import CLOSE, OPEN, PollScheduleSweeper
+
+
+def _poll(status, open_time, close_time):
+    return Poll(
+        name="Sweeper Poll",
+        question="Question?",
+        options=["A", "B"],
+        server_id="123456789",
+        channel_id="987654321",
+        creator_id="555555555",
+        open_time=open_time,
+        close_time=close_time,
+        status=status,
+    )
+
+
+class TestPollScheduleSweeper:
+    """Test due-time queries and dispatch bookkeeping."""
+
+    def test_loads_only_due_polls(self, db_session):
+        now = datetime.now(pytz.UTC)
+        overdue_close = _poll("active", now - timedelta(hours=2), now - timedelta(minutes=1))
+        due_open = _poll("scheduled", now - timedelta(minutes=1), now + timedelta(hours=1))
+        future = _poll("scheduled", now + timedelta(minutes=30), now + timedelta(hours=2))
+        closed = _poll("closed", now - timedelta(hours=2), now - timedelta(hours=1))
+        db_session.add_all([overdue_close, due_open, future, closed])
+        db_session.commit()
+        # The patched session is closed by the loaders, detaching these rows
+        overdue_close_id = overdue_close.id
+        overdue_close_time = overdue_close.close_time.replace(tzinfo=None)
+        due_open_id = due_open.id
+
+        with patch.object(sweeper_module, "get_db_session", return_value=db_session):
+            due = sweeper_module._load_due_polls(sweeper_module._utc_now_naive(), 50)
+            next_due = sweeper_module._load_next_due_time()
+
+        assert due == [(CLOSE, overdue_close_id), (OPEN, due_open_id)]
+        # Earliest pending time is the overdue close
+        assert abs((next_due - overdue_close_time).total_seconds()) < 1
+
+    @pytest.mark.asyncio
+    async def test_run_once_skips_in_flight_and_backs_off(self):
+        sweeper = PollScheduleSweeper()
+        release = asyncio.Event()
+        dispatched = []
+
+        async def fake_dispatch(bot, action, poll_id):
+            dispatched.append((action, poll_id))
+            await release.wait()
+            sweeper._in_flight.discard((action, poll_id))
+
+        async def fake_run_db(func, *args):
+            return [(CLOSE, 1)]
+
+        with (
+            patch.object(sweeper_module, "run_db", side_effect=fake_run_db),
+            patch.object(sweeper, "_dispatch", side_effect=fake_dispatch),
+        ):
+            assert await sweeper.run_once(bot=None) == 1
+            await asyncio.sleep(0)
+            # Still in flight: not dispatched twice
+            assert await sweeper.run_once(bot=None) == 0
+
+            release.set()
+            await asyncio.sleep(0)
+            # Finished but still due (closure failed): waits for its retry backoff
+            assert await sweeper.run_once(bot=None) == 0
+
+        assert dispatched == [(CLOSE, 1)]
+        assert sweeper.get_stats()["backing_off"] == 1
+
+
+class TestJobRestoration:
+    """Test startup restoration now that the sweeper drives poll scheduling."""
+
+    @pytest.mark.asyncio
+    async def test_restore_scheduled_jobs_does_not_rebuild_jobs(
+        self, db_session, mock_scheduler
+    ):
+        """Startup wakes the sweeper instead of adding one job per poll."""
+        now = datetime.now(pytz.UTC)
+        for i in range(3):
+            db_session.add(
+                Poll(
+                    name=f"Test Poll {i}",
+                    question="Question?",
+                    options=["A", "B"],
+                    server_id="123456789",
+                    channel_id="987654321",
+                    creator_id="555555555",
+                    open_time=now + timedelta(hours=i + 1),
+                    close_time=now + timedelta(hours=i + 2),
+                    status="scheduled",
+                )
+            )
+        db_session.commit()
+
+        sweeper = Mock()
+        with (
+            patch("polly.background_tasks.get_db_session", return_value=db_session),
+            patch("polly.background_tasks.get_scheduler", return_value=mock_scheduler),
+            patch("polly.background_tasks.run_discord_dependent_startup_tasks", new=AsyncMock()),
+            patch(
+                "polly.poll_schedule_sweeper.get_poll_schedule_sweeper",
+                return_value=sweeper,
+            ),
+        ):
+            await restore_scheduled_jobs()
+
+            sweeper.wake.assert_called_once()
+            mock_scheduler.add_job.assert_not_called()
@@ -0,0 +1,55 @@
+"""
+Rate limiter tests for Polly.
+"""
+
+import pytest
+
+from polly.rate_limiter import RateLimiter
+
+
+@pytest.fixture
+def limiter(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_REDIS_ENABLED", "false")
+    monkeypatch.setenv("RATE_LIMIT_REALTIME_PER_MINUTE", "5")
+    return RateLimiter(requests_per_minute=3, requests_per_hour=100)
+
+
+class TestRateLimiter:
+    """Test GCRA limits, cost classes and the local fallback bound."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_limited_with_retry_after(self, limiter):
+        decisions = [await limiter.hit("203.0.113.5", "GET", "/dashboard") for _ in range(4)]
+
+        assert [d.allowed for d in decisions] == [True, True, True, False]
+        # One request's worth of the minute window (20s) until the next is allowed
+        assert 0 < decisions[-1].retry_after <= 20
+        assert limiter.get_stats()["limited"]["default"] == 1
+
+    @pytest.mark.asyncio
+    async def test_realtime_polling_has_its_own_bucket(self, limiter):
+        for _ in range(5):
+            assert (await limiter.hit("203.0.113.5", "GET", "/htmx/poll/7/results-realtime")).allowed
+
+        # Polling used up its own budget, not the one for pages and forms
+        assert (await limiter.hit("203.0.113.5", "POST", "/htmx/create-poll")).allowed
+        assert not (await limiter.hit("203.0.113.5", "GET", "/htmx/polls-realtime")).allowed
+
+    @pytest.mark.asyncio
+    async def test_clients_are_independent(self, limiter):
+        for _ in range(3):
+            await limiter.hit("203.0.113.5")
+
+        assert await limiter.is_rate_limited("203.0.113.5")
+        assert not await limiter.is_rate_limited("198.51.100.9")
+
+    @pytest.mark.asyncio
+    async def test_local_state_is_bounded(self, limiter):
+        limiter.max_local_keys = 10
+
+        for i in range(50):
+            await limiter.hit(f"10.0.0.{i}")
+
+        stats = limiter.get_stats()
+        assert stats["local_keys"] == 10
+        assert stats["local_evictions"] == 90  # two windows per client
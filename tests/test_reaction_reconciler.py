@@ -0,0 +1,162 @@
+"""
+Reaction reconciler tests for Polly.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+import pytz
+from unittest.mock import Mock, AsyncMock, patch
+import discord
+
+from polly.background_tasks import _reconcile_poll_reactions, _rescan_poll_message
+from polly.database import Poll
+from polly.reaction_reconciler import ReactionReconciler, RestCallMeter
+
+
+class TestReactionRescan:
+    """Test rescanning dirty poll messages."""
+
+    @pytest.mark.asyncio
+    async def test_rescan_poll_message_success(self, db_session, mock_bot):
+        """Test rescanning a dirty poll message."""
+        # Create active poll
+        poll = Poll(
+            name="Active Poll",
+            question="Question?",
+            options=["A", "B"],
+            emojis=["🇦", "🇧"],
+            server_id="123456789",
+            channel_id="987654321",
+            creator_id="555555555",
+            message_id="777777777",
+            open_time=datetime.now(pytz.UTC) - timedelta(hours=1),
+            close_time=datetime.now(pytz.UTC) + timedelta(hours=1),
+            status="active",
+        )
+
+        db_session.add(poll)
+        db_session.commit()
+
+        # Mock Discord objects
+        mock_channel = Mock(spec=discord.TextChannel)
+        mock_message = Mock()
+        mock_message.reactions = []
+        mock_channel.fetch_message = AsyncMock(return_value=mock_message)
+        mock_bot.get_channel.return_value = mock_channel
+
+        with (
+            patch("polly.background_tasks.get_db_session", return_value=db_session),
+            patch("polly.discord_bot.get_bot_instance", return_value=mock_bot),
+        ):
+            processed = await _rescan_poll_message(777777777)
+
+            assert processed == 0
+            mock_bot.get_channel.assert_called()
+            mock_channel.fetch_message.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rescan_poll_message_not_a_poll(self, db_session, mock_bot):
+        """Test rescanning a message that is not an active poll."""
+        with (
+            patch("polly.background_tasks.get_db_session", return_value=db_session),
+            patch("polly.discord_bot.get_bot_instance", return_value=mock_bot),
+        ):
+            processed = await _rescan_poll_message(123)
+
+            # Should not try to fetch messages
+            assert processed is None
+            mock_bot.get_channel.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reconcile_poll_reactions_discord_error(self, db_session, mock_bot):
+        """Test reaction reconciliation with Discord error."""
+        # Create active poll
+        poll = Poll(
+            name="Active Poll",
+            question="Question?",
+            options=["A", "B"],
+            server_id="123456789",
+            channel_id="987654321",
+            creator_id="555555555",
+            message_id="777777777",
+            open_time=datetime.now(pytz.UTC) - timedelta(hours=1),
+            close_time=datetime.now(pytz.UTC) + timedelta(hours=1),
+            status="active",
+        )
+
+        db_session.add(poll)
+        db_session.commit()
+
+        # Mock Discord error
+        mock_bot.get_channel.side_effect = Exception("Discord error")
+
+        # Should handle error gracefully
+        processed = await _reconcile_poll_reactions(
+            mock_bot, poll, RestCallMeter()
+        )
+        assert processed == 0
+
+
+class TestReactionReconciler:
+    """Test dirty-message scheduling and adaptive backoff."""
+
+    def test_mark_dirty_keeps_earliest_due_time(self):
+        """Test that repeated events cannot postpone a rescan."""
+        reconciler = ReactionReconciler()
+        reconciler.track(1)
+        reconciler.mark_dirty(1, delay=0)
+        reconciler.on_raw_reaction(1)
+
+        assert reconciler._pop_due() == [1]
+        assert reconciler.events_received == 1
+
+    def test_ignores_reactions_on_non_poll_messages(self):
+        """Test that only known poll messages are marked dirty."""
+        reconciler = ReactionReconciler()
+        reconciler.track(1)
+        reconciler.on_raw_reaction(2)
+        reconciler.on_raw_reaction(1)
+
+        assert list(reconciler._dirty) == [1]
+        assert reconciler.events_ignored == 1
+
+    @pytest.mark.asyncio
+    async def test_sweep_refreshes_known_poll_messages(self):
+        """Test that the sweep replaces the known set with active polls."""
+        reconciler = ReactionReconciler()
+        reconciler.track(1)
+
+        async def active_messages():
+            reconciler.track(3)  # posted while the sweep query runs
+            return [2]
+
+        await reconciler._sweep(active_messages)
+
+        assert reconciler._poll_messages == {2, 3}
+
+    def test_backoff_grows_when_clean_and_resets_on_work(self):
+        """Test per-poll backoff adapts to rescan results."""
+        reconciler = ReactionReconciler()
+        reconciler.min_backoff_seconds = 5
+        reconciler.max_backoff_seconds = 20
+
+        reconciler._record_result(1, 0)
+        assert reconciler._backoff[1] == 5
+        reconciler._record_result(1, 0)
+        reconciler._record_result(1, 0)
+        reconciler._record_result(1, 0)
+        assert reconciler._backoff[1] == 20
+
+        reconciler._record_result(1, 2)
+        assert reconciler._backoff[1] == 5
+        assert reconciler.reactions_reconciled == 2
+        assert 1 in reconciler._dirty
+
+    def test_rest_call_meter(self):
+        """Test REST calls per minute metric."""
+        meter = RestCallMeter()
+        meter.record()
+        meter.record(2)
+
+        assert meter.calls_per_minute() == 3
+        assert meter.total_calls == 3
@@ -0,0 +1,69 @@
+"""
+Recovery executor tests for Polly.
+"""
+
+import asyncio
+import pytest
+
+from polly.recovery_executor import DiscordRateBudget, RecoveryExecutor
+
+
+def _budget(max_rate=20.0):
+    budget = DiscordRateBudget()
+    budget.max_rate = budget.rate = max_rate
+    budget.min_rate = 1.0
+    budget.rate_step = 0.5
+    return budget
+
+
+class TestDiscordRateBudget:
+    """Test adaptation to Discord's rate-limit headers."""
+
+    def test_429_halves_rate_and_success_recovers(self):
+        budget = _budget()
+        budget.observe(429, {"Retry-After": "2"})
+        assert budget.rate == 10.0
+        assert budget.get_stats()["paused_seconds"] == 0.0
+
+        budget.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "1.5"})
+        assert budget.rate == 10.5
+        assert budget.buckets_exhausted == 1
+
+    def test_global_429_pauses_recovery(self):
+        budget = _budget()
+        budget.observe(429, {"Retry-After": "3", "X-RateLimit-Global": "true"})
+        assert budget.global_rate_limited == 1
+        assert 0 < budget.get_stats()["paused_seconds"] <= 3
+
+
+class TestRecoveryExecutor:
+    """Test priority order, bounded concurrency and progress."""
+
+    @pytest.mark.asyncio
+    async def test_runs_soonest_first_within_concurrency(self):
+        executor = RecoveryExecutor(budget=_budget())
+        executor.concurrency = 2
+        started = []
+        running = 0
+        peak = 0
+
+        async def job(poll_id):
+            nonlocal running, peak
+            started.append(poll_id)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if poll_id == 3:
+                raise RuntimeError("boom")
+
+        progress = await executor.run(
+            "active_polls", [(30.0, 3, job), (10.0, 1, job), (20.0, 2, job), (40.0, 4, job)]
+        )
+
+        assert started[:2] == [1, 2]
+        assert peak == 2
+        assert (progress.completed, progress.failed) == (3, 1)
+        stats = executor.get_stats()["phases"][0]
+        assert stats["percent"] == 100.0 and stats["eta_seconds"] == 0.0
+        assert not executor.get_stats()["running"]
@@ -0,0 +1,57 @@
+"""
+Redis client multi-key operation tests for Polly.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from polly import redis_client as redis_module
+from polly.redis_client import RedisClient
+
+
+def _connected_client(keys=()):
+    client = RedisClient()
+    client._client = Mock()
+    client._connected = True
+
+    async def scan_iter(match=None, count=None):
+        for key in keys:
+            yield key
+
+    client._client.scan_iter = scan_iter
+    client._client.unlink = AsyncMock(side_effect=lambda *chunk: len(chunk))
+    return client
+
+
+class TestRedisClientMultiKey:
+    """Test batched reads and chunked pattern deletes."""
+
+    @pytest.mark.asyncio
+    async def test_mget_decodes_in_key_order(self):
+        """Values come back aligned with keys; JSON is decoded, misses use the default."""
+        client = _connected_client()
+        client._client.mget = AsyncMock(return_value=[json.dumps({"a": 1}), None, "plain"])
+
+        assert await client.mget(["k1", "k2", "k3"], default=0) == [{"a": 1}, 0, "plain"]
+        assert await client.cache_get_many(["x", "y", "z"]) == {"x": {"a": 1}, "z": "plain"}
+        client._client.mget.assert_awaited_with(["cache:x", "cache:y", "cache:z"])
+
+    @pytest.mark.asyncio
+    async def test_clear_pattern_unlinks_in_chunks(self, monkeypatch):
+        """Keys are unlinked while scanning instead of in one giant DEL."""
+        monkeypatch.setattr(redis_module, "CLEAR_PATTERN_CHUNK_SIZE", 2)
+        client = _connected_client([f"cache:poll:{i}" for i in range(5)])
+
+        assert await client.cache_clear_pattern("poll:*") == 5
+        assert [len(call.args) for call in client._client.unlink.await_args_list] == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_empty_multi_set_is_false(self):
+        """An empty mapping writes nothing and reports False, as before batching."""
+        client = _connected_client()
+        client._client.pipeline = Mock()
+
+        assert await client.mset_with_ttl({}) is False
+        assert await client.cache_set_many({}) is False
+        client._client.pipeline.assert_not_called()
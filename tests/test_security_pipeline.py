@@ -0,0 +1,105 @@
+"""
+Security pipeline middleware tests for Polly.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from polly import security_pipeline as security_pipeline_module
+from polly.auth import DiscordUser, create_access_token
+from polly.ip_blocker import IPBlocker
+from polly.security_pipeline import SecurityPipelineMiddleware
+
+
+@pytest.fixture(autouse=True)
+def local_rate_limits(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_REDIS_ENABLED", "false")
+
+
+def _client(requests_per_minute=1000):
+    app = FastAPI()
+
+    @app.get("/", response_class=HTMLResponse)
+    async def home():
+        return "home"
+
+    @app.get("/dashboard", response_class=HTMLResponse)
+    async def dashboard():
+        return "dashboard"
+
+    @app.get("/htmx/export.csv")
+    async def export():
+        async def rows():
+            for i in range(3):
+                yield f"{i},row\n".encode()
+
+        return StreamingResponse(rows(), media_type="text/csv")
+
+    app.add_middleware(
+        SecurityPipelineMiddleware, requests_per_minute=requests_per_minute, requests_per_hour=10000
+    )
+    return TestClient(app)
+
+
+class TestSecurityPipeline:
+    """Test the single-pass security middleware."""
+
+    def test_security_headers_on_every_response(self):
+        client = _client()
+
+        ok = client.get("/")
+        denied = client.get("/dashboard", follow_redirects=False)
+
+        for response in (ok, denied):
+            assert response.headers["X-Frame-Options"] == "DENY"
+            assert "default-src 'self'" in response.headers["Content-Security-Policy"]
+
+    def test_protected_routes_require_session(self):
+        client = _client()
+
+        redirect = client.get("/dashboard", follow_redirects=False)
+        htmx = client.get("/htmx/export.csv", headers={"HX-Request": "true"})
+
+        assert redirect.status_code == 302 and redirect.headers["location"] == "/login"
+        assert htmx.status_code == 401 and htmx.headers["HX-Redirect"] == "/login"
+
+    def test_valid_session_streams_response(self):
+        client = _client()
+        token = create_access_token(DiscordUser({"id": "1", "username": "tester"}, []))
+        client.cookies.set("access_token", token)
+
+        response = client.get("/htmx/export.csv")
+
+        assert response.status_code == 200
+        assert response.text == "0,row\n1,row\n2,row\n"
+        assert response.headers["X-Content-Type-Options"] == "nosniff"
+
+    def test_rate_limit(self):
+        client = _client(requests_per_minute=2)
+
+        statuses = [client.get("/").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+        assert int(client.get("/").headers["Retry-After"]) >= 1
+
+    def test_each_app_has_its_own_buckets(self):
+        first = _client(requests_per_minute=1)
+        second = _client(requests_per_minute=1)
+
+        assert first.get("/").status_code == 200
+        assert first.get("/").status_code == 429
+        assert second.get("/").status_code == 200
+
+    def test_blocked_ip_denied_without_attack_analysis(self, monkeypatch):
+        blocker = IPBlocker()
+        blocker.block("203.0.113.0/24", duration=60)
+        monkeypatch.setattr(security_pipeline_module, "get_ip_blocker", lambda: blocker)
+        client = _client()
+
+        blocked = client.get("/", headers={"X-Forwarded-For": "203.0.113.5"})
+        allowed = client.get("/", headers={"X-Forwarded-For": "198.51.100.5"})
+
+        assert blocked.status_code == 403
+        assert allowed.status_code == 200
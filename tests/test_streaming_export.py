@@ -0,0 +1,125 @@
+"""
+Streaming export tests for Polly.
+"""
+
+import zlib
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from polly.streaming_export import CsvChunkEncoder, encode_chunks
+
+
+async def _chunks(*items):
+    for item in items:
+        yield item
+
+
+class TestStreamingExport:
+    """Test chunk encoding, on-the-fly gzip and keyset-paginated export pages."""
+
+    def test_csv_encoder_reuses_buffer(self):
+        encoder = CsvChunkEncoder()
+
+        first = encoder.encode([["Poll Name", "Voter ID"]])
+        second = encoder.encode([["Lunch, Friday", "42"], ["Dinner", "7"]])
+
+        assert first == "Poll Name,Voter ID\r\n"
+        assert second == '"Lunch, Friday",42\r\nDinner,7\r\n'
+
+    @pytest.mark.asyncio
+    async def test_gzip_chunks_decode_progressively(self):
+        decompressor = zlib.decompressobj(31)
+        received = []
+
+        async for data in encode_chunks(_chunks("a,b\r\n", "", "1,2\r\n", b"3,4\r\n"), compress=True):
+            received.append(decompressor.decompress(data).decode())
+
+        # Each chunk is flushed, so it's readable before the stream ends
+        assert received[:3] == ["a,b\r\n", "1,2\r\n", "3,4\r\n"]
+        assert "".join(received) == "a,b\r\n1,2\r\n3,4\r\n"
+
+    @pytest.mark.asyncio
+    async def test_vote_chunks_follow_voted_at_order(self, tmp_path):
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from polly.database import Base, Vote
+        from polly.htmx_endpoints import _iter_vote_chunks
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'votes.db'}")
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+
+        @asynccontextmanager
+        async def session():
+            async with Session() as db:
+                yield db
+
+        same_time = datetime(2024, 5, 1, 12, 0)
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with Session() as db:
+                db.add_all(
+                    [
+                        Vote(id=1, poll_id=1, user_id="a", option_index=0, voted_at=datetime(2024, 5, 1, 9, 0)),
+                        Vote(id=2, poll_id=1, user_id="b", option_index=0, voted_at=same_time),
+                        Vote(id=3, poll_id=1, user_id="c", option_index=1, voted_at=same_time),
+                        Vote(id=4, poll_id=1, user_id="d", option_index=1, voted_at=datetime(2024, 5, 2, 9, 0)),
+                        Vote(id=5, poll_id=2, user_id="e", option_index=0, voted_at=same_time),
+                    ]
+                )
+                await db.commit()
+
+            with patch("polly.htmx_endpoints.get_async_db_session", session):
+                chunks = [chunk async for chunk in _iter_vote_chunks(1, chunk_size=2)]
+        finally:
+            await engine.dispose()
+
+        assert [[row.id for row in chunk] for chunk in chunks] == [[4, 3], [2, 1]]
+
+    @pytest.mark.asyncio
+    async def test_system_export_pages_with_vote_aggregates(self, tmp_path):
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from polly.database import Base, Poll, Vote
+        from polly.super_admin import SuperAdminService
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'polls.db'}")
+        Session = async_sessionmaker(engine, expire_on_commit=False)
+        old, recent = datetime(2024, 1, 1), datetime(2024, 6, 1)
+
+        def poll(poll_id):
+            return Poll(
+                id=poll_id, name=f"Poll {poll_id}", question="Lunch?", options_json='["A", "B"]',
+                server_id="1", channel_id="2", creator_id="3",
+                open_time=old, close_time=old, created_at=old, status="closed",
+            )
+
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            async with Session() as db:
+                db.add_all([poll(1), poll(2), poll(3)])
+                db.add_all(
+                    [
+                        Vote(poll_id=1, user_id="a", option_index=0, voted_at=old),
+                        Vote(poll_id=1, user_id="a", option_index=1, voted_at=old),
+                        Vote(poll_id=1, user_id="b", option_index=1, voted_at=old),
+                        Vote(poll_id=3, user_id="c", option_index=0, voted_at=recent),
+                    ]
+                )
+                await db.commit()
+
+                first = await SuperAdminService.get_poll_export_page(db, after_id=0, limit=2)
+                rest = await SuperAdminService.get_poll_export_page(db, after_id=first[-1]["id"], limit=2)
+                changed = await SuperAdminService.get_poll_export_page(db, since=datetime(2024, 3, 1))
+        finally:
+            await engine.dispose()
+
+        assert [p["id"] for p in first] == [1, 2] and [p["id"] for p in rest] == [3]
+        assert (first[0]["vote_count"], first[0]["unique_voters"], first[0]["option_counts"]) == (3, 2, [1, 2])
+        assert (first[1]["vote_count"], first[1]["option_counts"], first[1]["last_vote_at"]) == (0, [0, 0], None)
+        # Only the poll voted on after the cursor is re-exported
+        assert [p["id"] for p in changed] == [3]
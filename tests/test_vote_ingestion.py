@@ -0,0 +1,170 @@
+"""
+Vote ingestion tests for Polly.
+Tests batched vote commits keep per-vote toggle/replace semantics.
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, patch
+import pytz
+
+from polly.database import Poll, Vote
+from polly import vote_ingestion as vote_ingestion_module
+from polly.vote_ingestion import VoteIngestionQueue, shutdown_vote_ingestion_queue
+
+
+def _create_poll(session, multiple_choice=False):
+    poll = Poll(
+        name="Batch Poll",
+        question="Question?",
+        options=["A", "B", "C"],
+        emojis=["🇦", "🇧", "🇨"],
+        server_id="123456789",
+        channel_id="987654321",
+        creator_id="555555555",
+        message_id="777777777",
+        open_time=datetime.now(pytz.UTC) - timedelta(hours=1),
+        close_time=datetime.now(pytz.UTC) + timedelta(hours=1),
+        multiple_choice=multiple_choice,
+        status="active",
+    )
+    session.add(poll)
+    session.commit()
+    return poll.id
+
+
+class TestVoteIngestionQueue:
+    """Test micro-batched vote collection."""
+
+    @pytest.mark.asyncio
+    async def test_single_choice_batch_semantics(self, temp_db):
+        """Concurrent votes in one batch behave like sequential votes."""
+        TestSessionLocal, _ = temp_db
+        setup = TestSessionLocal()
+        poll_id = _create_poll(setup)
+        setup.close()
+
+        queue = VoteIngestionQueue()
+        with patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal):
+            results = await asyncio.gather(
+                queue.submit(poll_id, "1001", 0),
+                queue.submit(poll_id, "1001", 0),
+                queue.submit(poll_id, "1001", 2),
+                queue.submit(poll_id, "1002", 1),
+            )
+
+        assert [r["action"] for r in results] == [
+            "created",
+            "already_recorded",
+            "updated",
+            "created",
+        ]
+        assert all(r["success"] for r in results)
+        assert queue.batches_committed == 1
+
+        check = TestSessionLocal()
+        votes = {v.user_id: v.option_index for v in check.query(Vote).all()}
+        check.close()
+        assert votes == {"1001": 2, "1002": 1}
+
+    @pytest.mark.asyncio
+    async def test_multiple_choice_toggle_within_batch(self, temp_db):
+        """Adding then removing the same option in one batch leaves no row."""
+        TestSessionLocal, _ = temp_db
+        setup = TestSessionLocal()
+        poll_id = _create_poll(setup, multiple_choice=True)
+        setup.close()
+
+        queue = VoteIngestionQueue()
+        with patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal):
+            results = await asyncio.gather(
+                queue.submit(poll_id, "1001", 0),
+                queue.submit(poll_id, "1001", 1),
+                queue.submit(poll_id, "1001", 0),
+            )
+
+        assert [r["action"] for r in results] == ["added", "added", "removed"]
+
+        check = TestSessionLocal()
+        options = [v.option_index for v in check.query(Vote).all()]
+        check.close()
+        assert options == [1]
+
+    @pytest.mark.asyncio
+    async def test_invalid_vote_does_not_fail_batch(self, temp_db):
+        """A validation failure is reported only to its own caller."""
+        TestSessionLocal, _ = temp_db
+        setup = TestSessionLocal()
+        poll_id = _create_poll(setup)
+        setup.close()
+
+        queue = VoteIngestionQueue()
+        with patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal):
+            bad, good = await asyncio.gather(
+                queue.submit(poll_id, "1001", 9),
+                queue.submit(poll_id, "1002", 0),
+            )
+
+        assert bad["success"] is False
+        assert good["success"] is True
+        assert good["action"] == "created"
+
+    @pytest.mark.asyncio
+    async def test_committed_batch_wakes_result_streams(self, temp_db):
+        """Live result streams are notified once per committed batch."""
+        TestSessionLocal, _ = temp_db
+        setup = TestSessionLocal()
+        poll_id = _create_poll(setup)
+        setup.close()
+
+        queue = VoteIngestionQueue()
+        with (
+            patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal),
+            patch(
+                "polly.vote_ingestion.notify_poll_results_changed", new=AsyncMock()
+            ) as notify,
+        ):
+            await asyncio.gather(
+                queue.submit(poll_id, "1001", 0),
+                queue.submit(poll_id, "1002", 1),
+            )
+            await asyncio.sleep(0)
+
+        notify.assert_awaited_once_with(poll_id)
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_gives_each_caller_its_own_result(self, temp_db):
+        """Callers of a failed batch must not share one mutable result dict."""
+        TestSessionLocal, _ = temp_db
+
+        queue = VoteIngestionQueue()
+        with patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal):
+            first, second = await asyncio.gather(
+                queue.submit(99999, "1001", 0),
+                queue.submit(99999, "1002", 0),
+            )
+
+        assert first == second == {"success": False, "error": "Poll not found"}
+        first["error"] = "changed"
+        assert second["error"] == "Poll not found"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_commits_queued_votes_and_stops_writer(self, temp_db, monkeypatch):
+        """Shutdown waits for the queued batch, then stops the writer thread."""
+        TestSessionLocal, _ = temp_db
+        setup = TestSessionLocal()
+        poll_id = _create_poll(setup)
+        setup.close()
+
+        queue = VoteIngestionQueue()
+        monkeypatch.setattr(vote_ingestion_module, "_vote_ingestion_queue", queue)
+        with patch("polly.vote_ingestion.get_db_session", side_effect=TestSessionLocal):
+            vote = asyncio.create_task(queue.submit(poll_id, "1001", 0))
+            await asyncio.sleep(0)
+            await shutdown_vote_ingestion_queue()
+
+        assert (await vote)["success"] is True
+        assert vote_ingestion_module._vote_ingestion_queue is None
+        with pytest.raises(RuntimeError):
+            queue._executor.submit(print)